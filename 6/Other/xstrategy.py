@@ -10,7 +10,7 @@ from xtree import _action_to_json
 from strategy import Strategy
 
 
-def xstrategy():
+def xstrategy(time_budget: float = None):
     # Initialize objects to read to
     input_obj = ""
 
@@ -35,8 +35,9 @@ def xstrategy():
     if first_player_color in initialized_state.stuck_players:
         print(json.dumps(False))
     else:
-        # Compute the best action the first player can take given the current state and depth
-        best_action = Strategy.get_best_action(initialized_state, depth)
+        # Compute the best action the first player can take given the current state and depth (within
+        # the time budget if one is given)
+        best_action = Strategy.get_best_action(initialized_state, depth, time_budget)
 
         # Print the best action to STDOUT
         print(_action_to_json(best_action))
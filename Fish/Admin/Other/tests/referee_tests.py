@@ -13,6 +13,7 @@ from player import Player
 from color import Color
 from position import Position
 from state import State
+from game_tree import GameTree
 from cheating_player1 import CheatingPlayer1
 from cheating_player2 import CheatingPlayer2
 from cheating_player3 import CheatingPlayer3
@@ -577,3 +578,56 @@ class RefereeTests(unittest.TestCase):
             referee.start()
             self.assertCountEqual(referee.winners, [self.__p17])
             self.assertCountEqual(referee.losers, [self.__failing_player7])
+
+    def test_start_success_search_stats(self):
+        # Tests that the game report holds the statistics of the players' searches throughout the game
+        referee = Referee(4, 3, [self.__p1, self.__p2])
+
+        # Make up observer callback to validate game report
+        def game_report_observer(report: dict):
+            self.assertCountEqual(report['search_stats'].keys(), ['Bob', 'Jim'])
+
+            for p in [self.__p1, self.__p2]:
+                self.assertEqual(report['search_stats'][p.name], p.search_stats.to_dict())
+
+            # Jim gets to move, hence searches
+            self.assertGreater(report['search_stats']['Jim']['searches'], 0)
+
+        referee.subscribe_final_game_report(game_report_observer)
+        referee.start()
+
+
+
+class RefereeGameTreeTests(unittest.TestCase):
+    """
+    Tests that the referee re-roots its game tree at each move rather than making it up anew.
+    """
+    def setUp(self):
+        # Keep the random boards made up here from affecting those of other tests
+        self.__random_state = random.getstate()
+
+    def tearDown(self):
+        random.setstate(self.__random_state)
+
+    def test_start_success_rerooted(self):
+        # Tests that the game tree is made up once for a game without removals and re-rooted at every move
+        referee = Referee(4, 3, [Player('Bob'), Player('Jim')])
+
+        with patch('referee.GameTree', wraps=GameTree) as game_tree_mock:
+            with patch.object(GameTree, 'reroot', autospec=True, side_effect=GameTree.reroot) as reroot_mock:
+                referee.start()
+
+        self.assertEqual(game_tree_mock.call_count, 1)
+        self.assertGreater(reroot_mock.call_count, 0)
+        self.assertFalse(referee.state.can_anyone_move())
+
+    def test_start_success_rebuilt(self):
+        # Tests that the game tree is made up anew once a player is removed during the game
+        cheating_player = CheatingPlayer2('iCrack v2')
+        referee = Referee(4, 3, [Player('Bob'), cheating_player])
+
+        with patch('referee.GameTree', wraps=GameTree) as game_tree_mock:
+            referee.start()
+
+        self.assertEqual(game_tree_mock.call_count, 2)
+        self.assertCountEqual(referee.cheating_players, [cheating_player])
@@ -36,7 +36,10 @@ class Referee(object):
                     are not accessible in a straight line across parallel hexagon edges, moving in-place, and moving
                     outside the bounds of the board). This determination is for placements is made using the State and
                     whereas the one for moves (or actions) is made using the GameTree. Both State and GameTree will
-                    raise appropriate exceptions to indicate abnormal conditions should any occur.
+                    raise appropriate exceptions to indicate abnormal conditions should any occur. The GameTree is
+                    made up once all avatars have been placed and is re-rooted at the node each move leads to from
+                    there on, so that nodes computed for validation are carried over. It is only made up anew when a
+                    player is removed from the game.
 
                     A failing player is one that fails to return either a placement or an action. More specifically,
                     if a player returns an object of the wrong type (something that is not a Position for
@@ -80,7 +83,9 @@ class Referee(object):
 
                     The final game report encompasses a list of the cheating players, a list of the failing
                     players and a list of dictionary objects sorted in decreasing order of score,
-                    each object containing a rule-abiding player's name, color and score.
+                    each object containing a rule-abiding player's name, color and score. Players that keep
+                    statistics of their searches throughout the game (i.e. a Player's search_stats) have them
+                    included by name (see SearchStats.to_dict).
 
                     Here's an example of what the report may look like:
 
@@ -90,8 +95,10 @@ class Referee(object):
                         'leaderboard': [
                             {'name': 'Winner', 'color': Color.BLACK, 'score': 99},
                             {'name': 'Runner-up', 'color': Color.WHITE, 'score': 40}
-                        ]
-
+                        ],
+                        'search_stats': {
+                            'Winner': {'nodes': 5120, 'cutoffs': 731, ...}
+                        }
                     }
 
                     Upon determining that no more moves can be made (by calling can_anyone_move() on the internal state)
@@ -447,6 +454,11 @@ class Referee(object):
         player_obj.kick(reason.name)
         # Remove player from state
         self.__state.remove_player(player_obj.color)
+
+        # Make up game tree anew once the game is running, as its nodes do not account for the player's removal
+        if self.__game_tree is not None:
+            self.__game_tree = GameTree(self.__state)
+
         # Trigger event
         self.__fire_game_state_changed()
 
@@ -478,8 +490,9 @@ class Referee(object):
                 self.__kick_player(current_player_obj, PlayerKickReason.FAILING)
             else:
                 # Use game tree to validate action (will throw InvalidPositionException if
-                # action is illegal)
-                self.__state = self.__game_tree.try_action(action)
+                # action is illegal) and re-root it at the resulting node
+                self.__game_tree = self.__game_tree.reroot(action)
+                self.__state = self.__game_tree.state
 
                 if Referee.DEBUG:
                     print(f'{current_player_obj.color} just moved from {action.src} to {action.dst}')
@@ -509,13 +522,11 @@ class Referee(object):
 
     def __fire_game_state_changed(self):
         """
-        Signals that the game state has changed and it is time to update the game tree, sync all the players and
-        notify all subscribed observers about the new state. It notifies observers so by calling their provided
-        callbacks on a copy of the latest game state.
+        Signals that the game state has changed and it is time to sync all the players and notify all subscribed
+        observers about the new state. It notifies observers so by calling their provided callbacks on a copy of
+        the latest game state. The game tree is kept up to date where the state is changed (see __run_turn and
+        __kick_player).
         """
-        # Update game tree
-        self.__game_tree = GameTree(self.__state)
-
         # Notify all parties subscribed for game updates
         state_to_broadcast = self.__state.deepcopy()
 
@@ -538,7 +549,8 @@ class Referee(object):
         """
         Retrieves the final game report. It encompasses a list of the cheating players' colors,
         a list of the failing players' colors and a list of dictionary objects sorted in decreasing
-        order of score, each object containing the respective player's name, color and score.
+        order of score, each object containing the respective player's name, color and score, along
+        with the search statistics of the players keeping them.
 
         Here's an example of what the report may look like:
 
@@ -548,8 +560,10 @@ class Referee(object):
             'leaderboard': [
                 {'name': 'Winner', 'color': Color.BLACK, 'score': 99},
                 {'name': 'Runner-up', 'color': Color.WHITE, 'score': 40}
-            ]
-
+            ],
+            'search_stats': {
+                'Winner': {'nodes': 5120, 'cutoffs': 731, ...}
+            }
         }
 
         :return: resulting dict object
@@ -566,11 +580,21 @@ class Referee(object):
         # Sort leader board in decreasing order of score
         leaderboard.sort(key=operator.itemgetter('score'), reverse=True)
 
+        # Collect search statistics of the players keeping them (remote players do not)
+        search_stats = {}
+
+        for p in self.__players:
+            stats = getattr(p, 'search_stats', None)
+
+            if stats is not None:
+                search_stats[p.name] = stats.to_dict()
+
         # Return report
         return {
             'cheating_players': self.__cheating_players,
             'failing_players': self.__failing_players,
-            'leaderboard': leaderboard
+            'leaderboard': leaderboard,
+            'search_stats': search_stats
         }
 
     def __get_player_by_name(self, name: str) -> IPlayer:
@@ -0,0 +1,170 @@
+from board import Board
+from board_geometry import BoardGeometry
+from movement_direction import MovementDirection
+
+# NumPy is optional; only the ArrayBoard (and what builds on it) requires it
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class ArrayBoard(object):
+    """
+    PURPOSE:        The purpose of the array board is to lay a board out in NumPy arrays so that properties of many
+                    positions on it (i.e. the positions of a batch of sibling states) can be computed with a handful
+                    of vectorized operations rather than by looping over tiles in Python.
+
+    INTERPRETATION: The positions of a board are numbered by their bit index (see Bitboard), and an extra index
+                    (size, one past the last position) stands for a sentinel that never holds a tile. The array
+                    board holds:
+
+                    - fish: the number of fish on each position's tile at the time the array board was made up
+                      (0 for holes and the sentinel), also available as a rows x cols matrix (fish_matrix)
+                    - rays: for each MovementDirection (by value) and each position, the indices of the positions
+                      on the position's ray in said direction ordered by their distance (see BoardGeometry), padded
+                      with the sentinel up to the length of the longest ray
+
+                    As the number of fish on a tile never changes, which tiles are left and which are occupied is
+                    not part of the array board; it is handed to it as rows of booleans indexed by position (see
+                    to_bool_array). Walking a ray until the first position that is not open then comes down to a
+                    cumulative logical and along the ray's indices (see reach).
+
+                    Rays only depend on the dimensions of the board and are shared by all array boards of the same
+                    dimensions. Making up an ArrayBoard requires NumPy to be installed; ImportError is thrown if
+                    it is not.
+    """
+    # Cache of ray index arrays shared amongst array boards; maps (rows, cols) to array
+    __RAYS = {}
+
+    def __init__(self, board: Board):
+        """
+        Lays out the given board in arrays.
+
+        :param board: board to lay out
+        :return: new ArrayBoard designed to spec
+        """
+        if np is None:
+            raise ImportError('ArrayBoard requires numpy!')
+
+        # Validate params
+        if not isinstance(board, Board):
+            raise TypeError('Expected Board for board!')
+
+        # Set fields
+        self.__rows = board.rows
+        self.__cols = board.cols
+        self.__size = board.rows * board.cols
+
+        # Initialize number of fish indexed by bit index (with the sentinel holding none)
+        self.__fish = np.zeros(self.__size + 1, dtype=np.int64)
+
+        for pos, tile in board.tiles.items():
+            if tile.is_tile:
+                self.__fish[pos.x * self.__cols + pos.y] = tile.fish_no
+
+        self.__fish.flags.writeable = False
+        self.__rays = ArrayBoard.__get_rays(board.geometry)
+
+    @property
+    def rows(self) -> int:
+        """
+        Returns the number of rows of the array board.
+        """
+        return self.__rows
+
+    @property
+    def cols(self) -> int:
+        """
+        Returns the number of cols of the array board.
+        """
+        return self.__cols
+
+    @property
+    def size(self) -> int:
+        """
+        Returns the number of positions on the array board (which is also the index of the sentinel).
+        """
+        return self.__size
+
+    @property
+    def fish(self) -> 'np.ndarray':
+        """
+        Returns the (read-only) array of the number of fish indexed by bit index, the sentinel included.
+        """
+        return self.__fish
+
+    @property
+    def fish_matrix(self) -> 'np.ndarray':
+        """
+        Returns the (read-only) rows x cols matrix of the number of fish on each position.
+        """
+        return self.__fish[:self.__size].reshape(self.__rows, self.__cols)
+
+    @property
+    def rays(self) -> 'np.ndarray':
+        """
+        Returns the (shared, read-only) array of ray indices indexed by MovementDirection value, bit index
+        and distance (minus one), padded with the sentinel.
+        """
+        return self.__rays
+
+    def to_bool_array(self, masks: [int]) -> 'np.ndarray':
+        """
+        Converts bitmasks of positions (see Bitboard) into rows of booleans indexed by bit index.
+
+        :param masks: list of bitmasks
+        :return: len(masks) x (size + 1) array of bool (False for the sentinel)
+        """
+        # Make room for the sentinel's bit, which is never set in a mask of positions
+        byte_no = self.__size // 8 + 1
+        data = b''.join(mask.to_bytes(byte_no, 'little') for mask in masks)
+        rows = np.frombuffer(data, dtype=np.uint8).reshape(len(masks), byte_no)
+
+        return np.unpackbits(rows, axis=1, count=self.__size + 1, bitorder='little').astype(bool)
+
+    def reach(self, open_rows: 'np.ndarray', batch: 'np.ndarray', sources: 'np.ndarray') -> tuple:
+        """
+        Determines the positions reachable via straight line paths from each of the given sources, where
+        a path stops at the first position that is not open. Each source is looked at on its own row of
+        open positions.
+
+        :param open_rows: B x (size + 1) array of bool telling which positions are open on each row
+        :param batch: array of the row (0 to B - 1) to look at each source on
+        :param sources: array of bit indices of the sources
+        :return: tuple of the ray indices of each source (len(sources) x 6 x ray length array of int) and
+                 whether each of them is reachable (array of bool of the same shape)
+        """
+        # Gather rays of each source, ordered by source
+        cells = self.__rays[:, sources, :].transpose(1, 0, 2)
+        # A position is reachable if it and every position before it on its ray are open
+        is_open = open_rows[batch[:, None, None], cells]
+
+        return cells, np.logical_and.accumulate(is_open, axis=2)
+
+    @staticmethod
+    def __get_rays(geometry: BoardGeometry) -> 'np.ndarray':
+        """
+        Retrieves the ray index array of the given geometry's dimensions, computing it if this is
+        the first time it is asked for.
+
+        :param geometry: geometry to lay out the rays of
+        :return: shared array of ray indices (see rays)
+        """
+        key = (geometry.rows, geometry.cols)
+
+        if key not in ArrayBoard.__RAYS:
+            cols = geometry.cols
+            size = geometry.rows * cols
+            ray_masks = geometry.ray_masks
+            length = max(len(ray) for position_rays in ray_masks for _, ray in position_rays)
+            rays = np.full((len(MovementDirection), size, max(length, 1)), size, dtype=np.intp)
+
+            for index, position_rays in enumerate(ray_masks):
+                for direction, (_, ray) in enumerate(position_rays):
+                    rays[direction, index, :len(ray)] = [pos.x * cols + pos.y for pos in ray]
+
+            rays.flags.writeable = False
+            ArrayBoard.__RAYS[key] = rays
+
+        return ArrayBoard.__RAYS[key]
@@ -0,0 +1,64 @@
+#!/usr/bin/python3
+
+import pickle
+import sys
+import timeit
+
+sys.path.append('../')
+
+from board import Board
+from state import State
+from player_entity import PlayerEntity
+from color import Color
+from position import Position
+
+# Board sizes (rows = cols) to benchmark
+SIZES = [5, 10, 20, 30, 40, 50]
+# Number of times each operation is timed
+REPETITIONS = 2000
+
+
+def make_state(size: int) -> State:
+    """
+    Makes up a two-player state on a homogeneous size x size board on
+    which all avatars have been placed.
+
+    :param size: number of rows and cols to board
+    :return: resulting State object
+    """
+    state = State(Board.homogeneous(2, size, size), [PlayerEntity('p1', Color.RED),
+                                                     PlayerEntity('p2', Color.WHITE)], [])
+
+    # Place avatars along the top rows
+    for i in range(state.players_no * state.avatars_per_player):
+        state.place_avatar(state.player_order[i % state.players_no], Position(i // size, i % size))
+
+    return state
+
+
+def time_per_call(fn) -> float:
+    """
+    Returns the average time (in microseconds) a call to the given function takes.
+    """
+    return timeit.timeit(fn, number=REPETITIONS) / REPETITIONS * 1e6
+
+
+def copy_and_move(state: State, action) -> None:
+    """
+    Copies the given state and applies the given action to the copy, as a
+    GameTree does for each of its child nodes.
+    """
+    child = state.deepcopy()
+    child.move_avatar(*action)
+
+
+print(f'{"board":>8} {"deepcopy (us)":>15} {"copy + move (us)":>18} {"pickle (us)":>13}')
+
+for size in SIZES:
+    state = make_state(size)
+    action = state.get_possible_actions()[0]
+
+    print(f'{f"{size}x{size}":>8} '
+          f'{time_per_call(state.deepcopy):>15.1f} '
+          f'{time_per_call(lambda: copy_and_move(state, action)):>18.1f} '
+          f'{time_per_call(lambda: pickle.loads(pickle.dumps(state))):>13.1f}')
@@ -0,0 +1,72 @@
+#!/usr/bin/python3
+
+import sys
+import timeit
+
+sys.path.append('../')
+
+from board import Board
+from state import State
+from player_entity import PlayerEntity
+from color import Color
+from position import Position
+
+# Board sizes (rows = cols) to benchmark
+SIZES = [5, 10, 20]
+# Number of times each operation is timed
+REPETITIONS = 200
+
+
+def make_state(size: int) -> State:
+    """
+    Makes up a four-player state on a homogeneous size x size board on which no
+    avatars have been placed yet.
+
+    :param size: number of rows and cols to board
+    :return: resulting State object
+    """
+    return State(Board.homogeneous(2, size, size), [PlayerEntity('a', Color.RED),
+                                                    PlayerEntity('b', Color.BROWN),
+                                                    PlayerEntity('c', Color.WHITE),
+                                                    PlayerEntity('d', Color.BLACK)], [])
+
+
+def place_avatars(state: State) -> State:
+    """
+    Places all avatars on the given state by scanning the board for the first open
+    position row by row, as the strategy does.
+
+    :param state: state to place avatars on
+    :return: the given state
+    """
+    board = state.board
+
+    for i in range(state.players_no * state.avatars_per_player):
+        # Scan board for the first open position
+        pos = next(Position(row, col) for row in range(board.rows) for col in range(board.cols)
+                   if state.is_position_open(Position(row, col)))
+        state.place_avatar(state.player_order[i % state.players_no], pos)
+
+    return state
+
+
+def time_per_call(fn) -> float:
+    """
+    Returns the average time (in microseconds) a call to the given function takes.
+    """
+    return timeit.timeit(fn, number=REPETITIONS) / REPETITIONS * 1e6
+
+
+print(f'{"board":>8} {"backend":>10} {"placement (us)":>16} {"move generation (us)":>22}')
+
+for use_bitboard in [True, False]:
+    Board.USE_BITBOARD = use_bitboard
+
+    for size in SIZES:
+        placed_state = place_avatars(make_state(size))
+        # Make up fresh states up front so that placements are timed on their own
+        fresh_states = iter([make_state(size) for _ in range(REPETITIONS)])
+
+        print(f'{f"{size}x{size}":>8} {"bitboard" if use_bitboard else "dict":>10} '
+              f'{time_per_call(lambda: place_avatars(next(fresh_states))):>16.1f} '
+              f'{time_per_call(placed_state.get_possible_actions):>22.1f}')
@@ -0,0 +1,238 @@
+from position import Position
+from board_geometry import BoardGeometry
+
+
+class Bitboard(object):
+    """
+    PURPOSE:        The purpose of the bitboard is to provide a compact, integer-based representation of a
+                    board's tiles that allows straight line path queries to be answered using a handful of
+                    bitwise operations rather than by walking the board one tile at a time.
+
+    INTERPRETATION: Each position on a board of the given dimensions is mapped onto a single bit of an integer.
+                    The bit index of Position(row, col) is row * cols + col, which means that bit 0 represents
+                    the top-left position of the board and the last bit represents the bottom-right one. A set of
+                    positions (i.e. the tiles that have not yet been removed, or the positions occupied by avatars)
+                    is then simply an integer whose set bits are the bit indices of the positions in the set.
+
+                    For every position and every MovementDirection, the bitboard precomputes a ray: a bitmask
+                    holding all positions that lie in a straight line from said position in said direction (up until
+                    the edge of the board), along with the positions on the ray ordered by their distance from the
+                    starting position. Since moving towards the top of the board always lowers the bit index and
+                    moving towards the bottom always raises it, the nearest obstacle on any ray is either its highest
+                    (top directions) or its lowest (bottom directions) set bit. This allows the reachable part of a
+                    ray to be computed without traversing it.
+
+                    Rays only depend on the dimensions of the board and are therefore taken from the BoardGeometry
+                    shared by all boards of the same dimensions.
+    """
+
+    def __init__(self, rows: int, cols: int):
+        """
+        Initializes a bitboard of the given dimensions on which every position holds a tile.
+
+        :param rows: number of rows to board
+        :param cols: number of cols to board
+        :return: new Bitboard designed to spec
+        """
+        # Validate params
+        if not isinstance(rows, int) or rows <= 0:
+            raise ValueError('Expected int > 0 for rows!')
+
+        if not isinstance(cols, int) or cols <= 0:
+            raise ValueError('Expected int > 0 for cols!')
+
+        # Set fields
+        self.__rows = rows
+        self.__cols = cols
+
+        # Initialize mask of tiles to hold every position on the board
+        self.__tiles = (1 << (rows * cols)) - 1
+
+        # Retrieve geometry for the board's dimensions
+        self.__geometry = BoardGeometry.get(rows, cols)
+
+    @property
+    def rows(self) -> int:
+        """
+        Returns the number of rows on the bitboard.
+        """
+        return self.__rows
+
+    @property
+    def cols(self) -> int:
+        """
+        Returns the number of cols on the bitboard.
+        """
+        return self.__cols
+
+    @property
+    def tiles(self) -> int:
+        """
+        Returns the bitmask of positions that hold a tile (as opposed to a hole).
+        """
+        return self.__tiles
+
+    def copy(self) -> 'Bitboard':
+        """
+        Returns a copy of the bitboard. As masks are immutable ints, the copy
+        shares everything but itself with this bitboard.
+
+        :return: resulting Bitboard object
+        """
+        bitboard = Bitboard.__new__(Bitboard)
+        bitboard.__dict__.update(self.__dict__)
+        return bitboard
+
+    def contains(self, pos: Position) -> bool:
+        """
+        Tells whether the given position lies within the bounds of the bitboard.
+
+        :param pos: position to check
+        :return: boolean indicating whether the condition is fulfilled
+        """
+        return 0 <= pos[0] < self.__rows and 0 <= pos[1] < self.__cols
+
+    def bit(self, pos: Position) -> int:
+        """
+        Returns the bitmask with the sole bit of the given position set.
+
+        :param pos: position to retrieve bit for
+        :return: resulting bitmask
+        """
+        return 1 << (pos[0] * self.__cols + pos[1])
+
+    def mask(self, positions: [Position]) -> int:
+        """
+        Returns the bitmask with the bits of all the given positions set.
+
+        :param positions: collection of Position objects
+        :return: resulting bitmask
+        """
+        # Initialize empty mask
+        result = 0
+
+        # Set the bit of each position
+        for pos in positions:
+            result |= 1 << (pos[0] * self.__cols + pos[1])
+
+        return result
+
+    @staticmethod
+    def bits(mask: int):
+        """
+        Lazily yields the set bits of the given bitmask one at a time (lowest first), each as
+        a bitmask of its own.
+
+        :param mask: bitmask to split up
+        :return: generator of bitmasks
+        """
+        while mask:
+            # Isolate lowest set bit
+            bit = mask & -mask
+            yield bit
+            mask ^= bit
+
+    def remove_tile(self, pos: Position) -> None:
+        """
+        Clears the tile bit of the given position (i.e. marks it as a hole).
+
+        :param pos: position to remove tile at
+        :return: None
+        """
+        self.__tiles &= ~self.bit(pos)
+
+    def add_tile(self, pos: Position) -> None:
+        """
+        Sets the tile bit of the given position (i.e. marks it as holding a tile).
+
+        :param pos: position to add tile at
+        :return: None
+        """
+        self.__tiles |= self.bit(pos)
+
+    def reachable_mask(self, pos: Position, occupied: int = 0) -> int:
+        """
+        Returns the bitmask of all positions reachable via a straight line path from the given
+        position. A straight line path stops short of the first hole or occupied position.
+
+        :param pos: the starting position
+        :param occupied: bitmask of positions that block paths in addition to holes (i.e. avatars)
+        :return: resulting bitmask
+        """
+        return Bitboard.reach(self.__geometry.ray_masks[pos[0] * self.__cols + pos[1]], self.__tiles & ~occupied)
+
+    @staticmethod
+    def reach(rays: list, open_mask: int) -> int:
+        """
+        Returns the bitmask of all positions reachable along the given rays of a position when only
+        the positions of the given mask are open. This allows for reachability to be determined on
+        masks other than those of a bitboard (i.e. while simulating moves).
+
+        :param rays: list of tuples of ray mask and positions indexed by MovementDirection value (see
+                     BoardGeometry.ray_masks)
+        :param open_mask: bitmask of open positions
+        :return: resulting bitmask
+        """
+        # Initialize empty result
+        result = 0
+
+        # Cycle over rays in every direction
+        for direction, (ray, _) in enumerate(rays):
+            # Determine obstacles on the ray
+            blockers = ray & ~open_mask
+
+            # Entire ray is reachable if there are no obstacles
+            if not blockers:
+                result |= ray
+            elif direction < 3:
+                # Top direction: nearest obstacle is the highest bit; keep the bits above it
+                result |= ray & ~((1 << blockers.bit_length()) - 1)
+            else:
+                # Bottom direction: nearest obstacle is the lowest bit; keep the bits below it
+                result |= ray & ((blockers & -blockers) - 1)
+
+        return result
+
+    def reachable_positions(self, pos: Position, occupied: int = 0) -> [Position]:
+        """
+        Returns a list of all positions reachable via a straight line path from the given position. The
+        positions are ordered by direction (in the order of MovementDirection) and then by distance from
+        the starting position.
+
+        :param pos: the starting position
+        :param occupied: bitmask of positions that block paths in addition to holes (i.e. avatars)
+        :return: list of Position
+        """
+        # Determine positions that are open
+        open_mask = self.__tiles & ~occupied
+        # Initialize collection of reachable positions
+        reachable_positions = []
+
+        # Cycle over rays in every direction
+        for direction, (ray, positions) in enumerate(self.__geometry.ray_masks[pos[0] * self.__cols + pos[1]]):
+            # Determine obstacles on the ray
+            blockers = ray & ~open_mask
+
+            if not blockers:
+                # Entire ray is reachable
+                reachable_positions.extend(positions)
+            elif direction < 3:
+                # Top direction: count positions above the nearest obstacle
+                reachable_positions.extend(
+                    positions[:bin(ray & ~((1 << blockers.bit_length()) - 1)).count('1')])
+            else:
+                # Bottom direction: count positions below the nearest obstacle
+                reachable_positions.extend(positions[:bin(ray & ((blockers & -blockers) - 1)).count('1')])
+
+        return reachable_positions
+
+    def is_path_clear(self, src: Position, dst: Position, occupied: int = 0) -> bool:
+        """
+        Tells whether dst can be reached from src via a straight line path.
+
+        :param src: start position
+        :param dst: end position
+        :param occupied: bitmask of positions that block paths in addition to holes (i.e. avatars)
+        :return: boolean indicating whether the condition is fulfilled
+        """
+        return self.reachable_mask(src, occupied) & self.bit(dst) != 0
@@ -7,6 +7,8 @@ from abstract_tile import AbstractTile
 import tkinter as tk
 import itertools
 from movement_direction import MovementDirection
+from bitboard import Bitboard
+from board_geometry import BoardGeometry
 from exceptions.InvalidPositionException import InvalidPositionException
 from sprite_manager import SpriteManager
 
@@ -33,14 +35,30 @@ class Board(object):
                     to create an interlaced board layout where adjacent hexagons "lock" into each other. For a graphical
                     representation of this, please see the pictures in sprites/example_board.png.
 
-                    To determine which tiles are reachable from where, the board computes an edge list (a list of all
+                    To determine which tiles are reachable from where, the board uses an edge list (a list of all
                     the adjacent tiles each tile on the board can access across its 6 sides). The edge list is then
                     used to determine all the Position(s) (and therefore, tiles) that can be accessed in any given
-                    direction for a given Position.
+                    direction for a given Position. The edge list, along with precomputed straight line paths (rays)
+                    and the positions in-between any two aligned positions, only depends on the board's dimensions
+                    and is therefore held by a BoardGeometry shared by all boards of the same dimensions.
+
+                    Alternatively, if USE_BITBOARD is enabled at the time the board is created, the board
+                    mirrors its tiles and holes onto a Bitboard and answers straight line path queries with
+                    it instead of walking the edge list. Both approaches yield the same results.
+
+                    Boards are copied on write: a copy made via copy() shares the tiles dict of the board it was
+                    copied from, and each board records the tiles it removed (or restored) since then in an overlay
+                    of its own rather than in the shared dict. Copying a board therefore costs as much as the number
+                    of tiles changed since the shared dict was made, not as much as the size of the board. Once the
+                    overlay grows larger than MAX_OVERLAY_SIZE, the board folds it into a fresh dict of its own.
 
     """
     DISABLE_SPRITE_MANAGER = True
     RENDER_TILE_COORDINATES = True
+    # Initialize flag to indicate whether boards are to be backed by a Bitboard
+    USE_BITBOARD = True
+    # Initialize maximum number of removed tiles a board keeps apart from shared tiles
+    MAX_OVERLAY_SIZE = 64
 
     def __init__(self, tiles: dict):
         """
@@ -77,19 +95,56 @@ class Board(object):
 
         # Initialize tile container
         self.__tiles = tiles
+        # Initialize flag to indicate whether the tile container is shared with copies of the board
+        self.__tiles_shared = False
+        # Initialize dict of Position to AbstractTile for tiles changed since the tile container was shared
+        self.__overlay = {}
 
         # Set fields
         self.__rows = rows
         self.__cols = cols
         self.__tile_no = self.__rows * self.__cols
 
-        # Compute edge list for determining reachable positions.
+        # Retrieve shared geometry for the board's dimensions
+        self.__geometry = BoardGeometry.get(rows, cols)
+
+        # Retrieve edge list for determining reachable positions.
         self.__edge_list = self.__compute_reachable_edge_list()
 
+        # Initialize bitboard (if enabled) and carve out holes on it
+        self.__bitboard = None
+
+        if Board.USE_BITBOARD:
+            self.__bitboard = Bitboard(self.__rows, self.__cols)
+
+            for pos, tile in self.__tiles.items():
+                if tile.is_hole:
+                    self.__bitboard.remove_tile(pos)
+
         if not Board.DISABLE_SPRITE_MANAGER:
             # Loads sprites
             SpriteManager.load_sprites()
 
+    def __getstate__(self) -> dict:
+        """
+        Returns the picklable state of the board. The edge list is left out as it
+        is shared and can be recovered from the board's geometry, and the overlay is
+        folded into the tiles as the unpickled board will own them.
+        """
+        state = self.__dict__.copy()
+        del state['_Board__edge_list']
+        state['_Board__tiles'] = self.tiles
+        state['_Board__tiles_shared'] = False
+        state['_Board__overlay'] = {}
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """
+        Restores the board from its pickled state.
+        """
+        self.__dict__.update(state)
+        self.__edge_list = self.__compute_reachable_edge_list()
+
     @property
     def rows(self) -> int:
         """
@@ -116,7 +171,44 @@ class Board(object):
         """
         Returns immutable copy of tile collection.
         """
-        return self.__tiles.copy()
+        tiles = self.__tiles.copy()
+        tiles.update(self.__overlay)
+        return tiles
+
+    @property
+    def geometry(self) -> BoardGeometry:
+        """
+        Returns the (shared) geometry of the board.
+        """
+        return self.__geometry
+
+    @property
+    def bitboard(self) -> Bitboard:
+        """
+        Returns the Bitboard backing the board or None if the board is
+        not backed by one.
+        """
+        return self.__bitboard
+
+    def copy(self) -> 'Board':
+        """
+        Returns a copy of the board that shares its tile container with this board. Either
+        board records tiles removed from here on apart from the shared container.
+
+        :return: resulting Board object
+        """
+        # Mark tile container as shared so that neither board writes to it
+        self.__tiles_shared = True
+
+        # Make up copy without going through the constructor's validation
+        board = Board.__new__(Board)
+        board.__dict__.update(self.__dict__)
+        board.__overlay = self.__overlay.copy()
+
+        if self.__bitboard is not None:
+            board.__bitboard = self.__bitboard.copy()
+
+        return board
 
     @classmethod
     def min_oft_and_holes(cls, min_one_fish_tile_no: int, holes: [Position]):
@@ -241,10 +333,63 @@ class Board(object):
 
         # Check tile type
         if tile.is_tile:
-            self.__tiles.update({pt: Hole()})
+            self.__set_tile(pt, Hole())
+
+            # Mirror removal onto bitboard
+            if self.__bitboard is not None:
+                self.__bitboard.remove_tile(pt)
         else:
             raise ValueError('No tile at given location!')
 
+    def restore_tile(self, pt: Position, tile: Tile) -> None:
+        """
+        Puts the given tile back at the given position, which is expected to
+        hold a hole (i.e. a tile removed via remove_tile).
+
+        :param pt: position to restore tile at
+        :param tile: Tile object to restore
+        :return: None
+        """
+        # Validate params
+        if not isinstance(pt, Position):
+            raise ValueError('Expected Position object for pt!')
+
+        if not isinstance(tile, Tile):
+            raise ValueError('Expected Tile object for tile!')
+
+        # Make sure there is a hole at the given position
+        if not self.get_tile(pt).is_hole:
+            raise ValueError('No hole at given location!')
+
+        self.__set_tile(pt, tile)
+
+        # Mirror restoration onto bitboard
+        if self.__bitboard is not None:
+            self.__bitboard.add_tile(pt)
+
+    def __set_tile(self, pt: Position, tile: AbstractTile) -> None:
+        """
+        Sets the tile at the given position without altering the tile container
+        if it is shared with copies of the board.
+
+        :param pt: position to set tile at
+        :param tile: AbstractTile object to set
+        :return: None
+        """
+        if not self.__tiles_shared:
+            self.__tiles.update({pt: tile})
+        elif self.__tiles[pt] is tile:
+            # Tile matches the shared container again
+            self.__overlay.pop(pt, None)
+        elif len(self.__overlay) < Board.MAX_OVERLAY_SIZE:
+            self.__overlay.update({pt: tile})
+        else:
+            # Fold overlay into a tile container of our own
+            self.__tiles = self.tiles
+            self.__tiles.update({pt: tile})
+            self.__tiles_shared = False
+            self.__overlay = {}
+
     def get_tile(self, pt: Position) -> AbstractTile:
         """
         Returns the tile at the given point.
@@ -259,6 +404,10 @@ class Board(object):
         if pt not in self.__tiles.keys():
             raise InvalidPositionException('No tile exists at given position!')
 
+        # Tiles removed since the tile container was shared take precedence
+        if pt in self.__overlay:
+            return self.__overlay[pt]
+
         return self.__tiles.get(pt)
 
     def render(self, parent_frame: tk.Frame):
@@ -283,7 +432,7 @@ class Board(object):
                            height=total_height, width=total_width)
         canvas.place(x=0, y=0)
         # Render one tile at a time
-        for pt, tile in self.__tiles.items():
+        for pt, tile in self.tiles.items():
             # Determine x
             x = (0 if pt[0] % 2 == 0 else ct.DELTA) + (2 * ct.DELTA * pt[1])
             # Determine y
@@ -323,9 +472,13 @@ class Board(object):
         # Validate params
         if not isinstance(pos, Position):
             raise TypeError('Expected Position for pos.')
-        if pos not in self.tiles.keys():
+        if pos not in self.__tiles:
             raise ValueError('Expected pos to be a position on the game board.')
 
+        # Use bitboard if the board is backed by one
+        if self.__bitboard is not None:
+            return self.__bitboard.reachable_positions(pos)
+
         # Store reachable positions
         reachable_positions = []
 
@@ -357,103 +510,40 @@ class Board(object):
         if not isinstance(pos2, Position):
             raise TypeError('Expected Position for pos2')
 
-        # De-multiplex positions into x,y coordinates
-        x1, y1 = pos1
-        x2, y2 = pos2
-
         # No connecting points if the two are equal
         if pos1 == pos2:
             return []
 
-        # Determine direction
-        if y1 == y2:
-            if x2 > x1:
-                direction = MovementDirection.Bottom
-            else:
-                direction = MovementDirection.Top
-        elif y1 > y2:
-            if x1 == x2:
-                return []  # cannot move across corners
-            elif x1 > x2:
-                direction = MovementDirection.TopLeft
-            else:
-                direction = MovementDirection.BottomLeft
-        else:
-            if x2 > x1:
-                direction = MovementDirection.BottomRight
-            elif x1 > x2:
-                direction = MovementDirection.TopRight
-            else:
-                return []  # cannot move across corners
+        # Look up positions in-between the two (if they are aligned at all)
+        if not self.__geometry.is_in_line(pos1, pos2):
+            return []
 
-        # Retrieves all positions in said direction from pos1
-        positions = self.__find_straight_path(pos1, direction)
+        positions = self.__geometry.get_positions_between(pos1, pos2)
 
-        # Check if pos2 is among the points in direct line path
-        if pos2 in positions:
-            return positions[:positions.index(pos2)]
-        else:
+        # Make sure pos2 can be reached from pos1 without crossing a hole
+        if self.__bitboard is not None:
+            if not self.__bitboard.is_path_clear(pos1, pos2):
+                return []
+        elif any(self.get_tile(pos).is_hole for pos in positions) or self.get_tile(pos2).is_hole:
             return []
 
+        return list(positions)
+
     def __compute_reachable_edge_list(self) -> dict:
         """
         Return an edge dict for all of the tiles on the board. The graph in question
         is directed. Edges exist between all adjacent tiles, and each edge has a weight
         that represents the direction of said edge (i.e each weight is a MovementDirection)
 
-        Note that edges cannot be created between a hole and a tile, nor can they be created
-        between two holes.
-
         As an example, an edge between a starting tile A and its neighboring tile to the
         top left will have a weight of MovementDirection.TopLeft, or 0.
-        
+
+        The edge list is computed once per board dimensions and shared (see BoardGeometry).
+
         :return: a dict whose keys are Position objects representing positions
                  and whose values are dicts containing adjacent tiles with weights
         """
-        # Store the edges
-        edges = {}
-
-        # Compute a list of edges for all tiles on the board
-        for pos in self.tiles:
-            # Store the edges to adjacent tiles with directions as weights 
-            adjacent_tiles_dict = {}
-
-            # Current row/col position
-            row = pos[0]
-            col = pos[1]
-
-            # Locations of surrounding tiles
-            top_left = Position(row - 1, col - 1) if row % 2 == 0 else Position(row - 1, col)
-            top = Position(row - 2, col)
-            top_right = Position(row - 1, col) if row % 2 == 0 else Position(row - 1, col + 1)
-            bottom_right = Position(row + 1, col) if row % 2 == 0 else Position(row + 1, col + 1)
-            bottom = Position(row + 2, col)
-            bottom_left = Position(row + 1, col - 1) if row % 2 == 0 else Position(row + 1, col)
-
-            # For all possible directions, check if the computed position exists on the board
-            # and add to the current adjacent tiles dict with 
-            if top_left in self.tiles.keys():
-                adjacent_tiles_dict[MovementDirection.TopLeft] = top_left
-
-            if top in self.tiles.keys():
-                adjacent_tiles_dict[MovementDirection.Top] = top
-
-            if top_right in self.tiles.keys():
-                adjacent_tiles_dict[MovementDirection.TopRight] = top_right
-
-            if bottom_right in self.tiles.keys():
-                adjacent_tiles_dict[MovementDirection.BottomRight] = bottom_right
-
-            if bottom in self.tiles.keys():
-                adjacent_tiles_dict[MovementDirection.Bottom] = bottom
-
-            if bottom_left in self.tiles.keys():
-                adjacent_tiles_dict[MovementDirection.BottomLeft] = bottom_left
-
-            # Set the edges list for the current position
-            edges[pos] = adjacent_tiles_dict
-
-        return edges
+        return self.__geometry.edge_list
 
     def __find_straight_path(self, start_pos, direction) -> [Position]:
         """
@@ -484,7 +574,7 @@ class Board(object):
             next_pos = self.__edge_list.get(current_pos, {}).get(direction, None)
 
             # If the next tile in the path is a hole, break
-            if next_pos and self.tiles[next_pos].is_hole:
+            if next_pos and self.get_tile(next_pos).is_hole:
                 break
 
             # If there is a next position, append that position to the list
@@ -0,0 +1,235 @@
+from position import Position
+from movement_direction import MovementDirection
+
+
+class BoardGeometry(object):
+    """
+    PURPOSE:        The purpose of the board geometry is to hold all straight line path information that only
+                    depends on the dimensions of a board (and not on what tiles or holes it holds) so that it can
+                    be computed once and shared by all boards of the same dimensions.
+
+    INTERPRETATION: A BoardGeometry describes a board of a given number of rows and cols using the same coordinate
+                    system as the Board. For every position, it holds the positions adjacent to it in each
+                    MovementDirection (the edge list), and the ray in each MovementDirection: all positions lying
+                    in a straight line from said position in said direction up until the edge of the board, ordered
+                    by their distance from said position. Each ray is also available as a bitmask (see Bitboard for
+                    the mapping of positions to bits), as are the adjacent positions of each position.
+
+                    It also holds an alignment table that maps every pair of positions (A, B) where B lies on a ray
+                    of A onto the direction of said ray and the distance (in steps) from A to B. The positions in-between
+                    A and B are then simply the leading positions of A's ray in that direction. This makes it possible
+                    to tell whether B is on a line from A and what positions lie in-between with constant-time lookups.
+
+                    Geometries are retrieved via BoardGeometry.get(rows, cols), which computes the geometry for the
+                    given dimensions once and hands out the same instance from there on.
+    """
+    # Cache of geometries shared amongst boards; maps (rows, cols) to BoardGeometry
+    __CACHE = {}
+
+    def __init__(self, rows: int, cols: int):
+        """
+        Computes the geometry of a board of the given dimensions. Use BoardGeometry.get
+        to retrieve a shared instance instead.
+
+        :param rows: number of rows to board
+        :param cols: number of cols to board
+        :return: new BoardGeometry designed to spec
+        """
+        # Validate params
+        if not isinstance(rows, int) or rows <= 0:
+            raise ValueError('Expected int > 0 for rows!')
+
+        if not isinstance(cols, int) or cols <= 0:
+            raise ValueError('Expected int > 0 for cols!')
+
+        # Set fields
+        self.__rows = rows
+        self.__cols = cols
+
+        # Initialize dict of Position to dict of MovementDirection to adjacent Position
+        self.__edge_list = {}
+        # Initialize dict of (Position, MovementDirection) to tuple of Position making up the ray
+        self.__rays = {}
+        # Initialize list indexed by bit index of lists indexed by MovementDirection value, each
+        # holding a tuple of the ray's bitmask and the ray's positions
+        self.__ray_masks = []
+        # Initialize list indexed by bit index of the bitmask of positions adjacent to it
+        self.__adjacent_masks = []
+        # Initialize dict of (Position, Position) to tuple of (MovementDirection, distance)
+        self.__alignments = {}
+
+        self.__compute()
+
+    @classmethod
+    def get(cls, rows: int, cols: int) -> 'BoardGeometry':
+        """
+        Retrieves the shared geometry of a board of the given dimensions, computing
+        it if this is the first time it is asked for.
+
+        :param rows: number of rows to board
+        :param cols: number of cols to board
+        :return: BoardGeometry object
+        """
+        if (rows, cols) not in cls.__CACHE:
+            cls.__CACHE[(rows, cols)] = cls(rows, cols)
+
+        return cls.__CACHE[(rows, cols)]
+
+    def __reduce__(self):
+        """
+        Pickles the geometry by its dimensions so that unpickling it yields the
+        shared instance rather than a copy of its tables.
+        """
+        return BoardGeometry.get, (self.__rows, self.__cols)
+
+    @property
+    def rows(self) -> int:
+        """
+        Returns the number of rows of the geometry.
+        """
+        return self.__rows
+
+    @property
+    def cols(self) -> int:
+        """
+        Returns the number of cols of the geometry.
+        """
+        return self.__cols
+
+    @property
+    def edge_list(self) -> dict:
+        """
+        Returns the (shared) dict of Position to dict of MovementDirection to adjacent Position. It
+        is not to be mutated.
+        """
+        return self.__edge_list
+
+    @property
+    def ray_masks(self) -> list:
+        """
+        Returns the (shared) list of rays indexed by bit index and MovementDirection value, each held
+        as a tuple of the ray's bitmask and its positions ordered by distance. It is not to be mutated.
+        """
+        return self.__ray_masks
+
+    @property
+    def adjacent_masks(self) -> list:
+        """
+        Returns the (shared) list of bitmasks of the positions adjacent to a position indexed by the
+        position's bit index. It is not to be mutated.
+        """
+        return self.__adjacent_masks
+
+    def get_ray(self, pos: Position, direction: MovementDirection) -> tuple:
+        """
+        Returns the positions lying in a straight line from the given position in the given direction
+        ordered by their distance from it.
+
+        :param pos: starting position
+        :param direction: direction of the ray
+        :return: tuple of Position (empty if the starting position is not on the board)
+        """
+        return self.__rays.get((pos, direction), ())
+
+    def get_alignment(self, pos1: Position, pos2: Position) -> tuple:
+        """
+        Returns the direction and distance (in steps) of pos2 as seen from pos1 if pos2 lies
+        in a straight line from pos1.
+
+        :param pos1: first position
+        :param pos2: second position
+        :return: tuple of MovementDirection and int, or None if the positions are not aligned
+        """
+        return self.__alignments.get((pos1, pos2))
+
+    def is_in_line(self, pos1: Position, pos2: Position) -> bool:
+        """
+        Tells whether pos2 lies in a straight line from pos1.
+
+        :param pos1: first position
+        :param pos2: second position
+        :return: boolean indicating whether the condition is fulfilled
+        """
+        return (pos1, pos2) in self.__alignments
+
+    def get_positions_between(self, pos1: Position, pos2: Position) -> tuple:
+        """
+        Returns the positions lying in-between the given positions if they are aligned.
+
+        :param pos1: first position
+        :param pos2: second position
+        :return: tuple of Position ordered by distance from pos1 (empty if the positions
+                 are not aligned)
+        """
+        alignment = self.__alignments.get((pos1, pos2))
+
+        if alignment is None:
+            return ()
+
+        # The positions in-between are the ones preceding pos2 on pos1's ray
+        direction, distance = alignment
+        return self.__rays[(pos1, direction)][:distance - 1]
+
+    def __compute(self) -> None:
+        """
+        Computes the edge list, rays, ray masks, adjacent masks and alignments of the geometry.
+        """
+        for row in range(self.__rows):
+            for col in range(self.__cols):
+                pos = Position(row, col)
+                # Initialize adjacent positions and ray masks of current position
+                adjacent_positions = {}
+                position_ray_masks = []
+                adjacent_mask = 0
+
+                for direction in MovementDirection:
+                    # Initialize ray
+                    ray = []
+                    ray_mask = 0
+                    # Take the first step
+                    current = BoardGeometry.__step(pos, direction)
+
+                    # Keep stepping until we fall off the board
+                    while 0 <= current.x < self.__rows and 0 <= current.y < self.__cols:
+                        ray.append(current)
+                        ray_mask |= 1 << (current.x * self.__cols + current.y)
+                        # Record alignment of pos and current
+                        self.__alignments[(pos, current)] = (direction, len(ray))
+                        current = BoardGeometry.__step(current, direction)
+
+                    # Record neighbor in current direction (if any)
+                    if ray:
+                        adjacent_positions[direction] = ray[0]
+                        adjacent_mask |= 1 << (ray[0].x * self.__cols + ray[0].y)
+
+                    self.__rays[(pos, direction)] = tuple(ray)
+                    position_ray_masks.append((ray_mask, tuple(ray)))
+
+                self.__edge_list[pos] = adjacent_positions
+                self.__ray_masks.append(position_ray_masks)
+                self.__adjacent_masks.append(adjacent_mask)
+
+    @staticmethod
+    def __step(pos: Position, direction: MovementDirection) -> Position:
+        """
+        Returns the position adjacent to the given one in the given direction. Note that the
+        resulting position may not be on the board.
+
+        :param pos: position to step from
+        :param direction: direction to step in
+        :return: resulting Position
+        """
+        row, col = pos
+
+        if direction == MovementDirection.TopLeft:
+            return Position(row - 1, col - 1) if row % 2 == 0 else Position(row - 1, col)
+        elif direction == MovementDirection.Top:
+            return Position(row - 2, col)
+        elif direction == MovementDirection.TopRight:
+            return Position(row - 1, col) if row % 2 == 0 else Position(row - 1, col + 1)
+        elif direction == MovementDirection.BottomRight:
+            return Position(row + 1, col) if row % 2 == 0 else Position(row + 1, col + 1)
+        elif direction == MovementDirection.Bottom:
+            return Position(row + 2, col)
+        else:
+            return Position(row + 1, col - 1) if row % 2 == 0 else Position(row + 1, col)
@@ -0,0 +1,132 @@
+import pickle
+from collections import OrderedDict
+
+from action import Action
+
+
+class ChildCache(object):
+    """
+    PURPOSE:        The purpose of the child cache is to cap the memory taken up by the child nodes a GameTree
+                    (in BOUNDED RetentionPolicy) holds on to, across all of the tree's nodes.
+
+    INTERPRETATION: The cache keeps track of every child node held by a node of the tree it is shared by, in
+                    order of when said child was last reached through its parent. Once the number of nodes held
+                    exceeds max_nodes, or the estimated number of bytes they take up exceeds max_bytes, the least
+                    recently used node is dropped by its parent, along with the nodes below it. Either cap may be
+                    None, in which case it does not apply.
+
+                    The bytes taken up by a node are estimated as the size of its pickled state, as measured on the
+                    first node added to the cache. As states share their board and players until they are altered
+                    (see State.deepcopy), said estimate errs on the high side.
+
+                    The cache counts evictions (nodes dropped to make room for others) to allow for tuning its caps.
+    """
+
+    def __init__(self, max_nodes: int = None, max_bytes: int = None):
+        """
+        Initializes an empty child cache.
+
+        :param max_nodes: maximum number of child nodes held at any one time (or None)
+        :param max_bytes: maximum number of bytes held child nodes may take up at any one time (or None)
+        :return: new ChildCache designed to spec
+        """
+        # Validate params
+        if max_nodes is not None and (not isinstance(max_nodes, int) or max_nodes <= 0):
+            raise ValueError('Expected int > 0 or None for max_nodes!')
+
+        if max_bytes is not None and (not isinstance(max_bytes, int) or max_bytes <= 0):
+            raise ValueError('Expected int > 0 or None for max_bytes!')
+
+        if max_nodes is None and max_bytes is None:
+            raise ValueError('Expected at least one of max_nodes and max_bytes!')
+
+        # Set fields
+        self.__max_nodes = max_nodes
+        self.__max_bytes = max_bytes
+        # Initialize ordered dict of child GameTree to tuple of (parent GameTree, Action leading to child),
+        # least recently used first
+        self.__entries = OrderedDict()
+        # Initialize estimated number of bytes a node takes up (measured upon the first add)
+        self.__node_bytes = None
+        # Initialize counter of evictions
+        self.evictions = 0
+
+    @property
+    def max_nodes(self) -> int:
+        """
+        Returns the maximum number of child nodes held (or None).
+        """
+        return self.__max_nodes
+
+    @property
+    def max_bytes(self) -> int:
+        """
+        Returns the maximum number of bytes held child nodes may take up (or None).
+        """
+        return self.__max_bytes
+
+    @property
+    def nodes(self) -> int:
+        """
+        Returns the number of child nodes currently held.
+        """
+        return len(self.__entries)
+
+    @property
+    def bytes(self) -> int:
+        """
+        Returns the estimated number of bytes currently held child nodes take up.
+        """
+        return len(self.__entries) * (self.__node_bytes or 0)
+
+    def add(self, parent, move: Action, child) -> None:
+        """
+        Adds the given child node, reached from the given parent by the given move, to the cache as its
+        most recently used node, evicting the least recently used nodes if the cache is then over one of
+        its caps.
+
+        :param parent: GameTree holding the child
+        :param move: Action leading from parent to child
+        :param child: GameTree to add
+        :return: None
+        """
+        # Measure bytes taken up by a node upon first add
+        if self.__node_bytes is None:
+            self.__node_bytes = len(pickle.dumps(child.view.deepcopy()))
+
+        self.__entries[child] = (parent, move)
+
+        # Evict least recently used nodes (never the one just added) for as long as cache is over a cap
+        while len(self.__entries) > 1 and self.__is_over_cap():
+            lru_child, (lru_parent, lru_move) = next(iter(self.__entries.items()))
+            # Parent drops child along with the nodes below it (each of which is discarded from the cache)
+            lru_parent._GameTree__drop_child(lru_move)
+            self.evictions += 1
+
+    def touch(self, child) -> None:
+        """
+        Marks the given child node as the most recently used one.
+
+        :param child: GameTree held by the cache
+        :return: None
+        """
+        if child in self.__entries:
+            self.__entries.move_to_end(child)
+
+    def discard(self, child) -> None:
+        """
+        Discards the given child node from the cache (if held).
+
+        :param child: GameTree to discard
+        :return: None
+        """
+        self.__entries.pop(child, None)
+
+    def __is_over_cap(self) -> bool:
+        """
+        Returns whether the nodes held exceed either of the caps.
+        """
+        if self.__max_nodes is not None and len(self.__entries) > self.__max_nodes:
+            return True
+
+        return self.__max_bytes is not None and self.bytes > self.__max_bytes
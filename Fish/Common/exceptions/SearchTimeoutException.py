@@ -0,0 +1,12 @@
+class SearchTimeoutException(Exception):
+    """
+    An exception signaling that a search ran out of the time
+    it was given.
+    """
+    def __init__(self, msg=""):
+        """
+        Initializes exception.
+        :param msg: exception message
+        :return: new Exception object
+        """
+        super().__init__(msg)
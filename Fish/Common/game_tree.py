@@ -1,8 +1,21 @@
-import pickle
+import atexit
+import math
+import multiprocessing
+from multiprocessing.pool import ThreadPool
 
 from action import Action
+from board import Board
+from child_cache import ChildCache
 from exceptions.InvalidActionException import InvalidActionException
+from hole import Hole
+from player_entity import PlayerEntity
+from pool_kind import PoolKind
+from position import Position
+from position_table import PositionTable
+from retention_policy import RetentionPolicy
 from state import State
+from state_view import StateView
+from tile import Tile
 
 
 class GameTree(object):
@@ -20,10 +33,38 @@ class GameTree(object):
     DEFINITION(S): A a GameTree node is simply a GameTree with child GameTrees attached to it.
 
     The structure follows a lazy, generative design meaning that adjacent trees are not computed
-    until there is an explicit "need".
+    until there is an explicit "need". The same goes for the tree's possible actions: get_next yields
+    them as the state generates them, so that a traversal that stops early never pays for the full list.
+
+    How long child nodes are held on to once computed is determined by the tree's RetentionPolicy, which
+    is passed on to every node below it. By default, they are held for as long as the tree is around. A
+    NON_RETAINING tree computes its child nodes anew each time they are needed, which keeps a one-shot
+    depth-first traversal from holding more than the nodes along its path. A BOUNDED tree holds them in a
+    ChildCache shared by all of its nodes, which drops the least recently used ones once it fills up. The
+    child nodes held by a node may also be dropped explicitly (see prune).
+
+    As a game goes on, the tree may be re-rooted at the child node the move played leads to (see reroot),
+    which carries over the nodes already computed below it rather than making up a new tree.
+
+    If a PositionTable is given, the nodes of the tree are shared by all the orders of moves leading to the
+    same position (see PositionTable), which turns the tree into a directed acyclic graph. The state of such
+    a node holds the move log of the first order of moves it was reached by. As the nodes are held by the
+    table, a tree sharing its nodes holds on to all of its child nodes.
+
+    A function may also be applied to the child states in parallel (see apply_to_child_states_parallel),
+    on pools of threads or worker processes that are kept around across calls.
     """
+    # Initialize minimum number of child states to apply a function to in parallel (fewer are applied to
+    # serially, as handing them to a pool would take longer than applying the function)
+    PARALLEL_MIN_CHILDREN = 16
+    # Initialize number of chunks handed to each thread or worker process of a pool per call
+    CHUNKS_PER_WORKER = 4
+    # Initialize dict of (PoolKind, number of threads or worker processes, function) to pool (started upon
+    # first use); thread pools are shared among all functions and are keyed by None in their stead
+    __pools = {}
 
-    def __init__(self, state: State):
+    def __init__(self, state: State, retention_policy: RetentionPolicy = RetentionPolicy.RETAIN_ALL,
+                 cache: ChildCache = None, positions: PositionTable = None):
         """
         Initializes a barren GameTree with the given state. The tree's child
         nodes are not computed until get_next() is called. This constructor solely
@@ -31,37 +72,167 @@ class GameTree(object):
         a reference to the given game state.
 
         :param state: State object in which no more penguins will be placed
+        :param retention_policy: RetentionPolicy to hold on to child nodes by
+        :param cache: ChildCache to hold child nodes in (required by and only allowed for BOUNDED policy)
+        :param positions: PositionTable to share nodes through (only allowed for RETAIN_ALL policy)
         :return: resulting GameTree object
         """
         # Validate state
         if not isinstance(state, State):
             raise TypeError('Expected State object for state!')
 
+        if not isinstance(retention_policy, RetentionPolicy):
+            raise TypeError('Expected RetentionPolicy for retention_policy!')
+
+        if (retention_policy == RetentionPolicy.BOUNDED) != isinstance(cache, ChildCache):
+            raise ValueError('Expected ChildCache for cache with BOUNDED retention policy only!')
+
+        if positions is not None and not isinstance(positions, PositionTable):
+            raise TypeError('Expected PositionTable or None for positions!')
+
+        if positions is not None and retention_policy != RetentionPolicy.RETAIN_ALL:
+            raise ValueError('Expected RETAIN_ALL retention policy for positions!')
+
         # Initialize state
         self.__state = state
 
+        # Initialize policy to hold on to child nodes by and cache to hold them in (if bounded)
+        self.__retention_policy = retention_policy
+        self.__cache = cache
+
+        # Initialize table to share nodes through (if any)
+        self.__positions = positions
+
         # Initialize dictionary of Action objects to GameTree objects (nodes).
         # to hold subsequent game trees.
         self.__children = {}
 
-        # Get all possible actions for this tree's underlying state. It only includes
+        # Initialize all possible actions for this tree's underlying state. It only includes
         # actions that can be performed by the current player and that are legal
-        # under the rules of Fish.
-        self.__all_possible_actions = self.__state.get_possible_actions()
+        # under the rules of Fish. It is not determined until it is needed.
+        self.__all_possible_actions = None
+
+        # Initialize read-only view of the state. It is not made up until it is needed.
+        self.__view = None
+
+        # Add node to table to share it through
+        if positions is not None:
+            positions.add(self)
 
     @property
     def all_possible_actions(self):
         """
         Returns a copy of all possible actions (list of Action).
         """
-        return self.__all_possible_actions.copy()
+        return self.__get_all_possible_actions().copy()
+
+    def __get_all_possible_actions(self) -> [Action]:
+        """
+        Returns the list of all possible actions, determining it if this is the first
+        time it is needed.
+        """
+        if self.__all_possible_actions is None:
+            self.__all_possible_actions = self.__state.get_possible_actions()
+
+        return self.__all_possible_actions
 
     @property
     def state(self) -> State:
         """
-        Returns a copy of the GameState that the tree is based off of.
+        Returns a copy of the GameState that the tree is based off of (a mutable snapshot
+        for callers that wish to alter it).
         """
-        return pickle.loads(pickle.dumps(self.__state))
+        return self.__state.deepcopy()
+
+    @property
+    def view(self) -> StateView:
+        """
+        Returns a read-only view of the GameState that the tree is based off of. Unlike state,
+        it never copies the state, which makes it the one to query the state with.
+        """
+        # Make up view once it is first needed
+        if self.__view is None:
+            self.__view = StateView(self.__state)
+
+        return self.__view
+
+    @property
+    def retention_policy(self) -> RetentionPolicy:
+        """
+        Returns the policy the tree holds on to child nodes by.
+        """
+        return self.__retention_policy
+
+    @property
+    def children_no(self) -> int:
+        """
+        Returns the number of child nodes currently held by this node.
+        """
+        return len(self.__children)
+
+    def prune(self, keep: Action = None) -> None:
+        """
+        Drops the child nodes held by this node (and thereby the nodes below them), other than the one
+        the given action leads to (if any). Dropped nodes are computed anew once they are needed again.
+
+        :param keep: Action leading to the child node to hold on to (or None to drop them all)
+        :return: None
+        """
+        # Validate params
+        if keep is not None and not isinstance(keep, Action):
+            raise TypeError('Expected Action or None for keep!')
+
+        for move in [move for move in self.__children if move != keep]:
+            self.__drop_child(move)
+
+    def reroot(self, action: Action) -> 'GameTree':
+        """
+        Tries to perform the given action on the underlying state of the game tree, like try_action
+        does, but returns the child node it leads to (rather than a copy of its state) for said node to
+        take the place of this one as the root of the tree. Child nodes already computed below it are
+        carried over, whereas this node drops all of its child nodes. Throws InvalidActionException if
+        the action is illegal.
+
+        :param action: Action object representing move to make
+        :return: GameTree node for the resulting game state
+        """
+        # Validate parameters
+        if not isinstance(action, Action):
+            raise TypeError('Expected a Action object for action!')
+
+        # __get_node throws InvalidActionException() upon failure
+        child = self.__get_node(action)
+
+        # Drop siblings, then let go of child without dropping the nodes below it from the cache
+        self.prune(keep=action)
+        self.__children.pop(action, None)
+
+        if self.__cache is not None:
+            self.__cache.discard(child)
+
+        return child
+
+    def __drop_child(self, move: Action) -> None:
+        """
+        Drops the child node the given action leads to, discarding it along with the nodes below it
+        from the child cache (if any).
+
+        :param move: Action leading to child node held by this node
+        :return: None
+        """
+        child = self.__children.pop(move)
+
+        if self.__cache is not None:
+            child.__discard_from_cache()
+
+    def __discard_from_cache(self) -> None:
+        """
+        Discards this node along with the nodes below it from the child cache.
+        """
+        self.__cache.discard(self)
+
+        for child in self.__children.values():
+            child.__discard_from_cache()
 
     def __get_node(self, move: Action):
         """
@@ -77,37 +248,74 @@ class GameTree(object):
             raise TypeError('Expected Action for move!')
 
         # Make sure move is possible
-        if move not in self.__all_possible_actions:
+        if move not in self.__get_all_possible_actions():
             raise InvalidActionException()
 
-        # Crate child node for move if not in cache
-        if move not in self.__children:
-            # Make a copy of the state
-            subsequent_state: State = self.__state.deepcopy()
-            # Get move to make
-            src, dst = move
-            # Make move
-            subsequent_state.move_avatar(src, dst)
-            # Make up game tree for this child state
-            subsequent_gt = GameTree(subsequent_state)
-            # Cache child node
+        return self.__get_child(move)
+
+    def __get_child(self, move: Action):
+        """
+        Gets node from performing specified move, which is known to be possible, on this
+        game tree's underlying state. If the node does not exist, it is created.
+
+        :param move: Action object to perform
+        :return: game tree node
+        """
+        # Return from cache if held (marking it as recently used)
+        if move in self.__children:
+            subsequent_gt = self.__children[move]
+
+            if self.__cache is not None:
+                self.__cache.touch(subsequent_gt)
+
+            return subsequent_gt
+
+        # Make a copy of the state
+        subsequent_state: State = self.__state.deepcopy()
+        # Get move to make
+        src, dst = move
+        # Make move
+        subsequent_state.move_avatar(src, dst)
+        # Reuse node holding the same position if nodes are shared
+        subsequent_gt = self.__positions.get(subsequent_state) if self.__positions is not None else None
+
+        # Make up game tree for this child state otherwise
+        if subsequent_gt is None:
+            subsequent_gt = GameTree(subsequent_state, self.__retention_policy, self.__cache, self.__positions)
+
+        # Cache child node unless it is not to be held on to
+        if self.__retention_policy != RetentionPolicy.NON_RETAINING:
             self.__children.update({move: subsequent_gt})
 
-        # Return from cache
-        return self.__children[move]
+            if self.__cache is not None:
+                self.__cache.add(self, move, subsequent_gt)
+
+        return subsequent_gt
 
-    def get_next(self):
+    def get_next(self, key=None):
         """
-        Returns a generator that lazily yields the tree's next child nodes.
+        Returns a generator that lazily yields the tree's next child nodes. If a key is
+        provided, child nodes are yielded in ascending order of the key applied to their
+        actions (see State.generate_actions).
 
+        :param key: optional function of Action to comparable value to order child nodes by
         :return: a tuple made of an Action object and the GameTree node said action
                  results in when applied to the underlying state of the tree.
         """
+        # Validate params
+        if key is not None and not callable(key):
+            raise TypeError('Expected function or None for key!')
+
+        # Use all possible moves if they have been determined, or generate them as we go otherwise
+        if self.__all_possible_actions is not None:
+            moves = self.__all_possible_actions if key is None else sorted(self.__all_possible_actions, key=key)
+        else:
+            moves = self.__state.generate_actions(key)
 
         # Cycle over all possible moves from this node
-        for move in self.__all_possible_actions:
+        for move in moves:
             # Yield move along with resulting node
-            yield move, self.__get_node(move)
+            yield move, self.__get_child(move)
 
     def try_action(self, action: Action) -> State:
         """
@@ -141,3 +349,218 @@ class GameTree(object):
         # For each child, apply the function to child's underlying state and
         # append result to array
         return [fn(child_node.state) for move, child_node in self.get_next()]
+
+    def apply_to_child_states_parallel(self, fn, pool_kind: PoolKind = PoolKind.PROCESS, workers: int = None,
+                                       chunk_size: int = None):
+        """
+        Applies given function to all child states that are reachable from this game tree,
+        like apply_to_child_states does, but spreads the moves leading to them over a pool of
+        threads or worker processes in chunks of chunk_size, each of which makes up the child
+        states of its chunk by itself. Results are listed in the same order. If there are fewer
+        than PARALLEL_MIN_CHILDREN child states, the function is applied serially. No child
+        nodes are computed on this tree either way.
+
+        Threads are handed a copy of this node's state each. Worker processes are shipped the
+        function once, when the pool kept for it is started, and a compact encoding of the
+        position this node's state holds (see _encode_position) along with each chunk of moves.
+        Each worker process rebuilds the state from it once per position rather than once per
+        chunk. As the encoding leaves the move log out, the child states made up by worker
+        processes only log the moves leading to them. The function has to be picklable (i.e.
+        defined at module level) for PROCESS pools.
+
+        :param fn: function to apply
+        :param pool_kind: PoolKind of pool to apply the function on
+        :param workers: number of threads or worker processes of the pool (None for the number of CPUs)
+        :param chunk_size: number of child states per chunk (None to split them into CHUNKS_PER_WORKER
+                           chunks per worker)
+        :return: list of results of applying given function to all reachable
+                 states
+        """
+        # Validate parameters
+        if not callable(fn):
+            raise TypeError('Expected function for fn!')
+
+        if not isinstance(pool_kind, PoolKind):
+            raise TypeError('Expected PoolKind for pool_kind!')
+
+        if workers is not None and (not isinstance(workers, int) or workers <= 0):
+            raise ValueError('Expected int > 0 or None for workers!')
+
+        if chunk_size is not None and (not isinstance(chunk_size, int) or chunk_size <= 0):
+            raise ValueError('Expected int > 0 or None for chunk_size!')
+
+        moves = self.__get_all_possible_actions()
+
+        # Apply function serially if there are too few child states to make up for the pool's overhead
+        if len(moves) < GameTree.PARALLEL_MIN_CHILDREN:
+            return _apply_to_moves(fn, self.__state, moves)
+
+        workers = workers or multiprocessing.cpu_count()
+        chunk_size = chunk_size or math.ceil(len(moves) / (workers * GameTree.CHUNKS_PER_WORKER))
+        chunks = [moves[i:i + chunk_size] for i in range(0, len(moves), chunk_size)]
+
+        if pool_kind == PoolKind.THREAD:
+            # Hand each thread a copy of the state of its own to make up the child states of its chunk from
+            tasks = [(self.__state.deepcopy(), chunk) for chunk in chunks]
+            results = GameTree.__get_pool(pool_kind, workers).map(lambda task: _apply_to_moves(fn, *task), tasks)
+        else:
+            # Ship encoded position along with each chunk of moves (as bit indices) to the pool kept for fn
+            encoded_position = _encode_position(self.__state)
+            cols = self.__state.board.cols
+            tasks = [(encoded_position, [(src.x * cols + src.y, dst.x * cols + dst.y) for src, dst in chunk])
+                     for chunk in chunks]
+            results = GameTree.__get_pool(pool_kind, workers, fn).map(_apply_to_chunk, tasks)
+
+        return [result for chunk_results in results for result in chunk_results]
+
+    @staticmethod
+    def __get_pool(pool_kind: PoolKind, workers: int, fn=None):
+        """
+        Returns the pool of the given kind made up of the given number of threads or worker
+        processes, starting it if it has not been started yet. Worker processes are started
+        with the given function to apply to child states.
+
+        :param pool_kind: PoolKind of pool
+        :param workers: number of threads or worker processes of the pool
+        :param fn: function worker processes apply to child states (ignored for THREAD pools)
+        :return: ThreadPool or multiprocessing Pool
+        """
+        key = (pool_kind, workers, fn if pool_kind == PoolKind.PROCESS else None)
+
+        if key not in GameTree.__pools:
+            if pool_kind == PoolKind.THREAD:
+                GameTree.__pools[key] = ThreadPool(workers)
+            else:
+                GameTree.__pools[key] = multiprocessing.Pool(workers, _init_chunk_worker, (fn,))
+
+            # Make sure threads and worker processes are shut down along with this process
+            if len(GameTree.__pools) == 1:
+                atexit.register(GameTree.shutdown_pools)
+
+        return GameTree.__pools[key]
+
+    @staticmethod
+    def shutdown_pools() -> None:
+        """
+        Shuts down the pools of threads and worker processes apply_to_child_states_parallel
+        has started (they are restarted upon next use).
+
+        :return: None
+        """
+        for pool in GameTree.__pools.values():
+            pool.terminate()
+            pool.join()
+
+        GameTree.__pools.clear()
+        atexit.unregister(GameTree.shutdown_pools)
+
+
+# Function a worker process applies to child states, the encoded position it last rebuilt a state from,
+# said state and the number of columns of its board; all are only set in worker processes
+_worker_fn = None
+_worker_position = None
+_worker_state = None
+_worker_cols = None
+
+
+def _apply_to_moves(fn, state: State, moves: [Action]) -> list:
+    """
+    Applies a function to the child states the given moves lead to from the given state (see
+    GameTree.apply_to_child_states_parallel).
+
+    :param fn: function to apply
+    :param state: State to make the moves on copies of
+    :param moves: list of Action objects leading to the child states
+    :return: list of results of applying the function to the child states (in the order of moves)
+    """
+    results = []
+
+    for src, dst in moves:
+        child_state = state.deepcopy()
+        child_state.move_avatar(src, dst)
+        results.append(fn(child_state))
+
+    return results
+
+
+def _encode_position(state: State) -> tuple:
+    """
+    Encodes the position held by the given state compactly, i.e. as the number of columns of the
+    board, the number of fish of each tile as bytes (row by row, 0 for holes), the name, color,
+    score and avatar positions (as bit indices, see Bitboard) of each player in turn order and the
+    number of avatars each player started with (which players that have been removed count towards).
+
+    :param state: State to encode
+    :return: tuple of number of columns, bytes, tuple of player tuples and number of avatars per player
+    """
+    board = state.board
+    tiles = board.tiles
+    fish = bytes(tiles[Position(row, col)].fish_no for row in range(board.rows) for col in range(board.cols))
+    players = tuple((player.name, player.color, player.score,
+                     tuple(pos.x * board.cols + pos.y for pos in player.places)) for player in state.players)
+
+    return board.cols, fish, players, state.avatars_per_player
+
+
+def _decode_position(encoded_position: tuple) -> State:
+    """
+    Rebuilds a state holding the position encoded by _encode_position (with an empty move log).
+
+    :param encoded_position: tuple returned by _encode_position
+    :return: resulting State
+    """
+    cols, fish, players, avatars_per_player = encoded_position
+    board = Board({Position(*divmod(index, cols)): Tile(fish_no) if fish_no > 0 else Hole()
+                   for index, fish_no in enumerate(fish)})
+    player_entities = []
+
+    for name, color, score, places in players:
+        player = PlayerEntity(name, color)
+        player.score = score
+
+        for index in places:
+            player.add_place(Position(*divmod(index, cols)))
+
+        player_entities.append(player)
+
+    state = State(board, player_entities, [], avatars_per_player)
+    # Compute stuck players
+    state.can_anyone_move()
+    return state
+
+
+def _init_chunk_worker(fn) -> None:
+    """
+    Initializes a worker process of a pool used by GameTree.apply_to_child_states_parallel.
+
+    :param fn: function to apply to child states
+    :return: None
+    """
+    global _worker_fn
+
+    _worker_fn = fn
+
+
+def _apply_to_chunk(task: tuple) -> list:
+    """
+    Applies the function of a worker process to a chunk of the child states of the state holding
+    the given encoded position (see GameTree.apply_to_child_states_parallel). The state is only
+    rebuilt if the position differs from the one of the chunk this worker process handled last.
+
+    :param task: tuple of encoded position (see _encode_position) and list of moves (as tuples of src
+                 and dst bit index) leading to the child states
+    :return: list of results of applying the function to the child states (in the order of moves)
+    """
+    global _worker_position, _worker_state, _worker_cols
+
+    encoded_position, encoded_moves = task
+
+    if encoded_position != _worker_position:
+        _worker_position = encoded_position
+        _worker_state = _decode_position(encoded_position)
+        _worker_cols = encoded_position[0]
+
+    moves = [Action(Position(*divmod(src, _worker_cols)), Position(*divmod(dst, _worker_cols)))
+             for src, dst in encoded_moves]
+
+    return _apply_to_moves(_worker_fn, _worker_state, moves)
@@ -36,6 +36,18 @@ class PlayerEntity(object):
         # the player's avatars live
         self.__places = []
 
+    def copy(self) -> 'PlayerEntity':
+        """
+        Returns a copy of the player entity that can be altered without
+        affecting this one.
+
+        :return: resulting PlayerEntity object
+        """
+        player = PlayerEntity(self.__name, self.__color)
+        player.__score = self.__score
+        player.__places = self.__places.copy()
+        return player
+
     def add_place(self, pos: Position):
         """
         Adds an avatar position to player's places array.
@@ -0,0 +1,11 @@
+from enum import Enum
+
+
+class PoolKind(Enum):
+    """
+    Represents the kind of pool a GameTree applies a function to its child states on in parallel:
+    either a pool of threads (sharing the states, which suits functions that release the GIL or
+    wait on I/O) or a pool of worker processes (to which the states are shipped).
+    """
+    THREAD = 0
+    PROCESS = 1
@@ -0,0 +1,97 @@
+class PositionTable(object):
+    """
+    PURPOSE:        The purpose of the position table is to let the nodes of a GameTree be shared by all the orders
+                    of moves that lead to the same game position, which turns the tree into a directed acyclic graph
+                    holding a single node (and a single State) per position.
+
+    INTERPRETATION: The table maps the key of a state to the GameTree node holding said state. The key is made up
+                    of the state's position hash (see State.position_hash), the order the players take turns in and
+                    the players' scores, as the position hash does not cover the latter. Two states holding the same
+                    position are therefore told apart by nothing but their move logs.
+
+                    A node is added to the table as it is made up, and a node about to make up a child node for a
+                    state looks the state up in the table first, reusing the node found there. As different positions
+                    may share a position hash, a node found under the key of a state is only reused if it holds the
+                    same tiles (fish per position) and the same avatar placements as the state; otherwise the look-up
+                    counts as a collision and finds nothing. The table counts the merges (look-ups that found a node)
+                    and collisions to allow for telling how many nodes it saved.
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty position table.
+
+        :return: new PositionTable designed to spec
+        """
+        # Initialize dict of key to GameTree node
+        self.__nodes = {}
+        # Initialize counters of merges and collisions
+        self.merges = 0
+        self.collisions = 0
+
+    @property
+    def nodes(self) -> int:
+        """
+        Returns the number of nodes held by the table.
+        """
+        return len(self.__nodes)
+
+    @staticmethod
+    def get_key(state) -> tuple:
+        """
+        Returns the key of the given state, which it shares with all states holding the same position.
+
+        :param state: State (or StateView) to get key of
+        :return: tuple of position hash, turn order and scores
+        """
+        player_order = tuple(state.player_order)
+        return state.position_hash, player_order, tuple(state.get_player_score(color) for color in player_order)
+
+    def get(self, state):
+        """
+        Returns the node holding the same position as the given state, or None if there is none.
+
+        :param state: State to look up
+        :return: GameTree node or None
+        """
+        node = self.__nodes.get(PositionTable.get_key(state))
+
+        if node is None:
+            return None
+
+        # Make sure the node holds the very same position rather than one sharing its hash
+        if not PositionTable.__is_same_position(node.view, state):
+            self.collisions += 1
+            return None
+
+        self.merges += 1
+        return node
+
+    @staticmethod
+    def __is_same_position(state1, state2) -> bool:
+        """
+        Tells whether the given states hold the same tiles and the same avatar placements.
+
+        :param state1: State (or StateView) to compare
+        :param state2: State (or StateView) to compare to
+        :return: boolean indicating whether they hold the same position
+        """
+        placements1, placements2 = state1.placements, state2.placements
+
+        if placements1.keys() != placements2.keys() \
+                or any(set(places) != set(placements2[color]) for color, places in placements1.items()):
+            return False
+
+        tiles1, tiles2 = state1.board.tiles, state2.board.tiles
+        return tiles1.keys() == tiles2.keys() and all(tile.fish_no == tiles2[pos].fish_no
+                                                      for pos, tile in tiles1.items())
+
+    def add(self, node) -> None:
+        """
+        Adds the given node to the table under the key of its state (unless a node is already held
+        under said key).
+
+        :param node: GameTree node to add
+        :return: None
+        """
+        self.__nodes.setdefault(PositionTable.get_key(node.view), node)
@@ -0,0 +1,13 @@
+from enum import Enum
+
+
+class RetentionPolicy(Enum):
+    """
+    Represents the way a GameTree holds on to the child nodes it expands: either keep every
+    one of them for as long as the tree is around, keep none of them (so that a one-shot
+    depth-first traversal only holds the nodes along its path), or keep them in a ChildCache
+    shared by the whole tree that evicts the least recently used ones once it fills up.
+    """
+    RETAIN_ALL = 0
+    NON_RETAINING = 1
+    BOUNDED = 2
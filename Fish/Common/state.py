@@ -1,10 +1,11 @@
 import copy
-import pickle
+import heapq
 import tkinter as tk
 from collections import deque
 
 import constants as ct
 from action import Action
+from bitboard import Bitboard
 from board import Board
 from color import Color
 from exceptions.InvalidActionException import InvalidActionException
@@ -15,6 +16,7 @@ from exceptions.UnclearPathException import UnclearPathException
 from player_entity import PlayerEntity
 from position import Position
 from sprite_manager import SpriteManager
+from zobrist_keys import ZobristKeys
 
 
 class State(object):
@@ -29,7 +31,23 @@ class State(object):
                     by way of the 'places' member of a Player object, which contains Position
                     objects describing where each of the player's avatars are located. These
                     locations along with the information provided by the Board determine the
-                    placements and moves that can be performed.
+                    placements and moves that can be performed. To tell whether a position is occupied
+                    without looking through every player's places, the state also keeps an occupancy index
+                    that maps each occupied Position onto the color of the player whose avatar stands on it
+                    (along with a bitmask of said positions), which it updates as avatars are placed, moved
+                    and removed.
+
+                    An avatar can move if and only if at least one of the tiles adjacent to it is open (neither
+                    a hole nor occupied by another avatar), as every straight line path starts with an adjacent
+                    tile. The state therefore keeps the number of open adjacent tiles of every avatar (its
+                    mobility) and, whenever a position changes, only recounts it for the avatars at or next to
+                    said position. This makes telling whether a player is stuck a matter of looking up the
+                    mobility of its avatars rather than of generating their moves.
+
+                    Lastly, the state keeps a Zobrist hash (see ZobristKeys) of its tiles, holes and avatars,
+                    which it updates in constant time as avatars are placed, moved and removed. Combined with the
+                    player to move, it makes up the position hash, which is the same for any two states holding
+                    the same position no matter the moves that led to them (scores are not part of it).
 
                     The State expects a list of players sorted by age in the beginning, which it
                     then rotates throughout the game to allow the next movable player to go. A
@@ -42,15 +60,30 @@ class State(object):
                     On a different note, the state provides the tooling necessary to query whose turn it is,
                     whether any moves are possibles or if all avatars have been placed. This allows for a
                     referee to properly run a game and end it when needed.
+
+                    States are copied on write: a copy made via deepcopy() shares the board storage and the
+                    PlayerEntity objects of the state it was copied from. The board records removed tiles apart
+                    from the shared storage (see Board), and a state copies a PlayerEntity the first time it
+                    alters it after having been copied, so that neither state observes the other's changes. A copy
+                    of a state with moves left to undo gets PlayerEntity objects of its own right away instead, as
+                    undoing said moves reverts the PlayerEntity objects they altered in place.
+
+                    Moves made via apply_action are recorded on an undo stack and can be taken back in reverse
+                    order via undo_action, which restores the removed tile, the player's score and avatar position,
+                    the turn order and the stuck player cache as they were before the move. This allows a search
+                    to explore moves on a single mutable state rather than on copies of it. Moves made via
+                    move_avatar, placements and player removals cannot be undone and discard the undo stack.
     """
 
-    def __init__(self, board: Board, players: [PlayerEntity], move_log: [Action] = []):
+    def __init__(self, board: Board, players: [PlayerEntity], move_log: [Action] = [],
+                 avatars_per_player: int = None):
         """
         Initializes a State object with the given board and player list.
 
         :param board: Board object
         :param players: list of Player objects
         :param move_log: log of moves that have occurred in the game
+        :param avatars_per_player: number of avatars each player started with (None for 6 - number of players)
         :return: new State object designed to spec
         """
         # Validate params
@@ -71,6 +104,10 @@ class State(object):
         if any(player_colors.count(color) > 1 for color in player_colors):
             raise ValueError('Player colors must unique!')
 
+        # Make sure avatars_per_player is None or a positive int
+        if avatars_per_player is not None and (not isinstance(avatars_per_player, int) or avatars_per_player <= 0):
+            raise ValueError('Expected int > 0 or None for avatars_per_player!')
+
         # Initialize players to list of players arranged in the order they go. This list encompasses
         # the players along with their name, color and penguin placements (expressed using Position objects).
         self.__players = players
@@ -82,7 +119,7 @@ class State(object):
         self.__all_possible_actions_cache = []
 
         # Determine # no avatars per player
-        self.__avatars_per_player = 6 - len(players)
+        self.__avatars_per_player = avatars_per_player if avatars_per_player is not None else 6 - len(players)
 
         # Make up log of moves that have been made since the beginning
         # of the game
@@ -91,22 +128,81 @@ class State(object):
         # Make up cache of stuck player colors
         self.__player_stuck_cache = []
 
+        # Make up set of colors of players whose PlayerEntity this state does not share
+        # with any copy of it (and may therefore alter in place)
+        self.__owned_player_colors = set(player_colors)
+
+        # Initialize stack of records of moves made via apply_action that can be undone
+        self.__undo_stack = []
+
+        # Initialize Zobrist hash of the board's tiles and holes (avatars are hashed in as
+        # they are added to the occupancy index)
+        self.__zobrist_keys = ZobristKeys.get(board.rows, board.cols)
+        self.__zobrist_hash = 0
+
+        # Initialize dict of number of fish to bitmask of the tiles holding said number of fish (tiles
+        # are only ever removed and restored, hence the masks hold every tile the board will ever have)
+        fish_masks = {}
+
+        for pos, tile in board.tiles.items():
+            self.__zobrist_hash ^= self.__zobrist_keys.tile(pos, tile.fish_no if tile.is_tile else 0)
+
+            if tile.is_tile:
+                fish_masks[tile.fish_no] = fish_masks.get(tile.fish_no, 0) | (1 << (pos.x * board.cols + pos.y))
+
+        # Keep masks as a list of (number of fish, bitmask) tuples, richest tiles first
+        self.__fish_masks = sorted(fish_masks.items(), reverse=True)
+
+        # Initialize occupancy index (dict of Position to color of the player whose avatar is
+        # placed on it) and bitmask of occupied positions (see Bitboard for the mapping of positions
+        # to bits) from the players' places
+        self.__occupancy = {}
+        self.__occupied_mask = 0
+
+        for player in players:
+            for pos in player.places:
+                self.__occupy(pos, player.color)
+
+        # Initialize dict of avatar Position to number of open tiles adjacent to it
+        self.__mobility = {}
+        self.__refresh_mobility(self.__occupancy.keys())
+
     def deepcopy(self) -> 'State':
         """
-        Returns a 'deep-copy' of the state.
-
-        Note: move_log contents are lost in the copy process and
-        the resulting copy will not have the contents of the original.
+        Returns a 'deep-copy' of the state. The copy shares the board storage and the PlayerEntity
+        objects of this state until either state alters them (see class description), which is
+        why PlayerEntity objects retrieved via get_player_by_color are not to be altered.
         """
-        # Copy board
-        board: Board = pickle.loads(pickle.dumps(self.__board))
-        # Copy players
-        players: [PlayerEntity] = pickle.loads(pickle.dumps(self.__players))
-        # Copy of move log
-        move_log: [Action] = self.move_log
-
-        # Return new copy of state
-        return State(board, players, move_log)
+        # Make up copy without going through the constructor's validation
+        state = State.__new__(State)
+
+        if self.__undo_stack:
+            # Undoing moves may revert player entities in place (which the turn orders recorded on the
+            # undo stack rely on), hence the copy gets player entities of its own
+            state.__players = [player.copy() for player in self.__players]
+            state.__owned_player_colors = {player.color for player in state.__players}
+        else:
+            # Both states share all player entities from here on
+            self.__owned_player_colors = set()
+            state.__players = self.__players.copy()
+            state.__owned_player_colors = set()
+
+        state.__board = self.__board.copy()
+        # The actions cache is replaced rather than altered, hence it can be shared
+        state.__all_possible_actions_cache = self.__all_possible_actions_cache
+        state.__avatars_per_player = self.__avatars_per_player
+        state.__move_log = self.__move_log.copy()
+        state.__player_stuck_cache = self.__player_stuck_cache.copy()
+        state.__occupancy = self.__occupancy.copy()
+        state.__occupied_mask = self.__occupied_mask
+        state.__mobility = self.__mobility.copy()
+        state.__zobrist_keys = self.__zobrist_keys
+        state.__zobrist_hash = self.__zobrist_hash
+        state.__fish_masks = self.__fish_masks
+        # Moves made before the copy cannot be undone on it
+        state.__undo_stack = []
+
+        return state
 
     @property
     def stuck_players(self) -> [int]:
@@ -117,6 +213,25 @@ class State(object):
         """
         return self.__player_stuck_cache.copy()
 
+    @property
+    def occupied_mask(self) -> int:
+        """
+        Returns the bitmask of positions occupied by an avatar (see Bitboard for the mapping of
+        positions to bits).
+        """
+        return self.__occupied_mask
+
+    @property
+    def position_hash(self) -> int:
+        """
+        Returns the 64-bit Zobrist hash of the position held by the state: its tiles and
+        holes, the avatars of each player and the player whose turn it is.
+        """
+        if len(self.__players) == 0:
+            return self.__zobrist_hash
+
+        return self.__zobrist_hash ^ self.__zobrist_keys.side_to_move(self.__players[0].color)
+
     @property
     def avatars_per_player(self) -> int:
         """
@@ -137,7 +252,7 @@ class State(object):
         """
         Returns a copy of the state's list of PlayerEntity objects.
         """
-        return pickle.loads(pickle.dumps(self.__players))
+        return [player.copy() for player in self.__players]
 
     @property
     def move_log(self) -> []:
@@ -152,7 +267,7 @@ class State(object):
         """
         Returns an immutable copy of the board.
         """
-        return pickle.loads(pickle.dumps(self.__board))
+        return self.__board.copy()
 
     @property
     def placements(self) -> []:
@@ -188,8 +303,15 @@ class State(object):
         # Cycle over players until one matching color is found
         for player in self.__players:
             if player.color == color:
-                # Remove player
+                # Remove player and free up the positions of its avatars
                 self.__players.remove(player)
+
+                for pos in player.places:
+                    self.__vacate(pos)
+
+                self.__refresh_mobility(player.places)
+                # Discard undo records as they do not account for the removal
+                self.__undo_stack = []
                 # Recompute stuck players
                 self.can_anyone_move()
                 return
@@ -208,14 +330,96 @@ class State(object):
         if len(self.__players) == 0:
             return []
 
-        # Initialize collection of possible moves
-        possible_moves = []
+        # Make up collection of possible moves
+        possible_moves = list(self.__generate_actions())
+
+        # Set cache
+        self.__all_possible_actions_cache = possible_moves
+
+        return possible_moves
+
+    def generate_actions(self, key=None, color: Color = None):
+        """
+        Returns a generator that lazily yields all possible moves for the current player (or the player
+        of the given color, regardless of whose turn it is). Moves are
+        yielded in the same order get_possible_actions lists them in unless a key is provided, in which
+        case they are yielded in ascending order of the key (ties are broken by the former order). For
+        example, key=lambda action: -board.get_tile(action.dst).fish_no yields moves onto tiles with the
+        most fish first.
+
+        Without a key, the moves of each avatar are only determined once the moves of the previous avatar
+        have been consumed. With a key, all moves are determined upfront, yet they are only ordered as
+        they are consumed. The state is not to be altered while the generator is in use (unless it is
+        restored via undo_action before the generator is resumed).
+
+        :param key: optional function of Action to comparable value to order moves by
+        :param color: optional color of player whose moves to yield (None for the current player)
+        :return: generator of Action objects
+        """
+        # Validate params
+        if key is not None and not callable(key):
+            raise TypeError('Expected function or None for key!')
+
+        if color is not None and not isinstance(color, Color):
+            raise TypeError('Expected Color or None for color!')
+
+        if color is not None and color not in self.player_order:
+            raise NonExistentPlayerException()
+
+        if key is None:
+            return self.__generate_actions(color)
+
+        return self.__generate_ordered_actions(key, color)
+
+    def count_possible_actions(self) -> int:
+        """
+        Returns the number of possible moves for the current player without
+        making up said moves.
+
+        :return: number of possible moves
+        """
+        # if there are no more players
+        if len(self.__players) == 0:
+            return 0
+
+        # Retrieve bitboard backing the board (if any)
+        bitboard = self.__board.bitboard
+
+        if bitboard is not None:
+            # Count positions reachable from each avatar position
+            return sum(bin(bitboard.reachable_mask(position, self.__occupied_mask)).count('1')
+                       for position in self.get_player_by_color(self.current_player).places)
+
+        return sum(1 for _ in self.__generate_actions())
+
+    def __generate_actions(self, color: Color = None):
+        """
+        Lazily yields all possible moves for the current player (or the player of the given color),
+        one avatar at a time.
+
+        :param color: color of player whose moves to yield (None for the current player)
+        :return: generator of Action objects
+        """
+        # if there are no more players
+        if len(self.__players) == 0:
+            return
 
         # Get player's placements
-        player_placements = self.get_player_by_color(self.current_player).places
+        player_placements = self.get_player_by_color(self.current_player if color is None else color).places
+
+        # Retrieve bitboard backing the board (if any)
+        bitboard = self.__board.bitboard
 
         # Cycle over each avatar position
         for position in player_placements:
+            if bitboard is not None:
+                # Create possible move for every position that can be reached without crossing
+                # a hole or an avatar
+                for pos in bitboard.reachable_positions(position, self.__occupied_mask):
+                    yield Action(position, pos)
+
+                continue
+
             # Determine all reachable positions for avatar_pos
             reachable_positions = self.__board.get_reachable_positions(position)
 
@@ -226,12 +430,25 @@ class State(object):
                 if not self.__is_path_clear(position, pos, reachable_positions):
                     continue
 
-                possible_moves.append(Action(position, pos))
+                yield Action(position, pos)
 
-        # Set cache
-        self.__all_possible_actions_cache = possible_moves
+    def __generate_ordered_actions(self, key, color: Color = None):
+        """
+        Lazily yields all possible moves for the current player (or the player of the given color)
+        in ascending order of the given key (see generate_actions).
 
-        return possible_moves
+        :param key: function of Action to comparable value to order moves by
+        :param color: color of player whose moves to yield (None for the current player)
+        :return: generator of Action objects
+        """
+        # Make up heap of moves keyed by the given key and their original index, which
+        # breaks ties between moves of the same key
+        heap = [(key(action), index, action) for index, action in enumerate(self.__generate_actions(color))]
+        heapq.heapify(heap)
+
+        # Pop moves as they are consumed
+        while heap:
+            yield heapq.heappop(heap)[2]
 
     def __trigger_next_turn(self, initial_shift=1):
         """
@@ -268,6 +485,16 @@ class State(object):
         # Update actual players collection
         self.__players = list(players_deque)
 
+    def __rotate_players_to(self, color: Color) -> None:
+        """
+        Rotates the player order so that the player of the given color goes first.
+
+        :param color: color of player to go first
+        :return: None
+        """
+        index = self.player_order.index(color)
+        self.__players = self.__players[index:] + self.__players[:index]
+
     @property
     def player_order(self):
         """
@@ -296,6 +523,25 @@ class State(object):
 
         raise NonExistentPlayerException()
 
+    def __get_owned_player(self, color: Color) -> PlayerEntity:
+        """
+        Retrieves the PlayerEntity object by the provided color for it to be altered. If the
+        object is shared with a copy of this state, it is replaced by a copy of its own first.
+
+        :param color: color of player to retrieve
+        :return: PlayerEntity object
+        """
+        player = self.get_player_by_color(color)
+
+        # Copy player if it is shared
+        if color not in self.__owned_player_colors:
+            player_copy = player.copy()
+            self.__players[self.__players.index(player)] = player_copy
+            self.__owned_player_colors.add(color)
+            return player_copy
+
+        return player
+
     def get_player_score(self, color: Color) -> int:
         """
         Gets provided player's score or throws
@@ -326,6 +572,64 @@ class State(object):
 
         return self.get_player_by_color(color).places
 
+    def get_score_upper_bound(self, color: Color, moves: int = None) -> int:
+        """
+        Determines an upper bound on the score the player of the given color can end up with by
+        making at most the given number of moves: its current score plus the fish on the richest
+        tiles its avatars could ever collect, one tile per move. An avatar collects the tile it moves
+        away from, and it can only ever stand on the tiles connected to its own via adjacent tiles
+        that are not occupied by an avatar of another player (see BoardGeometry), as avatars never
+        move across holes or other avatars and the tiles they leave behind are removed.
+
+        :param color: color of player whose score to bound
+        :param moves: number of moves the player is to make (None for as many as it can)
+        :return: resulting bound
+        """
+        # Validate params
+        if not isinstance(color, Color):
+            raise TypeError('Expected Color for color!')
+
+        if moves is not None and (not isinstance(moves, int) or moves < 0):
+            raise ValueError('Expected int >= 0 for moves!')
+
+        cols = self.__board.cols
+        bitboard = self.__board.bitboard
+        tiles = bitboard.tiles if bitboard is not None else \
+            sum(1 << (pos.x * cols + pos.y) for pos, tile in self.__board.tiles.items() if tile.is_tile)
+        adjacent_masks = self.__board.geometry.adjacent_masks
+        avatars = 0
+
+        for pos in self.get_player_positions(color):
+            avatars |= 1 << (pos.x * cols + pos.y)
+
+        # Flood region from the player's avatars across tiles not occupied by other avatars
+        passable = tiles & ~(self.__occupied_mask & ~avatars)
+        region = avatars
+        frontier = avatars
+
+        while frontier:
+            reached = 0
+
+            for bit in Bitboard.bits(frontier):
+                reached |= adjacent_masks[bit.bit_length() - 1]
+
+            frontier = reached & passable & ~region
+            region |= frontier
+
+        # Collect the richest tiles of the region until the moves run out
+        bound = self.get_player_score(color)
+        moves_left = bin(region).count('1') if moves is None else moves
+
+        for fish_no, mask in self.__fish_masks:
+            if moves_left == 0:
+                break
+
+            count = min(bin(region & mask).count('1'), moves_left)
+            bound += count * fish_no
+            moves_left -= count
+
+        return bound
+
     def place_avatar(self, color: Color, position: Position) -> None:
         """
         Places an avatar on behalf of the given player color at
@@ -353,7 +657,11 @@ class State(object):
             raise NonExistentPlayerException()
 
         # Update placement to reflect updated avatar's position
-        self.get_player_by_color(color).add_place(position)
+        self.__get_owned_player(color).add_place(position)
+        self.__occupy(position, color)
+        self.__refresh_mobility([position])
+        # Discard undo records as they do not account for the placement
+        self.__undo_stack = []
 
         if self.__all_avatars_have_been_placed:
             # Proceed to the next unstuck player
@@ -388,11 +696,7 @@ class State(object):
             return False
 
         # Check if an avatar is at position
-        for placement_arr in self.placements.values():
-            if position in placement_arr:
-                return False
-
-        return True
+        return position not in self.__occupancy
 
     def move_avatar(self, src: Position, dst: Position) -> None:
         """
@@ -403,6 +707,113 @@ class State(object):
         :param dst: position to which to move player's avatar
         :return: None
         """
+        self.__move_avatar(src, dst)
+        # Discard undo records as this move cannot be undone
+        self.__undo_stack = []
+
+    def apply_action(self, action: Action, next_player: Color = None) -> None:
+        """
+        Moves an avatar on behalf of the current player as per the given action (see move_avatar)
+        and records what it takes to undo the move on the undo stack.
+
+        If next_player is given, the avatar may belong to any player (not just the current one), and
+        the turn goes to next_player once the move is made (or to the first player after them that can
+        move). This allows a search to consider the moves of players out of turn.
+
+        :param action: Action object to perform
+        :param next_player: optional color of player to hand the turn to once the move is made
+        :return: None
+        """
+        # Validate params
+        if not isinstance(action, Action):
+            raise TypeError('Expected Action for action!')
+
+        if next_player is not None and not isinstance(next_player, Color):
+            raise TypeError('Expected Color or None for next_player!')
+
+        if next_player is not None and next_player not in self.player_order:
+            raise NonExistentPlayerException()
+
+        # Take note of the turn order and caches the move alters
+        players = self.__players.copy()
+        owned_player_colors = self.__owned_player_colors.copy()
+        player_stuck_cache = self.__player_stuck_cache.copy()
+        all_possible_actions_cache = self.__all_possible_actions_cache
+        mobility = self.__mobility.copy()
+        zobrist_hash = self.__zobrist_hash
+
+        if next_player is not None:
+            # Hand the turn to the avatar's owner so that it may move out of turn
+            owner = self.__whose_avatar(action.src)
+
+            if owner is None:
+                raise InvalidActionException()
+
+            self.__rotate_players_to(owner)
+
+        # Make move and record what it takes to undo it
+        color, tile, score = self.__move_avatar(*action)
+
+        if next_player is not None:
+            # Hand the turn to next_player (or the first player after them that can move)
+            self.__rotate_players_to(next_player)
+            self.__trigger_next_turn(initial_shift=0)
+
+        self.__undo_stack.append((action, color, tile, score, players, owned_player_colors,
+                                  player_stuck_cache, all_possible_actions_cache, mobility, zobrist_hash))
+
+    def undo_action(self) -> Action:
+        """
+        Takes back the last move made via apply_action that has not been undone yet,
+        restoring the state to what it was before said move.
+
+        :return: the Action object that was undone
+        """
+        # Make sure there is something to undo
+        if not self.__undo_stack:
+            raise InvalidActionException('No action to undo!')
+
+        action, color, tile, score, players, owned_player_colors, \
+            player_stuck_cache, all_possible_actions_cache, mobility, zobrist_hash = self.__undo_stack.pop()
+        src, dst = action
+
+        # Restore turn order; players that were copied by the move are dropped in favor
+        # of the ones they were copied from
+        self.__players = players
+        self.__owned_player_colors &= owned_player_colors
+
+        # Revert the moving player's score and avatar position if the move altered
+        # its PlayerEntity in place
+        if color in owned_player_colors:
+            player = self.__get_owned_player(color)
+            player.swap_places(dst, src)
+            player.score = score
+
+        # Move avatar back in occupancy index
+        self.__vacate(dst)
+        self.__occupy(src, color)
+
+        # Restore removed tile
+        self.__board.restore_tile(src, tile)
+        # Restore caches
+        self.__player_stuck_cache = player_stuck_cache
+        self.__mobility = mobility
+        self.__zobrist_hash = zobrist_hash
+        self.__all_possible_actions_cache = all_possible_actions_cache
+        # Remove move from log
+        self.__move_log.pop()
+
+        return action
+
+    def __move_avatar(self, src: Position, dst: Position) -> tuple:
+        """
+        Moves an avatar on behalf of the current player from src to dst (see move_avatar).
+
+        :param src: position from which to move player's avatar
+        :param dst: position to which to move player's avatar
+        :return: tuple of the moving player's color, the removed Tile and the player's score
+                 prior to the move
+        """
         # Validate src
         if not isinstance(src, Position):
             raise TypeError('Expected Position for src!')
@@ -429,22 +840,35 @@ class State(object):
             raise MoveOutOfTurnException(f'avatar belongs to player color {player_color} '
                                          f'current player color: {self.current_player}')
 
+        # Retrieve player (copying it if it is shared with another state)
+        player = self.__get_owned_player(player_color)
+        # Retrieve tile to remove and player's score prior to the move
+        tile = self.__board.get_tile(src)
+        score = player.score
+
         # Adjust player score
-        self.get_player_by_color(player_color).score += self.__board.get_tile(src).fish_no
+        player.score += tile.fish_no
 
         # Swap out old avatar position for new
-        self.get_player_by_color(player_color).swap_places(src, dst)
+        player.swap_places(src, dst)
+        self.__vacate(src)
+        self.__occupy(dst, player_color)
 
         # Clear cache for all possible actions
-        self.__all_possible_actions_cache.clear()
+        self.__all_possible_actions_cache = []
 
-        # Remove board tile
+        # Remove board tile and swap its key out for that of a hole
         self.__board.remove_tile(src)
+        self.__zobrist_hash ^= self.__zobrist_keys.tile(src, tile.fish_no) ^ self.__zobrist_keys.tile(src, 0)
+        # Recount mobility of avatars around the positions that changed
+        self.__refresh_mobility([src, dst])
         # Record move
         self.__move_log.append(Action(src, dst))
         # Trigger next turn
         self.__trigger_next_turn()
 
+        return player_color, tile, score
+
     def __whose_avatar(self, pos: Position) -> Color:
         """
         Returns the color of the player to whom the avatar
@@ -458,13 +882,8 @@ class State(object):
         if not isinstance(pos, Position):
             raise TypeError('Expected Position for pos!')
 
-        # Get player color whose avatar exists at src
-        for player in self.__players:
-            # If src is among this player's placements, return color
-            if pos in player.places:
-                return player.color
-
-        return None
+        # Look up player color whose avatar exists at src
+        return self.__occupancy.get(pos)
 
     def __is_path_clear(self, pos1: Position, pos2: Position, reachable_pos=None) -> bool:
         """
@@ -485,30 +904,97 @@ class State(object):
         if reachable_pos is not None and not isinstance(reachable_pos, list):
             raise TypeError('Expected list of Position for reachable_pos or None!')
 
-        # Check if reachable pos is provided
-        if not reachable_pos:
-            # Retrieve all reachable positions from pos1
-            reachable_pos = self.__board.get_reachable_positions(pos1)
+        # Make sure start position is on the board
+        if not (0 <= pos1.x < self.__board.rows and 0 <= pos1.y < self.__board.cols):
+            raise ValueError('Expected pos to be a position on the game board.')
+
+        # Use bitboard if the board is backed by one
+        bitboard = self.__board.bitboard
+
+        if bitboard is not None:
+            # End position cannot be reached if it is not on the board
+            if not bitboard.contains(pos2):
+                return False
+
+            return bitboard.is_path_clear(pos1, pos2, self.__occupied_mask)
+
+        # Check if pos2 is among the reachable positions (if provided)
+        if reachable_pos and pos2 not in reachable_pos:
+            return False
+
+        # Check if pos2 lies on a straight line from pos1
+        geometry = self.__board.geometry
 
-        # Check if pos2 is among said positions
-        if pos2 not in reachable_pos:
+        if not geometry.is_in_line(pos1, pos2):
             return False
 
         # Retrieve all in-between positions between pos1 and pos2, including
         # the latter
-        positions_to_check = self.__board.get_connecting_positions(pos1, pos2)
-        positions_to_check.append(pos2)
+        positions_to_check = geometry.get_positions_between(pos1, pos2) + (pos2,)
 
         # For each in-between position
         for pos in positions_to_check:
-            # Cycle over placements of each player
-            for player_placements in self.placements.values():
-                # Check if an avatar has been placed on current position
-                if pos in player_placements:
-                    return False
+            # Check if position is a hole or if an avatar has been placed on it
+            if self.__board.get_tile(pos).is_hole or pos in self.__occupancy:
+                return False
 
         return True
 
+    def __occupy(self, pos: Position, color: Color) -> None:
+        """
+        Records that the avatar of the player with the given color stands at
+        the given position in the occupancy index.
+
+        :param pos: position the avatar stands at
+        :param color: color of the player the avatar belongs to
+        :return: None
+        """
+        self.__occupancy[pos] = color
+        self.__occupied_mask |= 1 << (pos.x * self.__board.cols + pos.y)
+        self.__zobrist_hash ^= self.__zobrist_keys.avatar(pos, color)
+
+    def __vacate(self, pos: Position) -> None:
+        """
+        Records that no avatar stands at the given position in the occupancy index.
+
+        :param pos: position to vacate
+        :return: None
+        """
+        self.__zobrist_hash ^= self.__zobrist_keys.avatar(pos, self.__occupancy.pop(pos))
+        self.__occupied_mask &= ~(1 << (pos.x * self.__board.cols + pos.y))
+        self.__mobility.pop(pos, None)
+
+    def __refresh_mobility(self, positions: [Position]) -> None:
+        """
+        Recounts the open tiles adjacent to the avatars at or next to the given positions,
+        which are the only avatars whose mobility can change when said positions do.
+
+        :param positions: positions that changed (i.e. were vacated, occupied or removed)
+        :return: None
+        """
+        edge_list = self.__board.geometry.edge_list
+
+        for pos in positions:
+            for avatar_pos in [pos, *edge_list[pos].values()]:
+                if avatar_pos in self.__occupancy:
+                    self.__mobility[avatar_pos] = self.__count_open_adjacent_tiles(avatar_pos)
+
+    def __count_open_adjacent_tiles(self, pos: Position) -> int:
+        """
+        Counts the tiles adjacent to the given position that are neither holes nor occupied
+        by an avatar.
+
+        :param pos: position to count open adjacent tiles for
+        :return: number of open adjacent tiles
+        """
+        count = 0
+
+        for adjacent_pos in self.__board.geometry.edge_list[pos].values():
+            if adjacent_pos not in self.__occupancy and self.__board.get_tile(adjacent_pos).is_tile:
+                count += 1
+
+        return count
+
     def can_anyone_move(self) -> bool:
         """
         Tells if any player can move any of their avatars.
@@ -528,38 +1014,41 @@ class State(object):
 
         return at_least_one_can_move
 
-    def __is_player_stuck(self, player_color: Color) -> bool:
+    def can_player_move(self, player_color: Color) -> bool:
         """
-        Tells if player with given player_color can go anywhere. It does
-        not check for turn. Can only be called after everyone has
-        finished placing their avatars.
+        Tells if player with given player_color can move any of their avatars (not necessarily
+        this turn). Unlike can_anyone_move, it leaves the stuck player cache as it is.
 
         :param player_color: color of player for whom to check
-        :return: boolean indicating whether player
-                 can move (not necessarily this turn)
+        :return: boolean indicating whether player can move
         """
         # Validate player_color
         if not isinstance(player_color, Color):
-            raise TypeError('Expected positive Color for player_color!')
+            raise TypeError('Expected Color for player_color!')
 
         # Make sure player_color is in player collection
         if player_color not in self.player_order:
             raise NonExistentPlayerException()
 
-        # Retrieve player's positions
-        player_positions = self.get_player_by_color(player_color).places
-
-        # Cycle over player's positions
-        for position in player_positions:
-            # Retrieve all reachable positions from this position
-            reachable_pos: [Position] = self.__board.get_reachable_positions(position)
-            # Make sure at least one path is clear
-            for pos in reachable_pos:
-                if self.__is_path_clear(position, pos, reachable_pos):
-                    # Remove them from player stuck cache if they're in there
-                    if player_color in self.__player_stuck_cache:
-                        self.__player_stuck_cache.remove(player_color)
-                    return False
+        # Player can move if any of its avatars has an open tile next to it
+        return any(self.__mobility[position] > 0 for position in self.get_player_by_color(player_color).places)
+
+    def __is_player_stuck(self, player_color: Color) -> bool:
+        """
+        Tells if player with given player_color can go anywhere. It does
+        not check for turn. Can only be called after everyone has
+        finished placing their avatars.
+
+        :param player_color: color of player for whom to check
+        :return: boolean indicating whether player
+                 can move (not necessarily this turn)
+        """
+        # Player is not stuck if any of its avatars has an open tile next to it
+        if self.can_player_move(player_color):
+            # Remove them from player stuck cache if they're in there
+            if player_color in self.__player_stuck_cache:
+                self.__player_stuck_cache.remove(player_color)
+            return False
 
         # Add them to cache if they're not already there
         if player_color not in self.__player_stuck_cache:
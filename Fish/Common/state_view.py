@@ -0,0 +1,103 @@
+from operator import attrgetter
+
+from state import State
+from player_entity import PlayerEntity
+from color import Color
+
+
+class StateView(object):
+    """
+    PURPOSE:        The purpose of the state view is to let the holder of a State (such as a GameTree) hand it out
+                    for queries without copying it, whilst making sure it cannot be altered through the view.
+
+    INTERPRETATION: A StateView wraps a State and passes on reads of the members listed in READ_ONLY_MEMBERS
+                    (properties and methods that neither alter the state nor write to its caches) straight to it.
+                    The members of the state that do write to its caches are answered by the view itself without
+                    doing so: get_possible_actions does not cache the actions it lists (which move_avatar checks
+                    moves against), can_anyone_move does not update the players the state has found to be stuck
+                    and get_player_by_color returns a copy of the PlayerEntity, which the state may share with
+                    its copies. Any other member, and above all the ones that alter the state (place_avatar,
+                    move_avatar, apply_action, ...), cannot be reached through the view and throw AttributeError.
+                    The members are passed on by properties of the view that are made up once along with the
+                    class.
+
+                    As the view holds no copy of its own, it reflects the wrapped state as it is at the time it
+                    is read. Members that hand out containers (such as stuck_players or players) return copies
+                    of them, just like the state does. A mutable snapshot of the state is made by deepcopy(),
+                    which leaves the wrapped state as it reads but has it share its storage with the snapshot
+                    from then on (see State).
+    """
+    # Initialize names of the State members that do not alter the state
+    READ_ONLY_MEMBERS = frozenset({
+        # Properties
+        'stuck_players', 'occupied_mask', 'position_hash', 'avatars_per_player', 'players_no', 'players',
+        'move_log', 'board', 'placements', 'current_player', 'player_order',
+        # Methods
+        'generate_actions', 'count_possible_actions', 'get_player_score', 'get_player_positions',
+        'get_score_upper_bound', 'is_position_open', 'can_player_move', 'deepcopy', 'render'
+    })
+
+    __slots__ = ('__state',)
+
+    def __init__(self, state: State):
+        """
+        Initializes a view of the given state.
+
+        :param state: State to view
+        :return: new StateView designed to spec
+        """
+        # Validate params
+        if not isinstance(state, State):
+            raise TypeError('Expected State for state!')
+
+        # Set fields
+        self.__state = state
+
+    def __setattr__(self, name: str, value) -> None:
+        """
+        Prevents members from being set on the view once it has been initialized.
+
+        :param name: name of the member to set
+        :param value: value to set it to
+        :return: None
+        """
+        if name != '_StateView__state' or hasattr(self, name):
+            raise AttributeError('StateView is read-only!')
+
+        super().__setattr__(name, value)
+
+    def get_possible_actions(self) -> []:
+        """
+        Returns a list of all possible moves for the current player (see State.get_possible_actions)
+        without caching them on the state.
+
+        :return: list of Action objects
+        """
+        return list(self.__state.generate_actions())
+
+    def can_anyone_move(self) -> bool:
+        """
+        Tells if any player can move any of their avatars (see State.can_anyone_move) without updating
+        the players the state has found to be stuck.
+
+        :return: boolean indicating whether anyone can move
+        """
+        return any(self.__state.can_player_move(color) for color in self.__state.player_order)
+
+    def get_player_by_color(self, color: Color) -> PlayerEntity:
+        """
+        Retrieves a copy of the PlayerEntity object by the provided color (see State.get_player_by_color),
+        which can be altered without affecting the state or its copies.
+
+        :param color: color of player to retrieve
+        :return: PlayerEntity object
+        """
+        return self.__state.get_player_by_color(color).copy()
+
+
+# Make up a property for each read-only member that reads it off the wrapped state (methods are read off
+# as methods bound to the state)
+for _name in StateView.READ_ONLY_MEMBERS:
+    setattr(StateView, _name, property(attrgetter(f'_StateView__state.{_name}')))
+
+del _name
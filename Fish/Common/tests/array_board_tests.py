@@ -0,0 +1,76 @@
+import unittest
+import sys
+
+sys.path.append('Common/')
+
+from array_board import ArrayBoard, np
+from board import Board
+from position import Position
+from tile import Tile
+from hole import Hole
+
+
+@unittest.skipIf(np is None, 'numpy is not installed')
+class ArrayBoardTests(unittest.TestCase):
+    def __init__(self, *args, **kwargs):
+        super(ArrayBoardTests, self).__init__(*args, **kwargs)
+
+        # Initialize a heterogeneous 4x3 board with a hole at (1, 1)
+        self.__board = Board({Position(row, col): Hole() if (row, col) == (1, 1) else Tile((row + col) % 5 + 1)
+                              for row in range(4) for col in range(3)})
+
+    def test_init_fail1(self):
+        # Tests constructor failing due to invalid board
+        with self.assertRaises(TypeError):
+            ArrayBoard('board')
+
+    def test_init_success1(self):
+        # Tests successful constructor
+        array_board = ArrayBoard(self.__board)
+
+        self.assertEqual(array_board.rows, 4)
+        self.assertEqual(array_board.cols, 3)
+        self.assertEqual(array_board.size, 12)
+        # Holes and the sentinel hold no fish
+        self.assertEqual(array_board.fish.tolist(), [1, 2, 3, 2, 0, 4, 3, 4, 5, 4, 5, 1, 0])
+        self.assertEqual(array_board.fish_matrix[1].tolist(), [2, 0, 4])
+
+    def test_rays_success1(self):
+        # Tests that rays match the ones of the board's geometry, padded with the sentinel
+        array_board = ArrayBoard(self.__board)
+        geometry = self.__board.geometry
+
+        for index, position_rays in enumerate(geometry.ray_masks):
+            for direction, (_, ray) in enumerate(position_rays):
+                cells = array_board.rays[direction, index].tolist()
+
+                self.assertEqual(cells[:len(ray)], [pos.x * 3 + pos.y for pos in ray])
+                self.assertTrue(all(cell == 12 for cell in cells[len(ray):]))
+
+    def test_rays_success2(self):
+        # Tests that boards of the same dimensions share their rays
+        self.assertIs(ArrayBoard(self.__board).rays, ArrayBoard(Board.homogeneous(2, 4, 3)).rays)
+
+    def test_to_bool_array_success1(self):
+        # Tests converting bitmasks into rows of booleans
+        array_board = ArrayBoard(self.__board)
+        rows = array_board.to_bool_array([0b100000000001, 0, (1 << 12) - 1])
+
+        self.assertEqual(rows.shape, (3, 13))
+        self.assertEqual(rows[0].nonzero()[0].tolist(), [0, 11])
+        self.assertFalse(rows[1].any())
+        # The sentinel is never open
+        self.assertEqual(rows[2].tolist(), [True] * 12 + [False])
+
+    def test_reach_success1(self):
+        # Tests that the positions reached match the ones reachable on the bitboard
+        array_board = ArrayBoard(self.__board)
+        bitboard = self.__board.bitboard
+        occupied = bitboard.mask([Position(0, 0), Position(2, 1)])
+        open_rows = array_board.to_bool_array([bitboard.tiles & ~occupied])
+
+        for src in [Position(0, 0), Position(2, 1), Position(3, 2)]:
+            cells, reachable = array_board.reach(open_rows, np.array([0]), np.array([src.x * 3 + src.y]))
+
+            self.assertCountEqual(cells[reachable].tolist(),
+                                  [pos.x * 3 + pos.y for pos in bitboard.reachable_positions(src, occupied)])
@@ -0,0 +1,182 @@
+import random
+import unittest
+import sys
+
+sys.path.append('Common/')
+
+from bitboard import Bitboard
+from board import Board
+from position import Position
+from tile import Tile
+from hole import Hole
+from board_tests import BoardTests
+from state_tests import StateTests
+
+
+class BitboardTests(unittest.TestCase):
+    def __init__(self, *args, **kwargs):
+        super(BitboardTests, self).__init__(*args, **kwargs)
+
+        # Initialize some bitboards for testing
+        self.__bitboard1 = Bitboard(5, 2)
+        self.__bitboard2 = Bitboard(10, 5)
+
+    def test_init_fail1(self):
+        # Tests constructor failing due to invalid rows
+        with self.assertRaises(ValueError):
+            Bitboard(0, 3)
+
+    def test_init_fail2(self):
+        # Tests constructor failing due to invalid cols
+        with self.assertRaises(ValueError):
+            Bitboard(3, 'cols')
+
+    def test_init_success(self):
+        # Tests successful constructor
+        b = Bitboard(3, 2)
+
+        self.assertEqual(b.rows, 3)
+        self.assertEqual(b.cols, 2)
+        # Every position should hold a tile
+        self.assertEqual(b.tiles, 0b111111)
+
+    def test_bit_and_mask(self):
+        # Tests bit indices of positions
+        self.assertEqual(self.__bitboard1.bit(Position(0, 0)), 1)
+        self.assertEqual(self.__bitboard1.bit(Position(0, 1)), 1 << 1)
+        self.assertEqual(self.__bitboard1.bit(Position(2, 1)), 1 << 5)
+        self.assertEqual(self.__bitboard1.mask([Position(0, 0), Position(2, 1)]), 0b100001)
+        self.assertEqual(self.__bitboard1.mask([]), 0)
+
+    def test_contains(self):
+        # Tests bounds checking
+        self.assertTrue(self.__bitboard1.contains(Position(4, 1)))
+        self.assertFalse(self.__bitboard1.contains(Position(5, 0)))
+        self.assertFalse(self.__bitboard1.contains(Position(0, 2)))
+        self.assertFalse(self.__bitboard1.contains(Position(-1, 0)))
+
+    def test_remove_tile(self):
+        # Tests removing a tile clears its bit
+        b = Bitboard(5, 2)
+        b.remove_tile(Position(1, 0))
+
+        self.assertEqual(b.tiles & b.bit(Position(1, 0)), 0)
+        self.assertEqual(bin(b.tiles).count('1'), 9)
+
+    def test_reachable_positions_homogeneous(self):
+        # Tests reachable positions on a board without holes (same expectations as the
+        # dict walk in BoardTests)
+        self.assertEqual(self.__bitboard1.reachable_positions(Position(0, 0)),
+                         [(1, 0), (2, 1), (3, 1), (2, 0), (4, 0)])
+        self.assertCountEqual(self.__bitboard1.reachable_positions(Position(3, 0)),
+                              [(2, 0), (1, 0), (2, 1), (1, 1), (4, 1), (4, 0)])
+
+    def test_reachable_positions_with_holes(self):
+        # Tests that holes interrupt straight line paths
+        b = Bitboard(5, 2)
+        b.remove_tile(Position(1, 0))
+
+        self.assertEqual(b.reachable_positions(Position(0, 0)), [(2, 0), (4, 0)])
+        self.assertCountEqual(b.reachable_positions(Position(2, 1)),
+                              [(0, 1), (1, 1), (3, 1), (4, 1), (3, 0), (4, 0)])
+
+    def test_reachable_positions_with_occupied(self):
+        # Tests that occupied positions interrupt straight line paths
+        occupied = self.__bitboard1.mask([Position(2, 1)])
+
+        self.assertEqual(self.__bitboard1.reachable_positions(Position(0, 0), occupied),
+                         [(1, 0), (2, 0), (4, 0)])
+
+    def test_reachable_mask(self):
+        # Tests reachable mask agrees with reachable positions
+        occupied = self.__bitboard2.mask([Position(5, 2), Position(2, 1)])
+
+        for row in range(10):
+            for col in range(5):
+                pos = Position(row, col)
+                self.assertEqual(self.__bitboard2.reachable_mask(pos, occupied),
+                                 self.__bitboard2.mask(self.__bitboard2.reachable_positions(pos, occupied)))
+
+    def test_bits(self):
+        # Tests splitting up a mask into its bits
+        self.assertEqual(list(Bitboard.bits(0b101001)), [0b1, 0b1000, 0b100000])
+        self.assertEqual(list(Bitboard.bits(0)), [])
+
+    def test_is_path_clear(self):
+        # Tests straight line path checks
+        occupied = self.__bitboard1.mask([Position(2, 1)])
+
+        self.assertTrue(self.__bitboard1.is_path_clear(Position(0, 0), Position(2, 0), occupied))
+        self.assertFalse(self.__bitboard1.is_path_clear(Position(0, 0), Position(2, 1), occupied))
+        self.assertFalse(self.__bitboard1.is_path_clear(Position(0, 0), Position(3, 1), occupied))
+        self.assertFalse(self.__bitboard1.is_path_clear(Position(0, 0), Position(0, 1)))
+
+    def test_parity_with_dict_walk(self):
+        # Tests that bitboard-backed boards yield the same reachable positions as the
+        # dict walk on boards with holes
+        tiles = {}
+
+        # Make up 8x4 board with a few holes
+        for row in range(8):
+            for col in range(4):
+                pos = Position(row, col)
+                tiles[pos] = Hole() if pos in [(2, 1), (4, 3), (7, 2)] else Tile(row % 5 + 1)
+
+        Board.USE_BITBOARD = False
+        try:
+            dict_board = Board(tiles.copy())
+        finally:
+            Board.USE_BITBOARD = True
+
+        # Make up bitboard-backed board from the same tiles
+        bit_board = Board(tiles.copy())
+
+        self.assertIsNone(dict_board.bitboard)
+        self.assertIsNotNone(bit_board.bitboard)
+
+        # Remove a tile from both boards
+        dict_board.remove_tile(Position(1, 1))
+        bit_board.remove_tile(Position(1, 1))
+
+        for pos in dict_board.tiles:
+            self.assertEqual(bit_board.get_reachable_positions(Position(*pos)),
+                             dict_board.get_reachable_positions(Position(*pos)))
+
+
+class DictWalkBoardTests(BoardTests):
+    """
+    Runs BoardTests against boards that are not backed by a Bitboard.
+    """
+    def __init__(self, *args, **kwargs):
+        # Preserve the random state as other test cases seed it upon initialization
+        random_state = random.getstate()
+        Board.USE_BITBOARD = False
+        try:
+            super(DictWalkBoardTests, self).__init__(*args, **kwargs)
+        finally:
+            Board.USE_BITBOARD = True
+            random.setstate(random_state)
+
+    def setUp(self):
+        Board.USE_BITBOARD = False
+
+    def tearDown(self):
+        Board.USE_BITBOARD = True
+
+
+class DictWalkStateTests(StateTests):
+    """
+    Runs StateTests against boards that are not backed by a Bitboard.
+    """
+    def __init__(self, *args, **kwargs):
+        Board.USE_BITBOARD = False
+        try:
+            super(DictWalkStateTests, self).__init__(*args, **kwargs)
+        finally:
+            Board.USE_BITBOARD = True
+
+    def setUp(self):
+        Board.USE_BITBOARD = False
+
+    def tearDown(self):
+        Board.USE_BITBOARD = True
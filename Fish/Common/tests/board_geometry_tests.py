@@ -0,0 +1,92 @@
+import pickle
+import unittest
+import sys
+
+sys.path.append('Common/')
+
+from board import Board
+from board_geometry import BoardGeometry
+from movement_direction import MovementDirection
+from position import Position
+
+
+class BoardGeometryTests(unittest.TestCase):
+    def __init__(self, *args, **kwargs):
+        super(BoardGeometryTests, self).__init__(*args, **kwargs)
+
+        # Initialize geometry for testing
+        self.__geometry = BoardGeometry.get(10, 5)
+
+    def test_init_fail1(self):
+        # Tests constructor failing due to invalid rows
+        with self.assertRaises(ValueError):
+            BoardGeometry(-1, 3)
+
+    def test_init_fail2(self):
+        # Tests constructor failing due to invalid cols
+        with self.assertRaises(ValueError):
+            BoardGeometry(3, None)
+
+    def test_get_shared(self):
+        # Tests that geometries are shared per dimensions
+        self.assertIs(BoardGeometry.get(10, 5), self.__geometry)
+        self.assertIsNot(BoardGeometry.get(5, 10), self.__geometry)
+
+        # Tests that boards of the same dimensions share their geometry
+        self.assertIs(Board.homogeneous(2, 10, 5).geometry, Board.homogeneous(4, 10, 5).geometry)
+
+    def test_pickle_shared(self):
+        # Tests that unpickling a geometry yields the shared instance
+        self.assertIs(pickle.loads(pickle.dumps(self.__geometry)), self.__geometry)
+
+    def test_get_ray(self):
+        # Tests rays are ordered by distance
+        self.assertEqual(self.__geometry.get_ray(Position(0, 0), MovementDirection.BottomRight),
+                         (Position(1, 0), Position(2, 1), Position(3, 1), Position(4, 2),
+                          Position(5, 2), Position(6, 3), Position(7, 3), Position(8, 4), Position(9, 4)))
+        self.assertEqual(self.__geometry.get_ray(Position(6, 0), MovementDirection.Top),
+                         (Position(4, 0), Position(2, 0), Position(0, 0)))
+        self.assertEqual(self.__geometry.get_ray(Position(0, 0), MovementDirection.TopLeft), ())
+
+        # Off-board positions have no rays
+        self.assertEqual(self.__geometry.get_ray(Position(100, -5), MovementDirection.TopRight), ())
+
+    def test_get_alignment(self):
+        # Tests direction and distance between aligned positions
+        self.assertEqual(self.__geometry.get_alignment(Position(3, 1), Position(0, 0)),
+                         (MovementDirection.TopLeft, 3))
+        self.assertEqual(self.__geometry.get_alignment(Position(0, 0), Position(6, 0)),
+                         (MovementDirection.Bottom, 3))
+        self.assertIsNone(self.__geometry.get_alignment(Position(0, 0), Position(0, 1)))
+        self.assertIsNone(self.__geometry.get_alignment(Position(0, 0), Position(0, 0)))
+
+    def test_is_in_line(self):
+        # Tests alignment checks
+        self.assertTrue(self.__geometry.is_in_line(Position(2, 1), Position(4, 0)))
+        self.assertTrue(self.__geometry.is_in_line(Position(0, 0), Position(1, 0)))
+        self.assertFalse(self.__geometry.is_in_line(Position(0, 0), Position(3, 0)))
+        self.assertFalse(self.__geometry.is_in_line(Position(0, 0), Position(20, 0)))
+
+    def test_get_positions_between(self):
+        # Tests in-between positions of aligned positions
+        self.assertEqual(self.__geometry.get_positions_between(Position(3, 1), Position(0, 0)),
+                         (Position(2, 1), Position(1, 0)))
+        self.assertEqual(self.__geometry.get_positions_between(Position(0, 0), Position(1, 0)), ())
+        self.assertEqual(self.__geometry.get_positions_between(Position(0, 0), Position(3, 0)), ())
+
+    def test_edge_list(self):
+        # Tests the edge list agrees with the rays
+        for pos, adjacent_positions in self.__geometry.edge_list.items():
+            for direction in MovementDirection:
+                ray = self.__geometry.get_ray(pos, direction)
+
+                if ray:
+                    self.assertEqual(adjacent_positions[direction], ray[0])
+                else:
+                    self.assertNotIn(direction, adjacent_positions)
+
+    def test_adjacent_masks(self):
+        # Tests the adjacent masks agree with the edge list
+        for pos, adjacent_positions in self.__geometry.edge_list.items():
+            expected_mask = sum(1 << (adjacent.x * 5 + adjacent.y) for adjacent in adjacent_positions.values())
+            self.assertEqual(self.__geometry.adjacent_masks[pos.x * 5 + pos.y], expected_mask)
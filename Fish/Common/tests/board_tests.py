@@ -1,3 +1,4 @@
+import pickle
 import unittest
 import sys
 
@@ -206,6 +207,70 @@ class BoardTests(unittest.TestCase):
         # Tile should not be a hole
         self.assertTrue(self.__hole_board1.get_tile(Position(0, 0)).is_hole)
 
+    def test_copy_success(self):
+        # Tests that a board and its copy do not observe each other's removed tiles
+        b = Board.homogeneous(3, 4, 3)
+        b_copy = b.copy()
+
+        b.remove_tile(Position(0, 0))
+        b_copy.remove_tile(Position(1, 1))
+
+        self.assertTrue(b.get_tile(Position(0, 0)).is_hole)
+        self.assertTrue(b.get_tile(Position(1, 1)).is_tile)
+        self.assertTrue(b_copy.get_tile(Position(0, 0)).is_tile)
+        self.assertTrue(b_copy.get_tile(Position(1, 1)).is_hole)
+        self.assertEqual(b.tiles[Position(0, 0)].is_hole, True)
+        self.assertEqual(b_copy.tiles[Position(1, 1)].is_hole, True)
+
+        # Reachable positions reflect the board's own holes
+        self.assertNotIn(Position(0, 0), b.get_reachable_positions(Position(2, 0)))
+        self.assertIn(Position(0, 0), b_copy.get_reachable_positions(Position(2, 0)))
+
+    def test_restore_tile_fail1(self):
+        # Tests failing restore_tile due to there being no hole at the given position
+        with self.assertRaises(ValueError):
+            Board.homogeneous(3, 4, 3).restore_tile(Position(0, 0), Tile(2))
+
+    def test_restore_tile_fail2(self):
+        # Tests failing restore_tile due to invalid tile
+        b = Board.homogeneous(3, 4, 3)
+        b.remove_tile(Position(0, 0))
+
+        with self.assertRaises(ValueError):
+            b.restore_tile(Position(0, 0), Hole())
+
+    def test_restore_tile_success(self):
+        # Tests successful restore_tile on a board and on a copy of it
+        b = Board.homogeneous(3, 4, 3)
+        tile = b.get_tile(Position(1, 0))
+        b.remove_tile(Position(1, 0))
+        b_copy = b.copy()
+
+        b.restore_tile(Position(1, 0), tile)
+
+        self.assertIs(b.get_tile(Position(1, 0)), tile)
+        self.assertIn(Position(1, 0), b.get_reachable_positions(Position(0, 0)))
+        self.assertTrue(b_copy.get_tile(Position(1, 0)).is_hole)
+        self.assertNotIn(Position(1, 0), b_copy.get_reachable_positions(Position(0, 0)))
+
+    def test_copy_overlay_folding(self):
+        # Tests that copies keep their removed tiles apart until there are too many of them
+        b = Board.homogeneous(3, 10, 10)
+        b_copy = b.copy()
+
+        # Remove more tiles from the copy than its overlay holds
+        positions = [Position(row, col) for row in range(10) for col in range(10)][:Board.MAX_OVERLAY_SIZE + 5]
+
+        for pos in positions:
+            b_copy.remove_tile(pos)
+
+        for pos in positions:
+            self.assertTrue(b_copy.get_tile(pos).is_hole)
+            self.assertTrue(b.get_tile(pos).is_tile)
+
+        # Make sure pickling preserves removed tiles
+        self.assertTrue(pickle.loads(pickle.dumps(b_copy)).get_tile(positions[0]).is_hole)
+
     def test_get_tile_fail1(self):
         # Tests failing get_tile due to point being invalid
         with self.assertRaises(TypeError):
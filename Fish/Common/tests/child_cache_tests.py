@@ -0,0 +1,83 @@
+import unittest
+import sys
+
+sys.path.append('Common/')
+
+from child_cache import ChildCache
+from game_tree import GameTree
+from retention_policy import RetentionPolicy
+from board import Board
+from color import Color
+from player_entity import PlayerEntity
+from position import Position
+from state import State
+
+
+class ChildCacheTests(unittest.TestCase):
+    def __init__(self, *args, **kwargs):
+        super(ChildCacheTests, self).__init__(*args, **kwargs)
+
+        # Initialize a 2-player state on a homogeneous board with all avatars placed
+        self.__state = State(Board.homogeneous(3, 5, 3), [PlayerEntity('a', Color.RED),
+                                                         PlayerEntity('b', Color.WHITE)], [])
+
+        for i, pos in enumerate([Position(0, 0), Position(0, 1), Position(0, 2), Position(1, 0),
+                                 Position(1, 1), Position(1, 2), Position(2, 0), Position(2, 1)]):
+            self.__state.place_avatar(self.__state.player_order[i % 2], pos)
+
+    def test_init_fail1(self):
+        # Tests constructor failing due to invalid caps
+        with self.assertRaises(ValueError):
+            ChildCache(max_nodes=0)
+
+        with self.assertRaises(ValueError):
+            ChildCache(max_bytes=-1)
+
+        with self.assertRaises(ValueError):
+            ChildCache(max_nodes='4')
+
+    def test_init_fail2(self):
+        # Tests constructor failing due to both caps missing
+        with self.assertRaises(ValueError):
+            ChildCache()
+
+    def test_init_success(self):
+        # Tests that a new cache is empty
+        cache = ChildCache(max_nodes=4, max_bytes=1 << 20)
+
+        self.assertEqual(cache.max_nodes, 4)
+        self.assertEqual(cache.max_bytes, 1 << 20)
+        self.assertEqual(cache.nodes, 0)
+        self.assertEqual(cache.bytes, 0)
+        self.assertEqual(cache.evictions, 0)
+
+    def test_max_bytes(self):
+        # Tests that the byte cap bounds the estimated bytes held
+        cache = ChildCache(max_nodes=1000)
+        tree = GameTree(self.__state, RetentionPolicy.BOUNDED, cache)
+        next(tree.get_next())
+        node_bytes = cache.bytes
+
+        cache = ChildCache(max_bytes=node_bytes * 2)
+        tree = GameTree(self.__state, RetentionPolicy.BOUNDED, cache)
+
+        for _ in tree.get_next():
+            pass
+
+        self.assertGreater(node_bytes, 0)
+        self.assertEqual(cache.nodes, 2)
+        self.assertEqual(cache.bytes, node_bytes * 2)
+        self.assertEqual(tree.children_no, 2)
+        self.assertEqual(cache.evictions, len(self.__state.get_possible_actions()) - 2)
+
+    def test_discard(self):
+        # Tests that discarded nodes are no longer held
+        cache = ChildCache(max_nodes=4)
+        tree = GameTree(self.__state, RetentionPolicy.BOUNDED, cache)
+        _, child = next(tree.get_next())
+
+        cache.discard(child)
+        cache.discard(child)
+        cache.touch(child)
+
+        self.assertEqual(cache.nodes, 0)
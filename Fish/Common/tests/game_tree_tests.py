@@ -11,10 +11,20 @@ from player_entity import PlayerEntity
 from position import Position
 from state import State
 from tile import Tile
+from hole import Hole
 
 sys.path.append('Common/')
 
-from game_tree import GameTree
+from game_tree import GameTree, _encode_position, _decode_position
+from retention_policy import RetentionPolicy
+from child_cache import ChildCache
+from position_table import PositionTable
+from pool_kind import PoolKind
+
+
+def _get_child_key(state: State) -> tuple:
+    # Returns what tells child states apart (defined at module level to be shipped to worker processes)
+    return state.position_hash, state.get_player_score(Color.RED), tuple(state.move_log)
 
 
 class GameTreeTests(unittest.TestCase):
@@ -318,3 +328,400 @@ class GameTreeTests(unittest.TestCase):
         result = GameTree.apply_to_child_states(GameTree(self.__state5), lambda state: state.get_player_score(Color.WHITE))
 
         self.assertSequenceEqual(result, [3, 3, 3, 2, 1, 1, 1, 1])
+
+
+class LazyGameTreeTests(unittest.TestCase):
+    """
+    Tests that game trees only determine their possible actions when needed.
+    """
+    def __init__(self, *args, **kwargs):
+        super(LazyGameTreeTests, self).__init__(*args, **kwargs)
+
+        # Initialize a 2-player state on a homogeneous board with all avatars placed
+        self.__state = State(Board.homogeneous(3, 5, 3), [PlayerEntity('a', Color.RED),
+                                                         PlayerEntity('b', Color.WHITE)], [])
+
+        for i, pos in enumerate([Position(0, 0), Position(0, 1), Position(0, 2), Position(1, 0),
+                                 Position(1, 1), Position(1, 2), Position(2, 0), Position(2, 1)]):
+            self.__state.place_avatar(self.__state.player_order[i % 2], pos)
+
+    def test_get_next_lazy(self):
+        # Tests that get_next yields the same moves as all_possible_actions without the
+        # latter having to be determined
+        tree = GameTree(self.__state)
+
+        self.assertIsNone(tree._GameTree__all_possible_actions)
+
+        # Consume first child only
+        move, _ = next(tree.get_next())
+
+        self.assertEqual(move, self.__state.get_possible_actions()[0])
+        self.assertIsNone(tree._GameTree__all_possible_actions)
+
+        # Make sure get_next yields all possible actions in order
+        self.assertSequenceEqual([move for move, _ in tree.get_next()], tree.all_possible_actions)
+        self.assertIsNotNone(tree._GameTree__all_possible_actions)
+
+    def test_try_action_lazy(self):
+        # Tests that try_action validates actions against the lazily determined possible actions
+        tree = GameTree(self.__state)
+
+        with self.assertRaises(InvalidActionException):
+            tree.try_action(Action(Position(0, 0), Position(0, 1)))
+
+        action = self.__state.get_possible_actions()[-1]
+        self.assertEqual(tree.try_action(action).move_log, [action])
+
+
+    def test_get_next_ordered(self):
+        # Tests that get_next yields child nodes in order of the given key, whether or not
+        # the possible actions have been determined
+        tree = GameTree(self.__state)
+        key = lambda action: (-action.dst.x, action.dst.y)
+        expected = sorted(self.__state.get_possible_actions(), key=key)
+
+        self.assertSequenceEqual([move for move, _ in tree.get_next(key)], expected)
+        self.assertIsNone(tree._GameTree__all_possible_actions)
+
+        tree.all_possible_actions
+        self.assertSequenceEqual([move for move, _ in tree.get_next(key)], expected)
+
+        with self.assertRaises(TypeError):
+            next(tree.get_next('not a function'))
+
+
+class GameTreeRetentionTests(unittest.TestCase):
+    """
+    Tests that game trees hold on to child nodes as their RetentionPolicy dictates.
+    """
+    def __init__(self, *args, **kwargs):
+        super(GameTreeRetentionTests, self).__init__(*args, **kwargs)
+
+        # Initialize a 2-player state on a homogeneous board with all avatars placed
+        self.__state = State(Board.homogeneous(3, 5, 3), [PlayerEntity('a', Color.RED),
+                                                         PlayerEntity('b', Color.WHITE)], [])
+
+        for i, pos in enumerate([Position(0, 0), Position(0, 1), Position(0, 2), Position(1, 0),
+                                 Position(1, 1), Position(1, 2), Position(2, 0), Position(2, 1)]):
+            self.__state.place_avatar(self.__state.player_order[i % 2], pos)
+
+    def test_init_fail1(self):
+        # Tests constructor failing due to invalid retention policy
+        with self.assertRaises(TypeError):
+            GameTree(self.__state, 'bounded')
+
+    def test_init_fail2(self):
+        # Tests constructor failing due to cache missing from BOUNDED policy or given to another one
+        with self.assertRaises(ValueError):
+            GameTree(self.__state, RetentionPolicy.BOUNDED)
+
+        with self.assertRaises(ValueError):
+            GameTree(self.__state, RetentionPolicy.RETAIN_ALL, ChildCache(max_nodes=4))
+
+    def test_retain_all(self):
+        # Tests that child nodes are held on to and handed out again by default
+        tree = GameTree(self.__state)
+        children = [child for _, child in tree.get_next()]
+
+        self.assertEqual(tree.retention_policy, RetentionPolicy.RETAIN_ALL)
+        self.assertEqual(tree.children_no, len(children))
+        self.assertTrue(all(a is b for a, (_, b) in zip(children, tree.get_next())))
+
+    def test_non_retaining(self):
+        # Tests that child nodes are computed anew each time without being held on to
+        tree = GameTree(self.__state, RetentionPolicy.NON_RETAINING)
+        move, child = next(tree.get_next())
+
+        self.assertEqual(tree.children_no, 0)
+        self.assertEqual(child.retention_policy, RetentionPolicy.NON_RETAINING)
+        self.assertIsNot(next(tree.get_next())[1], child)
+        self.assertEqual(child.view.move_log, [move])
+
+        # Make sure child states are the same as with a retaining tree
+        self.assertSequenceEqual(tree.apply_to_child_states(lambda state: state.position_hash),
+                                 GameTree(self.__state).apply_to_child_states(lambda state: state.position_hash))
+
+    def test_bounded(self):
+        # Tests that the least recently used child nodes are dropped once the cache is full
+        cache = ChildCache(max_nodes=3)
+        tree = GameTree(self.__state, RetentionPolicy.BOUNDED, cache)
+        moves = tree.all_possible_actions
+
+        first = tree.try_action(moves[0])
+        tree.try_action(moves[1])
+        tree.try_action(moves[2])
+        # Mark first child as recently used
+        tree.try_action(moves[0])
+        tree.try_action(moves[3])
+
+        self.assertEqual(cache.nodes, 3)
+        self.assertEqual(cache.evictions, 1)
+        self.assertEqual(tree.children_no, 3)
+        self.assertNotIn(moves[1], tree._GameTree__children)
+        self.assertEqual(tree.try_action(moves[0]).position_hash, first.position_hash)
+
+    def test_bounded_subtree(self):
+        # Tests that the nodes below an evicted node are discarded from the cache along with it
+        cache = ChildCache(max_nodes=4)
+        tree = GameTree(self.__state, RetentionPolicy.BOUNDED, cache)
+        move, child = next(tree.get_next())
+
+        for _ in child.get_next():
+            pass
+
+        # First child is least recently used, its eviction takes its children with it
+        self.assertNotIn(move, tree._GameTree__children)
+        self.assertGreaterEqual(cache.evictions, 1)
+        self.assertLessEqual(cache.nodes, cache.max_nodes)
+
+    def test_prune(self):
+        # Tests that prune drops all child nodes other than the one to keep
+        tree = GameTree(self.__state)
+        moves = [move for move, _ in tree.get_next()]
+
+        tree.prune(keep=moves[1])
+        self.assertEqual(list(tree._GameTree__children), [moves[1]])
+
+        tree.prune()
+        self.assertEqual(tree.children_no, 0)
+
+        with self.assertRaises(TypeError):
+            tree.prune('move')
+
+    def test_reroot(self):
+        # Tests that re-rooting hands out the child node of the action, carrying over its child nodes
+        tree = GameTree(self.__state)
+        move, child = next(tree.get_next())
+        grandchildren = [grandchild for _, grandchild in child.get_next()]
+        next(tree.get_next())
+
+        root = tree.reroot(move)
+
+        self.assertIs(root, child)
+        self.assertEqual(tree.children_no, 0)
+        self.assertEqual(root.view.move_log, [move])
+        self.assertTrue(all(a is b for a, (_, b) in zip(grandchildren, root.get_next())))
+
+        with self.assertRaises(InvalidActionException):
+            root.reroot(Action(Position(0, 0), Position(0, 1)))
+
+        with self.assertRaises(TypeError):
+            root.reroot('move')
+
+    def test_reroot_bounded(self):
+        # Tests that re-rooting a bounded tree lets go of the new root without dropping its child nodes
+        cache = ChildCache(max_nodes=100)
+        tree = GameTree(self.__state, RetentionPolicy.BOUNDED, cache)
+        moves = [move for move, _ in tree.get_next()]
+        root = tree.reroot(moves[0])
+        children = [child for _, child in root.get_next()]
+
+        self.assertEqual(cache.nodes, len(children))
+        self.assertEqual(root.children_no, len(children))
+
+
+class GameTreePositionTableTests(unittest.TestCase):
+    """
+    Tests that game trees sharing their nodes through a PositionTable hold a single node per position.
+    """
+    def __init__(self, *args, **kwargs):
+        super(GameTreePositionTableTests, self).__init__(*args, **kwargs)
+
+        # Initialize a 2-player state on a homogeneous board with all avatars placed
+        self.__state = State(Board.homogeneous(3, 5, 3), [PlayerEntity('a', Color.RED),
+                                                         PlayerEntity('b', Color.WHITE)], [])
+
+        for i, pos in enumerate([Position(0, 0), Position(0, 1), Position(0, 2), Position(1, 0),
+                                 Position(1, 1), Position(1, 2), Position(2, 0), Position(2, 1)]):
+            self.__state.place_avatar(self.__state.player_order[i % 2], pos)
+
+    def __expand(self, tree: GameTree, plies: int) -> set:
+        # Expands the tree to the given number of plies and returns the ids of the nodes within them
+        nodes = {id(tree)}
+
+        if plies > 0:
+            for _, child in tree.get_next():
+                nodes |= self.__expand(child, plies - 1)
+
+        return nodes
+
+    def test_init_fail1(self):
+        # Tests constructor failing due to invalid position table or retention policy
+        with self.assertRaises(TypeError):
+            GameTree(self.__state, positions={})
+
+        with self.assertRaises(ValueError):
+            GameTree(self.__state, RetentionPolicy.NON_RETAINING, positions=PositionTable())
+
+    def test_merge_transpositions(self):
+        # Tests that orders of moves leading to the same position share a node
+        positions = PositionTable()
+        tree = GameTree(self.__state, positions=positions)
+        unmerged = self.__expand(GameTree(self.__state), 3)
+        merged = self.__expand(tree, 3)
+
+        self.assertEqual(positions.nodes, len(merged))
+        self.assertGreater(positions.merges, 0)
+        self.assertLess(len(merged), len(unmerged))
+
+        # Make sure the orders of moves sharing a node lead to the same position when played out
+        paths = {}
+
+        for move1, child1 in tree.get_next():
+            for move2, child2 in child1.get_next():
+                for move3, child3 in child2.get_next():
+                    paths.setdefault(id(child3), []).append([move1, move2, move3])
+
+        shared = next(node_paths for node_paths in paths.values() if len(node_paths) > 1)
+        keys = set()
+
+        for path in shared:
+            state = self.__state.deepcopy()
+
+            for move in path:
+                state.move_avatar(*move)
+
+            keys.add(PositionTable.get_key(state))
+
+        self.assertEqual(len(keys), 1)
+
+    def test_apply_to_child_states(self):
+        # Tests that sharing nodes does not change the child states
+        fn = lambda state: (state.position_hash, state.get_player_score(Color.RED))
+
+        self.assertSequenceEqual(GameTree(self.__state, positions=PositionTable()).apply_to_child_states(fn),
+                                 GameTree(self.__state).apply_to_child_states(fn))
+
+
+class GameTreeParallelTests(unittest.TestCase):
+    """
+    Tests that applying a function to the child states in parallel yields the same results as doing so serially.
+    """
+    def __init__(self, *args, **kwargs):
+        super(GameTreeParallelTests, self).__init__(*args, **kwargs)
+
+        # Initialize a 2-player state on a homogeneous board with all avatars placed
+        self.__state = State(Board.homogeneous(3, 5, 3), [PlayerEntity('a', Color.RED),
+                                                         PlayerEntity('b', Color.WHITE)], [])
+
+        for i, pos in enumerate([Position(0, 0), Position(0, 1), Position(0, 2), Position(1, 0),
+                                 Position(1, 1), Position(1, 2), Position(2, 0), Position(2, 1)]):
+            self.__state.place_avatar(self.__state.player_order[i % 2], pos)
+
+    def setUp(self):
+        # Apply function in parallel regardless of the number of child states
+        self.__min_children = GameTree.PARALLEL_MIN_CHILDREN
+        GameTree.PARALLEL_MIN_CHILDREN = 1
+
+    def tearDown(self):
+        GameTree.PARALLEL_MIN_CHILDREN = self.__min_children
+        GameTree.shutdown_pools()
+
+    def test_apply_fail1(self):
+        # Tests failing due to invalid params
+        tree = GameTree(self.__state)
+
+        with self.assertRaises(TypeError):
+            tree.apply_to_child_states_parallel('not a function')
+
+        with self.assertRaises(TypeError):
+            tree.apply_to_child_states_parallel(_get_child_key, 'threads')
+
+        with self.assertRaises(ValueError):
+            tree.apply_to_child_states_parallel(_get_child_key, workers=0)
+
+        with self.assertRaises(ValueError):
+            tree.apply_to_child_states_parallel(_get_child_key, chunk_size=-1)
+
+    def test_apply_processes(self):
+        # Tests that worker processes yield the same results in the same order as the serial variant
+        tree = GameTree(self.__state)
+        expected = tree.apply_to_child_states(_get_child_key)
+
+        self.assertSequenceEqual(tree.apply_to_child_states_parallel(_get_child_key, workers=2), expected)
+        self.assertSequenceEqual(tree.apply_to_child_states_parallel(_get_child_key, workers=2, chunk_size=3),
+                                 expected)
+        # Make sure state of tree was not altered
+        self.assertEqual(tree.view.move_log, [])
+
+    def test_apply_processes2(self):
+        # Tests that the pool of worker processes is kept for the function across calls and positions
+        tree = GameTree(self.__state)
+        tree.apply_to_child_states_parallel(_get_child_key, workers=2)
+        pools = dict(GameTree._GameTree__pools)
+
+        move, child = next(tree.get_next())
+
+        # Child states made up by worker processes only log the moves leading to them
+        self.assertSequenceEqual([key[:2] for key in child.apply_to_child_states_parallel(_get_child_key, workers=2)],
+                                 [key[:2] for key in child.apply_to_child_states(_get_child_key)])
+        self.assertEqual(GameTree._GameTree__pools, pools)
+        self.assertEqual(len(pools), 1)
+
+    def test_apply_threads(self):
+        # Tests that threads yield the same results in the same order as the serial variant
+        tree = GameTree(self.__state)
+
+        self.assertSequenceEqual(tree.apply_to_child_states_parallel(lambda state: state.position_hash,
+                                                                     PoolKind.THREAD, 2, 1),
+                                 tree.apply_to_child_states(lambda state: state.position_hash))
+
+    def test_apply_threads2(self):
+        # Tests that threads make up the child states themselves rather than having the tree compute child nodes
+        tree = GameTree(self.__state)
+        results = tree.apply_to_child_states_parallel(_get_child_key, PoolKind.THREAD, 2)
+
+        self.assertEqual(tree.children_no, 0)
+        self.assertSequenceEqual(results, tree.apply_to_child_states(_get_child_key))
+
+    def test_encode_position(self):
+        # Tests that the compact encoding of a position rebuilds a state holding the same position
+        board = Board({Position(row, col): Hole() if (row, col) == (4, 2) else Tile(row % 3 + 1)
+                       for row in range(5) for col in range(3)})
+        state = State(board, [PlayerEntity('a', Color.RED), PlayerEntity('b', Color.WHITE)], [])
+
+        for i, pos in enumerate([Position(0, 0), Position(0, 1), Position(0, 2), Position(1, 0),
+                                 Position(1, 1), Position(1, 2), Position(2, 0), Position(2, 1)]):
+            state.place_avatar(state.player_order[i % 2], pos)
+
+        # Move avatar off of Position(0, 2), which leaves a hole behind
+        state.move_avatar(Position(0, 2), Position(2, 2))
+
+        encoded_position = _encode_position(state)
+        decoded_state = _decode_position(encoded_position)
+
+        # Make sure tiles are encoded as a byte each
+        self.assertEqual(encoded_position[1], bytes([1, 1, 0, 2, 2, 2, 3, 3, 3, 1, 1, 1, 2, 2, 0]))
+        # Make sure avatar positions are encoded as bit indices (RED is second to move now)
+        self.assertEqual(encoded_position[2][1][:3], ('a', Color.RED, 1))
+        self.assertEqual(set(encoded_position[2][1][3]), {0, 4, 6, 8})
+        self.assertEqual(decoded_state.position_hash, state.position_hash)
+        self.assertEqual(decoded_state.player_order, state.player_order)
+        self.assertEqual(decoded_state.placements, state.placements)
+        self.assertEqual(decoded_state.get_player_score(Color.RED), state.get_player_score(Color.RED))
+        self.assertEqual(decoded_state.get_possible_actions(), state.get_possible_actions())
+        self.assertEqual(decoded_state.move_log, [])
+        self.assertEqual(decoded_state.avatars_per_player, 4)
+
+    def test_encode_position_removed_player(self):
+        # Tests that the number of avatars per player survives the encoding after a player was removed
+        state = State(Board.homogeneous(2, 5, 5), [PlayerEntity('a', Color.RED), PlayerEntity('b', Color.WHITE),
+                                                  PlayerEntity('c', Color.BLACK)], [])
+        state.remove_player(Color.BLACK)
+
+        encoded_position = _encode_position(state)
+
+        self.assertEqual(encoded_position[3], 3)
+        self.assertEqual(_decode_position(encoded_position).avatars_per_player, 3)
+
+    def test_apply_serial(self):
+        # Tests that small fan-outs are applied to serially without starting a pool
+        GameTree.PARALLEL_MIN_CHILDREN = 1000
+        tree = GameTree(self.__state)
+
+        # Function defined within test cannot be shipped to worker processes, hence is applied to serially
+        results = tree.apply_to_child_states_parallel(lambda state: state.position_hash)
+        # No child nodes are computed on the tree either
+        self.assertEqual(tree.children_no, 0)
+        self.assertSequenceEqual(results, tree.apply_to_child_states(lambda state: state.position_hash))
+        self.assertEqual(GameTree._GameTree__pools, {})
@@ -122,3 +122,20 @@ class PlayerEntityTests(unittest.TestCase):
 
         # Run check
         self.assertEqual(player.score, 10)
+
+    def test_copy_success(self):
+        # Tests that a copy can be altered without affecting the original
+        player = PlayerEntity('iBot', Color.WHITE)
+        player.add_place(Position(1, 2))
+        player.score = 3
+
+        player_copy = player.copy()
+        player_copy.swap_places(Position(1, 2), Position(3, 2))
+        player_copy.score += 2
+
+        self.assertEqual(player_copy.name, 'iBot')
+        self.assertEqual(player_copy.color, Color.WHITE)
+        self.assertEqual(player_copy.places, [Position(3, 2)])
+        self.assertEqual(player_copy.score, 5)
+        self.assertEqual(player.places, [Position(1, 2)])
+        self.assertEqual(player.score, 3)
@@ -0,0 +1,84 @@
+import unittest
+import sys
+
+sys.path.append('Common/')
+
+from position_table import PositionTable
+from game_tree import GameTree
+from board import Board
+from color import Color
+from player_entity import PlayerEntity
+from position import Position
+from state import State
+from unittest.mock import patch
+
+
+class PositionTableTests(unittest.TestCase):
+    def __init__(self, *args, **kwargs):
+        super(PositionTableTests, self).__init__(*args, **kwargs)
+
+        # Initialize a 2-player state on a homogeneous board with all avatars placed
+        self.__state = State(Board.homogeneous(3, 5, 3), [PlayerEntity('a', Color.RED),
+                                                         PlayerEntity('b', Color.WHITE)], [])
+
+        for i, pos in enumerate([Position(0, 0), Position(0, 1), Position(0, 2), Position(1, 0),
+                                 Position(1, 1), Position(1, 2), Position(2, 0), Position(2, 1)]):
+            self.__state.place_avatar(self.__state.player_order[i % 2], pos)
+
+    def test_init_success(self):
+        # Tests that a new table is empty
+        positions = PositionTable()
+
+        self.assertEqual(positions.nodes, 0)
+        self.assertEqual(positions.merges, 0)
+        self.assertEqual(positions.collisions, 0)
+
+    def test_get_key(self):
+        # Tests that the key covers the position and the scores
+        state = self.__state.deepcopy()
+        state.move_avatar(*state.get_possible_actions()[0])
+
+        self.assertEqual(PositionTable.get_key(self.__state), PositionTable.get_key(self.__state.deepcopy()))
+        self.assertNotEqual(PositionTable.get_key(self.__state), PositionTable.get_key(state))
+        self.assertEqual(PositionTable.get_key(self.__state)[0], self.__state.position_hash)
+        self.assertEqual(PositionTable.get_key(self.__state)[2], (0, 0))
+
+    def test_add_get(self):
+        # Tests that nodes are found by the positions of their states
+        positions = PositionTable()
+        tree = GameTree(self.__state, positions=positions)
+
+        self.assertEqual(positions.nodes, 1)
+        self.assertIs(positions.get(self.__state.deepcopy()), tree)
+        self.assertEqual(positions.merges, 1)
+
+        # Make sure the first node added for a position is kept
+        positions.add(GameTree(self.__state.deepcopy()))
+        self.assertIs(positions.get(self.__state), tree)
+
+    def test_get_missing(self):
+        # Tests that look-ups of positions not in the table find nothing
+        positions = PositionTable()
+        state = self.__state.deepcopy()
+        state.move_avatar(*state.get_possible_actions()[0])
+
+        GameTree(self.__state, positions=positions)
+
+        self.assertIsNone(positions.get(state))
+        self.assertEqual(positions.merges, 0)
+
+    def test_get_collision(self):
+        # Tests that a node found under the key of a different position is not reused
+        positions = PositionTable()
+        state = self.__state.deepcopy()
+        state.move_avatar(*state.get_possible_actions()[0])
+
+        # Make both positions share a key as if their hashes collided
+        with patch.object(PositionTable, 'get_key', return_value=(0, (), ())):
+            GameTree(self.__state, positions=positions)
+
+            self.assertIsNone(positions.get(state))
+            self.assertIsNotNone(positions.get(self.__state.deepcopy()))
+
+        self.assertEqual(positions.collisions, 1)
+        self.assertEqual(positions.merges, 1)
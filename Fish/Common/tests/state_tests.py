@@ -127,6 +127,22 @@ class StateTests(unittest.TestCase):
         # Assert the placements dictionary is initialized to the proper val
         self.assertEqual(state.placements, {})
 
+    def test_init_fail_avatars_per_player(self):
+        # Test constructor failing due to invalid number of avatars per player
+        with self.assertRaises(ValueError):
+            State(self.__b, [self.__p1, self.__p2], [], 0)
+
+        with self.assertRaises(ValueError):
+            State(self.__b, [self.__p1, self.__p2], [], '3')
+
+    def test_init_success_avatars_per_player(self):
+        # Test constructor overriding the number of avatars per player (e.g. after a player was removed)
+        state = State(self.__b, [self.__p1, self.__p2], [], 3)
+
+        self.assertEqual(state.players_no, 2)
+        self.assertEqual(state.avatars_per_player, 3)
+        self.assertEqual(state.deepcopy().avatars_per_player, 3)
+
     def test_place_avatar_fail1(self):
         # Test failure of place_avater due to invalid player id type
         with self.assertRaises(TypeError):
@@ -278,6 +294,44 @@ class StateTests(unittest.TestCase):
         # Check if position is open on an open tile
         self.assertTrue(state.is_position_open(Position(2, 1)))
 
+    def test_is_position_open_success2(self):
+        # Tests that is_position_open keeps track of avatars being placed, moved,
+        # moved back and removed
+        state = State(Board.homogeneous(2, 7, 3), players=[self.__p1, self.__p2], move_log=[])
+
+        # Place avatars on behalf of either player in turn
+        for i, pos in enumerate([Position(0, 0), Position(0, 1), Position(0, 2), Position(1, 2),
+                                 Position(1, 0), Position(1, 1), Position(2, 2), Position(2, 1)]):
+            state.place_avatar(state.player_order[i % 2], pos)
+            self.assertFalse(state.is_position_open(pos))
+
+        # Move avatar
+        state.apply_action(Action(Position(0, 0), Position(2, 0)))
+        self.assertFalse(state.is_position_open(Position(2, 0)))
+        self.assertFalse(state.is_position_open(Position(0, 0)))
+        self.assertTrue(state.is_position_open(Position(3, 0)))
+
+        # Move it back
+        state.undo_action()
+        self.assertTrue(state.is_position_open(Position(2, 0)))
+        self.assertFalse(state.is_position_open(Position(0, 0)))
+
+        # Remove player
+        state.remove_player(Color.WHITE)
+        self.assertTrue(state.is_position_open(Position(0, 1)))
+        self.assertTrue(state.is_position_open(Position(2, 1)))
+        self.assertFalse(state.is_position_open(Position(2, 2)))
+
+    def test_is_position_open_success3(self):
+        # Tests that is_position_open accounts for avatars of players that were placed
+        # before the state was made up
+        self.__p1.add_place(Position(3, 1))
+
+        state = State(Board.homogeneous(2, 7, 3), players=[self.__p1, self.__p2], move_log=[])
+
+        self.assertFalse(state.is_position_open(Position(3, 1)))
+        self.assertTrue(state.is_position_open(Position(3, 0)))
+
     def test_move_avatar_fail1(self):
         # Test failure of place_avatar due to invalid dst
         with self.assertRaises(TypeError):
@@ -694,6 +748,83 @@ class StateTests(unittest.TestCase):
         # Make sure player id 4 is NOT among stuck players
         self.assertNotIn(Color.BROWN, state.stuck_players)
 
+    def test_is_player_stuck_success4(self):
+        # Tests that tracking which avatars can move agrees with generating their moves
+        # throughout a game on a board with holes
+        tiles = {}
+
+        for row in range(6):
+            for col in range(4):
+                tiles[Position(row, col)] = Hole() if (row, col) in [(2, 1), (3, 3), (5, 0)] else Tile(2)
+
+        state = State(Board(tiles), players=[self.__p1, self.__p2, self.__p3], move_log=[])
+
+        # Place avatars on behalf of each player in turn
+        for i, pos in enumerate([Position(0, 0), Position(0, 1), Position(0, 2), Position(1, 1),
+                                 Position(1, 0), Position(0, 3), Position(4, 0), Position(4, 1),
+                                 Position(5, 1)]):
+            state.place_avatar(state.player_order[i % 3], pos)
+
+        def can_move(color):
+            # Determine whether any of the player's avatars can reach a position
+            occupied = [pos for places in state.placements.values() for pos in places]
+            board = state.board
+
+            for pos in state.get_player_positions(color):
+                for reachable_pos in board.get_reachable_positions(pos):
+                    if reachable_pos not in occupied and \
+                            not any(p in occupied for p in board.get_connecting_positions(pos, reachable_pos)):
+                        return True
+
+            return False
+
+        while state.can_anyone_move():
+            for color in state.player_order:
+                self.assertEqual(state._State__is_player_stuck(color), not can_move(color))
+
+            state.apply_action(state.get_possible_actions()[0])
+
+        for color in state.player_order:
+            self.assertTrue(state._State__is_player_stuck(color))
+
+        # Make sure tracking is restored by undoing moves
+        state.undo_action()
+
+        for color in state.player_order:
+            self.assertEqual(state._State__is_player_stuck(color), not can_move(color))
+
+    def test_can_player_move_fail1(self):
+        # Tests can_player_move failing due to invalid or non-existent player color
+        state = State(self.__b, players=[self.__p4, self.__p2, self.__p3])
+
+        with self.assertRaises(TypeError):
+            state.can_player_move('red')
+
+        with self.assertRaises(NonExistentPlayerException):
+            state.can_player_move(Color.RED)
+
+    def test_can_player_move_success1(self):
+        # Tests that can_player_move agrees with is_player_stuck without updating the stuck player cache
+        state = State(self.__b, players=[self.__p1, self.__p2, self.__p3], move_log=[])
+
+        for i, pos in enumerate([Position(0, 0), Position(0, 1), Position(0, 2), Position(1, 0),
+                                 Position(1, 1), Position(1, 2), Position(2, 0), Position(2, 1),
+                                 Position(2, 2)]):
+            state.place_avatar(state.player_order[i % 3], pos)
+
+        while True:
+            stuck_players = state.stuck_players
+            can_move = {color: state.can_player_move(color) for color in state.player_order}
+            self.assertEqual(state.stuck_players, stuck_players)
+
+            for color in state.player_order:
+                self.assertEqual(can_move[color], not state._State__is_player_stuck(color))
+
+            if not state.can_anyone_move():
+                break
+
+            state.apply_action(state.get_possible_actions()[0])
+
     def test_player_order1(self):
         # Tests player order for two players
         state = State(self.__b, players=[
@@ -1048,6 +1179,75 @@ class StateTests(unittest.TestCase):
         # There should only no actions remaining
         self.assertCountEqual(state.get_possible_actions(), [])
 
+    def test_generate_actions_fail1(self):
+        # Tests failing generate_actions due to invalid key
+        state = State(self.__b, players=[self.__p1, self.__p2], move_log=[])
+
+        with self.assertRaises(TypeError):
+            state.generate_actions('fish')
+
+    def test_generate_actions_success1(self):
+        # Tests that generated actions match the possible actions, in the same order
+        # unless a key is provided
+        tiles = {}
+
+        for row in range(6):
+            for col in range(4):
+                tiles[Position(row, col)] = Hole() if (row, col) in [(2, 1), (3, 3)] else Tile((row + col) % 5 + 1)
+
+        board = Board(tiles)
+        state = State(board, players=[self.__p1, self.__p2, self.__p3], move_log=[])
+
+        # Place avatars on behalf of each player in turn
+        for i, pos in enumerate([Position(0, 0), Position(0, 1), Position(0, 2), Position(1, 1),
+                                 Position(1, 0), Position(0, 3), Position(4, 0), Position(4, 1),
+                                 Position(5, 1)]):
+            state.place_avatar(state.player_order[i % 3], pos)
+
+        possible_actions = state.get_possible_actions()
+
+        self.assertEqual(list(state.generate_actions()), possible_actions)
+        self.assertEqual(state.count_possible_actions(), len(possible_actions))
+
+        # Order by fish on destination tile (most first)
+        key = lambda action: -board.get_tile(action.dst).fish_no
+        self.assertEqual(list(state.generate_actions(key)), sorted(possible_actions, key=key))
+
+        # Make sure a move makes for a different set of actions
+        state.move_avatar(*possible_actions[0])
+        possible_actions = state.get_possible_actions()
+
+        self.assertEqual(list(state.generate_actions()), possible_actions)
+        self.assertEqual(state.count_possible_actions(), len(possible_actions))
+
+    def test_generate_actions_success2(self):
+        # Tests that no actions are generated for a state without players
+        state = State(self.__b, players=[self.__p1], move_log=[])
+        state.remove_player(Color.RED)
+
+        self.assertEqual(list(state.generate_actions()), [])
+        self.assertEqual(state.count_possible_actions(), 0)
+
+    def test_generate_actions_success3(self):
+        # Tests generating the actions of a player other than the current one
+        state = State(Board.homogeneous(2, 7, 3), players=[PlayerEntity('a', Color.RED),
+                                                           PlayerEntity('b', Color.WHITE)], move_log=[])
+
+        for i, pos in enumerate([Position(0, 0), Position(0, 1), Position(0, 2), Position(1, 2),
+                                 Position(1, 0), Position(1, 1), Position(2, 2), Position(2, 1)]):
+            state.place_avatar(state.player_order[i % 2], pos)
+
+        red_actions = state.get_possible_actions()
+        self.assertEqual(list(state.generate_actions(color=Color.RED)), red_actions)
+
+        # Make sure WHITE's actions are those it has in a state where it goes first
+        white_first_state = State(state.board, list(reversed(state.players)))
+        self.assertEqual(white_first_state.current_player, Color.WHITE)
+        self.assertEqual(list(state.generate_actions(color=Color.WHITE)), white_first_state.get_possible_actions())
+
+        with self.assertRaises(NonExistentPlayerException):
+            list(state.generate_actions(color=Color.BLACK))
+
     def test_get_player_score_test_fail1(self):
         # Tests failing get_player_score due to player_color being invalid
         # (type-wise)
@@ -1142,7 +1342,7 @@ class StateTests(unittest.TestCase):
             self.__p1,
             self.__p2,
             self.__p3,
-            self.__p4])
+            self.__p4], move_log=[])
 
         # Successful placement
         # Place player 1's avatar
@@ -1164,17 +1364,17 @@ class StateTests(unittest.TestCase):
         state.place_avatar(Color.BROWN,  Position(3, 1))
 
         # No moves have been made yet
-        self.assertEqual(len(state.move_log), 56)
+        self.assertEqual(len(state.move_log), 0)
 
         # Make a move
         state.move_avatar(Position(0, 0), Position(2, 1))
         # Check log
-        self.assertEqual(len(state.move_log), 57)
+        self.assertEqual(len(state.move_log), 1)
 
         # Make another move
         state.move_avatar(Position(5, 0), Position(6, 0))
         # Check log
-        self.assertEqual(len(state.move_log), 58)
+        self.assertEqual(len(state.move_log), 2)
 
     def test_player_order_success1(self):
         # Tests successful get player order
@@ -1387,8 +1587,8 @@ class StateTests(unittest.TestCase):
 
         # Make sure board was deep copied
         self.assertNotEqual(copied_state.board, state)
-        # Make sure player list was deep copied
-        self.assertNotEqual(copied_state._State__players, state._State__players)
+        # Make sure player list was copied
+        self.assertIsNot(copied_state._State__players, state._State__players)
         # Make sure placements are the same
         self.assertEqual(copied_state.placements, state.placements)
         # Make sure current player is the same
@@ -1403,6 +1603,330 @@ class StateTests(unittest.TestCase):
         # Make sure possible actions are the same
         self.assertEqual(copied_state.get_possible_actions(), state.get_possible_actions())
 
+    def test_deepcopy_copy_on_write(self):
+        # Tests that a state and its copy do not observe each other's changes
+        state = State(Board.homogeneous(2, 7, 3), players=[
+            self.__p1,
+            self.__p2], move_log=[])
+
+        # Place a bunch of avatars
+        # Place avatars on behalf of either player in turn
+        for i, pos in enumerate([Position(0, 0), Position(0, 1), Position(0, 2), Position(1, 2),
+                                 Position(1, 0), Position(1, 1), Position(2, 2), Position(2, 1)]):
+            state.place_avatar(state.player_order[i % 2], pos)
+
+        # Make deep copy
+        copied_state = state.deepcopy()
+
+        # Make sure player entities are shared until altered
+        self.assertIs(copied_state.get_player_by_color(Color.RED), state.get_player_by_color(Color.RED))
+
+        # Make a move on the copy
+        copied_state.move_avatar(Position(1, 0), Position(3, 0))
+
+        # Make sure the copy reflects the move
+        self.assertEqual(copied_state.get_player_score(Color.RED), 2)
+        self.assertTrue(copied_state.board.get_tile(Position(1, 0)).is_hole)
+        self.assertIn(Position(3, 0), copied_state.get_player_positions(Color.RED))
+
+        # Make sure the original does not
+        self.assertEqual(state.get_player_score(Color.RED), 0)
+        self.assertTrue(state.board.get_tile(Position(1, 0)).is_tile)
+        self.assertIn(Position(1, 0), state.get_player_positions(Color.RED))
+        self.assertEqual(state.current_player, Color.RED)
+
+        # Make a move on the original
+        state.move_avatar(Position(0, 0), Position(2, 0))
+
+        # Make sure the copy does not reflect it
+        self.assertTrue(copied_state.board.get_tile(Position(0, 0)).is_tile)
+        self.assertIn(Position(0, 0), copied_state.get_player_positions(Color.RED))
+        self.assertEqual(copied_state.get_player_score(Color.RED), 2)
+        self.assertEqual(state.get_player_score(Color.RED), 2)
+        self.assertEqual(len(copied_state.move_log), len(state.move_log))
+
+    def test_apply_action_fail1(self):
+        # Tests failing apply_action due to invalid action (type-wise)
+        state = State(self.__b, players=[self.__p1, self.__p2], move_log=[])
+
+        with self.assertRaises(TypeError):
+            state.apply_action((1, 2))
+
+    def test_undo_action_fail1(self):
+        # Tests failing undo_action due to there being nothing to undo
+        state = State(self.__b, players=[self.__p1, self.__p2], move_log=[])
+
+        with self.assertRaises(InvalidActionException):
+            state.undo_action()
+
+    def test_undo_action_fail2(self):
+        # Tests failing undo_action due to moves made via move_avatar not being undoable
+        state = State(Board.homogeneous(2, 7, 3), players=[self.__p1, self.__p2], move_log=[])
+
+        # Place avatars on behalf of either player in turn
+        for i, pos in enumerate([Position(0, 0), Position(0, 1), Position(0, 2), Position(1, 2),
+                                 Position(1, 0), Position(1, 1), Position(2, 2), Position(2, 1)]):
+            state.place_avatar(state.player_order[i % 2], pos)
+
+        state.apply_action(Action(Position(0, 0), Position(2, 0)))
+        state.move_avatar(*state.get_possible_actions()[0])
+
+        with self.assertRaises(InvalidActionException):
+            state.undo_action()
+
+    def test_apply_undo_action_success(self):
+        # Tests that undoing moves restores tiles, scores, avatar positions, turn order and
+        # stuck players exactly
+        state = State(Board.homogeneous(3, 4, 3), players=[self.__p1, self.__p2], move_log=[])
+
+        # Place avatars on behalf of either player in turn
+        for i, pos in enumerate([Position(0, 0), Position(0, 1), Position(0, 2), Position(1, 2),
+                                 Position(1, 0), Position(1, 1), Position(2, 2), Position(2, 1)]):
+            state.place_avatar(state.player_order[i % 2], pos)
+
+        def snapshot():
+            return (state.placements, state.board.tiles, state.player_order, state.stuck_players,
+                    state.get_player_score(Color.RED), state.get_player_score(Color.WHITE),
+                    state.move_log, state.get_possible_actions())
+
+        # Play game till the end, taking snapshots along the way
+        snapshots = []
+        actions = []
+
+        while state.can_anyone_move():
+            snapshots.append(snapshot())
+            actions.append(state.get_possible_actions()[-1])
+            state.apply_action(actions[-1])
+
+        # Make sure a player became stuck throughout the game
+        self.assertNotEqual(state.stuck_players, [])
+
+        # Undo moves one at a time
+        while snapshots:
+            self.assertEqual(state.undo_action(), actions.pop())
+            self.assertEqual(snapshot(), snapshots.pop())
+
+    def test_apply_undo_action_next_player(self):
+        # Tests making moves out of turn and handing the turn to a given player
+        state = State(Board.homogeneous(2, 7, 3), players=[PlayerEntity('a', Color.RED),
+                                                           PlayerEntity('b', Color.WHITE),
+                                                           PlayerEntity('c', Color.BLACK)], move_log=[])
+
+        for i, pos in enumerate([Position(0, 0), Position(0, 1), Position(0, 2), Position(1, 0),
+                                 Position(1, 1), Position(1, 2)]):
+            state.place_avatar(state.player_order[i % 3], pos)
+
+        position_hash = state.position_hash
+
+        # Have BLACK move out of turn and hand the turn back to RED
+        state.apply_action(Action(Position(0, 2), Position(2, 2)), Color.RED)
+        self.assertEqual(state.player_order, [Color.RED, Color.WHITE, Color.BLACK])
+        self.assertEqual(state.get_player_score(Color.BLACK), 2)
+
+        # Have RED move in turn and hand the turn to BLACK
+        state.apply_action(Action(Position(1, 0), Position(3, 0)), Color.BLACK)
+        self.assertEqual(state.current_player, Color.BLACK)
+
+        state.undo_action()
+        state.undo_action()
+        self.assertEqual(state.player_order, [Color.RED, Color.WHITE, Color.BLACK])
+        self.assertEqual(state.get_player_score(Color.BLACK), 0)
+        self.assertEqual(state.position_hash, position_hash)
+
+        with self.assertRaises(InvalidActionException):
+            state.apply_action(Action(Position(2, 0), Position(3, 0)), Color.RED)
+
+        with self.assertRaises(NonExistentPlayerException):
+            state.apply_action(Action(Position(0, 2), Position(2, 2)), Color.BROWN)
+
+    def test_apply_undo_action_copy(self):
+        # Tests that undoing a move does not affect a copy made after the move
+        state = State(Board.homogeneous(2, 7, 3), players=[self.__p1, self.__p2], move_log=[])
+
+        # Place avatars on behalf of either player in turn
+        for i, pos in enumerate([Position(0, 0), Position(0, 1), Position(0, 2), Position(1, 2),
+                                 Position(1, 0), Position(1, 1), Position(2, 2), Position(2, 1)]):
+            state.place_avatar(state.player_order[i % 2], pos)
+
+        state.apply_action(Action(Position(0, 0), Position(2, 0)))
+        player_order = state.player_order
+        copied_state = state.deepcopy()
+        state.undo_action()
+
+        self.assertEqual(state.get_player_score(Color.RED), 0)
+        self.assertTrue(state.board.get_tile(Position(0, 0)).is_tile)
+        self.assertIn(Position(0, 0), state.get_player_positions(Color.RED))
+        self.assertEqual(state.current_player, Color.RED)
+
+        self.assertEqual(copied_state.get_player_score(Color.RED), 2)
+        self.assertTrue(copied_state.board.get_tile(Position(0, 0)).is_hole)
+        self.assertIn(Position(2, 0), copied_state.get_player_positions(Color.RED))
+        self.assertEqual(copied_state.player_order, player_order)
+
+    def test_apply_undo_action_copy2(self):
+        # Tests that undoing several moves after copying the state reverts the players
+        # as they were before each move
+        state = State(Board.homogeneous(2, 7, 3), players=[PlayerEntity('a', Color.RED),
+                                                           PlayerEntity('b', Color.WHITE)], move_log=[])
+
+        # Place avatars on behalf of either player in turn
+        for i, pos in enumerate([Position(0, 0), Position(0, 1), Position(0, 2), Position(1, 2),
+                                 Position(1, 0), Position(1, 1), Position(2, 2), Position(2, 1)]):
+            state.place_avatar(state.player_order[i % 2], pos)
+
+        state.apply_action(Action(Position(0, 0), Position(2, 0)))
+        red_positions = state.get_player_positions(Color.RED)
+        state.apply_action(Action(Position(2, 1), Position(4, 1)))
+        state.apply_action(Action(Position(2, 2), Position(4, 2)))
+
+        copied_state = state.deepcopy()
+        state.undo_action()
+        state.undo_action()
+
+        self.assertEqual(state.get_player_positions(Color.RED), red_positions)
+        self.assertEqual(state.get_player_score(Color.RED), 2)
+        self.assertTrue(state.is_position_open(Position(4, 2)))
+        self.assertIn(Position(4, 2), copied_state.get_player_positions(Color.RED))
+        self.assertEqual(copied_state.get_player_score(Color.RED), 4)
+
+        state.undo_action()
+        self.assertIn(Position(0, 0), state.get_player_positions(Color.RED))
+        self.assertEqual(state.get_player_score(Color.RED), 0)
+
+    def test_position_hash_success1(self):
+        # Tests that position hashes agree for transposed move orders and with hashes
+        # computed from scratch
+        states = []
+
+        for moves in [[(Position(0, 0), Position(2, 0)), (Position(2, 1), Position(4, 1)),
+                       (Position(2, 2), Position(4, 2))],
+                      [(Position(2, 2), Position(4, 2)), (Position(2, 1), Position(4, 1)),
+                       (Position(0, 0), Position(2, 0))]]:
+            state = State(Board.homogeneous(2, 7, 3), players=[PlayerEntity('a', Color.RED),
+                                                               PlayerEntity('b', Color.WHITE)], move_log=[])
+
+            # Place avatars on behalf of either player in turn
+            for i, pos in enumerate([Position(0, 0), Position(0, 1), Position(0, 2), Position(1, 2),
+                                     Position(1, 0), Position(1, 1), Position(2, 2), Position(2, 1)]):
+                state.place_avatar(state.player_order[i % 2], pos)
+
+            for src, dst in moves:
+                state.move_avatar(src, dst)
+
+            states.append(state)
+
+        self.assertEqual(states[0].position_hash, states[1].position_hash)
+        # Make up state from scratch
+        self.assertEqual(State(states[0].board, states[0].players).position_hash, states[0].position_hash)
+
+        # Make sure hash changes with the player to move
+        self.assertNotEqual(State(states[0].board, list(reversed(states[0].players))).position_hash,
+                            states[0].position_hash)
+
+    def test_occupied_mask(self):
+        # Tests that the occupied mask follows avatars as they are placed, moved and moves are undone
+        state = State(Board.homogeneous(2, 4, 3), players=[PlayerEntity('a', Color.RED),
+                                                           PlayerEntity('b', Color.WHITE)], move_log=[])
+        state.place_avatar(Color.RED, Position(0, 0))
+        state.place_avatar(Color.WHITE, Position(0, 1))
+        self.assertEqual(state.occupied_mask, 0b11)
+
+        state.apply_action(Action(Position(0, 0), Position(2, 0)))
+        self.assertEqual(state.occupied_mask, 0b10 | 1 << 6)
+
+        state.undo_action()
+        self.assertEqual(state.occupied_mask, 0b11)
+
+    def test_get_score_upper_bound_fail1(self):
+        # Tests failing get_score_upper_bound due to invalid color or number of moves
+        state = State(self.__b, players=[self.__p1, self.__p2])
+        state.place_avatar(Color.RED, Position(0, 0))
+
+        with self.assertRaises(TypeError):
+            state.get_score_upper_bound('red')
+
+        with self.assertRaises(NonExistentPlayerException):
+            state.get_score_upper_bound(Color.BROWN)
+
+        with self.assertRaises(ValueError):
+            state.get_score_upper_bound(Color.RED, -1)
+
+        with self.assertRaises(ValueError):
+            state.get_score_upper_bound(Color.RED, 'two')
+
+    def test_get_score_upper_bound_success1(self):
+        # Tests get_score_upper_bound on a board split into a top and a bottom region by two rows of holes
+        fish = {(0, 0): 1, (0, 1): 5, (1, 0): 3, (1, 1): 2, (4, 0): 4, (4, 1): 4, (5, 0): 4, (5, 1): 4}
+        board = Board({Position(row, col): Tile(fish[(row, col)]) if (row, col) in fish else Hole()
+                       for row in range(6) for col in range(2)})
+        state = State(board, players=[self.__p1, self.__p2], move_log=[])
+        state.place_avatar(Color.RED, Position(0, 0))
+        state.place_avatar(Color.WHITE, Position(4, 0))
+
+        # RED can at best collect the richest tiles of the top region
+        self.assertEqual(state.get_score_upper_bound(Color.RED), 11)
+        self.assertEqual(state.get_score_upper_bound(Color.RED, 0), 0)
+        self.assertEqual(state.get_score_upper_bound(Color.RED, 1), 5)
+        self.assertEqual(state.get_score_upper_bound(Color.RED, 2), 8)
+        self.assertEqual(state.get_score_upper_bound(Color.RED, 10), 11)
+        # WHITE can at best collect the richest tiles of the bottom region
+        self.assertEqual(state.get_score_upper_bound(Color.WHITE), 16)
+        self.assertEqual(state.get_score_upper_bound(Color.WHITE, 1), 4)
+
+        # Cut RED off from the rest of the top region by placing an avatar of WHITE's next to it
+        state.place_avatar(Color.WHITE, Position(1, 0))
+        self.assertEqual(state.get_score_upper_bound(Color.RED), 1)
+        self.assertEqual(state.get_score_upper_bound(Color.WHITE, 2), 9)
+
+    def test_get_score_upper_bound_success2(self):
+        # Tests that get_score_upper_bound accounts for the player's score and never falls short
+        # of the score the player ends up with
+        state = State(Board.homogeneous(2, 4, 3), players=[self.__p1, self.__p2], move_log=[])
+
+        for i, pos in enumerate([Position(0, 0), Position(0, 1), Position(0, 2), Position(1, 0),
+                                 Position(1, 1), Position(1, 2), Position(2, 0), Position(2, 1)]):
+            state.place_avatar(state.player_order[i % 2], pos)
+
+        bounds = {color: state.get_score_upper_bound(color) for color in state.player_order}
+
+        # Play game out
+        while state.can_anyone_move():
+            color = state.current_player
+            state.apply_action(state.get_possible_actions()[0])
+            self.assertEqual(state.get_score_upper_bound(color, 0), state.get_player_score(color))
+            self.assertLessEqual(state.get_score_upper_bound(color), bounds[color])
+
+        for color in state.player_order:
+            self.assertLessEqual(state.get_player_score(color), bounds[color])
+
+    def test_position_hash_success2(self):
+        # Tests that position hashes are updated by placements, moves, undoing moves and
+        # player removals
+        state = State(Board.homogeneous(3, 7, 3), players=[self.__p1, self.__p2, self.__p3], move_log=[])
+        hashes = {state.position_hash}
+
+        # Place avatars on behalf of each player in turn
+        for i, pos in enumerate([Position(0, 0), Position(0, 1), Position(0, 2), Position(1, 2),
+                                 Position(1, 0), Position(1, 1), Position(2, 2), Position(2, 1),
+                                 Position(3, 0)]):
+            state.place_avatar(state.player_order[i % 3], pos)
+            self.assertNotIn(state.position_hash, hashes)
+            hashes.add(state.position_hash)
+
+        position_hash = state.position_hash
+
+        state.apply_action(state.get_possible_actions()[0])
+        self.assertNotIn(state.position_hash, hashes)
+        self.assertEqual(State(state.board, state.players).position_hash, state.position_hash)
+
+        state.undo_action()
+        self.assertEqual(state.position_hash, position_hash)
+
+        state.remove_player(Color.WHITE)
+        self.assertNotIn(state.position_hash, hashes)
+        self.assertEqual(State(state.board, state.players).position_hash, state.position_hash)
+        self.assertEqual(state.deepcopy().position_hash, state.position_hash)
+
     def test_remove_player_fail1(self):
         # Tests remove_player failing due to invalid Color (type-wise)
         state = State(self.__b, players=[
@@ -0,0 +1,119 @@
+import unittest
+import sys
+
+sys.path.append('Common/')
+
+from state_view import StateView
+from game_tree import GameTree
+from board import Board
+from color import Color
+from player_entity import PlayerEntity
+from position import Position
+from state import State
+
+
+class StateViewTests(unittest.TestCase):
+    def __init__(self, *args, **kwargs):
+        super(StateViewTests, self).__init__(*args, **kwargs)
+
+        # Initialize a 2-player state on a 3x4 board with all avatars placed
+        self.__state = State(Board.homogeneous(3, 3, 4),
+                             [PlayerEntity("John", Color.RED), PlayerEntity("George", Color.WHITE)], [])
+
+        for i, pos in enumerate([Position(0, 0), Position(0, 3), Position(1, 0), Position(1, 3),
+                                 Position(2, 0), Position(2, 3), Position(0, 1), Position(2, 2)]):
+            self.__state.place_avatar(self.__state.player_order[i % 2], pos)
+
+    def test_init_fail1(self):
+        # Tests constructor failing due to invalid state
+        with self.assertRaises(TypeError):
+            StateView(GameTree(self.__state))
+
+    def test_read_success1(self):
+        # Tests that the view answers queries just like the state it wraps
+        view = StateView(self.__state)
+
+        self.assertEqual(view.current_player, self.__state.current_player)
+        self.assertEqual(view.position_hash, self.__state.position_hash)
+        self.assertEqual(view.stuck_players, self.__state.stuck_players)
+        self.assertEqual(view.can_anyone_move(), self.__state.can_anyone_move())
+        self.assertEqual(view.get_player_score(Color.RED), self.__state.get_player_score(Color.RED))
+        self.assertEqual(view.get_possible_actions(), self.__state.get_possible_actions())
+
+    def test_read_success2(self):
+        # Tests that the view reflects the state it wraps as it changes
+        view = StateView(self.__state)
+        action = self.__state.get_possible_actions()[0]
+
+        self.__state.move_avatar(*action)
+
+        self.assertEqual(view.position_hash, self.__state.position_hash)
+        self.assertEqual(view.current_player, Color.WHITE)
+        self.assertEqual(view.move_log, [action])
+
+    def test_write_fail1(self):
+        # Tests that members altering the state cannot be reached through the view
+        view = StateView(self.__state)
+
+        for name in ['move_avatar', 'apply_action', 'undo_action', 'place_avatar', 'remove_player']:
+            with self.assertRaises(AttributeError):
+                getattr(view, name)
+
+    def test_write_fail2(self):
+        # Tests that the view's members cannot be set
+        view = StateView(self.__state)
+
+        with self.assertRaises(AttributeError):
+            view.current_player = Color.WHITE
+
+        with self.assertRaises(AttributeError):
+            view._StateView__state = self.__state.deepcopy()
+
+    def test_write_fail3(self):
+        # Tests that altering a player entity retrieved through the view leaves the state and its copies alone
+        view = StateView(self.__state)
+        state_copy = self.__state.deepcopy()
+
+        player = view.get_player_by_color(Color.RED)
+        player.score = 10
+        player.add_place(Position(1, 1))
+
+        self.assertEqual(self.__state.get_player_score(Color.RED), 0)
+        self.assertEqual(state_copy.get_player_score(Color.RED), 0)
+        self.assertNotIn(Position(1, 1), self.__state.get_player_positions(Color.RED))
+
+    def test_write_fail4(self):
+        # Tests that queries through the view leave the caches of the state alone
+        state = self.__state.deepcopy()
+        view = StateView(state)
+        action = view.get_possible_actions()[0]
+
+        self.assertTrue(view.can_anyone_move())
+        self.assertEqual(state.stuck_players, self.__state.stuck_players)
+
+        # Make sure the moves listed by the view were not cached (which move_avatar checks moves against)
+        self.assertEqual(state._State__all_possible_actions_cache, [])
+        self.assertEqual(state.get_possible_actions()[0], action)
+
+    def test_deepcopy_success1(self):
+        # Tests that a snapshot made through the view is a state of its own
+        view = StateView(self.__state)
+        snapshot = view.deepcopy()
+        snapshot.move_avatar(*snapshot.get_possible_actions()[0])
+
+        self.assertIsInstance(snapshot, State)
+        self.assertEqual(view.current_player, Color.RED)
+        self.assertEqual(self.__state.move_log, [])
+
+    def test_game_tree_view_success1(self):
+        # Tests that a game tree hands out the same view each time rather than copies of its state
+        tree = GameTree(self.__state)
+
+        self.assertIs(tree.view, tree.view)
+        self.assertIsNot(tree.state, tree.state)
+        self.assertEqual(tree.view.position_hash, tree.state.position_hash)
+
+        # Make sure child nodes hand out views of their own states
+        move, child = next(tree.get_next())
+        self.assertEqual(child.view.move_log, [move])
+        self.assertEqual(tree.view.move_log, [])
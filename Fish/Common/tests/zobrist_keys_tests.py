@@ -0,0 +1,55 @@
+import pickle
+import random
+import unittest
+import sys
+
+sys.path.append('Common/')
+
+from zobrist_keys import ZobristKeys
+from color import Color
+from position import Position
+
+
+class ZobristKeysTests(unittest.TestCase):
+    def __init__(self, *args, **kwargs):
+        super(ZobristKeysTests, self).__init__(*args, **kwargs)
+
+        # Initialize keys for testing
+        self.__keys = ZobristKeys.get(6, 4)
+
+    def test_init_fail1(self):
+        # Tests constructor failing due to invalid rows
+        with self.assertRaises(ValueError):
+            ZobristKeys(0, 3)
+
+    def test_init_fail2(self):
+        # Tests constructor failing due to invalid cols
+        with self.assertRaises(ValueError):
+            ZobristKeys(3, 'cols')
+
+    def test_get_shared(self):
+        # Tests that keys are shared per dimensions and survive pickling
+        self.assertIs(ZobristKeys.get(6, 4), self.__keys)
+        self.assertIsNot(ZobristKeys.get(4, 6), self.__keys)
+        self.assertIs(pickle.loads(pickle.dumps(self.__keys)), self.__keys)
+
+    def test_deterministic(self):
+        # Tests that keys do not depend on the global random generator
+        random_state = random.getstate()
+        keys = ZobristKeys(6, 4)
+        self.assertEqual(random.getstate(), random_state)
+
+        self.assertEqual(keys.tile(Position(2, 3), 4), self.__keys.tile(Position(2, 3), 4))
+        self.assertEqual(keys.avatar(Position(5, 0), Color.BROWN), self.__keys.avatar(Position(5, 0), Color.BROWN))
+        self.assertEqual(keys.side_to_move(Color.WHITE), self.__keys.side_to_move(Color.WHITE))
+
+    def test_keys_distinct(self):
+        # Tests that all keys are distinct 64-bit integers
+        keys = [self.__keys.tile(Position(row, col), fish_no) for row in range(6) for col in range(4)
+                for fish_no in range(6)]
+        keys += [self.__keys.avatar(Position(row, col), color) for row in range(6) for col in range(4)
+                 for color in Color]
+        keys += [self.__keys.side_to_move(color) for color in Color]
+
+        self.assertEqual(len(set(keys)), len(keys))
+        self.assertTrue(all(0 <= key < 1 << 64 for key in keys))
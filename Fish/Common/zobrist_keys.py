@@ -0,0 +1,111 @@
+import random
+
+import constants as ct
+from color import Color
+from position import Position
+
+
+class ZobristKeys(object):
+    """
+    PURPOSE:        The purpose of the Zobrist keys is to allow a game position (the tiles and holes of a board,
+                    the avatars on it and the player whose turn it is) to be hashed into a single 64-bit integer
+                    that can be kept up to date in constant time as the position changes.
+
+    INTERPRETATION: Zobrist keys hold a random 64-bit key for every feature a position can have on a board of a
+                    given number of rows and cols: the number of fish on each position (zero standing for a hole),
+                    an avatar of each Color on each position, and each Color being the one to move. The hash of a
+                    position is the XOR of the keys of all of its features. As XOR is its own inverse, a feature
+                    is added to or removed from a hash by XOR-ing in its key, which is how a State keeps its hash
+                    up to date (see State.position_hash).
+
+                    Keys are drawn from a random number generator seeded with SEED (and the dimensions of the
+                    board) so that the same position always hashes to the same value, and they are retrieved via
+                    ZobristKeys.get(rows, cols), which makes them once per dimensions and hands out the same
+                    instance from there on.
+    """
+    # Initialize seed the keys are drawn from
+    SEED = 4500
+    # Cache of keys shared amongst states; maps (rows, cols) to ZobristKeys
+    __CACHE = {}
+
+    def __init__(self, rows: int, cols: int):
+        """
+        Draws the Zobrist keys for a board of the given dimensions. Use ZobristKeys.get
+        to retrieve a shared instance instead.
+
+        :param rows: number of rows to board
+        :param cols: number of cols to board
+        :return: new ZobristKeys designed to spec
+        """
+        # Validate params
+        if not isinstance(rows, int) or rows <= 0:
+            raise ValueError('Expected int > 0 for rows!')
+
+        if not isinstance(cols, int) or cols <= 0:
+            raise ValueError('Expected int > 0 for cols!')
+
+        # Set fields
+        self.__rows = rows
+        self.__cols = cols
+
+        # Make up a generator of our own so as not to disturb the global one
+        rng = random.Random(f'{ZobristKeys.SEED}:{rows}x{cols}')
+
+        # Initialize list indexed by bit index (see Bitboard) of lists of keys indexed by fish number
+        self.__tile_keys = [[rng.getrandbits(64) for _ in range(ct.MAX_FISH_PER_TILE + 1)]
+                            for _ in range(rows * cols)]
+        # Initialize dict of Color to list of keys indexed by bit index
+        self.__avatar_keys = {color: [rng.getrandbits(64) for _ in range(rows * cols)] for color in Color}
+        # Initialize dict of Color to key of said color being the one to move
+        self.__side_to_move_keys = {color: rng.getrandbits(64) for color in Color}
+
+    @classmethod
+    def get(cls, rows: int, cols: int) -> 'ZobristKeys':
+        """
+        Retrieves the shared keys of a board of the given dimensions, drawing
+        them if this is the first time they are asked for.
+
+        :param rows: number of rows to board
+        :param cols: number of cols to board
+        :return: ZobristKeys object
+        """
+        if (rows, cols) not in cls.__CACHE:
+            cls.__CACHE[(rows, cols)] = cls(rows, cols)
+
+        return cls.__CACHE[(rows, cols)]
+
+    def __reduce__(self):
+        """
+        Pickles the keys by their dimensions so that unpickling them yields the
+        shared instance rather than a copy.
+        """
+        return ZobristKeys.get, (self.__rows, self.__cols)
+
+    def tile(self, pos: Position, fish_no: int) -> int:
+        """
+        Returns the key of the given position holding the given number of fish.
+
+        :param pos: position of the tile
+        :param fish_no: number of fish on the tile (0 for a hole)
+        :return: 64-bit key
+        """
+        return self.__tile_keys[pos[0] * self.__cols + pos[1]][fish_no]
+
+    def avatar(self, pos: Position, color: Color) -> int:
+        """
+        Returns the key of an avatar of the given color standing at the given position.
+
+        :param pos: position of the avatar
+        :param color: color of the player the avatar belongs to
+        :return: 64-bit key
+        """
+        return self.__avatar_keys[color][pos[0] * self.__cols + pos[1]]
+
+    def side_to_move(self, color: Color) -> int:
+        """
+        Returns the key of the player of the given color being the one to move.
+
+        :param color: color of the player to move
+        :return: 64-bit key
+        """
+        return self.__side_to_move_keys[color]
@@ -0,0 +1,86 @@
+#!/usr/bin/python3
+
+import random
+import sys
+import time
+
+sys.path.append('../../')
+sys.path.append('../../../Common')
+
+from strategy import Strategy
+from opponent_model import OpponentModel
+from transposition_table import TranspositionTable
+from board import Board
+from state import State
+from player_entity import PlayerEntity
+from color import Color
+from position import Position
+from tile import Tile
+
+# Initialize number of seconds a player has to pick a move (see Referee)
+TIME_BUDGET = 1
+# Initialize deepest depth to try
+MAX_DEPTH = 6
+
+
+def make_state(seed: int, player_no: int, rows: int, cols: int) -> State:
+    """
+    Makes up a state with the given number of players on a board of the given dimensions whose tiles
+    hold a random number of fish, with all avatars placed at random.
+
+    :return: resulting State object
+    """
+    rng = random.Random(seed)
+    board = Board({Position(row, col): Tile(rng.randint(1, 5)) for row in range(rows) for col in range(cols)})
+    colors = [Color.RED, Color.WHITE, Color.BLACK, Color.BROWN][:player_no]
+    state = State(board, [PlayerEntity(color.name.lower(), color) for color in colors], [])
+
+    positions = [Position(row, col) for row in range(rows) for col in range(cols)]
+    rng.shuffle(positions)
+
+    for i in range(state.avatars_per_player * player_no):
+        state.place_avatar(colors[i % player_no], positions[i])
+
+    return state
+
+
+STATES = {
+    '3 players, 5x5': make_state(1, 3, 5, 5),
+    '4 players, 5x5': make_state(1, 4, 5, 5),
+    '4 players, 6x6': make_state(2, 4, 6, 6)
+}
+
+
+def measure_depth(state: State, opponent_model: OpponentModel) -> tuple:
+    """
+    Searches the given state to depth 1, 2, ... with the given opponent model (and a transposition
+    table kept across depths, as iterative deepening would) until the searches have taken up the time
+    budget. Returns the deepest depth completed within the budget along with the number of nodes searched
+    per second.
+    """
+    Strategy.OPPONENT_MODEL = opponent_model
+    Strategy.TRANSPOSITION_TABLE = TranspositionTable()
+    depth = 0
+    nodes = 0
+    start = time.time()
+
+    while depth < MAX_DEPTH:
+        Strategy.get_best_action(state, depth + 1)
+        nodes += Strategy.stats.nodes
+
+        if time.time() - start > TIME_BUDGET:
+            break
+
+        depth += 1
+
+    elapsed = time.time() - start
+    return depth, nodes / elapsed if elapsed > 0 else 0.0
+
+
+print(f'{"state":<18}{"paranoid depth":>16}{"best-reply depth":>18}{"paranoid nodes/s":>18}'
+      f'{"best-reply nodes/s":>20}')
+
+for name, state in STATES.items():
+    paranoid_depth, paranoid_rate = measure_depth(state, OpponentModel.PARANOID)
+    best_reply_depth, best_reply_rate = measure_depth(state, OpponentModel.BEST_REPLY)
+    print(f'{name:<18}{paranoid_depth:>16}{best_reply_depth:>18}{paranoid_rate:>18.0f}{best_reply_rate:>20.0f}')
@@ -0,0 +1,78 @@
+#!/usr/bin/python3
+
+import random
+import sys
+import time
+
+sys.path.append('../../')
+sys.path.append('../../../Common')
+
+from strategy import Strategy
+from transposition_table import TranspositionTable
+from board import Board
+from state import State
+from player_entity import PlayerEntity
+from color import Color
+from position import Position
+from tile import Tile
+
+
+def make_random_state(seed: int, colors: [Color], rows: int, cols: int, move_no: int) -> State:
+    """
+    Makes up a state on a board of the given dimensions holding tiles with a random number of fish, on which
+    the avatars of players of the given colors have been placed at random and the given number of random
+    moves has been made (or as many as could be made).
+
+    :return: resulting State object
+    """
+    rng = random.Random(seed)
+    board = Board({Position(row, col): Tile(rng.randint(1, 5)) for row in range(rows) for col in range(cols)})
+    state = State(board, [PlayerEntity(color.name, color) for color in colors], [])
+    positions = [Position(row, col) for row in range(rows) for col in range(cols)]
+    rng.shuffle(positions)
+
+    for i, pos in enumerate(positions[:len(colors) * state.avatars_per_player]):
+        state.place_avatar(colors[i % len(colors)], pos)
+
+    for _ in range(move_no):
+        actions = state.get_possible_actions()
+
+        if not actions:
+            break
+
+        state.move_avatar(*rng.choice(actions))
+
+    return state
+
+
+# Map each state onto the depths to search it to
+STATES = {
+    'opening (2 players, 6x6)': (make_random_state(1, [Color.RED, Color.WHITE], 6, 6, 0), [2, 3]),
+    'midgame (2 players, 6x6)': (make_random_state(1, [Color.RED, Color.WHITE], 6, 6, 8), [3, 4]),
+    'endgame (2 players, 6x6)': (make_random_state(1, [Color.RED, Color.WHITE], 6, 6, 16), [4, 5]),
+    'midgame (3 players, 5x5)': (make_random_state(2, [Color.RED, Color.WHITE, Color.BLACK], 5, 5, 6), [2, 3]),
+    'endgame (3 players, 5x5)': (make_random_state(2, [Color.RED, Color.WHITE, Color.BLACK], 5, 5, 10), [3, 4])
+}
+
+
+def measure_search(state: State, depth: int, bound_pruning: bool) -> tuple:
+    """
+    Returns the number of nodes searched and the time (in seconds) it takes to determine the best
+    action for the given state with or without bound pruning (and a fresh transposition table so
+    that searches do not feed off one another).
+    """
+    Strategy.BOUND_PRUNING = bound_pruning
+    Strategy.TRANSPOSITION_TABLE = TranspositionTable()
+    start = time.time()
+    Strategy.get_best_action(state, depth)
+    return Strategy.stats.nodes, time.time() - start
+
+
+print(f'{"state":<26}{"depth":>6}{"nodes before":>14}{"nodes after":>14}{"time before (s)":>17}'
+      f'{"time after (s)":>16}')
+
+for name, (state, depths) in STATES.items():
+    for depth in depths:
+        nodes_before, time_before = measure_search(state, depth, False)
+        nodes_after, time_after = measure_search(state, depth, True)
+        print(f'{name:<26}{depth:>6}{nodes_before:>14}{nodes_after:>14}{time_before:>17.3f}{time_after:>16.3f}')
@@ -0,0 +1,75 @@
+#!/usr/bin/python3
+
+import random
+import sys
+import time
+
+sys.path.append('../../')
+sys.path.append('../../../Common')
+
+from strategy import Strategy
+from transposition_table import TranspositionTable
+from board import Board
+from state import State
+from player_entity import PlayerEntity
+from color import Color
+from position import Position
+from tile import Tile
+from hole import Hole
+
+
+def make_split_state(seed: int, rows: int, cols: int) -> State:
+    """
+    Makes up a state on a board of the given dimensions whose tiles (holding a random number of fish) are
+    split into a top and a bottom region by two rows of holes. RED places its avatars in the top region
+    and WHITE places its avatars in the bottom one, so that neither player's moves affect the other.
+
+    :return: resulting State object
+    """
+    rng = random.Random(seed)
+    # Make up rows of holes in the middle of the board
+    top_rows = (rows - 2) // 2
+    board = Board({Position(row, col): Hole() if top_rows <= row < top_rows + 2 else Tile(rng.randint(1, 5))
+                   for row in range(rows) for col in range(cols)})
+    state = State(board, [PlayerEntity('red', Color.RED), PlayerEntity('white', Color.WHITE)], [])
+
+    top = [Position(row, col) for row in range(top_rows) for col in range(cols)]
+    bottom = [Position(row, col) for row in range(top_rows + 2, rows) for col in range(cols)]
+    rng.shuffle(top)
+    rng.shuffle(bottom)
+
+    for i in range(state.avatars_per_player):
+        state.place_avatar(Color.RED, top[i])
+        state.place_avatar(Color.WHITE, bottom[i])
+
+    return state
+
+
+# Map each state onto the depths to search it to (the last one being the number of open tiles in RED's region)
+STATES = {
+    'split (2 players, 8x3)': (make_split_state(1, 8, 3), [2, 3, 5]),
+    'split (2 players, 10x3)': (make_split_state(1, 10, 3), [2, 4, 8])
+}
+
+
+def measure_search(state: State, depth: int, endgame_solver: bool) -> tuple:
+    """
+    Returns the number of nodes searched and the time (in seconds) it takes to determine the best
+    action for the given state with or without an endgame solver (and a fresh transposition table
+    so that searches do not feed off one another).
+    """
+    Strategy.ENDGAME_SOLVER = endgame_solver
+    Strategy.TRANSPOSITION_TABLE = TranspositionTable()
+    start = time.time()
+    Strategy.get_best_action(state, depth)
+    return Strategy.stats.nodes, time.time() - start
+
+
+print(f'{"state":<26}{"depth":>6}{"nodes before":>14}{"nodes after":>14}{"time before (s)":>17}'
+      f'{"time after (s)":>16}')
+
+for name, (state, depths) in STATES.items():
+    for depth in depths:
+        nodes_before, time_before = measure_search(state, depth, False)
+        nodes_after, time_after = measure_search(state, depth, True)
+        print(f'{name:<26}{depth:>6}{nodes_before:>14}{nodes_after:>14}{time_before:>17.3f}{time_after:>16.3f}')
@@ -0,0 +1,135 @@
+#!/usr/bin/python3
+
+import random
+import sys
+import time
+
+sys.path.append('../../')
+sys.path.append('../../../Common')
+
+from strategy import Strategy
+from evaluator import Evaluator
+from transposition_table import TranspositionTable
+from board import Board
+from state import State
+from player_entity import PlayerEntity
+from color import Color
+from position import Position
+from tile import Tile
+
+
+# Initialize number of times to evaluate the children of each state
+REPETITIONS = 200
+
+
+def make_random_state(seed: int, colors: [Color], rows: int, cols: int, move_no: int) -> State:
+    """
+    Makes up a state on a board of the given dimensions holding tiles with a random number of fish, on which
+    the avatars of players of the given colors have been placed at random and the given number of random
+    moves has been made (or as many as could be made).
+
+    :return: resulting State object
+    """
+    rng = random.Random(seed)
+    board = Board({Position(row, col): Tile(rng.randint(1, 5)) for row in range(rows) for col in range(cols)})
+    state = State(board, [PlayerEntity(color.name, color) for color in colors], [])
+    positions = [Position(row, col) for row in range(rows) for col in range(cols)]
+    rng.shuffle(positions)
+
+    for i, pos in enumerate(positions[:len(colors) * state.avatars_per_player]):
+        state.place_avatar(colors[i % len(colors)], pos)
+
+    for _ in range(move_no):
+        actions = state.get_possible_actions()
+
+        if not actions:
+            break
+
+        state.move_avatar(*rng.choice(actions))
+
+    return state
+
+
+def evaluate_in_python(state: State, color: Color) -> int:
+    """
+    Evaluates the given state for the player of the given color just like Evaluator does, yet by looping
+    over the players' avatars and the positions they can reach in Python.
+    """
+    board = state.board
+    reached = {True: set(), False: set()}
+    mobility = 0
+
+    for player_color in state.player_order:
+        for pos in state.get_player_positions(player_color):
+            positions = board.bitboard.reachable_positions(pos, state.occupied_mask)
+            reached[player_color == color].update(positions)
+            mobility += len(positions) if player_color == color else -len(positions)
+
+    reachable_fish = sum(board.get_tile(pos).fish_no for pos in reached[True])
+    contested = len(reached[True] & reached[False])
+
+    return state.get_player_score(color) + (Evaluator.REACHABLE_FISH_WEIGHT * reachable_fish
+                                            + Evaluator.MOBILITY_WEIGHT * mobility
+                                            + Evaluator.CONTESTED_WEIGHT * contested) // Evaluator.SCALE
+
+
+def measure_python(state: State) -> float:
+    """
+    Returns the number of microseconds it takes to evaluate a child of the given state in Python
+    (making and unmaking the move leading to it).
+    """
+    moves = state.get_possible_actions()
+    state = state.deepcopy()
+    start = time.time()
+
+    for _ in range(REPETITIONS):
+        for move in moves:
+            state.apply_action(move)
+            evaluate_in_python(state, state.player_order[0])
+            state.undo_action()
+
+    return (time.time() - start) / (REPETITIONS * len(moves)) * 1e6
+
+
+def measure_batch(state: State) -> float:
+    """
+    Returns the number of microseconds it takes to evaluate a child of the given state as part of
+    a batch of all of its children.
+    """
+    moves = state.get_possible_actions()
+    evaluator = Evaluator(state.board)
+    start = time.time()
+
+    for _ in range(REPETITIONS):
+        evaluator.evaluate_children(state, state.player_order[0], moves)
+
+    return (time.time() - start) / (REPETITIONS * len(moves)) * 1e6
+
+
+def measure_search(state: State, depth: int, evaluation: bool) -> float:
+    """
+    Returns the number of nodes per second the strategy searches the given state at with or
+    without evaluation (and a fresh transposition table).
+    """
+    Strategy.EVALUATION = evaluation
+    Strategy.TRANSPOSITION_TABLE = TranspositionTable()
+    Strategy.get_best_action(state, depth)
+    return Strategy.stats.nodes_per_second
+
+
+# Map each state onto the depth to search it to
+STATES = {
+    'opening (2 players, 6x6)': (make_random_state(1, [Color.RED, Color.WHITE], 6, 6, 0), 3),
+    'midgame (2 players, 8x8)': (make_random_state(1, [Color.RED, Color.WHITE], 8, 8, 8), 2),
+    'midgame (3 players, 5x5)': (make_random_state(2, [Color.RED, Color.WHITE, Color.BLACK], 5, 5, 6), 3),
+    'opening (4 players, 8x8)': (make_random_state(3, [Color.RED, Color.WHITE, Color.BLACK, Color.BROWN],
+                                                   8, 8, 0), 2)
+}
+
+print(f'{"state":<26}{"children":>10}{"python (us)":>13}{"batch (us)":>12}{"depth":>7}'
+      f'{"nodes/s plain":>15}{"nodes/s evaluated":>19}')
+
+for name, (state, depth) in STATES.items():
+    print(f'{name:<26}{len(state.get_possible_actions()):>10}{measure_python(state):>13.1f}'
+          f'{measure_batch(state):>12.1f}{depth:>7}{measure_search(state, depth, False):>15.0f}'
+          f'{measure_search(state, depth, True):>19.0f}')
@@ -0,0 +1,57 @@
+#!/usr/bin/python3
+
+import sys
+
+sys.path.append('../../')
+sys.path.append('../../../Common')
+sys.path.append('../tests')
+sys.path.append('../../../../3/Other')
+sys.path.append('../../../../4/Other')
+
+from strategy_tests import StrategyTests
+from game_tree import GameTree
+from position_table import PositionTable
+from state import State
+
+# Initialize number of plies to expand each tree to
+PLIES = 6
+
+
+def get_fixtures() -> dict:
+    """
+    Returns the states of the strategy tests on which all avatars have been placed, by name.
+    """
+    tests = StrategyTests('test_get_best_action_fail1')
+    fixtures = {}
+
+    for name, value in vars(tests).items():
+        if isinstance(value, State) and all(len(value.get_player_positions(color)) == value.avatars_per_player
+                                            for color in value.player_order):
+            fixtures[name.replace('_StrategyTests__', '')] = value
+
+    return fixtures
+
+
+def count_nodes(tree: GameTree, plies: int, nodes: set) -> set:
+    """
+    Expands the given tree to the given number of plies, adding the ids of the nodes within them
+    to the given set.
+    """
+    nodes.add(id(tree))
+
+    if plies > 0:
+        for _, child in tree.get_next():
+            count_nodes(child, plies - 1, nodes)
+
+    return nodes
+
+
+print(f'{"state":<10}{"tree nodes":>12}{"DAG nodes":>12}{"merges":>10}{"saved":>9}')
+
+for name, state in get_fixtures().items():
+    tree_nodes = len(count_nodes(GameTree(state), PLIES, set()))
+    positions = PositionTable()
+    dag_nodes = len(count_nodes(GameTree(state, positions=positions), PLIES, set()))
+
+    print(f'{name:<10}{tree_nodes:>12}{dag_nodes:>12}{positions.merges:>10}'
+          f'{(1 - dag_nodes / tree_nodes) * 100:>8.1f}%')
@@ -0,0 +1,82 @@
+#!/usr/bin/python3
+
+import random
+import resource
+import subprocess
+import sys
+
+sys.path.append('../../')
+sys.path.append('../../../Common')
+
+from strategy import Strategy
+from search_mode import SearchMode
+from retention_policy import RetentionPolicy
+from board import Board
+from state import State
+from player_entity import PlayerEntity
+from color import Color
+from position import Position
+from tile import Tile
+
+# Initialize depth to search to
+DEPTH = 2
+# Initialize number of child nodes held by the ChildCache with BOUNDED policy
+CACHE_NODES = 500
+
+
+def make_state(seed: int, rows: int, cols: int) -> State:
+    """
+    Makes up a four-player state on a board of the given dimensions whose tiles hold a random
+    number of fish, with all avatars placed at random.
+
+    :return: resulting State object
+    """
+    rng = random.Random(seed)
+    board = Board({Position(row, col): Tile(rng.randint(1, 5)) for row in range(rows) for col in range(cols)})
+    colors = [Color.RED, Color.WHITE, Color.BLACK, Color.BROWN]
+    state = State(board, [PlayerEntity(color.name.lower(), color) for color in colors], [])
+
+    positions = [Position(row, col) for row in range(rows) for col in range(cols)]
+    rng.shuffle(positions)
+
+    for i in range(state.avatars_per_player * len(colors)):
+        state.place_avatar(colors[i % len(colors)], positions[i])
+
+    return state
+
+
+def peak_rss_kb() -> int:
+    """
+    Returns the peak resident set size of this process so far (in KB on Linux).
+    """
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def measure(policy: RetentionPolicy) -> None:
+    """
+    Searches the benchmark state to DEPTH on a GameTree with the given retention policy and prints the
+    peak RSS of the process before and after, along with the number of nodes searched. As the peak RSS
+    of a process never goes down, each policy is measured in a process of its own.
+    """
+    state = make_state(1, 6, 6)
+    Strategy.SEARCH_MODE = SearchMode.GAME_TREE
+    Strategy.GAME_TREE_RETENTION = policy
+    Strategy.GAME_TREE_CACHE_NODES = CACHE_NODES
+    # Keep transposition table from adding to (and cutting down) the memory used by the tree
+    Strategy.USE_TRANSPOSITION_TABLE = False
+
+    before = peak_rss_kb()
+    Strategy.get_best_action(state, DEPTH)
+    print(before, peak_rss_kb(), Strategy.stats.nodes)
+
+
+if len(sys.argv) > 1:
+    measure(RetentionPolicy[sys.argv[1]])
+else:
+    print(f'{"policy":<15}{"peak RSS (MB)":>15}{"search RSS (MB)":>17}{"nodes":>10}')
+
+    for policy in RetentionPolicy:
+        output = subprocess.run([sys.executable, __file__, policy.name], capture_output=True, text=True,
+                                check=True).stdout
+        before, after, nodes = (int(value) for value in output.split())
+        print(f'{policy.name:<15}{after / 1024:>15.1f}{(after - before) / 1024:>17.1f}{nodes:>10}')
@@ -0,0 +1,51 @@
+#!/usr/bin/python3
+
+import random
+import sys
+
+sys.path.append('../../')
+sys.path.append('../../../Common')
+
+from monte_carlo_tree_search import MonteCarloTreeSearch
+from playout_policy import PlayoutPolicy
+from board import Board
+from state import State
+from player_entity import PlayerEntity
+from color import Color
+from position import Position
+from tile import Tile
+
+
+def make_random_state(seed: int, colors: [Color], rows: int, cols: int) -> State:
+    """
+    Makes up a state on a board of the given dimensions holding tiles with a random number of fish, on which
+    the avatars of players of the given colors have been placed at random.
+
+    :return: resulting State object
+    """
+    rng = random.Random(seed)
+    board = Board({Position(row, col): Tile(rng.randint(1, 5)) for row in range(rows) for col in range(cols)})
+    state = State(board, [PlayerEntity(color.name, color) for color in colors], [])
+    positions = [Position(row, col) for row in range(rows) for col in range(cols)]
+    rng.shuffle(positions)
+
+    for i, pos in enumerate(positions[:len(colors) * (6 - len(colors))]):
+        state.place_avatar(colors[i % len(colors)], pos)
+
+    return state
+
+
+STATES = {
+    'random (2 players, 6x6)': make_random_state(1, [Color.RED, Color.WHITE], 6, 6),
+    'random (4 players, 5x5)': make_random_state(3, [Color.RED, Color.BROWN, Color.WHITE, Color.BLACK], 5, 5),
+    'random (4 players, 8x8)': make_random_state(5, [Color.RED, Color.BROWN, Color.WHITE, Color.BLACK], 8, 8)
+}
+
+print(f'{"state":<26}{"policy":>8}{"playouts (1s)":>15}{"playouts/s":>12}')
+
+for name, state in STATES.items():
+    for policy in PlayoutPolicy:
+        MonteCarloTreeSearch.PLAYOUT_POLICY = policy
+        MonteCarloTreeSearch.get_best_action(state, time_budget=1)
+        print(f'{name:<26}{policy.name:>8}{MonteCarloTreeSearch.playouts:>15}'
+              f'{MonteCarloTreeSearch.playouts_per_second:>12.0f}')
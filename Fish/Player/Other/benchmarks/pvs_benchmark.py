@@ -0,0 +1,113 @@
+#!/usr/bin/python3
+
+import random
+import sys
+
+sys.path.append('../../')
+sys.path.append('../../../Common')
+
+from strategy import Strategy
+from transposition_table import TranspositionTable
+from board import Board
+from state import State
+from player_entity import PlayerEntity
+from color import Color
+from position import Position
+from tile import Tile
+
+
+def make_state(board: Board, colors: [Color], placements: [Position], moves: [tuple] = []) -> State:
+    """
+    Makes up a state on the given board for players of the given colors, placing avatars at the given
+    positions on behalf of the players in turn and then making the given moves.
+
+    :return: resulting State object
+    """
+    state = State(board, [PlayerEntity(color.name, color) for color in colors], [])
+
+    for i, pos in enumerate(placements):
+        state.place_avatar(colors[i % len(colors)], pos)
+
+    for src, dst in moves:
+        state.move_avatar(src, dst)
+
+    return state
+
+
+# Make up the states of strategy_tests (along with depths around the ones they are searched to in there)
+STATES = {
+    'state2 (3 players, 5x3)': (make_state(Board.homogeneous(2, 5, 3), [Color.RED, Color.WHITE, Color.BLACK], [
+        Position(4, 2), Position(0, 1), Position(2, 1), Position(1, 0), Position(2, 0), Position(3, 1),
+        Position(1, 1), Position(4, 1), Position(3, 0)]), [2, 4, 5]),
+    'state3 (4 players, 5x2)': (make_state(Board.homogeneous(3, 5, 2), [Color.RED, Color.BROWN, Color.WHITE,
+                                                                         Color.BLACK], [
+        Position(3, 0), Position(0, 0), Position(1, 0), Position(2, 0), Position(3, 1), Position(0, 1),
+        Position(1, 1), Position(2, 1)], [(Position(3, 1), Position(4, 1))]), [1, 2]),
+    'state5 (3 players, 5x3)': (make_state(Board({
+        Position(0, 0): Tile(5), Position(0, 1): Tile(3), Position(0, 2): Tile(2),
+        Position(1, 0): Tile(2), Position(1, 1): Tile(3), Position(1, 2): Tile(2),
+        Position(2, 0): Tile(3), Position(2, 1): Tile(4), Position(2, 2): Tile(1),
+        Position(3, 0): Tile(1), Position(3, 1): Tile(1), Position(3, 2): Tile(5),
+        Position(4, 0): Tile(2), Position(4, 1): Tile(3), Position(4, 2): Tile(4)}),
+        [Color.RED, Color.BROWN, Color.BLACK], [
+        Position(2, 0), Position(0, 1), Position(0, 2), Position(1, 0), Position(1, 2), Position(0, 0),
+        Position(3, 1), Position(2, 1), Position(3, 2)]), [2, 3, 4]),
+    'state7 (4 players, 5x5)': (make_state(Board.homogeneous(2, 5, 5), [Color.RED, Color.BROWN, Color.WHITE,
+                                                                         Color.BLACK], [
+        Position(0, 0), Position(0, 1), Position(0, 2), Position(0, 3), Position(0, 4), Position(1, 0),
+        Position(1, 1), Position(1, 2)]), [1, 2])
+}
+
+
+def make_random_state(seed: int, colors: [Color], rows: int, cols: int) -> State:
+    """
+    Makes up a state on a board of the given dimensions holding tiles with a random number of fish, on which
+    the avatars of players of the given colors have been placed at random.
+
+    :return: resulting State object
+    """
+    rng = random.Random(seed)
+    board = Board({Position(row, col): Tile(rng.randint(1, 5)) for row in range(rows) for col in range(cols)})
+    positions = [Position(row, col) for row in range(rows) for col in range(cols)]
+    rng.shuffle(positions)
+
+    return make_state(board, colors, positions[:len(colors) * (6 - len(colors))])
+
+
+# Add heterogeneous boards (on which moves are told apart by more than just their fish count)
+STATES.update({
+    'random (2 players, 6x6)': (make_random_state(1, [Color.RED, Color.WHITE], 6, 6), [2, 3]),
+    'random (4 players, 5x5)': (make_random_state(3, [Color.RED, Color.BROWN, Color.WHITE, Color.BLACK], 5, 5),
+                                [1, 2])
+})
+
+
+def measure_search(state: State, depth: int, principal_variation_search: bool, aspiration_window: int = None,
+                   deepen: bool = False) -> int:
+    """
+    Returns the number of nodes searched to determine the best action for the given state with or without
+    principal variation search, either to the given depth right away or by deepening the search iteratively
+    up to said depth with the given aspiration window (and a fresh transposition table so that searches do
+    not feed off one another).
+    """
+    Strategy.PRINCIPAL_VARIATION_SEARCH = principal_variation_search
+    Strategy.ASPIRATION_WINDOW = aspiration_window
+    Strategy.TRANSPOSITION_TABLE = TranspositionTable()
+    Strategy.get_best_action(state, depth, VERY_LARGE_TIME_BUDGET if deepen else None)
+    return Strategy.stats.nodes
+
+
+# Initialize time budget that iterative deepening does not run out of
+VERY_LARGE_TIME_BUDGET = 3600
+# Initialize half-width of the aspiration window
+ASPIRATION_WINDOW = 2
+
+print(f'{"state":<26}{"depth":>6}{"alpha-beta":>12}{"pvs":>10}{"deepening":>11}{"aspiration":>12}'
+      f'{"pvs + aspiration":>18}')
+
+for name, (state, depths) in STATES.items():
+    for depth in depths:
+        print(f'{name:<26}{depth:>6}{measure_search(state, depth, False):>12}{measure_search(state, depth, True):>10}'
+              f'{measure_search(state, depth, False, None, True):>11}'
+              f'{measure_search(state, depth, False, ASPIRATION_WINDOW, True):>12}'
+              f'{measure_search(state, depth, True, ASPIRATION_WINDOW, True):>18}')
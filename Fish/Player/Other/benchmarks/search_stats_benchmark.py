@@ -0,0 +1,79 @@
+#!/usr/bin/python3
+
+import random
+import sys
+
+sys.path.append('../../')
+sys.path.append('../../../Common')
+
+from strategy import Strategy
+from search_stats import SearchStats
+from transposition_table import TranspositionTable
+from board import Board
+from state import State
+from player_entity import PlayerEntity
+from color import Color
+from position import Position
+from tile import Tile
+
+
+# Initialize number of seconds to deepen each search for
+TIME_BUDGET = 1
+
+
+def make_random_state(seed: int, colors: [Color], rows: int, cols: int, move_no: int) -> State:
+    """
+    Makes up a state on a board of the given dimensions holding tiles with a random number of fish, on which
+    the avatars of players of the given colors have been placed at random and the given number of random
+    moves has been made (or as many as could be made).
+
+    :return: resulting State object
+    """
+    rng = random.Random(seed)
+    board = Board({Position(row, col): Tile(rng.randint(1, 5)) for row in range(rows) for col in range(cols)})
+    state = State(board, [PlayerEntity(color.name, color) for color in colors], [])
+    positions = [Position(row, col) for row in range(rows) for col in range(cols)]
+    rng.shuffle(positions)
+
+    for i, pos in enumerate(positions[:len(colors) * state.avatars_per_player]):
+        state.place_avatar(colors[i % len(colors)], pos)
+
+    for _ in range(move_no):
+        actions = state.get_possible_actions()
+
+        if not actions:
+            break
+
+        state.move_avatar(*rng.choice(actions))
+
+    return state
+
+
+STATES = {
+    'opening (2 players, 6x6)': make_random_state(1, [Color.RED, Color.WHITE], 6, 6, 0),
+    'midgame (2 players, 6x6)': make_random_state(1, [Color.RED, Color.WHITE], 6, 6, 8),
+    'midgame (3 players, 5x5)': make_random_state(2, [Color.RED, Color.WHITE, Color.BLACK], 5, 5, 6),
+    'endgame (4 players, 6x6)': make_random_state(3, [Color.RED, Color.WHITE, Color.BLACK, Color.BROWN],
+                                                  6, 6, 8)
+}
+
+# Aggregate the statistics of all searches
+Strategy.AGGREGATE_STATS = SearchStats()
+
+print(f'{"state":<26}{"depth":>6}{"nodes":>9}{"cutoffs":>9}{"table hits":>12}{"bound cuts":>12}'
+      f'{"solved":>8}{"branching":>11}{"time (s)":>10}{"done":>6}')
+
+for name, state in STATES.items():
+    # Search with a fresh transposition table so that searches do not feed off one another
+    Strategy.TRANSPOSITION_TABLE = TranspositionTable()
+    Strategy.get_best_action(state, time_budget=TIME_BUDGET)
+
+    for depth, entry in sorted(Strategy.stats.depths.items()):
+        branching_factor = entry['children'] / entry['expanded'] if entry['expanded'] else 0.0
+        print(f'{name:<26}{depth:>6}{entry["nodes"]:>9}{entry["cutoffs"]:>9}{entry["table_hits"]:>12}'
+              f'{entry["bound_cutoffs"]:>12}{entry["solved"]:>8}{branching_factor:>11.2f}{entry["seconds"]:>10.3f}'
+              f'{"yes" if entry["completed"] else "no":>6}')
+
+total = Strategy.AGGREGATE_STATS
+print(f'\nall searches: {total.searches} searches, {total.nodes} nodes ({total.nodes_per_second:.0f}/s), '
+      f'{total.cutoffs} cutoffs, branching factor {total.branching_factor:.2f}')
@@ -0,0 +1,64 @@
+#!/usr/bin/python3
+
+import sys
+import time
+
+sys.path.append('../../')
+sys.path.append('../../../Common')
+
+from strategy import Strategy
+from search_mode import SearchMode
+from transposition_table import TranspositionTable
+from board import Board
+from state import State
+from player_entity import PlayerEntity
+from color import Color
+from position import Position
+
+# Search depths to benchmark
+DEPTHS = [1, 2, 3]
+
+
+def make_state() -> State:
+    """
+    Makes up a four-player state on a homogeneous 5x5 board on which all avatars
+    have been placed.
+
+    :return: resulting State object
+    """
+    state = State(Board.homogeneous(2, 5, 5), [PlayerEntity('a', Color.RED),
+                                               PlayerEntity('b', Color.BROWN),
+                                               PlayerEntity('c', Color.WHITE),
+                                               PlayerEntity('d', Color.BLACK)], [])
+
+    # Place avatars along the top rows
+    for i in range(state.players_no * state.avatars_per_player):
+        state.place_avatar(state.player_order[i % state.players_no], Position(i // 5, i % 5))
+
+    return state
+
+
+def time_search(state: State, depth: int, search_mode: SearchMode, table: TranspositionTable) -> float:
+    """
+    Returns the time (in seconds) it takes to determine the best action for the given
+    state with the given search mode and transposition table (None for no table).
+    """
+    Strategy.SEARCH_MODE = search_mode
+    Strategy.USE_TRANSPOSITION_TABLE = table is not None
+    start = time.time()
+    Strategy.get_best_action(state, depth, transposition_table=table)
+    return time.time() - start
+
+
+state = make_state()
+# Search with and without a (fresh) transposition table in either mode
+configurations = [(mode, use_table) for mode in SearchMode for use_table in [False, True]]
+
+print(f'{"depth":>6} ' + ' '.join(f'{mode.name + (" +TT" if use_table else "") + " (s)":>20}'
+                                  for mode, use_table in configurations) + f'{"TT hit rate":>14}')
+
+for depth in DEPTHS:
+    tables = [TranspositionTable() if use_table else None for _, use_table in configurations]
+    times = [time_search(state, depth, mode, table) for (mode, _), table in zip(configurations, tables)]
+    hit_rate = tables[-1].hits / max(1, tables[-1].hits + tables[-1].misses)
+    print(f'{depth:>6} ' + ' '.join(f'{t:>20.3f}' for t in times) + f'{hit_rate:>14.1%}')
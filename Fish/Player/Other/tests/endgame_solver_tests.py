@@ -0,0 +1,110 @@
+import sys
+import unittest
+
+sys.path.append('Player/')
+sys.path.append('../../../Common')
+
+from endgame_solver import EndgameSolver
+from strategy import Strategy
+from board import Board
+from color import Color
+from hole import Hole
+from player_entity import PlayerEntity
+from position import Position
+from state import State
+from tile import Tile
+
+
+class EndgameSolverTests(unittest.TestCase):
+    def __init__(self, *args, **kwargs):
+        super(EndgameSolverTests, self).__init__(*args, **kwargs)
+
+        # Initialize a 2-player state on a heterogeneous board split into a top region (rows 0-2) holding
+        # RED's avatars and a bottom region (rows 5-7) holding WHITE's avatars by two rows of holes
+        self.__split_state = self.__make_state({Position(row, col): Hole() if 3 <= row < 5 else
+                                                Tile((row * 2 + col) % 5 + 1)
+                                                for row in range(8) for col in range(3)},
+                                               [Position(0, 0), Position(5, 0), Position(0, 1), Position(5, 1),
+                                                Position(0, 2), Position(5, 2), Position(1, 0), Position(6, 0)])
+
+        # Initialize a 2-player state on the same board without holes
+        self.__joint_state = self.__make_state({Position(row, col): Tile((row * 2 + col) % 5 + 1)
+                                                for row in range(8) for col in range(3)},
+                                               [Position(0, 0), Position(5, 0), Position(0, 1), Position(5, 1),
+                                                Position(0, 2), Position(5, 2), Position(1, 0), Position(6, 0)])
+
+    def tearDown(self):
+        Strategy.ENDGAME_SOLVER = True
+        Strategy.TRANSPOSITION_TABLE = None
+
+    @staticmethod
+    def __make_state(tiles: dict, placements: [Position]) -> State:
+        """
+        Makes up a state for RED and WHITE on a board of the given tiles, placing avatars at the
+        given positions on behalf of either player in turn.
+        """
+        state = State(Board(tiles), [PlayerEntity('a', Color.RED), PlayerEntity('b', Color.WHITE)], [])
+
+        for i, pos in enumerate(placements):
+            state.place_avatar(state.player_order[i % 2], pos)
+
+        return state
+
+    @staticmethod
+    def __search(state: State, depth: int) -> int:
+        """
+        Returns the min-max score of the state's current player searched to the given depth without
+        a transposition table or endgame solver.
+        """
+        return Strategy._Strategy__mini_max_search_in_place(state.deepcopy(), state.current_player, depth)[0]
+
+    def test_solve_success1(self):
+        # Tests that the solved score agrees with the min-max score once the depth covers all
+        # 5 open tiles in RED's region
+        solver = EndgameSolver()
+
+        for depth in [5, 6]:
+            self.assertEqual(solver.solve(self.__split_state, Color.RED, depth), self.__search(self.__split_state, 5))
+
+        self.assertEqual(solver.solved, 2)
+
+    def test_solve_success2(self):
+        # Tests that the solved score agrees with the min-max score for either player as moves are made
+        solver = EndgameSolver()
+        state = self.__split_state.deepcopy()
+
+        while state.can_anyone_move():
+            self.assertEqual(solver.solve(state, state.current_player, 5), self.__search(state, 5))
+            state.move_avatar(*state.get_possible_actions()[0])
+
+    def test_solve_memo(self):
+        # Tests that solving a position again draws on the memo
+        solver = EndgameSolver()
+        solver.solve(self.__split_state, Color.RED, 5)
+        memo_size = solver.memo_size
+
+        self.assertGreater(memo_size, 0)
+        solver.solve(self.__split_state, Color.RED, 5)
+        self.assertEqual(solver.memo_size, memo_size)
+
+    def test_solve_fail1(self):
+        # Tests that positions are left to the search if the depth may not see RED run out of moves
+        self.assertIsNone(EndgameSolver().solve(self.__split_state, Color.RED, 4))
+
+    def test_solve_fail2(self):
+        # Tests that positions are left to the search if RED shares a region with WHITE
+        self.assertIsNone(EndgameSolver().solve(self.__joint_state, Color.RED, 20))
+
+    def test_get_best_action_agrees(self):
+        # Tests that the strategy picks the same actions with and without the endgame solver, yet
+        # searches fewer nodes with it
+        for depth in [2, 5]:
+            Strategy.ENDGAME_SOLVER = False
+            action = Strategy.get_best_action(self.__split_state, depth)
+            nodes_searched = Strategy.stats.nodes
+
+            Strategy.ENDGAME_SOLVER = True
+            self.assertEqual(Strategy.get_best_action(self.__split_state, depth), action)
+            self.assertLessEqual(Strategy.stats.nodes, nodes_searched)
+
+        self.assertLess(Strategy.stats.nodes, nodes_searched)
@@ -0,0 +1,157 @@
+import multiprocessing
+import sys
+import unittest
+
+sys.path.append('Player/')
+sys.path.append('../../../Common')
+
+from evaluator import Evaluator, np
+import strategy
+from strategy import Strategy
+from search_mode import SearchMode
+from board import Board
+from color import Color
+from hole import Hole
+from player_entity import PlayerEntity
+from position import Position
+from state import State
+from tile import Tile
+from constants import VERY_LARGE_NUMBER
+
+
+@unittest.skipIf(np is None, 'numpy is not installed')
+class EvaluatorTests(unittest.TestCase):
+    def __init__(self, *args, **kwargs):
+        super(EvaluatorTests, self).__init__(*args, **kwargs)
+
+        # Initialize a 2-player state on a heterogeneous 4x3 board with a hole at (2, 2) and all avatars placed
+        self.__state = State(Board({Position(row, col): Hole() if (row, col) == (2, 2) else Tile((row + col) % 5 + 1)
+                                    for row in range(4) for col in range(3)}),
+                             [PlayerEntity("John", Color.RED), PlayerEntity("George", Color.WHITE)], [])
+
+        for i, pos in enumerate([Position(0, 0), Position(0, 2), Position(1, 0), Position(3, 2),
+                                 Position(3, 0), Position(1, 1), Position(2, 0), Position(2, 1)]):
+            self.__state.place_avatar(self.__state.player_order[i % 2], pos)
+
+    def tearDown(self):
+        Strategy.EVALUATION = False
+        Strategy.SEARCH_MODE = SearchMode.MAKE_UNMAKE
+        Strategy.TRANSPOSITION_TABLE = None
+
+    def __evaluate_in_python(self, state: State, color: Color) -> int:
+        """
+        Evaluates the given state for the player of the given color by looping over the positions
+        each avatar can reach.
+        """
+        reached = {True: set(), False: set()}
+        mobility = 0
+
+        for player_color in state.player_order:
+            for pos in state.get_player_positions(player_color):
+                positions = state.board.bitboard.reachable_positions(pos, state.occupied_mask)
+                reached[player_color == color].update(positions)
+                mobility += len(positions) if player_color == color else -len(positions)
+
+        reachable_fish = sum(state.board.get_tile(pos).fish_no for pos in reached[True])
+        contested = len(reached[True] & reached[False])
+
+        return state.get_player_score(color) + (reachable_fish + mobility - contested) // Evaluator.SCALE
+
+    def test_init_fail1(self):
+        # Tests constructor failing due to invalid board
+        with self.assertRaises(TypeError):
+            Evaluator(self.__state)
+
+    def test_evaluate_fail1(self):
+        # Tests failing evaluate due to invalid states
+        with self.assertRaises(TypeError):
+            Evaluator(self.__state.board).evaluate(self.__state, Color.RED)
+
+    def test_evaluate_fail2(self):
+        # Tests failing evaluate due to invalid color
+        with self.assertRaises(TypeError):
+            Evaluator(self.__state.board).evaluate([self.__state], 'red')
+
+    def test_evaluate_success1(self):
+        # Tests that states are evaluated as laid out in the class description
+        evaluator = Evaluator(self.__state.board)
+        state = self.__state.deepcopy()
+        states = [state.deepcopy()]
+
+        while state.can_anyone_move():
+            state.move_avatar(*state.get_possible_actions()[0])
+            states.append(state.deepcopy())
+
+        for color in [Color.RED, Color.WHITE]:
+            self.assertEqual(evaluator.evaluate(states, color),
+                             [self.__evaluate_in_python(state, color) for state in states])
+
+    def test_evaluate_success2(self):
+        # Tests evaluating an empty batch
+        self.assertEqual(Evaluator(self.__state.board).evaluate([], Color.RED), [])
+
+    def test_evaluate_children_fail1(self):
+        # Tests failing evaluate_children due to invalid state
+        with self.assertRaises(TypeError):
+            Evaluator(self.__state.board).evaluate_children(None, Color.RED, [])
+
+    def test_evaluate_children_success1(self):
+        # Tests that children are evaluated just like the states resulting from making each move
+        evaluator = Evaluator(self.__state.board)
+        state = self.__state.deepcopy()
+        moves = state.get_possible_actions()
+        children = []
+
+        for move in moves:
+            child = state.deepcopy()
+            child.move_avatar(*move)
+            children.append(child)
+
+        for color in [Color.RED, Color.WHITE]:
+            self.assertEqual(evaluator.evaluate_children(state, color, moves), evaluator.evaluate(children, color))
+
+        # Make sure state was left as is
+        self.assertEqual(state.position_hash, self.__state.position_hash)
+
+    def test_strategy_success1(self):
+        # Tests that searches scoring leaves by evaluation pick the same moves in either search mode
+        actions = []
+
+        for search_mode in [SearchMode.MAKE_UNMAKE, SearchMode.GAME_TREE]:
+            Strategy.SEARCH_MODE = search_mode
+            Strategy.EVALUATION = True
+            actions.append(Strategy.get_best_action(self.__state, 2))
+
+        self.assertEqual(actions[0], actions[1])
+
+    def test_strategy_success2(self):
+        # Tests that a search to a depth of 1 picks the child with the best evaluation
+        Strategy.EVALUATION = True
+        action = Strategy.get_best_action(self.__state, 1)
+
+        moves = self.__state.get_possible_actions()
+        evaluations = Evaluator(self.__state.board).evaluate_children(self.__state, Color.RED, moves)
+        best = max(evaluations)
+
+        self.assertEqual(action, min(move for move, evaluation in zip(moves, evaluations) if evaluation == best))
+
+    def test_strategy_success3(self):
+        # Tests that a worker of a parallel search evaluates the leaves of its subtree without switching
+        # evaluation on for the searches that follow
+        strategy._init_search_worker(multiprocessing.Value('i', -VERY_LARGE_NUMBER))
+
+        try:
+            _, score, _ = strategy._search_subtree((0, self.__state.deepcopy(), Color.RED, 1, 1, None,
+                                                    Strategy.MOVE_ORDERING, False, False, True))
+        finally:
+            # Leave no worker search settings behind on this thread
+            Strategy._Strategy__local.evaluator = None
+            del Strategy._Strategy__local.table
+            del Strategy._Strategy__local.stats
+            strategy._worker_table = strategy._shared_bound = None
+
+        moves = self.__state.get_possible_actions()
+        evaluations = Evaluator(self.__state.board).evaluate_children(self.__state, Color.RED, moves)
+
+        self.assertEqual(score, max(evaluations))
+        self.assertFalse(Strategy.EVALUATION)
@@ -0,0 +1,77 @@
+import math
+import sys
+import unittest
+
+sys.path.append('Player/')
+sys.path.append('../../../Common')
+
+from monte_carlo_node import MonteCarloNode
+from action import Action
+from color import Color
+from position import Position
+
+
+class MonteCarloNodeTests(unittest.TestCase):
+    def __init__(self, *args, **kwargs):
+        super(MonteCarloNodeTests, self).__init__(*args, **kwargs)
+
+        # Initialize actions for testing
+        self.__action1 = Action(Position(0, 0), Position(1, 0))
+        self.__action2 = Action(Position(0, 0), Position(2, 0))
+
+    def test_init_fail1(self):
+        # Tests constructor failing due to invalid color
+        with self.assertRaises(TypeError):
+            MonteCarloNode('red', [])
+
+    def test_init_fail2(self):
+        # Tests constructor failing due to invalid untried actions
+        with self.assertRaises(TypeError):
+            MonteCarloNode(Color.RED, None)
+
+    def test_init_fail3(self):
+        # Tests constructor failing due to invalid parent
+        with self.assertRaises(TypeError):
+            MonteCarloNode(Color.RED, [], self.__action1, 'root')
+
+    def test_expand(self):
+        # Tests that untried actions are expanded last first
+        root = MonteCarloNode(Color.RED, [self.__action1, self.__action2])
+
+        self.assertFalse(root.is_fully_expanded)
+        self.assertEqual(root.next_action(), self.__action2)
+
+        child = root.expand(Color.WHITE, [])
+        self.assertEqual(child.action, self.__action2)
+        self.assertIs(child.parent, root)
+        self.assertEqual(child.color, Color.WHITE)
+
+        root.expand(None, [])
+        self.assertTrue(root.is_fully_expanded)
+        self.assertEqual([child.action for child in root.children], [self.__action2, self.__action1])
+
+    def test_update(self):
+        # Tests that rewards are summed up per player
+        node = MonteCarloNode(Color.RED, [])
+        node.update({Color.RED: 1.0, Color.WHITE: 0.0})
+        node.update({Color.RED: 0.5, Color.WHITE: 0.5})
+
+        self.assertEqual(node.visits, 2)
+        self.assertEqual(node.get_reward(Color.RED), 1.5)
+        self.assertEqual(node.get_reward(Color.WHITE), 0.5)
+        self.assertEqual(node.get_reward(Color.BLACK), 0.0)
+
+    def test_select_child(self):
+        # Tests that children are selected by the UCT score of the player to move
+        root = MonteCarloNode(Color.RED, [self.__action1, self.__action2])
+        child1 = root.expand(Color.WHITE, [])
+        child2 = root.expand(Color.WHITE, [])
+
+        for rewards, child in [({Color.RED: 1.0}, child1), ({Color.RED: 0.0, Color.WHITE: 1.0}, child2),
+                               ({Color.RED: 0.0, Color.WHITE: 1.0}, child2)]:
+            child.update(rewards)
+            root.update(rewards)
+
+        # Exploitation favors child1 (RED wins all of its playouts)
+        self.assertIs(root.select_child(0), child1)
+        self.assertIs(root.select_child(math.sqrt(2)), child1)
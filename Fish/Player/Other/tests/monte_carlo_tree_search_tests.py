@@ -0,0 +1,101 @@
+import sys
+import time
+import unittest
+
+sys.path.append('Player/')
+sys.path.append('../../../Common')
+
+from monte_carlo_tree_search import MonteCarloTreeSearch
+from playout_policy import PlayoutPolicy
+from board import Board
+from color import Color
+from player_entity import PlayerEntity
+from position import Position
+from state import State
+from tile import Tile
+
+
+class MonteCarloTreeSearchTests(unittest.TestCase):
+    def __init__(self, *args, **kwargs):
+        super(MonteCarloTreeSearchTests, self).__init__(*args, **kwargs)
+
+        # Initialize a 4-player state on a heterogeneous 5x5 board with all avatars placed
+        self.__state = State(Board({Position(row, col): Tile((row * 3 + col) % 5 + 1)
+                                    for row in range(5) for col in range(5)}),
+                             [PlayerEntity('a', Color.RED), PlayerEntity('b', Color.BROWN),
+                              PlayerEntity('c', Color.WHITE), PlayerEntity('d', Color.BLACK)], [])
+
+        for i, pos in enumerate([Position(0, 0), Position(0, 2), Position(0, 4), Position(2, 1),
+                                 Position(2, 3), Position(4, 0), Position(4, 2), Position(4, 4)]):
+            self.__state.place_avatar(self.__state.player_order[i % 4], pos)
+
+        # Initialize a 2-player state on a 3x3 board in which RED can only move to the sole open tile (0, 0)
+        self.__single_action_state = State(Board.homogeneous(1, 3, 3),
+                                           [PlayerEntity('a', Color.RED), PlayerEntity('b', Color.WHITE)], [])
+
+        for i, pos in enumerate([Position(row, col) for row in range(3) for col in range(3)][1:]):
+            self.__single_action_state.place_avatar(self.__single_action_state.player_order[i % 2], pos)
+
+    def tearDown(self):
+        MonteCarloTreeSearch.SEED = None
+        MonteCarloTreeSearch.PLAYOUT_POLICY = PlayoutPolicy.RANDOM
+
+    def test_get_best_action_fail1(self):
+        # Tests failing due to invalid state
+        with self.assertRaises(TypeError):
+            MonteCarloTreeSearch.get_best_action('state', 10)
+
+    def test_get_best_action_fail2(self):
+        # Tests failing due to invalid iterations
+        with self.assertRaises(ValueError):
+            MonteCarloTreeSearch.get_best_action(self.__state, 0)
+
+    def test_get_best_action_fail3(self):
+        # Tests failing due to invalid time budget
+        with self.assertRaises(ValueError):
+            MonteCarloTreeSearch.get_best_action(self.__state, time_budget=-1)
+
+    def test_get_best_action_iterations(self):
+        # Tests that the search runs the given number of iterations and yields the same action
+        # for the same seed
+        MonteCarloTreeSearch.SEED = 1
+        action = MonteCarloTreeSearch.get_best_action(self.__state, 200)
+
+        self.assertIn(action, self.__state.get_possible_actions())
+        self.assertEqual(MonteCarloTreeSearch.playouts, 200)
+        self.assertGreater(MonteCarloTreeSearch.playouts_per_second, 0)
+        self.assertEqual(MonteCarloTreeSearch.get_best_action(self.__state, 200), action)
+
+    def test_get_best_action_time_budget(self):
+        # Tests that the search keeps to its time budget
+        start = time.monotonic()
+        action = MonteCarloTreeSearch.get_best_action(self.__state, time_budget=0.3)
+
+        self.assertLess(time.monotonic() - start, 0.6)
+        self.assertIn(action, self.__state.get_possible_actions())
+        self.assertGreater(MonteCarloTreeSearch.playouts, 0)
+
+    def test_get_best_action_greedy(self):
+        # Tests searching with greedy playouts
+        MonteCarloTreeSearch.PLAYOUT_POLICY = PlayoutPolicy.GREEDY
+        action = MonteCarloTreeSearch.get_best_action(self.__state, 100)
+
+        self.assertIn(action, self.__state.get_possible_actions())
+        self.assertEqual(MonteCarloTreeSearch.playouts, 100)
+
+    def test_get_best_action_single_action(self):
+        # Tests that a sole action is returned without searching
+        actions = self.__single_action_state.get_possible_actions()
+
+        self.assertEqual(len(actions), 1)
+        self.assertEqual(MonteCarloTreeSearch.get_best_action(self.__single_action_state, 100), actions[0])
+        self.assertEqual(MonteCarloTreeSearch.playouts, 0)
+
+    def test_get_best_action_state_untouched(self):
+        # Tests that the given state is left as is
+        position_hash = self.__state.position_hash
+        MonteCarloTreeSearch.get_best_action(self.__state, 100)
+
+        self.assertEqual(self.__state.position_hash, position_hash)
+        self.assertEqual(self.__state.move_log, [])
+        self.assertEqual(self.__state.get_player_score(Color.RED), 0)
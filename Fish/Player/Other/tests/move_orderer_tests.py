@@ -0,0 +1,98 @@
+import sys
+import unittest
+
+sys.path.append('Player/')
+sys.path.append('../../../Common')
+
+from move_orderer import MoveOrderer
+from move_ordering import MoveOrdering
+from strategy import Strategy
+from action import Action
+from board import Board
+from color import Color
+from player_entity import PlayerEntity
+from position import Position
+from state import State
+from tile import Tile
+
+
+class MoveOrdererTests(unittest.TestCase):
+    def __init__(self, *args, **kwargs):
+        super(MoveOrdererTests, self).__init__(*args, **kwargs)
+
+        # Initialize a 2-player state on a heterogeneous board with all avatars placed
+        self.__state = State(Board({Position(row, col): Tile((row * 2 + col) % 5 + 1)
+                                    for row in range(6) for col in range(3)}),
+                             [PlayerEntity('a', Color.RED), PlayerEntity('b', Color.WHITE)], [])
+
+        for i, pos in enumerate([Position(0, 0), Position(0, 1), Position(0, 2), Position(1, 0),
+                                 Position(1, 1), Position(1, 2), Position(2, 0), Position(2, 1)]):
+            self.__state.place_avatar(self.__state.player_order[i % 2], pos)
+
+        self.__actions = self.__state.get_possible_actions()
+
+    def tearDown(self):
+        Strategy.MOVE_ORDERING = list(MoveOrdering)
+
+    def __order(self, orderer: MoveOrderer, ply: int = 0, table_move: Action = None) -> [Action]:
+        """
+        Orders the state's possible actions with the given orderer.
+        """
+        return sorted(self.__actions, key=orderer.get_key(self.__state, ply, table_move))
+
+    def test_init_fail1(self):
+        # Tests constructor failing due to invalid heuristics
+        with self.assertRaises(TypeError):
+            MoveOrderer(MoveOrdering.HISTORY)
+
+    def test_init_fail2(self):
+        # Tests constructor failing due to invalid heuristic
+        with self.assertRaises(TypeError):
+            MoveOrderer([MoveOrdering.HISTORY, 'killers'])
+
+    def test_get_key_success1(self):
+        # Tests there is no key without heuristics
+        self.assertIsNone(MoveOrderer([]).get_key(self.__state, 0))
+
+    def test_get_key_success2(self):
+        # Tests ordering by fish at destination keeps the generated order amongst ties
+        board = self.__state.board
+        expected = sorted(self.__actions, key=lambda action: -board.get_tile(action.dst).fish_no)
+
+        self.assertSequenceEqual(self.__order(MoveOrderer([MoveOrdering.FISH_AT_DESTINATION])), expected)
+
+    def test_get_key_success3(self):
+        # Tests that the table move goes first, then killer moves (latest first), then moves by history
+        orderer = MoveOrderer(list(MoveOrdering))
+        action1, action2, action3, action4 = self.__actions[-4:]
+
+        orderer.record_cutoff(action2, 1, 1)
+        orderer.record_cutoff(action3, 1, 1)
+        orderer.record_cutoff(action4, 2, 3)
+
+        self.assertSequenceEqual(self.__order(orderer, 1, action1)[:4], [action1, action3, action2, action4])
+        # Killer moves only apply to their own ply
+        self.assertSequenceEqual(self.__order(orderer, 2)[:3], [action4, action2, action3])
+
+    def test_record_cutoff_success(self):
+        # Tests that only the latest killer moves of each ply are remembered
+        orderer = MoveOrderer([MoveOrdering.KILLER_MOVES])
+
+        for action in self.__actions[:3]:
+            orderer.record_cutoff(action, 0, 1)
+
+        self.assertSequenceEqual(self.__order(orderer), [self.__actions[2], self.__actions[1], self.__actions[0]] +
+                                 self.__actions[3:])
+
+    def test_get_best_action_success(self):
+        # Tests that move ordering does not alter the actions picked throughout a game
+        state = self.__state.deepcopy()
+
+        while state.can_anyone_move():
+            Strategy.MOVE_ORDERING = []
+            action = Strategy.get_best_action(state, 2)
+
+            Strategy.MOVE_ORDERING = list(MoveOrdering)
+            self.assertEqual(Strategy.get_best_action(state, 2), action)
+
+            state.move_avatar(*action)
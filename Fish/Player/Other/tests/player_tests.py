@@ -1,7 +1,11 @@
+import pickle
 import sys
+import time
 import unittest
 
 from strategy import Strategy
+from monte_carlo_tree_search import MonteCarloTreeSearch
+from search_engine import SearchEngine
 
 sys.path.append('Player/')
 sys.path.append('../../../Common')
@@ -12,7 +16,8 @@ from board import Board
 from color import Color
 from position import Position
 from state import State
-from unittest.mock import patch
+from search_stats import SearchStats
+from unittest.mock import patch, ANY
 
 
 class PlayerTests(unittest.TestCase):
@@ -81,6 +86,31 @@ class PlayerTests(unittest.TestCase):
         with self.assertRaises(TypeError):
             Player('bob', Color.BLACK, 0)
 
+    def test_init_fail5(self):
+        # Tests init failing due to invalid time budget
+        with self.assertRaises(ValueError):
+            Player('bob', Color.BLACK, 1, 'a second')
+
+    def test_init_fail6(self):
+        # Tests init failing due to invalid time budget value
+        with self.assertRaises(ValueError):
+            Player('bob', Color.BLACK, 1, 0)
+
+    def test_init_fail7(self):
+        # Tests init failing due to invalid search engine
+        with self.assertRaises(TypeError):
+            Player('bob', Color.BLACK, 1, None, 'mcts')
+
+    def test_init_fail8(self):
+        # Tests init failing due to invalid ponder flag
+        with self.assertRaises(TypeError):
+            Player('bob', Color.BLACK, ponder='yes')
+
+    def test_init_fail9(self):
+        # Tests init failing due to pondering with a search engine other than MINIMAX
+        with self.assertRaises(ValueError):
+            Player('bob', Color.BLACK, search_engine=SearchEngine.MONTE_CARLO, ponder=True)
+
     def test_init_success(self):
         # Tests successful init
         p =  Player('drew', Color.BROWN)
@@ -90,6 +120,18 @@ class PlayerTests(unittest.TestCase):
         self.assertEqual(p.name, 'drew')
         self.assertEqual(p.kicked_reason, '')
 
+    def test_pickle_success(self):
+        # Tests that a pondering player can be pickled (as the referee does to copy its players), leaving
+        # the ponderer out of the copy
+        p = Player('drew', Color.BROWN, 2, ponder=True)
+
+        copy = pickle.loads(pickle.dumps(p))
+
+        self.assertEqual(copy.name, 'drew')
+        self.assertEqual(copy.color, Color.BROWN)
+        self.assertIsNone(copy.ponderer)
+        self.assertIsNotNone(p.ponderer)
+
     def test_get_placement_fail1(self):
         # Tests get_placement that fails due to invalid state
         # Make up player
@@ -129,10 +171,109 @@ class PlayerTests(unittest.TestCase):
 
         # Make sure Strategy.get_action was called with the
         # right params
-        mock.assert_called_with(self.__state1, p._Player__search_depth)
+        mock.assert_called_with(self.__state1, p._Player__search_depth, transposition_table=p.transposition_table,
+                                stats=ANY)
+        # Make sure state got updated
+        self.assertEqual(p.state, self.__state1)
+
+    def test_get_action_success2(self):
+        # Tests get_action that succeeds when searching within a time budget
+        p = Player('bob', Color.BROWN, time_budget=0.5)
+
+        # Patch Strategy.get_best_action
+        with patch.object(Strategy, 'get_best_action') as mock:
+            p.get_action(self.__state1)
+
+        # Make sure Strategy.get_action was called with the
+        # right params
+        mock.assert_called_with(self.__state1, time_budget=0.5, transposition_table=p.transposition_table,
+                                stats=ANY)
+        # Make sure state got updated
+        self.assertEqual(p.state, self.__state1)
+
+    def test_get_action_success3(self):
+        # Tests get_action that succeeds when running a Monte Carlo tree search
+        p = Player('bob', Color.BROWN, time_budget=0.5, search_engine=SearchEngine.MONTE_CARLO)
+
+        # Patch MonteCarloTreeSearch.get_best_action
+        with patch.object(MonteCarloTreeSearch, 'get_best_action') as mock:
+            p.get_action(self.__state1)
+
+        # Make sure MonteCarloTreeSearch.get_best_action was called with the right params
+        mock.assert_called_with(self.__state1, time_budget=0.5)
         # Make sure state got updated
         self.assertEqual(p.state, self.__state1)
 
+    def test_get_action_success4(self):
+        # Tests get_action that succeeds by answering from what was pondered while opponents were to move
+        p = Player('bob', Color.RED, 2, ponder=True)
+        state = self.__state2.deepcopy()
+        state.move_avatar(*state.get_possible_actions()[0])
+        p.sync(state)
+
+        # Wait for pondering to complete
+        while p.ponderer.is_pondering:
+            time.sleep(0.01)
+
+        # Let both opponents make the move pondered first
+        for _ in range(2):
+            board = state.board
+            state.move_avatar(*next(state.generate_actions(lambda action: -board.get_tile(action.dst).fish_no)))
+
+        p.sync(state)
+
+        with patch.object(Strategy, 'get_best_action') as mock:
+            action = p.get_action(state)
+
+        # Make sure action was answered from what was pondered
+        mock.assert_not_called()
+        self.assertEqual(p.ponderer.hits, 1)
+        self.assertEqual(action, Strategy.get_best_action(state, 2))
+
+    def test_get_action_success5(self):
+        # Tests get_action adds the statistics of its searches to those of the game and the tournament
+        p = Player('bob', Color.RED, 2)
+        p.tournament_has_started()
+        state = self.__state2.deepcopy()
+
+        with patch.object(Strategy, 'get_best_action', wraps=Strategy.get_best_action) as mock:
+            p.get_action(state)
+            # Make sure a search of someone else in the meantime does not find its way into them
+            Strategy.get_best_action(state, 1)
+            p.get_action(state)
+
+        # Make sure each search recorded into statistics of its own
+        stats1 = mock.call_args_list[0].kwargs['stats']
+        stats2 = mock.call_args_list[2].kwargs['stats']
+        self.assertIsInstance(stats1, SearchStats)
+        self.assertIsNot(stats1, stats2)
+
+        self.assertEqual(p.search_stats.searches, 2)
+        self.assertEqual(p.search_stats.nodes, stats1.nodes + stats2.nodes)
+
+        # Make sure game statistics start over for a new game, unlike the ones of the tournament
+        p.set_color(Color.WHITE)
+        self.assertEqual(p.search_stats.searches, 0)
+        self.assertEqual(p.tournament_search_stats.searches, 2)
+
+    def test_get_action_success6(self):
+        # Tests get_action searches with the player's own transposition table, which starts over each game
+        p = Player('bob', Color.RED, 2)
+
+        p.get_action(self.__state2.deepcopy())
+
+        self.assertIsNot(p.transposition_table, Strategy.TRANSPOSITION_TABLE)
+        self.assertGreater(p.transposition_table.entries, 0)
+        self.assertGreater(p.transposition_table.stores, 0)
+
+        p.game_over([], [], [])
+        self.assertEqual(p.transposition_table.entries, 0)
+        self.assertEqual(p.transposition_table.stores, 0)
+
+        p.get_action(self.__state2.deepcopy())
+        p.set_color(Color.WHITE)
+        self.assertEqual(p.transposition_table.entries, 0)
+
     def test_kick_player_success(self):
         # Tests successful kick player
         p = Player('bob', Color.BLACK)
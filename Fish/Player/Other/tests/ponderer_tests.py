@@ -0,0 +1,197 @@
+import sys
+import time
+import unittest
+
+sys.path.append('Player/')
+sys.path.append('../../../Common')
+
+from ponderer import Ponderer
+from strategy import Strategy
+from transposition_table import TranspositionTable
+from board import Board
+from color import Color
+from player_entity import PlayerEntity
+from position import Position
+from state import State
+from tile import Tile
+
+
+class PondererTests(unittest.TestCase):
+    def __init__(self, *args, **kwargs):
+        super(PondererTests, self).__init__(*args, **kwargs)
+
+        # Initialize a 2-player state on a heterogeneous 5x4 board with all avatars placed and
+        # WHITE to move
+        self.__state1 = State(Board({Position(row, col): Tile((row * 3 + col * 2) % 5 + 1)
+                                     for row in range(5) for col in range(4)}),
+                              [PlayerEntity("John", Color.RED), PlayerEntity("George", Color.WHITE)], [])
+
+        for i, pos in enumerate([Position(0, 0), Position(0, 3), Position(2, 1), Position(2, 2),
+                                 Position(3, 0), Position(3, 3), Position(4, 1), Position(4, 2)]):
+            self.__state1.place_avatar(self.__state1.player_order[i % 2], pos)
+
+        self.__state1.move_avatar(*self.__state1.get_possible_actions()[0])
+
+        # Initialize a 4-player state on a 6x6 board with all avatars placed
+        self.__state2 = State(Board({Position(row, col): Tile((row + col) % 5 + 1)
+                                     for row in range(6) for col in range(6)}),
+                              [PlayerEntity("John", Color.RED), PlayerEntity("George", Color.WHITE),
+                               PlayerEntity("Gary", Color.BLACK), PlayerEntity("Jeanine", Color.BROWN)], [])
+
+        for i in range(8):
+            self.__state2.place_avatar(self.__state2.player_order[i % 4], Position(i // 6 * 3, i % 6))
+
+    def tearDown(self):
+        Ponderer.MAX_PREDICTED_POSITIONS = 64
+        Strategy.TRANSPOSITION_TABLE = None
+
+    @staticmethod
+    def __wait(ponderer: Ponderer, timeout: float = 60) -> None:
+        """
+        Waits for the given ponderer to run out of positions to ponder.
+        """
+        deadline = time.monotonic() + timeout
+
+        while ponderer.is_pondering and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    def test_init_fail1(self):
+        # Tests init failing due to invalid color
+        with self.assertRaises(TypeError):
+            Ponderer('red', 1)
+
+    def test_init_fail2(self):
+        # Tests init failing due to invalid search depth
+        with self.assertRaises(ValueError):
+            Ponderer(Color.RED, 0)
+
+        with self.assertRaises(ValueError):
+            Ponderer(Color.RED, '1')
+
+    def test_init_fail3(self):
+        # Tests init failing due to invalid time budget
+        with self.assertRaises(ValueError):
+            Ponderer(Color.RED, 1, 0)
+
+    def test_init_fail4(self):
+        # Tests init failing due to invalid transposition table
+        with self.assertRaises(TypeError):
+            Ponderer(Color.RED, 1, None, 'table')
+
+    def test_start_fail1(self):
+        # Tests start failing due to invalid state
+        with self.assertRaises(TypeError):
+            Ponderer(Color.RED, 1).start('not a state')
+
+    def test_start_success1(self):
+        # Tests that the ponderer does not ponder if it is the player's turn or avatars are still being placed
+        ponderer = Ponderer(Color.WHITE, 1)
+        ponderer.start(self.__state1)
+        self.assertFalse(ponderer.is_pondering)
+
+        state = State(Board.homogeneous(2, 5, 4), [PlayerEntity("John", Color.RED),
+                                                   PlayerEntity("George", Color.WHITE)], [])
+        state.place_avatar(Color.RED, Position(0, 0))
+        ponderer.start(state)
+        self.assertFalse(ponderer.is_pondering)
+        self.assertEqual(ponderer.cached_actions, 0)
+
+    def test_start_success2(self):
+        # Tests that the ponderer caches the action the player would pick for each reply of its opponent
+        ponderer = Ponderer(Color.RED, 2)
+        ponderer.start(self.__state1)
+        self.__wait(ponderer)
+
+        replies = self.__state1.get_possible_actions()
+        self.assertEqual(ponderer.cached_actions, len(replies))
+        self.assertEqual(ponderer.positions_searched, len(replies))
+
+        for reply in replies:
+            state = self.__state1.deepcopy()
+            state.move_avatar(*reply)
+            self.assertEqual(ponderer.get_action(state), Strategy.get_best_action(state, 2))
+
+        self.assertEqual(ponderer.hits, len(replies))
+
+    def test_start_success3(self):
+        # Tests that the ponderer predicts no more than MAX_PREDICTED_POSITIONS positions, the ones
+        # reached by the moves landing on the most fish first, across several opponents
+        Ponderer.MAX_PREDICTED_POSITIONS = 3
+        state = self.__state2.deepcopy()
+        state.move_avatar(*state.get_possible_actions()[0])
+
+        ponderer = Ponderer(Color.RED, 1)
+        ponderer.start(state)
+        self.__wait(ponderer)
+
+        self.assertEqual(ponderer.cached_actions, 3)
+
+    def test_start_success4(self):
+        # Tests that the ponderer caches no actions in time mode
+        Ponderer.MAX_PREDICTED_POSITIONS = 2
+        ponderer = Ponderer(Color.RED, 1, 0.05)
+        ponderer.start(self.__state1)
+        self.__wait(ponderer)
+
+        self.assertEqual(ponderer.positions_searched, 2)
+        self.assertEqual(ponderer.cached_actions, 0)
+
+    def test_start_success5(self):
+        # Tests that each ponderer searches with a transposition table of its own rather than the shared one
+        Strategy.TRANSPOSITION_TABLE = TranspositionTable()
+        table = TranspositionTable()
+        ponderer1 = Ponderer(Color.RED, 2)
+        ponderer2 = Ponderer(Color.RED, 2, None, table)
+        ponderer1.start(self.__state1)
+        ponderer2.start(self.__state1)
+        self.__wait(ponderer1)
+        self.__wait(ponderer2)
+
+        self.assertIs(ponderer2.transposition_table, table)
+        self.assertIsNot(ponderer1.transposition_table, table)
+        self.assertGreater(ponderer1.transposition_table.stores, 0)
+        self.assertEqual(ponderer1.transposition_table.stores, table.stores)
+        self.assertEqual(Strategy.TRANSPOSITION_TABLE.stores, 0)
+
+    def test_stop_success1(self):
+        # Tests that stopping the ponderer stops its search right away, leaving no partial results behind
+        state = self.__state2.deepcopy()
+        state.move_avatar(*state.get_possible_actions()[0])
+
+        ponderer = Ponderer(Color.RED, 10)
+        ponderer.start(state)
+        time.sleep(0.1)
+        self.assertTrue(ponderer.is_pondering)
+
+        start = time.monotonic()
+        ponderer.stop()
+
+        self.assertLess(time.monotonic() - start, 1)
+        self.assertFalse(ponderer.is_pondering)
+        self.assertEqual(ponderer.cached_actions, 0)
+
+    def test_get_action_success1(self):
+        # Tests that the ponderer answers positions it has not searched with None
+        ponderer = Ponderer(Color.WHITE, 1)
+        self.assertIsNone(ponderer.get_action(self.__state1))
+        self.assertEqual(ponderer.hits, 0)
+
+    def test_reset_success1(self):
+        # Tests that resetting the ponderer drops cached actions and counters
+        ponderer = Ponderer(Color.RED, 1)
+        ponderer.start(self.__state1)
+        self.__wait(ponderer)
+        ponderer.reset()
+
+        self.assertEqual(ponderer.cached_actions, 0)
+        self.assertEqual(ponderer.positions_searched, 0)
+
+    def test_color_success1(self):
+        # Tests that changing the player's color drops cached actions
+        ponderer = Ponderer(Color.RED, 1)
+        ponderer.start(self.__state1)
+        self.__wait(ponderer)
+        ponderer.color = Color.WHITE
+
+        self.assertEqual(ponderer.color, Color.WHITE)
+        self.assertEqual(ponderer.cached_actions, 0)
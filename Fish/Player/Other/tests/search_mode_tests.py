@@ -0,0 +1,132 @@
+import sys
+import unittest
+
+sys.path.append('Player/')
+sys.path.append('../../../Common')
+
+from strategy import Strategy
+from search_mode import SearchMode
+from board import Board
+from color import Color
+from player_entity import PlayerEntity
+from position import Position
+from state import State
+from tile import Tile
+from hole import Hole
+
+
+class SearchModeTests(unittest.TestCase):
+    def __init__(self, *args, **kwargs):
+        super(SearchModeTests, self).__init__(*args, **kwargs)
+
+        # Initialize heterogeneous board riddled with a few holes
+        tiles = {}
+
+        for row in range(6):
+            for col in range(4):
+                tiles[Position(row, col)] = Hole() if (row, col) in [(2, 1), (4, 3)] \
+                    else Tile((row * 3 + col) % 5 + 1)
+
+        # Initialize a 3-player state on it with all avatars placed
+        self.__state1 = State(Board(tiles), [PlayerEntity('a', Color.RED),
+                                             PlayerEntity('b', Color.WHITE),
+                                             PlayerEntity('c', Color.BLACK)], [])
+
+        for i, pos in enumerate([Position(0, 0), Position(0, 1), Position(0, 2), Position(0, 3), Position(1, 0),
+                                 Position(1, 1), Position(1, 2), Position(1, 3), Position(5, 0)]):
+            self.__state1.place_avatar(self.__state1.player_order[i % 3], pos)
+
+        # Initialize a 4-player state on a homogeneous board with all avatars placed
+        self.__state2 = State(Board.homogeneous(2, 5, 5), [PlayerEntity('a', Color.RED),
+                                                          PlayerEntity('b', Color.BROWN),
+                                                          PlayerEntity('c', Color.WHITE),
+                                                          PlayerEntity('d', Color.BLACK)], [])
+
+        for i, pos in enumerate([Position(0, 0), Position(0, 1), Position(0, 2), Position(0, 3),
+                                 Position(0, 4), Position(1, 0), Position(1, 1), Position(1, 2)]):
+            self.__state2.place_avatar(self.__state2.player_order[i % 4], pos)
+
+    def tearDown(self):
+        Strategy.SEARCH_MODE = SearchMode.MAKE_UNMAKE
+        Strategy.PARALLEL_SPLIT_DEPTH = 1
+
+    def __get_best_action(self, state: State, depth: int, search_mode: SearchMode):
+        """
+        Retrieves the best action for the given state using the given search mode.
+        """
+        Strategy.SEARCH_MODE = search_mode
+        return Strategy.get_best_action(state, depth)
+
+    def test_search_modes_agree(self):
+        # Tests that both search modes yield the same actions throughout a game
+        for depth in [1, 2]:
+            state = self.__state1.deepcopy()
+
+            while state.can_anyone_move():
+                action = self.__get_best_action(state, depth, SearchMode.MAKE_UNMAKE)
+                self.assertEqual(action, self.__get_best_action(state, depth, SearchMode.GAME_TREE))
+                state.move_avatar(*action)
+
+    def test_search_modes_agree_four_players(self):
+        # Tests that both search modes yield the same action with four players
+        self.assertEqual(self.__get_best_action(self.__state2, 2, SearchMode.MAKE_UNMAKE),
+                         self.__get_best_action(self.__state2, 2, SearchMode.GAME_TREE))
+
+    def test_make_unmake_leaves_state(self):
+        # Tests that searching by making and unmaking moves leaves the given state as it was
+        placements = self.__state1.placements
+        tiles = self.__state1.board.tiles
+        player_order = self.__state1.player_order
+
+        self.__get_best_action(self.__state1, 3, SearchMode.MAKE_UNMAKE)
+
+        self.assertEqual(self.__state1.placements, placements)
+        self.assertEqual(self.__state1.board.tiles, tiles)
+        self.assertEqual(self.__state1.player_order, player_order)
+        self.assertEqual(self.__state1.move_log, [])
+        self.assertEqual(self.__state1.get_player_score(Color.RED), 0)
+
+    def test_mini_max_search_in_place(self):
+        # Tests that minimax search on a mutable state restores the state after each move
+        state = self.__state2.deepcopy()
+        score, action = Strategy._Strategy__mini_max_search_in_place(state, Color.RED, 2)
+
+        self.assertEqual(action, self.__get_best_action(self.__state2, 2, SearchMode.GAME_TREE))
+        self.assertEqual(state.placements, self.__state2.placements)
+        self.assertEqual(state.move_log, [])
+
+    def test_parallel_search_agrees(self):
+        # Tests that the parallel search yields the same actions as the serial one at either split depth
+        Strategy.PARALLEL_PROCESSES = 2
+
+        for split_depth in [1, 2]:
+            Strategy.PARALLEL_SPLIT_DEPTH = split_depth
+            state = self.__state1.deepcopy()
+
+            while state.can_anyone_move():
+                action = self.__get_best_action(state, 2, SearchMode.MAKE_UNMAKE)
+                self.assertEqual(action, self.__get_best_action(state, 2, SearchMode.PARALLEL))
+                state.move_avatar(*action)
+
+        self.assertEqual(self.__get_best_action(self.__state2, 2, SearchMode.PARALLEL),
+                         self.__get_best_action(self.__state2, 2, SearchMode.MAKE_UNMAKE))
+
+    def test_parallel_search_time_budget(self):
+        # Tests that the parallel search keeps to a time budget
+        Strategy.PARALLEL_PROCESSES = 2
+        Strategy.SEARCH_MODE = SearchMode.PARALLEL
+        action = Strategy.get_best_action(self.__state2, time_budget=0.5)
+
+        self.assertIn(action, self.__state2.get_possible_actions())
+
+    def test_parallel_search_pool_kept(self):
+        # Tests that the pool of worker processes is kept across searches
+        Strategy.PARALLEL_PROCESSES = 2
+        self.__get_best_action(self.__state1, 1, SearchMode.PARALLEL)
+        pool = Strategy._Strategy__search_pool
+
+        self.__get_best_action(self.__state1, 1, SearchMode.PARALLEL)
+        self.assertIs(Strategy._Strategy__search_pool, pool)
+
+        Strategy.shutdown_search_pool()
+        self.assertIsNone(Strategy._Strategy__search_pool)
@@ -0,0 +1,50 @@
+import sys
+import unittest
+
+sys.path.append('Player/')
+
+from search_pool import SearchPool
+
+# Bound shared with the worker processes of the pool under test
+shared_bound = None
+
+
+def init_worker(bound) -> None:
+    """
+    Keeps the shared bound handed to a worker process.
+    """
+    global shared_bound
+    shared_bound = bound
+
+
+def add_shared_bound(value: int) -> int:
+    """
+    Adds the shared bound to the given value in a worker process.
+    """
+    return value + shared_bound.value
+
+
+class SearchPoolTests(unittest.TestCase):
+    def test_init_fail1(self):
+        # Tests constructor failing due to invalid processes
+        with self.assertRaises(ValueError):
+            SearchPool(0, init_worker)
+
+    def test_init_fail2(self):
+        # Tests constructor failing due to invalid initializer
+        with self.assertRaises(TypeError):
+            SearchPool(2, 'init')
+
+    def test_imap_unordered_success(self):
+        # Tests that workers run tasks and observe the shared bound
+        pool = SearchPool(2, init_worker)
+
+        try:
+            self.assertEqual(pool.processes, 2)
+
+            with pool.lock:
+                pool.shared_bound = 10
+                self.assertEqual(pool.shared_bound, 10)
+                self.assertEqual(sorted(pool.imap_unordered(add_shared_bound, [1, 2, 3])), [11, 12, 13])
+        finally:
+            pool.close()
@@ -0,0 +1,190 @@
+import sys
+import unittest
+
+sys.path.append('Player/')
+sys.path.append('../../../Common')
+
+from search_stats import SearchStats
+from strategy import Strategy
+from search_mode import SearchMode
+from exceptions.SearchTimeoutException import SearchTimeoutException
+from board import Board
+from color import Color
+from player_entity import PlayerEntity
+from position import Position
+from state import State
+from tile import Tile
+
+
+class SearchStatsTests(unittest.TestCase):
+    def __init__(self, *args, **kwargs):
+        super(SearchStatsTests, self).__init__(*args, **kwargs)
+
+        # Initialize a 2-player state on a heterogeneous 5x4 board with all avatars placed
+        self.__state = State(Board({Position(row, col): Tile((row * 3 + col * 2) % 5 + 1)
+                                    for row in range(5) for col in range(4)}),
+                             [PlayerEntity("John", Color.RED), PlayerEntity("George", Color.WHITE)], [])
+
+        for i, pos in enumerate([Position(0, 0), Position(0, 3), Position(2, 1), Position(2, 2),
+                                 Position(4, 0), Position(4, 3), Position(1, 1), Position(3, 2)]):
+            self.__state.place_avatar(self.__state.player_order[i % 2], pos)
+
+    def tearDown(self):
+        Strategy.AGGREGATE_STATS = None
+        Strategy.SEARCH_MODE = SearchMode.MAKE_UNMAKE
+        Strategy.USE_TRANSPOSITION_TABLE = True
+        Strategy.TRANSPOSITION_TABLE = None
+
+    def test_init_success1(self):
+        # Tests that statistics start out at zero
+        stats = SearchStats()
+
+        self.assertEqual(stats.get_counters(), dict.fromkeys(SearchStats.COUNTERS, 0))
+        self.assertEqual(stats.searches, 0)
+        self.assertEqual(stats.seconds, 0.0)
+        self.assertEqual(stats.depths, {})
+        self.assertEqual(stats.branching_factor, 0.0)
+        self.assertEqual(stats.nodes_per_second, 0.0)
+
+    def test_iteration_fail1(self):
+        # Tests failing iteration due to invalid depth
+        with self.assertRaises(ValueError):
+            with SearchStats().iteration(0):
+                pass
+
+    def test_iteration_success1(self):
+        # Tests that an iteration records the counters bumped within it to its depth
+        stats = SearchStats()
+        stats.nodes = 3
+
+        with stats.iteration(2):
+            stats.nodes += 5
+            stats.cutoffs += 1
+
+        with stats.iteration(2):
+            stats.nodes += 2
+
+        self.assertEqual(stats.nodes, 10)
+        self.assertEqual(stats.depths[2]['nodes'], 7)
+        self.assertEqual(stats.depths[2]['cutoffs'], 1)
+        self.assertEqual(stats.depths[2]['iterations'], 2)
+        self.assertEqual(stats.depths[2]['completed'], 2)
+
+    def test_iteration_success2(self):
+        # Tests that an iteration left by an exception is recorded as incomplete and the exception passed on
+        stats = SearchStats()
+
+        with self.assertRaises(SearchTimeoutException):
+            with stats.iteration(1):
+                stats.nodes += 4
+                raise SearchTimeoutException()
+
+        self.assertEqual(stats.depths[1]['nodes'], 4)
+        self.assertEqual(stats.depths[1]['iterations'], 1)
+        self.assertEqual(stats.depths[1]['completed'], 0)
+
+    def test_merge_fail1(self):
+        # Tests failing merge due to invalid statistics
+        with self.assertRaises(TypeError):
+            SearchStats().merge({'nodes': 1})
+
+    def test_merge_success1(self):
+        # Tests that merging adds up counters, searches, seconds and depths
+        stats1 = SearchStats()
+        stats2 = SearchStats()
+
+        for stats, nodes in [(stats1, 4), (stats2, 6)]:
+            with stats.iteration(1):
+                stats.nodes += nodes
+                stats.expanded += 2
+                stats.children += 5
+
+            stats.searches = 1
+            stats.seconds = 0.5
+
+        stats1.merge(stats2)
+
+        self.assertEqual(stats1.nodes, 10)
+        self.assertEqual(stats1.searches, 2)
+        self.assertEqual(stats1.seconds, 1.0)
+        self.assertEqual(stats1.branching_factor, 2.5)
+        self.assertEqual(stats1.nodes_per_second, 10.0)
+        self.assertEqual(stats1.depths[1]['nodes'], 10)
+        self.assertEqual(stats1.depths[1]['iterations'], 2)
+        # Make sure merged statistics are left as they are
+        self.assertEqual(stats2.nodes, 6)
+
+    def test_to_dict_success1(self):
+        # Tests converting statistics into a dict
+        stats = SearchStats()
+
+        with stats.iteration(3):
+            stats.nodes += 2
+
+        result = stats.to_dict()
+
+        self.assertEqual(result['nodes'], 2)
+        self.assertEqual(result['searches'], 0)
+        self.assertEqual(result['branching_factor'], 0.0)
+        self.assertEqual(list(result['depths'].keys()), [3])
+
+    def test_strategy_fail1(self):
+        # Tests get_best_action failing due to invalid statistics
+        with self.assertRaises(TypeError):
+            Strategy.get_best_action(self.__state, 2, stats={})
+
+    def test_strategy_success1(self):
+        # Tests that a fixed depth search records a single completed iteration to its depth
+        Strategy.get_best_action(self.__state, 2)
+        stats = Strategy.stats
+
+        self.assertEqual(stats.searches, 1)
+        self.assertGreater(stats.nodes, 1)
+        self.assertGreater(stats.children, 0)
+        self.assertEqual(list(stats.depths.keys()), [2])
+        self.assertEqual(stats.depths[2]['nodes'], stats.nodes)
+        self.assertEqual(stats.depths[2]['completed'], 1)
+
+    def test_strategy_success2(self):
+        # Tests that iterative deepening records an iteration per depth
+        Strategy.get_best_action(self.__state, 3, 3600)
+        stats = Strategy.stats
+
+        self.assertEqual(list(stats.depths.keys()), [1, 2, 3])
+        self.assertEqual(sum(entry['nodes'] for entry in stats.depths.values()), stats.nodes)
+
+    def test_strategy_success3(self):
+        # Tests that only searches walking a GameTree make a copy of the state per node
+        Strategy.USE_TRANSPOSITION_TABLE = False
+        Strategy.get_best_action(self.__state, 2)
+        self.assertEqual(Strategy.stats.state_copies, 1)
+
+        Strategy.SEARCH_MODE = SearchMode.GAME_TREE
+        Strategy.get_best_action(self.__state, 2)
+        self.assertEqual(Strategy.stats.state_copies, Strategy.stats.children + 1)
+
+    def test_strategy_success4(self):
+        # Tests aggregating the statistics of several searches
+        Strategy.AGGREGATE_STATS = SearchStats()
+        nodes = 0
+
+        for depth in [1, 2]:
+            Strategy.get_best_action(self.__state, depth)
+            nodes += Strategy.stats.nodes
+
+        self.assertEqual(Strategy.AGGREGATE_STATS.searches, 2)
+        self.assertEqual(Strategy.AGGREGATE_STATS.nodes, nodes)
+        self.assertEqual(sorted(Strategy.AGGREGATE_STATS.depths.keys()), [1, 2])
+
+    def test_strategy_success5(self):
+        # Tests that a search records into the statistics it is handed, which later searches leave alone
+        stats = SearchStats()
+        Strategy.get_best_action(self.__state, 2, stats=stats)
+        nodes = stats.nodes
+
+        Strategy.get_best_action(self.__state, 1)
+
+        self.assertEqual(stats.searches, 1)
+        self.assertGreater(nodes, 1)
+        self.assertEqual(stats.nodes, nodes)
+        self.assertIsNot(Strategy.stats, stats)
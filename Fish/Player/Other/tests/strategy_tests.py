@@ -1,6 +1,6 @@
 import sys
-import unittest
 import time
+import unittest
 
 
 sys.path.append('Player/')
@@ -20,6 +20,10 @@ from exceptions.GameNotRunningException import GameNotRunningException
 from exceptions.InvalidGameStatus import InvalidGameStatus
 from game_tree import GameTree
 from hole import Hole
+from action import Action
+from opponent_model import OpponentModel
+from search_mode import SearchMode
+from search_stats import SearchStats
 
 
 class StrategyTests(unittest.TestCase):
@@ -322,11 +326,8 @@ class StrategyTests(unittest.TestCase):
         self.assertEqual(Strategy._Strategy__mini_max_search(self.__tree5, Color.RED, 2), (5, ((1, 0), (3, 0))))
 
     def test_mini_max_search_success7(self):
-        # Tests minimax search with a depth of 4 on a game at least 2 levels deep (heterogeneous board)
-        # Shows that applying a strategy on such a board always takes more than 1 second
-        time1 = time.time()
+        # Tests minimax search with a depth of 2 on a game at least 2 levels deep (heterogeneous board)
         self.assertEqual(Strategy._Strategy__mini_max_search(self.__tree7, Color.RED, 2), (4, ((0, 0), (2, 0))))
-        self.assertTrue(time.time() - time1 > 1)
 
     def test_place_penguin_fail1(self):
         # Tests failing place_penguin due to invalid player_id (type_wise)
@@ -393,3 +394,311 @@ class StrategyTests(unittest.TestCase):
         self.assertTrue({(0, 0), (1, 1), (3, 1)}.issubset(set(self.__state6.placements[Color.RED])))
         self.assertTrue({(0, 1), (2, 1), (3, 2)}.issubset(set(self.__state6.placements[Color.BROWN])))
         self.assertTrue({(1, 0), (3, 0), (4, 1)}.issubset(set(self.__state6.placements[Color.WHITE])))
+
+
+class StrategyTimeBudgetTests(unittest.TestCase):
+    def __init__(self, *args, **kwargs):
+        super(StrategyTimeBudgetTests, self).__init__(*args, **kwargs)
+
+        # Initialize a 4-player state on a homogeneous 5x5 board with all avatars placed
+        self.__state1 = State(Board.homogeneous(2, 5, 5), [PlayerEntity("John", Color.RED),
+                                                          PlayerEntity("George", Color.WHITE),
+                                                          PlayerEntity("Gary", Color.BLACK),
+                                                          PlayerEntity("Jeanine", Color.BROWN)], [])
+
+        for i in range(8):
+            self.__state1.place_avatar(self.__state1.player_order[i % 4], Position(i // 5, i % 5))
+
+        # Initialize a 2-player state on a heterogeneous board with few tiles left to move to
+        self.__state2 = State(Board({
+            Position(0, 0): Tile(5),
+            Position(0, 1): Tile(3),
+            Position(1, 0): Tile(2),
+            Position(1, 1): Tile(3),
+            Position(2, 0): Hole(),
+            Position(2, 1): Tile(4),
+            Position(3, 0): Tile(1),
+            Position(3, 1): Tile(1),
+            Position(4, 0): Tile(2),
+            Position(4, 1): Tile(5)
+        }), [PlayerEntity("John", Color.RED), PlayerEntity("George", Color.WHITE)], [])
+
+        for i, pos in enumerate([Position(0, 0), Position(0, 1), Position(1, 0), Position(1, 1),
+                                 Position(2, 1), Position(3, 0), Position(3, 1), Position(4, 0)]):
+            self.__state2.place_avatar(self.__state2.player_order[i % 2], pos)
+
+    def test_get_best_action_fail1(self):
+        # Tests failing get_best_action due to invalid time budget
+        with self.assertRaises(ValueError):
+            Strategy.get_best_action(self.__state1, 1, 'a second')
+
+    def test_get_best_action_fail2(self):
+        # Tests failing get_best_action due to invalid time budget value
+        with self.assertRaises(ValueError):
+            Strategy.get_best_action(self.__state1, time_budget=-1)
+
+    def test_get_best_action_fail3(self):
+        # Tests failing get_best_action due to neither depth nor time budget being provided
+        with self.assertRaises(TypeError):
+            Strategy.get_best_action(self.__state1)
+
+    def test_get_best_action_success1(self):
+        # Tests that deepening within an ample time budget agrees with searching to depth outright
+        for depth in [1, 2]:
+            self.assertEqual(Strategy.get_best_action(self.__state1, depth, 60),
+                             Strategy.get_best_action(self.__state1, depth))
+
+    def test_get_best_action_success2(self):
+        # Tests that the first iteration is completed regardless of the time budget
+        self.assertEqual(Strategy.get_best_action(self.__state1, time_budget=1e-9),
+                         Strategy.get_best_action(self.__state1, 1))
+
+    def test_get_best_action_success3(self):
+        # Tests that the search is cut short once the time budget runs out (a depth of 3 takes
+        # several seconds on this state)
+        start = time.monotonic()
+        action = Strategy.get_best_action(self.__state1, time_budget=0.5)
+
+        self.assertLess(time.monotonic() - start, 1)
+        self.assertIn(action, self.__state1.get_possible_actions())
+
+    def test_get_best_action_success4(self):
+        # Tests that deepening stops once there are no more tiles to move to
+        start = time.monotonic()
+        action = Strategy.get_best_action(self.__state2, time_budget=30)
+
+        self.assertLess(time.monotonic() - start, 5)
+        self.assertEqual(action, Strategy.get_best_action(self.__state2, 8))
+
+
+class StrategyBestReplyTests(unittest.TestCase):
+    def __init__(self, *args, **kwargs):
+        super(StrategyBestReplyTests, self).__init__(*args, **kwargs)
+
+        # Initialize a 4-player state on a heterogeneous 5x5 board with all avatars placed
+        self.__state1 = State(Board({Position(row, col): Tile((row * 3 + col) % 5 + 1)
+                                     for row in range(5) for col in range(5)}),
+                              [PlayerEntity("John", Color.RED), PlayerEntity("George", Color.WHITE),
+                               PlayerEntity("Gary", Color.BLACK), PlayerEntity("Jeanine", Color.BROWN)], [])
+
+        for i, pos in enumerate([Position(0, 0), Position(0, 2), Position(0, 4), Position(2, 1),
+                                 Position(2, 3), Position(4, 0), Position(4, 2), Position(4, 4)]):
+            self.__state1.place_avatar(self.__state1.player_order[i % 4], pos)
+
+        # Initialize a 2-player state on a heterogeneous board
+        self.__state2 = State(Board({Position(row, col): Tile((row * 2 + col) % 5 + 1)
+                                     for row in range(6) for col in range(3)}),
+                              [PlayerEntity("John", Color.RED), PlayerEntity("George", Color.WHITE)], [])
+
+        for i, pos in enumerate([Position(0, 0), Position(0, 1), Position(0, 2), Position(1, 0),
+                                 Position(1, 1), Position(1, 2), Position(2, 0), Position(2, 1)]):
+            self.__state2.place_avatar(self.__state2.player_order[i % 2], pos)
+
+    def tearDown(self):
+        Strategy.OPPONENT_MODEL = OpponentModel.PARANOID
+        Strategy.SEARCH_MODE = SearchMode.MAKE_UNMAKE
+        Strategy.TRANSPOSITION_TABLE = None
+
+    @staticmethod
+    def __get_best_action(state: State, depth: int, opponent_model: OpponentModel) -> Action:
+        """
+        Searches the given state to the given depth with the given opponent model and a fresh
+        transposition table.
+        """
+        Strategy.OPPONENT_MODEL = opponent_model
+        return Strategy.get_best_action(state, depth)
+
+    def test_get_best_action_two_players(self):
+        # Tests that best-reply search agrees with the paranoid search if there is a single opponent
+        state = self.__state2.deepcopy()
+
+        while state.can_anyone_move():
+            action = self.__get_best_action(state, 2, OpponentModel.PARANOID)
+            self.assertEqual(self.__get_best_action(state, 2, OpponentModel.BEST_REPLY), action)
+            state.move_avatar(*action)
+
+    def test_get_best_action_four_players(self):
+        # Tests that best-reply search searches fewer nodes than the paranoid search among four players
+        self.__get_best_action(self.__state1, 2, OpponentModel.PARANOID)
+        nodes_searched = Strategy.stats.nodes
+        action = self.__get_best_action(self.__state1, 2, OpponentModel.BEST_REPLY)
+
+        self.assertIn(action, self.__state1.get_possible_actions())
+        self.assertLess(Strategy.stats.nodes, nodes_searched)
+
+    def test_get_best_action_search_mode(self):
+        # Tests that best-reply search yields the same action regardless of search mode
+        action = self.__get_best_action(self.__state1, 2, OpponentModel.BEST_REPLY)
+        Strategy.SEARCH_MODE = SearchMode.GAME_TREE
+
+        self.assertEqual(self.__get_best_action(self.__state1, 2, OpponentModel.BEST_REPLY), action)
+
+    def test_get_best_action_shared_table(self):
+        # Tests that searches of either opponent model do not draw on each other's table entries
+        paranoid_action = self.__get_best_action(self.__state1, 2, OpponentModel.PARANOID)
+        best_reply_action = self.__get_best_action(self.__state1, 2, OpponentModel.BEST_REPLY)
+
+        Strategy.OPPONENT_MODEL = OpponentModel.PARANOID
+        self.assertEqual(Strategy.get_best_action(self.__state1, 2), paranoid_action)
+        Strategy.OPPONENT_MODEL = OpponentModel.BEST_REPLY
+        self.assertEqual(Strategy.get_best_action(self.__state1, 2), best_reply_action)
+
+
+class StrategyBoundPruningTests(unittest.TestCase):
+    def __init__(self, *args, **kwargs):
+        super(StrategyBoundPruningTests, self).__init__(*args, **kwargs)
+
+        # Initialize a 2-player state on a heterogeneous 6x4 board with all avatars placed
+        self.__state1 = State(Board({Position(row, col): Tile((row * 3 + col * 2) % 5 + 1)
+                                     for row in range(6) for col in range(4)}),
+                              [PlayerEntity("John", Color.RED), PlayerEntity("George", Color.WHITE)], [])
+
+        for i, pos in enumerate([Position(0, 0), Position(0, 3), Position(2, 1), Position(2, 2),
+                                 Position(3, 0), Position(3, 3), Position(5, 1), Position(5, 2)]):
+            self.__state1.place_avatar(self.__state1.player_order[i % 2], pos)
+
+        # Initialize a 3-player state on a heterogeneous 5x4 board with all avatars placed
+        self.__state2 = State(Board({Position(row, col): Tile((row + col * 3) % 5 + 1)
+                                     for row in range(5) for col in range(4)}),
+                              [PlayerEntity("John", Color.RED), PlayerEntity("George", Color.WHITE),
+                               PlayerEntity("Gary", Color.BLACK)], [])
+
+        for i, pos in enumerate([Position(0, 0), Position(0, 2), Position(1, 1), Position(2, 3),
+                                 Position(3, 0), Position(3, 2), Position(4, 1), Position(4, 3),
+                                 Position(2, 0)]):
+            self.__state2.place_avatar(self.__state2.player_order[i % 3], pos)
+
+    def tearDown(self):
+        Strategy.BOUND_PRUNING = True
+        Strategy.OPPONENT_MODEL = OpponentModel.PARANOID
+        Strategy.SEARCH_MODE = SearchMode.MAKE_UNMAKE
+        Strategy.USE_TRANSPOSITION_TABLE = True
+        Strategy.TRANSPOSITION_TABLE = None
+
+    @staticmethod
+    def __search(state: State, depth: int, bound_pruning: bool) -> tuple:
+        """
+        Searches the given state to the given depth with or without bound pruning (and no transposition
+        table so that searches do not feed off one another). Returns the best action along with the number
+        of nodes searched.
+        """
+        Strategy.BOUND_PRUNING = bound_pruning
+        Strategy.USE_TRANSPOSITION_TABLE = False
+        return Strategy.get_best_action(state, depth), Strategy.stats.nodes
+
+    def test_get_best_action_success1(self):
+        # Tests that bound pruning picks the same moves in either search mode while searching fewer nodes
+        for search_mode in [SearchMode.MAKE_UNMAKE, SearchMode.GAME_TREE]:
+            Strategy.SEARCH_MODE = search_mode
+
+            for state, depth in [(self.__state1, 3), (self.__state2, 2)]:
+                action, nodes_searched = self.__search(state, depth, False)
+                pruned_action, pruned_nodes_searched = self.__search(state, depth, True)
+
+                self.assertEqual(pruned_action, action)
+                self.assertLessEqual(pruned_nodes_searched, nodes_searched)
+
+    def test_get_best_action_success2(self):
+        # Tests that bound pruning picks the same moves with best-reply search
+        Strategy.OPPONENT_MODEL = OpponentModel.BEST_REPLY
+
+        for state, depth in [(self.__state1, 3), (self.__state2, 3)]:
+            self.assertEqual(self.__search(state, depth, True)[0], self.__search(state, depth, False)[0])
+
+    def test_get_best_action_success3(self):
+        # Tests that bound pruning picks the same moves over the course of a game
+        state = self.__state1.deepcopy()
+
+        while state.can_anyone_move():
+            action = self.__search(state, 2, False)[0]
+            self.assertEqual(self.__search(state, 2, True)[0], action)
+            state.move_avatar(*action)
+
+    def test_mini_max_search_success1(self):
+        # Tests that a node whose score bound does not beat alpha is cut off with said bound
+        state = self.__state1.deepcopy()
+        bound = state.get_score_upper_bound(Color.RED, 1)
+
+        Strategy.stats = SearchStats()
+        self.assertEqual(Strategy._Strategy__mini_max_search_in_place(state, Color.RED, 1, bound, VERY_LARGE_NUMBER,
+                                                                      ply=1), (bound, None))
+        self.assertEqual(Strategy.stats.nodes, 1)
+        self.assertEqual(Strategy.stats.bound_cutoffs, 1)
+
+
+class StrategyWindowTests(unittest.TestCase):
+    def __init__(self, *args, **kwargs):
+        super(StrategyWindowTests, self).__init__(*args, **kwargs)
+
+        # Initialize a 2-player state on a heterogeneous 6x4 board with all avatars placed
+        self.__state1 = State(Board({Position(row, col): Tile((row * 3 + col * 2) % 5 + 1)
+                                     for row in range(6) for col in range(4)}),
+                              [PlayerEntity("John", Color.RED), PlayerEntity("George", Color.WHITE)], [])
+
+        for i, pos in enumerate([Position(0, 0), Position(0, 3), Position(2, 1), Position(2, 2),
+                                 Position(3, 0), Position(3, 3), Position(5, 1), Position(5, 2)]):
+            self.__state1.place_avatar(self.__state1.player_order[i % 2], pos)
+
+        # Initialize a 3-player state on a heterogeneous 5x4 board with all avatars placed
+        self.__state2 = State(Board({Position(row, col): Tile((row + col * 3) % 5 + 1)
+                                     for row in range(5) for col in range(4)}),
+                              [PlayerEntity("John", Color.RED), PlayerEntity("George", Color.WHITE),
+                               PlayerEntity("Gary", Color.BLACK)], [])
+
+        for i, pos in enumerate([Position(0, 0), Position(0, 2), Position(1, 1), Position(2, 3),
+                                 Position(3, 0), Position(3, 2), Position(4, 1), Position(4, 3),
+                                 Position(2, 0)]):
+            self.__state2.place_avatar(self.__state2.player_order[i % 3], pos)
+
+    def tearDown(self):
+        Strategy.PRINCIPAL_VARIATION_SEARCH = False
+        Strategy.ASPIRATION_WINDOW = None
+        Strategy.OPPONENT_MODEL = OpponentModel.PARANOID
+        Strategy.SEARCH_MODE = SearchMode.MAKE_UNMAKE
+        Strategy.TRANSPOSITION_TABLE = None
+
+    @staticmethod
+    def __get_best_action(state: State, depth: int, principal_variation_search: bool,
+                          aspiration_window: int = None, time_budget: float = None) -> Action:
+        """
+        Searches the given state to the given depth with or without principal variation search and
+        with the given aspiration window (and a fresh transposition table).
+        """
+        Strategy.PRINCIPAL_VARIATION_SEARCH = principal_variation_search
+        Strategy.ASPIRATION_WINDOW = aspiration_window
+        return Strategy.get_best_action(state, depth, time_budget)
+
+    def test_get_best_action_success1(self):
+        # Tests that principal variation search picks the same moves as alpha-beta in either search mode
+        for search_mode in [SearchMode.MAKE_UNMAKE, SearchMode.GAME_TREE]:
+            Strategy.SEARCH_MODE = search_mode
+
+            for state, depth in [(self.__state1, 3), (self.__state2, 2)]:
+                self.assertEqual(self.__get_best_action(state, depth, True),
+                                 self.__get_best_action(state, depth, False))
+
+    def test_get_best_action_success2(self):
+        # Tests that principal variation search picks the same moves as alpha-beta with best-reply search
+        Strategy.OPPONENT_MODEL = OpponentModel.BEST_REPLY
+
+        for state, depth in [(self.__state1, 3), (self.__state2, 3)]:
+            self.assertEqual(self.__get_best_action(state, depth, True), self.__get_best_action(state, depth, False))
+
+    def test_get_best_action_success3(self):
+        # Tests that deepening with aspiration windows (narrow enough to fail on either side) picks the same
+        # moves as deepening with a full window, with and without principal variation search
+        for state, depth in [(self.__state1, 3), (self.__state2, 3)]:
+            action = self.__get_best_action(state, depth, False, None, 3600)
+
+            for aspiration_window in [1, 2, 5]:
+                self.assertEqual(self.__get_best_action(state, depth, False, aspiration_window, 3600), action)
+                self.assertEqual(self.__get_best_action(state, depth, True, aspiration_window, 3600), action)
+
+    def test_get_best_action_success4(self):
+        # Tests that principal variation search picks the same moves as alpha-beta over the course of a game
+        state = self.__state2.deepcopy()
+
+        while state.can_anyone_move():
+            action = self.__get_best_action(state, 2, False)
+            self.assertEqual(self.__get_best_action(state, 2, True, 1, 3600), action)
+            state.move_avatar(*action)
@@ -0,0 +1,137 @@
+import sys
+import unittest
+
+sys.path.append('Player/')
+sys.path.append('../../../Common')
+
+from transposition_table import TranspositionTable
+from replacement_policy import ReplacementPolicy
+from bound_type import BoundType
+from strategy import Strategy
+from search_stats import SearchStats
+from action import Action
+from board import Board
+from color import Color
+from player_entity import PlayerEntity
+from position import Position
+from state import State
+
+
+class TranspositionTableTests(unittest.TestCase):
+    def __init__(self, *args, **kwargs):
+        super(TranspositionTableTests, self).__init__(*args, **kwargs)
+
+        # Initialize some actions to store
+        self.__action1 = Action(Position(0, 0), Position(2, 0))
+        self.__action2 = Action(Position(1, 1), Position(3, 1))
+
+        # Initialize a 3-player state on a homogeneous board with all avatars placed
+        self.__state = State(Board.homogeneous(3, 6, 4), [PlayerEntity('a', Color.RED),
+                                                         PlayerEntity('b', Color.WHITE),
+                                                         PlayerEntity('c', Color.BLACK)], [])
+
+        for i, pos in enumerate([Position(0, 0), Position(0, 1), Position(0, 2), Position(0, 3), Position(1, 0),
+                                 Position(1, 1), Position(1, 2), Position(1, 3), Position(5, 0)]):
+            self.__state.place_avatar(self.__state.player_order[i % 3], pos)
+
+    def tearDown(self):
+        Strategy.USE_TRANSPOSITION_TABLE = True
+        Strategy.TRANSPOSITION_TABLE = None
+
+    def test_init_fail1(self):
+        # Tests constructor failing due to invalid max_entries
+        with self.assertRaises(ValueError):
+            TranspositionTable(0)
+
+    def test_init_fail2(self):
+        # Tests constructor failing due to invalid replacement_policy
+        with self.assertRaises(TypeError):
+            TranspositionTable(10, 'always')
+
+    def test_probe_store_success(self):
+        # Tests storing and probing entries updates counters
+        table = TranspositionTable(100)
+
+        self.assertIsNone(table.probe((1234, Color.RED)))
+        self.assertTrue(table.store((1234, Color.RED), 2, BoundType.EXACT, 5, self.__action1))
+        self.assertEqual(table.probe((1234, Color.RED)), (2, BoundType.EXACT, 5, self.__action1))
+        self.assertIsNone(table.probe((1234, Color.WHITE)))
+
+        self.assertEqual(table.entries, 1)
+        self.assertEqual(table.hits, 1)
+        self.assertEqual(table.misses, 2)
+        self.assertEqual(table.stores, 1)
+        self.assertEqual(table.replacements, 0)
+
+        # Entries of the same key are always overwritten
+        self.assertTrue(table.store((1234, Color.RED), 1, BoundType.LOWER, 3))
+        self.assertEqual(table.probe((1234, Color.RED)), (1, BoundType.LOWER, 3, None))
+        self.assertEqual(table.replacements, 0)
+
+        table.reset_counters()
+        self.assertEqual((table.hits, table.misses, table.stores), (0, 0, 0))
+
+        table.clear()
+        self.assertEqual(table.entries, 0)
+        self.assertIsNone(table.probe((1234, Color.RED)))
+
+    def test_replacement_policy_success1(self):
+        # Tests the always-replace policy evicts entries of other keys
+        table = TranspositionTable(1, ReplacementPolicy.ALWAYS_REPLACE)
+
+        table.store((1, Color.RED), 3, BoundType.EXACT, 5, self.__action1)
+        self.assertTrue(table.store((2, Color.RED), 1, BoundType.UPPER, 2, self.__action2))
+
+        self.assertIsNone(table.probe((1, Color.RED)))
+        self.assertEqual(table.probe((2, Color.RED)), (1, BoundType.UPPER, 2, self.__action2))
+        self.assertEqual(table.entries, 1)
+        self.assertEqual(table.replacements, 1)
+
+    def test_replacement_policy_success2(self):
+        # Tests the depth-preferred policy keeps deeper entries of other keys
+        table = TranspositionTable(1, ReplacementPolicy.DEPTH_PREFERRED)
+
+        table.store((1, Color.RED), 3, BoundType.EXACT, 5, self.__action1)
+        self.assertFalse(table.store((2, Color.RED), 1, BoundType.UPPER, 2, self.__action2))
+        self.assertEqual(table.probe((1, Color.RED)), (3, BoundType.EXACT, 5, self.__action1))
+
+        self.assertTrue(table.store((2, Color.RED), 3, BoundType.UPPER, 2, self.__action2))
+        self.assertEqual(table.probe((2, Color.RED)), (3, BoundType.UPPER, 2, self.__action2))
+        self.assertEqual(table.replacements, 1)
+
+    def test_get_best_action_success(self):
+        # Tests that searching with a transposition table yields the same actions as without one
+        state = self.__state.deepcopy()
+
+        while state.can_anyone_move():
+            Strategy.USE_TRANSPOSITION_TABLE = False
+            action = Strategy.get_best_action(state, 2)
+
+            Strategy.USE_TRANSPOSITION_TABLE = True
+            table = TranspositionTable(64)
+            self.assertEqual(Strategy.get_best_action(state, 2, transposition_table=table), action)
+            self.assertGreater(table.stores, 0)
+
+            state.move_avatar(*action)
+
+    def test_get_best_action_reuse(self):
+        # Tests that searching the same state twice is settled by the table below the root
+        table = TranspositionTable()
+        Strategy.TRANSPOSITION_TABLE = table
+
+        stats1, stats2 = SearchStats(), SearchStats()
+        action = Strategy.get_best_action(self.__state, 2, stats=stats1)
+        table.reset_counters()
+
+        self.assertEqual(Strategy.get_best_action(self.__state, 2, stats=stats2), action)
+        self.assertEqual(table.misses, 0)
+        self.assertLess(stats2.nodes, stats1.nodes)
+
+    def test_get_best_action_fresh(self):
+        # Tests that searches that are not handed a table do not feed off one another by default
+        stats1, stats2 = SearchStats(), SearchStats()
+        action = Strategy.get_best_action(self.__state, 2, stats=stats1)
+
+        self.assertEqual(Strategy.get_best_action(self.__state, 2, stats=stats2), action)
+        self.assertEqual(stats2.nodes, stats1.nodes)
+        self.assertIsNone(Strategy.TRANSPOSITION_TABLE)
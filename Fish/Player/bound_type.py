@@ -0,0 +1,12 @@
+from enum import Enum
+
+
+class BoundType(Enum):
+    """
+    Represents how a score stored in a TranspositionTable relates to the true min-max score
+    of its position: it is either the score itself (exact), or a bound the true score is known
+    to be at least (lower) or at most (upper) because the search was cut off.
+    """
+    EXACT = 0
+    LOWER = 1
+    UPPER = 2
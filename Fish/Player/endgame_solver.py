@@ -0,0 +1,173 @@
+import sys
+
+sys.path.append('../Common')
+
+from bitboard import Bitboard
+from color import Color
+from position import Position
+from state import State
+
+
+class EndgameSolver(object):
+    """
+    PURPOSE:        The purpose of the endgame solver is to settle the score of a player whose avatars have been
+                    cut off from those of every other player without having a min-max search explore all the
+                    ways in which the players' moves can be interleaved.
+
+    INTERPRETATION: The tiles left on a board fall apart into regions: groups of tiles connected to each other via
+                    adjacent tiles (see BoardGeometry). As straight line paths only lead across adjacent tiles, an
+                    avatar can never leave its region and the avatars of two different regions never interact. A
+                    region that only holds avatars of a single player is that player's alone: the number of fish
+                    it yields to said player does not depend on what its opponents do (or on when said player gets
+                    to move), and it is the largest number of fish any sequence of moves within the region collects.
+
+                    Once each of a player's avatars is in a region of its own, the score the player ends up with is
+                    therefore its current score plus the fish yielded by each of its regions, which are solved one
+                    at a time. Each move takes an open tile, so the player makes at most as many moves as its regions
+                    hold open tiles (tiles without an avatar on them). A min-max search looking ahead at least that
+                    many of the player's turns arrives at the very same score, which allows the solver to stand in
+                    for it. Positions in which players still interact are left to the search.
+
+                    The fish yielded by a region are memoized by the region's tiles and avatars. As the number of
+                    fish on a tile never changes, a solver may be kept for the duration of a game; it is, however,
+                    not to be shared amongst games.
+    """
+
+    def __init__(self):
+        """
+        Initializes an endgame solver with an empty memo.
+
+        :return: new EndgameSolver designed to spec
+        """
+        # Initialize dict of (region mask, avatar mask) to the fish the region yields
+        self.__memo = {}
+        # Initialize number of positions settled by the solver
+        self.__solved = 0
+
+    @property
+    def solved(self) -> int:
+        """
+        Returns the number of positions whose score the solver has settled.
+        """
+        return self.__solved
+
+    @property
+    def memo_size(self) -> int:
+        """
+        Returns the number of regions held in the memo.
+        """
+        return len(self.__memo)
+
+    def solve(self, state: State, color: Color, depth: int) -> int:
+        """
+        Determines the score the player of the given color ends up with if none of its avatars share
+        a region with an avatar of another player and looking ahead depth number of the player's turns
+        is bound to see it run out of moves (see class description).
+
+        :param state: state to solve
+        :param color: color of player whose score to determine
+        :param depth: number of the player's turns the score is to account for
+        :return: resulting score or None if the state cannot be solved (i.e. it is up to the search)
+        """
+        bitboard = state.board.bitboard
+
+        # Solving relies on the masks of the bitboard
+        if bitboard is None:
+            return None
+
+        tiles = bitboard.tiles
+        occupied = state.occupied_mask
+        avatars = bitboard.mask(state.get_player_positions(color))
+        adjacent_masks = state.board.geometry.adjacent_masks
+
+        if not avatars:
+            return None
+
+        # Collect the regions holding the player's avatars, giving up as soon as one turns out to hold
+        # an avatar of another player or the regions hold more open tiles than there are turns to account for
+        regions = []
+        covered = 0
+        open_tiles = 0
+
+        for avatar in Bitboard.bits(avatars):
+            # Skip avatars whose region has already been collected
+            if covered & avatar:
+                continue
+
+            # Flood region from avatar across adjacent tiles
+            region = avatar
+            frontier = avatar
+
+            while frontier:
+                reached = 0
+
+                for bit in Bitboard.bits(frontier):
+                    reached |= adjacent_masks[bit.bit_length() - 1]
+
+                frontier = reached & tiles & ~region
+
+                if frontier & occupied & ~avatars:
+                    return None
+
+                region |= frontier
+                open_tiles += bin(frontier & ~occupied).count('1')
+
+                if open_tiles > depth:
+                    return None
+
+            covered |= region
+            regions.append(region)
+
+        # Sum up the fish yielded by the regions
+        fish = self.__get_fish(state, covered)
+        self.__solved += 1
+
+        return state.get_player_score(color) + sum(self.__solve_region(state.board.geometry.ray_masks, fish,
+                                                                       region, region & avatars)
+                                                   for region in regions)
+
+    def __solve_region(self, ray_masks: list, fish: dict, region: int, avatars: int) -> int:
+        """
+        Determines the largest number of fish the avatars of the given region can collect.
+
+        :param ray_masks: ray masks of the board's geometry (see BoardGeometry)
+        :param fish: dict of bit index to the number of fish on the tile
+        :param region: bitmask of the region's tiles
+        :param avatars: bitmask of the region's avatars
+        :return: resulting number of fish
+        """
+        key = (region, avatars)
+
+        if key in self.__memo:
+            return self.__memo[key]
+
+        # Avatars may move onto the tiles of the region they do not occupy
+        open_mask = region & ~avatars
+        best = 0
+
+        for avatar in Bitboard.bits(avatars):
+            index = avatar.bit_length() - 1
+            # Moving away from a tile collects its fish
+            collected = fish[index]
+
+            for dst in Bitboard.bits(Bitboard.reach(ray_masks[index], open_mask)):
+                best = max(best, collected + self.__solve_region(ray_masks, fish, region & ~avatar,
+                                                                 avatars & ~avatar | dst))
+
+        self.__memo[key] = best
+        return best
+
+    @staticmethod
+    def __get_fish(state: State, mask: int) -> dict:
+        """
+        Looks up the number of fish on the tiles of the given mask.
+
+        :param state: state whose board to look tiles up on
+        :param mask: bitmask of tiles
+        :return: dict of bit index to number of fish
+        """
+        cols = state.board.cols
+
+        return {bit.bit_length() - 1: state.board.get_tile(Position((bit.bit_length() - 1) // cols,
+                                                                    (bit.bit_length() - 1) % cols)).fish_no
+                for bit in Bitboard.bits(mask)}
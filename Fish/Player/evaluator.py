@@ -0,0 +1,204 @@
+import sys
+
+sys.path.append('../Common')
+
+from action import Action
+from array_board import ArrayBoard
+from board import Board
+from color import Color
+from state import State
+from state_view import StateView
+
+# NumPy is optional (see ArrayBoard)
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class Evaluator(object):
+    """
+    PURPOSE:        The purpose of the evaluator is to score the positions at the leaves of a min-max search by more
+                    than the number of fish the maximizer has collected so far, which tells nothing about how well
+                    placed its avatars are to collect more of them.
+
+    INTERPRETATION: The evaluation of a position for a player (the maximizer) is its score plus a heuristic bonus
+                    made up of the following features of the position, weighted by the class-level weights:
+
+                    - reachable fish: the fish on the tiles the maximizer's avatars can move to
+                    - mobility: the number of moves the maximizer can make less the number of moves all of its
+                      opponents can make
+                    - contested tiles: the number of tiles both the maximizer and one of its opponents can move to
+
+                    The bonus is divided by SCALE (rounding down) so that it weighs less than the fish collected,
+                    and evaluations are whole numbers just like scores. Positions are scored in batches: the
+                    features of all positions of a batch (i.e. sibling states) are computed at once by vectorized
+                    operations on an ArrayBoard, so that the richer evaluation costs little per position. As the
+                    number of fish on a tile never changes, an evaluator may be kept for the duration of a game;
+                    it is, however, not to be shared amongst games.
+
+                    Making up an Evaluator requires NumPy to be installed (see ArrayBoard).
+    """
+    # Initialize weights of the features making up the heuristic bonus
+    REACHABLE_FISH_WEIGHT = 1
+    MOBILITY_WEIGHT = 1
+    CONTESTED_WEIGHT = -1
+    # Initialize divisor of the heuristic bonus
+    SCALE = 8
+
+    def __init__(self, board: Board):
+        """
+        Initializes an evaluator for positions on the given board.
+
+        :param board: board of the game to evaluate positions of
+        :return: new Evaluator designed to spec
+        """
+        # Set fields (validates params)
+        self.__array_board = ArrayBoard(board)
+
+    @property
+    def array_board(self) -> ArrayBoard:
+        """
+        Returns the ArrayBoard positions are evaluated on.
+        """
+        return self.__array_board
+
+    def evaluate(self, states: [State], color: Color) -> [int]:
+        """
+        Evaluates the given states for the player of the given color in a single batch.
+
+        :param states: list of State (or StateView) on the evaluator's board
+        :param color: color of player to evaluate states for
+        :return: list of int evaluation of each state
+        """
+        # Validate params
+        if not isinstance(states, list) or not all(isinstance(state, (State, StateView)) for state in states):
+            raise TypeError('Expected list of State or StateView for states!')
+
+        if not isinstance(color, Color):
+            raise TypeError('Expected Color for color!')
+
+        open_masks = []
+        batch = []
+        sources = []
+        owners = []
+
+        for index, state in enumerate(states):
+            open_masks.append(Evaluator.__get_tiles(state) & ~state.occupied_mask)
+
+            # Collect avatars of every player
+            for player_color in state.player_order:
+                for pos in state.get_player_positions(player_color):
+                    batch.append(index)
+                    sources.append(pos.x * state.board.cols + pos.y)
+                    owners.append(player_color == color)
+
+        return self.__evaluate(open_masks, np.array(batch, dtype=np.intp), np.array(sources, dtype=np.intp),
+                               np.array(owners, dtype=bool), [state.get_player_score(color) for state in states])
+
+    def evaluate_children(self, state: State, color: Color, moves: [Action]) -> [int]:
+        """
+        Evaluates the states resulting from making each of the given moves of the given state's current player
+        for the player of the given color in a single batch. The resulting states are derived from the given one
+        without being made up (and without the given state being altered).
+
+        :param state: state (or StateView) to make the moves on
+        :param color: color of player to evaluate resulting states for
+        :param moves: list of Action of the current player
+        :return: list of int evaluation of each resulting state (in the order of moves)
+        """
+        # Validate params
+        if not isinstance(state, (State, StateView)):
+            raise TypeError('Expected State or StateView for state!')
+
+        if not isinstance(color, Color):
+            raise TypeError('Expected Color for color!')
+
+        cols = state.board.cols
+        tiles = Evaluator.__get_tiles(state)
+        occupied = state.occupied_mask
+        fish = self.__array_board.fish
+        score = state.get_player_score(color)
+        is_maximizer_moving = state.current_player == color
+
+        # Collect avatars of every player, noting where each one is listed
+        sources = []
+        owners = []
+        slots = {}
+
+        for player_color in state.player_order:
+            for pos in state.get_player_positions(player_color):
+                slots[pos.x * cols + pos.y] = len(sources)
+                sources.append(pos.x * cols + pos.y)
+                owners.append(player_color == color)
+
+        # Make up the open tiles, avatars and maximizer's score of each resulting state
+        open_masks = []
+        child_sources = np.tile(np.array(sources, dtype=np.intp), (len(moves), 1))
+        scores = []
+
+        for index, (src, dst) in enumerate(moves):
+            src_bit = src.x * cols + src.y
+            dst_bit = dst.x * cols + dst.y
+            # Moving away removes the tile left behind and occupies the destination
+            open_masks.append((tiles & ~(1 << src_bit)) & ~(occupied ^ (1 << src_bit) ^ (1 << dst_bit)))
+            child_sources[index, slots[src_bit]] = dst_bit
+            scores.append(score + int(fish[src_bit]) if is_maximizer_moving else score)
+
+        batch = np.repeat(np.arange(len(moves), dtype=np.intp), len(sources))
+
+        return self.__evaluate(open_masks, batch, child_sources.ravel(),
+                               np.tile(np.array(owners, dtype=bool), len(moves)), scores)
+
+    def __evaluate(self, open_masks: [int], batch: 'np.ndarray', sources: 'np.ndarray', owners: 'np.ndarray',
+                   scores: [int]) -> [int]:
+        """
+        Evaluates a batch of positions given the open tiles and the avatars of each.
+
+        :param open_masks: list of bitmask of the tiles that are neither removed nor occupied in each position
+        :param batch: array of the position each avatar is on
+        :param sources: array of bit index of each avatar
+        :param owners: array of bool telling whether each avatar is the maximizer's
+        :param scores: list of the maximizer's score in each position
+        :return: list of int evaluation of each position
+        """
+        board = self.__array_board
+        size = len(open_masks)
+
+        if size == 0:
+            return []
+
+        cells, reachable = board.reach(board.to_bool_array(open_masks), batch, sources)
+
+        # Count moves of each avatar, adding them up per position (negated for opponents)
+        move_no = reachable.sum(axis=(1, 2))
+        mobility = np.bincount(batch, weights=np.where(owners, move_no, -move_no), minlength=size)
+
+        # Mark tiles reachable by the maximizer and by its opponents in each position
+        reached = np.zeros((2, size, board.size + 1), dtype=bool)
+        rows = np.broadcast_to(batch[:, None, None], cells.shape)
+        sides = np.broadcast_to(~owners[:, None, None], cells.shape).astype(np.intp)
+        reached[sides[reachable], rows[reachable], cells[reachable]] = True
+
+        reachable_fish = reached[0] @ board.fish
+        contested = (reached[0] & reached[1]).sum(axis=1)
+
+        bonus = (Evaluator.REACHABLE_FISH_WEIGHT * reachable_fish
+                 + Evaluator.MOBILITY_WEIGHT * mobility.astype(np.int64)
+                 + Evaluator.CONTESTED_WEIGHT * contested) // Evaluator.SCALE
+
+        return (np.array(scores, dtype=np.int64) + bonus).tolist()
+
+    @staticmethod
+    def __get_tiles(state: State) -> int:
+        """
+        Returns the bitmask of tiles on the given state's board.
+
+        :param state: state to get tiles of
+        :return: resulting bitmask
+        """
+        if state.board.bitboard is not None:
+            return state.board.bitboard.tiles
+
+        cols = state.board.cols
+        return sum(1 << (pos.x * cols + pos.y) for pos, tile in state.board.tiles.items() if tile.is_tile)
@@ -0,0 +1,158 @@
+import math
+import sys
+
+sys.path.append('../Common')
+
+from action import Action
+from color import Color
+
+
+class MonteCarloNode(object):
+    """
+    PURPOSE:        The purpose of the Monte Carlo node is to hold the statistics a MonteCarloTreeSearch gathers
+                    about a position it has reached, so that it can tell which moves are worth exploring further.
+
+    INTERPRETATION: A MonteCarloNode stands for the position reached by making its action from its parent's position
+                    (the root node has neither). It does not hold said position itself; the search makes the actions
+                    on the path from the root down to the node on a single State instead.
+
+                    Each node keeps the color of the player to move in its position (None if nobody can move), the
+                    actions of said player it has not expanded into children yet, the number of times it has been
+                    visited, and the sum of the rewards each player got out of the playouts run through it. The
+                    reward of a playout is a player's share of the win (1 for a sole winner, split evenly amongst
+                    players tying for the highest score, 0 for everybody else).
+    """
+
+    def __init__(self, color: Color, untried_actions: [Action], action: Action = None,
+                 parent: 'MonteCarloNode' = None):
+        """
+        Initializes an unvisited node.
+
+        :param color: color of player to move in the node's position (None if nobody can move)
+        :param untried_actions: list of Action the player to move can make, in the order to expand them in
+                                (last first)
+        :param action: Action leading from the parent's position to this one (None for the root)
+        :param parent: parent MonteCarloNode (None for the root)
+        :return: new MonteCarloNode designed to spec
+        """
+        # Validate params
+        if color is not None and not isinstance(color, Color):
+            raise TypeError('Expected Color for color!')
+
+        if not isinstance(untried_actions, list):
+            raise TypeError('Expected list of Action for untried_actions!')
+
+        if action is not None and not isinstance(action, Action):
+            raise TypeError('Expected Action for action!')
+
+        if parent is not None and not isinstance(parent, MonteCarloNode):
+            raise TypeError('Expected MonteCarloNode for parent!')
+
+        # Set fields
+        self.__color = color
+        self.__untried_actions = untried_actions
+        self.__action = action
+        self.__parent = parent
+        # Initialize list of expanded child nodes
+        self.__children = []
+        # Initialize visit count and dict of player Color to sum of rewards
+        self.__visits = 0
+        self.__rewards = {}
+
+    @property
+    def color(self) -> Color:
+        """
+        Returns the color of the player to move in the node's position.
+        """
+        return self.__color
+
+    @property
+    def action(self) -> Action:
+        """
+        Returns the action leading to the node's position.
+        """
+        return self.__action
+
+    @property
+    def parent(self) -> 'MonteCarloNode':
+        """
+        Returns the parent of the node.
+        """
+        return self.__parent
+
+    @property
+    def children(self) -> ['MonteCarloNode']:
+        """
+        Returns the (shared) list of expanded children of the node. It is not to be mutated.
+        """
+        return self.__children
+
+    @property
+    def visits(self) -> int:
+        """
+        Returns the number of playouts run through the node.
+        """
+        return self.__visits
+
+    @property
+    def is_fully_expanded(self) -> bool:
+        """
+        Tells whether every action of the node has been expanded into a child.
+        """
+        return not self.__untried_actions
+
+    def get_reward(self, color: Color) -> float:
+        """
+        Returns the sum of rewards the player of the given color got out of the playouts run
+        through the node.
+
+        :param color: color of player
+        :return: resulting sum
+        """
+        return self.__rewards.get(color, 0.0)
+
+    def expand(self, color: Color, untried_actions: [Action]) -> 'MonteCarloNode':
+        """
+        Expands the next untried action of the node into a child node.
+
+        :param color: color of player to move once the action has been made (None if nobody can move)
+        :param untried_actions: list of Action said player can make (see constructor)
+        :return: resulting child MonteCarloNode
+        """
+        child = MonteCarloNode(color, untried_actions, self.__untried_actions.pop(), self)
+        self.__children.append(child)
+        return child
+
+    def next_action(self) -> Action:
+        """
+        Returns the untried action to be expanded next.
+
+        :return: Action object
+        """
+        return self.__untried_actions[-1]
+
+    def select_child(self, exploration: float) -> 'MonteCarloNode':
+        """
+        Returns the child maximizing the UCT (upper confidence bound applied to trees) score of the
+        player to move: the average reward said player got out of the child plus an exploration term
+        that grows the less the child has been visited relative to the node.
+
+        :param exploration: weight of the exploration term
+        :return: selected child MonteCarloNode
+        """
+        log_visits = math.log(self.__visits)
+
+        return max(self.__children, key=lambda child: child.get_reward(self.__color) / child.visits
+                   + exploration * math.sqrt(log_visits / child.visits))
+
+    def update(self, rewards: dict) -> None:
+        """
+        Records a playout run through the node.
+
+        :param rewards: dict of player Color to the reward said player got out of the playout
+        :return: None
+        """
+        self.__visits += 1
+
+        for color, reward in rewards.items():
+            self.__rewards[color] = self.__rewards.get(color, 0.0) + reward
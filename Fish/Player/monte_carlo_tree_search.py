@@ -0,0 +1,288 @@
+import math
+import random
+import sys
+import time
+
+sys.path.append('../Common')
+
+from state import State
+from action import Action
+from bitboard import Bitboard
+from monte_carlo_node import MonteCarloNode
+from playout_policy import PlayoutPolicy
+
+
+class MonteCarloTreeSearch(object):
+    """
+    PURPOSE:        The purpose of the Monte Carlo tree search is to determine a move for the current player without
+                    having to look at every possible sequence of moves down to a fixed depth, which the branching
+                    factor of games with many players and avatars rules out within a short time budget. It serves as
+                    an alternative to the minimax search of Strategy.
+
+    INTERPRETATION: The search grows a tree of MonteCarloNode objects rooted at the given state. Each iteration
+                    walks down the tree by picking the child with the highest UCT score for the player to move (see
+                    MonteCarloNode.select_child) until it arrives at a node with untried actions, expands one of
+                    them into a new node, plays the game out from there and credits each player's share of the win
+                    to every node on the path it walked. Once the iterations or the time budget run out, the action
+                    of the root's most visited child is picked. Ties are broken by picking the action with the
+                    smallest source row, source column, destination row or destination column (in that order).
+
+                    The tree is walked by making and unmaking moves on a single copy of the state (see
+                    State.apply_action). Playouts, which make up the bulk of the work, are run on a stripped down
+                    copy of the position instead: a bitmask of the tiles left, the bit indices of each player's
+                    avatars and each player's score (see Bitboard for the mapping of positions to bits). Moves are
+                    picked as dictated by PLAYOUT_POLICY until no player can move.
+
+                    The number of playouts run by the latest search and the rate they were run at are kept in
+                    playouts and playouts_per_second.
+    """
+    # Initialize DEBUG flag (if enabled debug information may be written to stdout)
+    DEBUG = False
+    # Initialize weight of the exploration term of the UCT score
+    EXPLORATION = math.sqrt(2)
+    # Initialize the way moves are picked during playouts
+    PLAYOUT_POLICY = PlayoutPolicy.RANDOM
+    # Initialize number of iterations to run if neither iterations nor time budget are given
+    DEFAULT_ITERATIONS = 1000
+    # Initialize seed of the random number generator of each search (None to seed it from the system)
+    SEED = None
+    # Initialize number of playouts run by the latest search and the number of playouts it ran per second
+    playouts = 0
+    playouts_per_second = 0.0
+
+    @staticmethod
+    def get_best_action(state: State, iterations: int = None, time_budget: float = None) -> Action:
+        """
+        Determines the best action for the current player of the given state by running iterations of
+        the Monte Carlo tree search until either the given number of iterations has been run or the time
+        budget runs out, whichever comes first. At least one iteration is run regardless of the time
+        budget. If the current player has a single action, it is returned right away.
+
+        :param state: state which to determine best move for current player for
+        :param iterations: number of iterations to run (None for no limit if a time budget is given,
+                           DEFAULT_ITERATIONS otherwise)
+        :param time_budget: number of seconds to search for (None for no limit)
+        :return: best Action the current player can make
+        """
+        # Validate params
+        if not isinstance(state, State):
+            raise TypeError('Expected State object for state!')
+
+        if iterations is not None and (not isinstance(iterations, int) or iterations <= 0):
+            raise ValueError('Expected int > 0 for iterations!')
+
+        if time_budget is not None and (not isinstance(time_budget, (int, float)) or time_budget <= 0):
+            raise ValueError('Expected number > 0 for time_budget!')
+
+        if iterations is None and time_budget is None:
+            iterations = MonteCarloTreeSearch.DEFAULT_ITERATIONS
+
+        MonteCarloTreeSearch.playouts = 0
+        MonteCarloTreeSearch.playouts_per_second = 0.0
+
+        actions = state.get_possible_actions()
+
+        # Make sure there is a choice to make
+        if len(actions) <= 1:
+            return actions[0] if actions else None
+
+        start = time.monotonic()
+        deadline = start + time_budget if time_budget is not None else None
+        rng = random.Random(MonteCarloTreeSearch.SEED)
+
+        # Make up a copy of the state to walk the tree on and the root of the tree
+        state = state.deepcopy()
+        root = MonteCarloNode(*MonteCarloTreeSearch.__get_turn(state, rng))
+        # Look up number of fish on each tile (by bit index) and the rays of each position
+        fish = MonteCarloTreeSearch.__get_fish(state)
+        rays = state.board.geometry.ray_masks
+
+        while iterations is None or MonteCarloTreeSearch.playouts < iterations:
+            # Stop once time is up (having run at least one iteration)
+            if deadline is not None and MonteCarloTreeSearch.playouts > 0 and time.monotonic() >= deadline:
+                break
+
+            node = root
+            # Select: walk down fully expanded nodes
+            while node.is_fully_expanded and node.children:
+                node = node.select_child(MonteCarloTreeSearch.EXPLORATION)
+                state.apply_action(node.action)
+
+            # Expand: add a child for an untried action (unless nobody can move)
+            if not node.is_fully_expanded:
+                state.apply_action(node.next_action())
+                node = node.expand(*MonteCarloTreeSearch.__get_turn(state, rng))
+
+            # Simulate: play out the game
+            rewards = MonteCarloTreeSearch.__get_rewards(MonteCarloTreeSearch.__playout(state, fish, rays, rng))
+            MonteCarloTreeSearch.playouts += 1
+
+            # Back up: credit rewards along the path and unmake its actions
+            while node.parent is not None:
+                node.update(rewards)
+                state.undo_action()
+                node = node.parent
+
+            root.update(rewards)
+
+        elapsed = time.monotonic() - start
+        MonteCarloTreeSearch.playouts_per_second = MonteCarloTreeSearch.playouts / elapsed if elapsed > 0 else 0.0
+
+        if MonteCarloTreeSearch.DEBUG:
+            print(f'  [mcts] {MonteCarloTreeSearch.playouts} playouts '
+                  f'({MonteCarloTreeSearch.playouts_per_second:.0f}/s)')
+
+        # Pick action of most visited child, breaking ties by the smallest action
+        return min(root.children, key=lambda child: (-child.visits, child.action)).action
+
+    @staticmethod
+    def __get_turn(state: State, rng: random.Random) -> tuple:
+        """
+        Returns the color of the given state's current player along with the actions said player can make
+        in the (random) order to expand them in.
+
+        :param state: state to get turn of
+        :param rng: random number generator to shuffle actions with
+        :return: tuple of Color and list of Action (None and an empty list if nobody can move)
+        """
+        if not state.can_anyone_move():
+            return None, []
+
+        actions = state.get_possible_actions()
+        rng.shuffle(actions)
+        return state.current_player, actions
+
+    @staticmethod
+    def __get_fish(state: State) -> list:
+        """
+        Looks up the number of fish on each tile of the given state's board.
+
+        :param state: state whose board to look tiles up on
+        :return: list of number of fish indexed by bit index (0 for holes)
+        """
+        cols = state.board.cols
+        fish = [0] * (state.board.rows * cols)
+
+        for pos, tile in state.board.tiles.items():
+            fish[pos.x * cols + pos.y] = tile.fish_no
+
+        return fish
+
+    @staticmethod
+    def __playout(state: State, fish: list, rays: list, rng: random.Random) -> dict:
+        """
+        Plays out the game from the given state on a stripped down copy of its position, picking moves as
+        dictated by PLAYOUT_POLICY until nobody can move. Players take turns in the state's player order,
+        and players that cannot move are skipped.
+
+        :param state: state to play out from (left as is)
+        :param fish: list of number of fish indexed by bit index
+        :param rays: ray masks of the board's geometry (see BoardGeometry)
+        :param rng: random number generator to pick moves with
+        :return: dict of player Color to final score
+        """
+        colors = state.player_order
+        cols = state.board.cols
+        # Make up masks of tiles and avatars, along with the bit indices of each player's avatars
+        tiles = MonteCarloTreeSearch.__get_tiles(state)
+        occupied = state.occupied_mask
+        avatars = [[pos.x * cols + pos.y for pos in state.get_player_positions(color)] for color in colors]
+        scores = [state.get_player_score(color) for color in colors]
+        is_greedy = MonteCarloTreeSearch.PLAYOUT_POLICY == PlayoutPolicy.GREEDY
+
+        turn = 0
+        # Count players in a row that could not move
+        passes = 0
+
+        while passes < len(colors):
+            open_mask = tiles & ~occupied
+            # Collect tuples of avatar index and mask of positions reachable by said avatar
+            moves = []
+            move_no = 0
+
+            for i, src in enumerate(avatars[turn]):
+                reachable = Bitboard.reach(rays[src], open_mask)
+
+                if reachable:
+                    moves.append((i, reachable))
+                    move_no += bin(reachable).count('1')
+
+            if not moves:
+                # Skip player that cannot move
+                passes += 1
+                turn = (turn + 1) % len(colors)
+                continue
+
+            passes = 0
+
+            if is_greedy:
+                # Collect moves landing on a tile holding the most fish
+                best_fish = -1
+                candidates = []
+
+                for i, reachable in moves:
+                    for dst_bit in Bitboard.bits(reachable):
+                        dst_fish = fish[dst_bit.bit_length() - 1]
+
+                        if dst_fish > best_fish:
+                            best_fish = dst_fish
+                            candidates = [(i, dst_bit)]
+                        elif dst_fish == best_fish:
+                            candidates.append((i, dst_bit))
+
+                i, dst_bit = candidates[rng.randrange(len(candidates))]
+            else:
+                # Pick a move uniformly at random by its index amongst all moves
+                pick = rng.randrange(move_no)
+
+                for i, reachable in moves:
+                    count = bin(reachable).count('1')
+
+                    if pick < count:
+                        break
+
+                    pick -= count
+
+                for dst_bit in Bitboard.bits(reachable):
+                    if pick == 0:
+                        break
+
+                    pick -= 1
+
+            # Make move: collect fish of the tile left behind and remove it
+            src = avatars[turn][i]
+            scores[turn] += fish[src]
+            tiles &= ~(1 << src)
+            occupied ^= (1 << src) | dst_bit
+            avatars[turn][i] = dst_bit.bit_length() - 1
+
+            turn = (turn + 1) % len(colors)
+
+        return dict(zip(colors, scores))
+
+    @staticmethod
+    def __get_tiles(state: State) -> int:
+        """
+        Returns the bitmask of tiles on the given state's board.
+
+        :param state: state to get tiles of
+        :return: resulting bitmask
+        """
+        if state.board.bitboard is not None:
+            return state.board.bitboard.tiles
+
+        cols = state.board.cols
+        return sum(1 << (pos.x * cols + pos.y) for pos, tile in state.board.tiles.items() if tile.is_tile)
+
+    @staticmethod
+    def __get_rewards(scores: dict) -> dict:
+        """
+        Determines each player's share of the win given the final scores of a game.
+
+        :param scores: dict of player Color to final score
+        :return: dict of player Color to reward
+        """
+        best_score = max(scores.values())
+        winners = [color for color, score in scores.items() if score == best_score]
+
+        return {color: 1.0 / len(winners) if color in winners else 0.0 for color in scores}
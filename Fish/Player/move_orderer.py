@@ -0,0 +1,111 @@
+import sys
+
+sys.path.append('../Common')
+
+from action import Action
+from state import State
+from move_ordering import MoveOrdering
+
+
+class MoveOrderer(object):
+    """
+    PURPOSE:        The purpose of the move orderer is to have a minimax search with alpha-beta pruning look at
+                    the moves that are most likely to be best (and hence to cause a cutoff) first, as the sooner
+                    a cutoff occurs the fewer nodes need to be searched.
+
+    INTERPRETATION: A MoveOrderer applies a list of MoveOrdering heuristics in order of precedence: moves are
+                    ordered by the first heuristic, ties are broken by the second one, and so forth. Moves that
+                    tie on all heuristics keep the order they were generated in. The heuristics are:
+
+                    TRANSPOSITION_TABLE: the best move stored in the transposition table for the position goes first.
+                    KILLER_MOVES: the (at most) KILLER_MOVES_PER_PLY latest moves that caused a cutoff at the same
+                                  ply (number of moves away from the root of the search) go next, latest first.
+                    HISTORY: moves are ordered by their history score, which is raised by depth * depth every time
+                             a move causes a cutoff at the given remaining depth, highest first.
+                    FISH_AT_DESTINATION: moves are ordered by the number of fish on the tile they land on, most first.
+
+                    A MoveOrderer keeps track of the killer moves and history scores of a single search, and is
+                    therefore to be made up anew for every search.
+    """
+    # Number of killer moves remembered per ply
+    KILLER_MOVES_PER_PLY = 2
+
+    def __init__(self, heuristics: [MoveOrdering]):
+        """
+        Initializes a move orderer applying the given heuristics.
+
+        :param heuristics: list of MoveOrdering in order of precedence
+        :return: new MoveOrderer designed to spec
+        """
+        # Validate params
+        if not isinstance(heuristics, list) or not all(isinstance(h, MoveOrdering) for h in heuristics):
+            raise TypeError('Expected list of MoveOrdering for heuristics!')
+
+        # Set fields
+        self.__heuristics = heuristics.copy()
+        # Initialize dict of ply to list of killer moves (latest first)
+        self.__killer_moves = {}
+        # Initialize dict of Action to history score
+        self.__history = {}
+
+    @property
+    def heuristics(self) -> [MoveOrdering]:
+        """
+        Returns the heuristics applied by the orderer in order of precedence.
+        """
+        return self.__heuristics.copy()
+
+    def get_key(self, state: State, ply: int, table_move: Action = None):
+        """
+        Returns a function that maps the moves of the provided state onto values that order them
+        as the heuristics dictate when sorted in ascending order (or None if there are no heuristics
+        to order by).
+
+        :param state: state whose moves are to be ordered
+        :param ply: number of moves the state is away from the root of the search
+        :param table_move: best Action stored in the transposition table for the state (if any)
+        :return: function of Action to tuple, or None
+        """
+        if not self.__heuristics:
+            return None
+
+        # Make up a component of the key for each heuristic
+        components = []
+
+        for heuristic in self.__heuristics:
+            if heuristic == MoveOrdering.TRANSPOSITION_TABLE:
+                components.append(lambda action: action != table_move)
+            elif heuristic == MoveOrdering.KILLER_MOVES:
+                killer_moves = self.__killer_moves.get(ply, [])
+                components.append(lambda action, killer_moves=killer_moves:
+                                  killer_moves.index(action) if action in killer_moves
+                                  else MoveOrderer.KILLER_MOVES_PER_PLY)
+            elif heuristic == MoveOrdering.HISTORY:
+                history = self.__history
+                components.append(lambda action: -history.get(action, 0))
+            else:
+                board = state.board
+                components.append(lambda action, board=board: -board.get_tile(action.dst).fish_no)
+
+        return lambda action: tuple(component(action) for component in components)
+
+    def record_cutoff(self, move: Action, ply: int, depth: int) -> None:
+        """
+        Records that the given move caused a cutoff, making it a killer move at the given ply
+        and raising its history score.
+
+        :param move: Action that caused the cutoff
+        :param ply: number of moves the node of the cutoff is away from the root of the search
+        :param depth: remaining depth of the node of the cutoff
+        :return: None
+        """
+        killer_moves = self.__killer_moves.setdefault(ply, [])
+
+        # Make move the latest killer move of the ply
+        if move in killer_moves:
+            killer_moves.remove(move)
+
+        killer_moves.insert(0, move)
+        del killer_moves[MoveOrderer.KILLER_MOVES_PER_PLY:]
+
+        self.__history[move] = self.__history.get(move, 0) + depth * depth
@@ -0,0 +1,14 @@
+from enum import Enum
+
+
+class MoveOrdering(Enum):
+    """
+    Represents a heuristic a Strategy may order moves by during its minimax search: the best move
+    the transposition table holds for the position, the killer moves (moves that caused a cutoff
+    at the same ply elsewhere in the tree), the history table (how often and how deep a move caused
+    cutoffs so far) and the number of fish on the tile a move lands on.
+    """
+    TRANSPOSITION_TABLE = 0
+    KILLER_MOVES = 1
+    HISTORY = 2
+    FISH_AT_DESTINATION = 3
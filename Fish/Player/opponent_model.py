@@ -0,0 +1,12 @@
+from enum import Enum
+
+
+class OpponentModel(Enum):
+    """
+    Represents the way a Strategy's minimax search models the opponents of the maximizing player:
+    either each opponent takes its turn in order, minimizing the maximizer's score (paranoid), or
+    only the single strongest reply across all opponents is considered in between the maximizer's
+    turns (best-reply search).
+    """
+    PARANOID = 0
+    BEST_REPLY = 1
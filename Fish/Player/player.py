@@ -3,6 +3,11 @@ import sys
 sys.path.append('../Common/')
 
 from strategy import Strategy
+from monte_carlo_tree_search import MonteCarloTreeSearch
+from search_engine import SearchEngine
+from ponderer import Ponderer
+from search_stats import SearchStats
+from transposition_table import TranspositionTable
 from color import Color
 from position import Position
 from state import State
@@ -28,9 +33,30 @@ class Player(IPlayer):
                     illegal placement or move) or fails to provide a valid return type for the functions laid out in the
                     Player interface.  When this happens the player' avatars are removed (the tiles upon which they
                     rested are not) and all communication with said player is terminated.
+
+                    A Player either searches for its moves to a fixed depth (depth mode) or, if it is given a time
+                    budget, deepens its search for as long as the budget allows (time mode). See Strategy for details.
+                    Alternatively, a Player may determine its moves via a Monte Carlo tree search, which runs for the
+                    time budget if there is one (or MonteCarloTreeSearch.DEFAULT_ITERATIONS iterations otherwise).
+
+                    A Player searching via min-max may also ponder: once it is synced with a state in which one of
+                    its opponents is to move, it searches the positions it may be faced with on its next turn on a
+                    background thread, and answers get_action from what it found if its prediction was right (see
+                    Ponderer). Pondering stops as soon as the Player is asked for an action or the game is over.
+
+                    A Player searching via min-max keeps a transposition table of its own (see Strategy), which
+                    its Ponderer searches with as well. It is cleared once the player is assigned a color for a new
+                    game and once the game is over, so that entries do not carry over from one game to the next.
+
+                    A Player searching via min-max keeps the statistics of its searches (see SearchStats), both for
+                    the game at hand (search_stats, reset once it is assigned a color for a new game) and for the
+                    tournament at hand (tournament_search_stats, reset once the tournament starts). Actions answered
+                    from what was pondered are not searched, hence do not add to either.
     """
 
-    def __init__(self, name: str, color: Color = Color.UNDEFINED, search_depth: int = 1) -> None:
+    def __init__(self, name: str, color: Color = Color.UNDEFINED, search_depth: int = 1,
+                 time_budget: float = None, search_engine: SearchEngine = SearchEngine.MINIMAX,
+                 ponder: bool = False) -> None:
         """
         This method is used to inform the player about the initial setup of the game before
         any placements are made. More specifically it provides it with its name and its color.
@@ -38,6 +64,10 @@ class Player(IPlayer):
         :param name:        player's name
         :param color:       player's color
         :param search_depth depth for our mini-max search to find the next best move. See Strategy for details.
+        :param time_budget: number of seconds to deepen our mini-max search for on each move (None to search
+                            to search_depth instead). See Strategy for details.
+        :param search_engine: SearchEngine to determine moves with
+        :param ponder: whether to search ahead while opponents are to move (MINIMAX search engine only)
         :return: None
         """
         # Validate params
@@ -50,16 +80,47 @@ class Player(IPlayer):
         if not isinstance(search_depth, int) or search_depth < 1:
             raise TypeError('Expected an int greater than zero for search_depth!')
 
+        if time_budget is not None and (not isinstance(time_budget, (int, float)) or time_budget <= 0):
+            raise ValueError('Expected a number greater than zero for time_budget!')
+
+        if not isinstance(search_engine, SearchEngine):
+            raise TypeError('Expected SearchEngine for search_engine!')
+
+        if not isinstance(ponder, bool):
+            raise TypeError('Expected bool for ponder!')
+
+        if ponder and search_engine != SearchEngine.MINIMAX:
+            raise ValueError('Pondering requires the MINIMAX search engine!')
+
         # Set properties
         self.__color = color
         self.__name = name
         self.__search_depth = search_depth
+        self.__time_budget = time_budget
+        self.__search_engine = search_engine
         # Initialize property to hold reason player was kicked
         self.__kicked_reason = ''
         # Initialize state to a place holder
         self.__state = None
         # Initialize opponent colors to empty list
         self.__opponent_colors = []
+        # Initialize transposition table of our min-max searches
+        self.__transposition_table = TranspositionTable()
+        # Initialize ponderer (if pondering)
+        self.__ponderer = Ponderer(color, search_depth, time_budget, self.__transposition_table) \
+            if ponder else None
+        # Initialize statistics of our min-max searches throughout the game and the tournament
+        self.__search_stats = SearchStats()
+        self.__tournament_search_stats = SearchStats()
+
+    def __getstate__(self) -> dict:
+        """
+        Returns the picklable state of the player. The ponderer is left out as it holds on to
+        a background thread and its lock, hence the unpickled player does not ponder.
+        """
+        state = self.__dict__.copy()
+        state['_Player__ponderer'] = None
+        return state
 
     @property
     def kicked_reason(self) -> str:
@@ -76,6 +137,34 @@ class Player(IPlayer):
         """
         return self.__state
 
+    @property
+    def transposition_table(self) -> TranspositionTable:
+        """
+        Returns the transposition table of the player's min-max searches.
+        """
+        return self.__transposition_table
+
+    @property
+    def ponderer(self) -> Ponderer:
+        """
+        Returns the player's Ponderer or None if the player does not ponder.
+        """
+        return self.__ponderer
+
+    @property
+    def search_stats(self) -> SearchStats:
+        """
+        Returns the statistics of the player's min-max searches throughout the current game.
+        """
+        return self.__search_stats
+
+    @property
+    def tournament_search_stats(self) -> SearchStats:
+        """
+        Returns the statistics of the player's min-max searches throughout the current tournament.
+        """
+        return self.__tournament_search_stats
+
     @property
     def color(self) -> Color:
         """
@@ -93,6 +182,9 @@ class Player(IPlayer):
 
         self.__color = color
 
+        if self.__ponderer is not None:
+            self.__ponderer.color = color
+
     @property
     def name(self) -> str:
         """
@@ -128,6 +220,10 @@ class Player(IPlayer):
         # Print reason why we got kicked.
         self.__kicked_reason = reason
 
+        # Stop pondering for good
+        if self.__ponderer is not None:
+            self.__ponderer.reset()
+
         # A real player may find this information more useful than an A.I. would.
 
     def sync(self, state: State) -> None:
@@ -140,8 +236,10 @@ class Player(IPlayer):
 
         # Update internal state
         self.__state = state
-        # A real player may decide what to do with this information, but an A.I. will use
-        # the state received via get_action and get_placement to decide on a response.
+
+        # Ponder the positions we may be faced with next while our opponents are to move
+        if self.__ponderer is not None:
+            self.__ponderer.start(state)
 
     def get_action(self, state: State) -> Action:
         """
@@ -156,7 +254,33 @@ class Player(IPlayer):
         # Update internal state
         self.__state = state
 
-        return Strategy.get_best_action(state, self.__search_depth)
+        # Answer right away if pondering predicted the position (stopping it either way)
+        if self.__ponderer is not None:
+            action = self.__ponderer.get_action(state)
+
+            if action is not None:
+                return action
+
+        # Run Monte Carlo tree search within time budget (if any) if it is the engine of choice
+        if self.__search_engine == SearchEngine.MONTE_CARLO:
+            return MonteCarloTreeSearch.get_best_action(state, time_budget=self.__time_budget)
+
+        # Make up statistics of the search
+        stats = SearchStats()
+
+        # Search within time budget (if any), or to search depth otherwise
+        if self.__time_budget is not None:
+            action = Strategy.get_best_action(state, time_budget=self.__time_budget,
+                                              transposition_table=self.__transposition_table, stats=stats)
+        else:
+            action = Strategy.get_best_action(state, self.__search_depth,
+                                              transposition_table=self.__transposition_table, stats=stats)
+
+        # Add statistics of the search to those of the game and the tournament
+        self.__search_stats.merge(stats)
+        self.__tournament_search_stats.merge(stats)
+
+        return action
 
     def game_over(self, leaderboard: list, cheating_players: list, failing_players: list) -> None:
         """
@@ -172,6 +296,12 @@ class Player(IPlayer):
         if not isinstance(failing_players, list):
             raise TypeError('Expected list for failing_players!')
 
+        # Stop pondering and drop what was pondered (and searched) as it does not carry over to the next game
+        if self.__ponderer is not None:
+            self.__ponderer.reset()
+
+        self.__clear_transposition_table()
+
         # A real player may decide what to do with this information, but an A.I. could
         # care less.
 
@@ -189,6 +319,14 @@ class Player(IPlayer):
     def set_color(self, color: Color) -> bool:
         """ Implements PlayerInterface.set_color() """
         self.__color = color
+        # Start over on the statistics of our searches as a new game is about to start
+        self.__search_stats = SearchStats()
+
+        if self.__ponderer is not None:
+            self.__ponderer.color = color
+
+        # Start over on the transposition table as well (after the ponderer has been stopped)
+        self.__clear_transposition_table()
 
         # A real player may decide what to do with this information, but an A.I. could
         # care less.
@@ -206,6 +344,9 @@ class Player(IPlayer):
         """
         Implements PlayerInterface.tournament_has_started()
         """
+        # Start over on the statistics of our searches throughout the tournament
+        self.__tournament_search_stats = SearchStats()
+
         # A real player may decide what to do with this information, but an A.I. could
         # care less.
         return True
@@ -217,3 +358,10 @@ class Player(IPlayer):
         # A real player may decide what to do with this information, but an A.I. could
         # care less.
         return True
+
+    def __clear_transposition_table(self) -> None:
+        """
+        Removes all entries from the transposition table of our min-max searches and resets its counters.
+        """
+        self.__transposition_table.clear()
+        self.__transposition_table.reset_counters()
@@ -0,0 +1,11 @@
+from enum import Enum
+
+
+class PlayoutPolicy(Enum):
+    """
+    Represents the way a MonteCarloTreeSearch picks moves while playing out a game: either
+    uniformly at random amongst all possible moves, or greedily by picking a move that lands
+    on a tile holding the most fish (ties being broken at random).
+    """
+    RANDOM = 0
+    GREEDY = 1
@@ -0,0 +1,278 @@
+import sys
+import threading
+from collections import deque
+
+sys.path.append('../Common')
+
+from state import State
+from action import Action
+from color import Color
+from strategy import Strategy
+from transposition_table import TranspositionTable
+from exceptions.SearchTimeoutException import SearchTimeoutException
+
+
+class Ponderer(object):
+    """
+    PURPOSE:        The purpose of the ponderer is to put the time a player spends waiting on its opponents to use
+                    by searching the positions it may be faced with on its next turn ahead of time (pondering).
+
+    INTERPRETATION: A Ponderer is started with the latest state of a game. If it is one of the player's opponents
+                    to move, the ponderer predicts the positions the player may find itself in once it is its turn
+                    again by playing out the opponents' moves up until then (the moves landing on the most fish
+                    first), and searches each of them on a background thread in the order they were predicted. At
+                    most MAX_PREDICTED_POSITIONS positions are predicted each time it is started.
+
+                    In depth mode, a position is searched just like the player would search it, and the best action
+                    found is cached by the position's hash (see State.position_hash). Once the player is asked for
+                    its action in a predicted position that has been searched, the cached action is returned right
+                    away. In time mode, the outcome of searching a position depends on the time it was given, hence
+                    no actions are cached; the searches merely fill the ponderer's transposition table, from which
+                    the player's own search picks up if it searches with the same table.
+
+                    Each ponderer searches with a transposition table of its own (the player's if given one), so that
+                    it never shares a table with the searches of other players running alongside it, and every
+                    search keeps its statistics to itself (see Strategy). Pondering stops as soon as the ponderer is
+                    started again or asked for an action, hence its searches never run concurrently with the
+                    player's own.
+    """
+    # Initialize maximum number of positions predicted each time the ponderer is started
+    MAX_PREDICTED_POSITIONS = 64
+
+    def __init__(self, color: Color, search_depth: int, time_budget: float = None,
+                 transposition_table: TranspositionTable = None):
+        """
+        Initializes an idle ponderer.
+
+        :param color: color of player to ponder for
+        :param search_depth: depth the player searches its moves to (see Strategy)
+        :param time_budget: number of seconds the player deepens its search for (None to search to search_depth)
+        :param transposition_table: TranspositionTable to search with (None for a new one)
+        :return: new Ponderer designed to spec
+        """
+        # Validate params
+        if not isinstance(color, Color):
+            raise TypeError('Expected Color for color!')
+
+        if not isinstance(search_depth, int) or search_depth < 1:
+            raise ValueError('Expected int > 0 for search_depth!')
+
+        if time_budget is not None and (not isinstance(time_budget, (int, float)) or time_budget <= 0):
+            raise ValueError('Expected number > 0 for time_budget!')
+
+        if transposition_table is not None and not isinstance(transposition_table, TranspositionTable):
+            raise TypeError('Expected TranspositionTable for transposition_table!')
+
+        # Set fields
+        self.__color = color
+        self.__search_depth = search_depth
+        self.__time_budget = time_budget
+        self.__transposition_table = TranspositionTable() if transposition_table is None else transposition_table
+        # Initialize dict of position hash to best Action found for it
+        self.__actions = {}
+        # Initialize background thread (None while idle) and the event to stop it with
+        self.__thread = None
+        self.__stop_event = threading.Event()
+        # Initialize number of positions searched and number of actions answered from the cache
+        self.__positions_searched = 0
+        self.__hits = 0
+
+    @property
+    def color(self) -> Color:
+        """
+        Returns the color of the player the ponderer ponders for.
+        """
+        return self.__color
+
+    @color.setter
+    def color(self, color: Color) -> None:
+        """
+        Sets the color of the player the ponderer ponders for, stopping it and dropping the actions
+        it has cached.
+        """
+        if not isinstance(color, Color):
+            raise TypeError('Expected Color for color!')
+
+        self.reset()
+        self.__color = color
+
+    @property
+    def transposition_table(self) -> TranspositionTable:
+        """
+        Returns the transposition table the ponderer searches with.
+        """
+        return self.__transposition_table
+
+    @property
+    def is_pondering(self) -> bool:
+        """
+        Tells whether the ponderer is currently searching on its background thread.
+        """
+        return self.__thread is not None and self.__thread.is_alive()
+
+    @property
+    def cached_actions(self) -> int:
+        """
+        Returns the number of actions cached.
+        """
+        return len(self.__actions)
+
+    @property
+    def positions_searched(self) -> int:
+        """
+        Returns the number of positions searched to completion since the ponderer was last reset.
+        """
+        return self.__positions_searched
+
+    @property
+    def hits(self) -> int:
+        """
+        Returns the number of actions answered from the cache since the ponderer was last reset.
+        """
+        return self.__hits
+
+    def start(self, state: State) -> None:
+        """
+        Stops pondering and, if one of the player's opponents is to move in the given state, starts pondering
+        the positions the player may be faced with on its next turn anew (see class description). Actions
+        cached for earlier states are kept as any of their positions may still come up.
+
+        :param state: latest state of the game
+        :return: None
+        """
+        # Validate params
+        if not isinstance(state, State):
+            raise TypeError('Expected State for state!')
+
+        self.stop()
+
+        # Only ponder once all avatars have been placed and while the player is waiting on an opponent
+        if not self.__is_game_running(state) or self.__color not in state.player_order \
+                or state.current_player == self.__color or not state.can_anyone_move():
+            return
+
+        self.__stop_event.clear()
+        self.__thread = threading.Thread(target=self.__ponder, args=(state.deepcopy(),), daemon=True)
+        self.__thread.start()
+
+    def stop(self) -> None:
+        """
+        Stops pondering and waits for the background thread to wind down.
+
+        :return: None
+        """
+        if self.__thread is not None:
+            self.__stop_event.set()
+            self.__thread.join()
+            self.__thread = None
+
+    def get_action(self, state: State) -> Action:
+        """
+        Stops pondering and returns the action cached for the position of the given state.
+
+        :param state: state the player is to act in
+        :return: cached Action or None if the position has not been searched
+        """
+        # Validate params
+        if not isinstance(state, State):
+            raise TypeError('Expected State for state!')
+
+        self.stop()
+        action = self.__actions.get(state.position_hash)
+
+        if action is not None:
+            self.__hits += 1
+
+        return action
+
+    def reset(self) -> None:
+        """
+        Stops pondering and drops all cached actions along with the counters (i.e. once a game is over).
+
+        :return: None
+        """
+        self.stop()
+        self.__actions = {}
+        self.__positions_searched = 0
+        self.__hits = 0
+
+    def __ponder(self, state: State) -> None:
+        """
+        Searches the positions the player may be faced with on its next turn one at a time until all have
+        been searched or the ponderer is stopped. Runs on the background thread.
+
+        :param state: state to predict positions from (owned by the background thread)
+        :return: None
+        """
+        for position in self.__predict_positions(state):
+            if self.__stop_event.is_set():
+                return
+
+            # Skip positions searched before
+            if position.position_hash in self.__actions:
+                continue
+
+            try:
+                if self.__time_budget is not None:
+                    Strategy.get_best_action(position, time_budget=self.__time_budget, stop_event=self.__stop_event,
+                                             transposition_table=self.__transposition_table)
+                else:
+                    action = Strategy.get_best_action(position, self.__search_depth, stop_event=self.__stop_event,
+                                                      transposition_table=self.__transposition_table)
+
+                    # Only cache actions of searches that ran to completion
+                    if self.__stop_event.is_set():
+                        return
+
+                    self.__actions[position.position_hash] = action
+            except SearchTimeoutException:
+                return
+
+            self.__positions_searched += 1
+
+    def __predict_positions(self, state: State):
+        """
+        Lazily yields the positions the player may be faced with on its next turn, reached by playing out the
+        opponents' moves from the given state in breadth-first order (moves landing on the most fish first),
+        up to MAX_PREDICTED_POSITIONS of them.
+
+        :param state: state to predict positions from
+        :return: generator of State objects in which the player is to move
+        """
+        queue = deque([state])
+        predicted_no = 0
+
+        while queue and predicted_no < Ponderer.MAX_PREDICTED_POSITIONS:
+            if self.__stop_event.is_set():
+                return
+
+            current = queue.popleft()
+            board = current.board
+
+            for action in current.generate_actions(lambda action: -board.get_tile(action.dst).fish_no):
+                # Stop making up positions once there are enough of them
+                if predicted_no + len(queue) >= Ponderer.MAX_PREDICTED_POSITIONS:
+                    break
+
+                position = current.deepcopy()
+                position.move_avatar(*action)
+
+                # Leave out positions in which the game is over or the player has been skipped
+                if not position.can_anyone_move() or self.__color in position.stuck_players:
+                    continue
+
+                if position.current_player == self.__color:
+                    predicted_no += 1
+                    yield position
+                else:
+                    queue.append(position)
+
+    @staticmethod
+    def __is_game_running(state: State) -> bool:
+        """
+        Tells whether all avatars have been placed in the given state.
+
+        :param state: state to check
+        :return: boolean indicating whether all avatars have been placed
+        """
+        return sum(len(places) for places in state.placements.values()) == state.players_no * state.avatars_per_player
@@ -0,0 +1,11 @@
+from enum import Enum
+
+
+class ReplacementPolicy(Enum):
+    """
+    Represents the policy a TranspositionTable follows when a new entry maps onto a slot
+    that already holds an entry for a different position: either always overwrite it, or
+    only overwrite it if the new entry was searched at least as deep.
+    """
+    ALWAYS_REPLACE = 0
+    DEPTH_PREFERRED = 1
@@ -0,0 +1,10 @@
+from enum import Enum
+
+
+class SearchEngine(Enum):
+    """
+    Represents the engine a Player (or Client) determines its moves with: either the minimax
+    search of Strategy, or a Monte Carlo tree search (see MonteCarloTreeSearch).
+    """
+    MINIMAX = 0
+    MONTE_CARLO = 1
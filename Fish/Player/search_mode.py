@@ -0,0 +1,13 @@
+from enum import Enum
+
+
+class SearchMode(Enum):
+    """
+    Represents the way a Strategy explores moves during its minimax search: either
+    on a GameTree (copying the state for every node), by making and unmaking moves
+    on a single mutable State, or by handing the subtrees below a split depth to a
+    pool of worker processes (each of which makes and unmakes moves).
+    """
+    GAME_TREE = 0
+    MAKE_UNMAKE = 1
+    PARALLEL = 2
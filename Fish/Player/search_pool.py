@@ -0,0 +1,94 @@
+import atexit
+import multiprocessing
+import threading
+
+
+class SearchPool(object):
+    """
+    PURPOSE:        The purpose of the search pool is to keep a set of worker processes warm across searches so
+                    that a parallel search does not have to pay for starting processes every time it is run.
+
+    INTERPRETATION: A SearchPool wraps a multiprocessing pool of the given number of worker processes along with
+                    a shared bound: an integer held in shared memory that every worker can read and the process
+                    that owns the pool can raise while a search is under way (i.e. the best score found so far).
+                    Each worker is handed the shared bound via the given initializer once it starts.
+
+                    Only one search may run on a pool at a time, which is ensured by holding the pool's lock for
+                    the duration of the search. The pool is closed once close() is called or the interpreter exits.
+    """
+
+    def __init__(self, processes: int, initializer):
+        """
+        Starts a pool of the given number of worker processes.
+
+        :param processes: number of worker processes
+        :param initializer: function called with the shared bound in each worker process once it starts
+        :return: new SearchPool designed to spec
+        """
+        # Validate params
+        if not isinstance(processes, int) or processes <= 0:
+            raise ValueError('Expected int > 0 for processes!')
+
+        if not callable(initializer):
+            raise TypeError('Expected function for initializer!')
+
+        # Set fields
+        self.__processes = processes
+        # Initialize bound shared amongst workers
+        self.__shared_bound = multiprocessing.Value('i', 0)
+        # Initialize lock held throughout a search
+        self.__lock = threading.Lock()
+        # Start worker processes
+        self.__pool = multiprocessing.Pool(processes, initializer, (self.__shared_bound,))
+
+        # Make sure worker processes are shut down along with this process
+        atexit.register(self.close)
+
+    @property
+    def processes(self) -> int:
+        """
+        Returns the number of worker processes of the pool.
+        """
+        return self.__processes
+
+    @property
+    def lock(self) -> threading.Lock:
+        """
+        Returns the lock to hold while running a search on the pool.
+        """
+        return self.__lock
+
+    @property
+    def shared_bound(self) -> int:
+        """
+        Returns the current value of the shared bound.
+        """
+        return self.__shared_bound.value
+
+    @shared_bound.setter
+    def shared_bound(self, value: int) -> None:
+        """
+        Sets the shared bound to the given value.
+        """
+        self.__shared_bound.value = value
+
+    def imap_unordered(self, fn, tasks: list):
+        """
+        Hands the given tasks to the worker processes and lazily yields their results in
+        the order they complete in.
+
+        :param fn: module-level function to call with each task in a worker process
+        :param tasks: list of (picklable) tasks
+        :return: generator of results
+        """
+        return self.__pool.imap_unordered(fn, tasks)
+
+    def close(self) -> None:
+        """
+        Shuts down the worker processes of the pool.
+
+        :return: None
+        """
+        self.__pool.terminate()
+        self.__pool.join()
+        atexit.unregister(self.close)
@@ -0,0 +1,164 @@
+from contextlib import contextmanager
+import time
+
+
+class SearchStats(object):
+    """
+    PURPOSE:        The purpose of the search statistics is to tell how the min-max search of Strategy spends its
+                    effort (how many nodes it visits, how many of them it gets to cut off and how long each depth
+                    takes), so that its features can be tuned and compared on numbers rather than hunches.
+
+    INTERPRETATION: SearchStats holds a set of counters (see COUNTERS) that the search bumps as it goes:
+
+                    - nodes: nodes visited
+                    - expanded: nodes whose moves were searched
+                    - children: moves searched at expanded nodes (children / expanded is the branching factor)
+                    - cutoffs: nodes whose remaining moves were cut off by alpha-beta pruning
+                    - table_hits: nodes settled by the transposition table
+                    - bound_cutoffs: nodes cut off by the maximizer's score bound
+                    - solved: nodes settled by the endgame solver
+                    - researches: searches run again with a wider window (principal variation search and
+                      aspiration windows)
+                    - state_copies: copies of the state made by the search (one per GameTree node)
+
+                    The counters are kept as plain attributes, as they are bumped for every node searched. On top
+                    of them, the statistics record the number of searches they cover (calls to get_best_action),
+                    the number of seconds said searches took and a breakdown of the counters and seconds by depth:
+                    each iteration of iterative deepening (or the single iteration of a fixed depth search) adds its
+                    share to the entry of the depth it searched to, noting whether it ran to completion.
+
+                    Statistics of several searches (e.g. all searches of a player throughout a game or tournament)
+                    are aggregated by merging them into one SearchStats object.
+    """
+    # Names of the counters bumped by the search
+    COUNTERS = ('nodes', 'expanded', 'children', 'cutoffs', 'table_hits', 'bound_cutoffs', 'solved', 'researches',
+                'state_copies')
+
+    def __init__(self):
+        """
+        Initializes statistics with all counters at zero.
+
+        :return: new SearchStats designed to spec
+        """
+        for name in SearchStats.COUNTERS:
+            setattr(self, name, 0)
+
+        # Initialize number of searches covered and the number of seconds they took
+        self.searches = 0
+        self.seconds = 0.0
+        # Initialize dict of depth to a dict of counter name (and 'seconds', 'iterations' and 'completed')
+        # to the share of the iterations searching to said depth
+        self.__depths = {}
+
+    @property
+    def depths(self) -> dict:
+        """
+        Returns a copy of the breakdown of the counters by depth (see class description).
+        """
+        return {depth: entry.copy() for depth, entry in self.__depths.items()}
+
+    @property
+    def branching_factor(self) -> float:
+        """
+        Returns the average number of moves searched per expanded node (0.0 if no node was expanded).
+        """
+        return self.children / self.expanded if self.expanded else 0.0
+
+    @property
+    def nodes_per_second(self) -> float:
+        """
+        Returns the number of nodes visited per second (0.0 if no time was recorded).
+        """
+        return self.nodes / self.seconds if self.seconds > 0 else 0.0
+
+    def get_counters(self) -> dict:
+        """
+        Returns the current value of each counter.
+
+        :return: dict of counter name to value
+        """
+        return {name: getattr(self, name) for name in SearchStats.COUNTERS}
+
+    @contextmanager
+    def iteration(self, depth: int):
+        """
+        Records the share of the counters and the time taken by the search run within the context to
+        the entry of the given depth. The iteration counts as completed unless the context is left by
+        an exception (such as SearchTimeoutException), which is passed on.
+
+        :param depth: depth the search run within the context searches to
+        :return: context manager
+        """
+        # Validate params
+        if not isinstance(depth, int) or depth <= 0:
+            raise ValueError('Expected int > 0 for depth!')
+
+        before = self.get_counters()
+        start = time.monotonic()
+        completed = False
+
+        try:
+            yield
+            completed = True
+        finally:
+            entry = self.__depths.setdefault(depth, SearchStats.__make_depth_entry())
+
+            for name, value in before.items():
+                entry[name] += getattr(self, name) - value
+
+            entry['seconds'] += time.monotonic() - start
+            entry['iterations'] += 1
+            entry['completed'] += int(completed)
+
+    def merge(self, other: 'SearchStats') -> None:
+        """
+        Adds the counters, searches, seconds and breakdown by depth of the given statistics to these ones.
+
+        :param other: SearchStats to add
+        :return: None
+        """
+        # Validate params
+        if not isinstance(other, SearchStats):
+            raise TypeError('Expected SearchStats for other!')
+
+        for name in SearchStats.COUNTERS:
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+
+        self.searches += other.searches
+        self.seconds += other.seconds
+
+        for depth, other_entry in other.__depths.items():
+            entry = self.__depths.setdefault(depth, SearchStats.__make_depth_entry())
+
+            for name, value in other_entry.items():
+                entry[name] += value
+
+    def to_dict(self) -> dict:
+        """
+        Converts the statistics into a dict of plain values (i.e. for reports or to be serialized to JSON).
+
+        :return: dict of counter name (along with 'searches', 'seconds', 'branching_factor' and
+                 'nodes_per_second') to value, and 'depths' to a dict of depth to its entry
+        """
+        result = self.get_counters()
+        result['searches'] = self.searches
+        result['seconds'] = self.seconds
+        result['branching_factor'] = self.branching_factor
+        result['nodes_per_second'] = self.nodes_per_second
+        result['depths'] = self.depths
+
+        return result
+
+    @staticmethod
+    def __make_depth_entry() -> dict:
+        """
+        Makes up an entry of the breakdown by depth with all values at zero.
+
+        :return: dict of counter name (along with 'seconds', 'iterations' and 'completed') to zero
+        """
+        entry = dict.fromkeys(SearchStats.COUNTERS, 0)
+        entry['seconds'] = 0.0
+        entry['iterations'] = 0
+        entry['completed'] = 0
+
+        return entry
@@ -1,15 +1,31 @@
+import multiprocessing
 import sys
+import threading
+import time
 
 
 sys.path.append('../Common')
 
 from state import State
 from exceptions.OutOfTilesException import OutOfTilesException
+from exceptions.SearchTimeoutException import SearchTimeoutException
 from action import Action
 from position import Position
 from constants import VERY_LARGE_NUMBER
 from game_tree import GameTree
 from color import Color
+from search_mode import SearchMode
+from retention_policy import RetentionPolicy
+from child_cache import ChildCache
+from transposition_table import TranspositionTable
+from bound_type import BoundType
+from move_ordering import MoveOrdering
+from move_orderer import MoveOrderer
+from search_pool import SearchPool
+from endgame_solver import EndgameSolver
+from opponent_model import OpponentModel
+from search_stats import SearchStats
+from evaluator import Evaluator
 
 
 class Strategy(object):
@@ -22,11 +38,67 @@ class Strategy(object):
              The latter strategy is achieved through a min-max algorithm that maximizes the player's score
              for the worst possible moves (for the player) played by their opponent(s).
 
+             The min-max search walks a GameTree or makes and unmakes moves on a single copy of the state
+             (SEARCH_MODE), consults a transposition table (the caller's, TRANSPOSITION_TABLE or a fresh one per
+             call, unless USE_TRANSPOSITION_TABLE is off), orders moves
+             by the MOVE_ORDERING heuristics and may be deepened iteratively within a time budget, split over
+             worker processes (PARALLEL), settle endgames (ENDGAME_SOLVER), cut off nodes by the maximizer's best
+             case (BOUND_PRUNING), search with null and aspiration windows (PRINCIPAL_VARIATION_SEARCH,
+             ASPIRATION_WINDOW), model opponents as a single best reply (OPPONENT_MODEL) or score leaves by an
+             Evaluator (EVALUATION). Apart from the time budget and the last two, none of these change the move
+             picked, as ties at the root are always told apart exactly. Each call records its statistics in a
+             SearchStats object of its own (see get_best_action), which are also added to AGGREGATE_STATS if set.
+
     Interpretation: The strategy is the logic employed by a player to determine their moves in an
                     attempt to win the game by collecting the largest number of fish.
     """
     # Initialize DEBUG flag (if enabled debug information may be written to stdout)
     DEBUG = False
+    # Initialize the way the min-max search explores moves
+    SEARCH_MODE = SearchMode.MAKE_UNMAKE
+    # Initialize the way the GameTree searched in GAME_TREE search mode holds on to child nodes, and the
+    # number of child nodes its ChildCache holds with BOUNDED policy
+    GAME_TREE_RETENTION = RetentionPolicy.NON_RETAINING
+    GAME_TREE_CACHE_NODES = 1 << 16
+    # Initialize the way the min-max search models the maximizer's opponents
+    OPPONENT_MODEL = OpponentModel.PARANOID
+    # Initialize flag to indicate whether searches consult a transposition table
+    USE_TRANSPOSITION_TABLE = True
+    # Initialize the transposition table consulted by searches that are not handed one of their own (None
+    # for a fresh one per call, so that searches of different games, players or threads do not share one)
+    TRANSPOSITION_TABLE = None
+    # Initialize the heuristics moves are ordered by during the search (in order of precedence)
+    MOVE_ORDERING = [MoveOrdering.TRANSPOSITION_TABLE, MoveOrdering.KILLER_MOVES, MoveOrdering.HISTORY,
+                     MoveOrdering.FISH_AT_DESTINATION]
+    # Initialize number of worker processes and the ply at which to split the search in PARALLEL search mode
+    PARALLEL_PROCESSES = multiprocessing.cpu_count()
+    PARALLEL_SPLIT_DEPTH = 1
+    # Initialize flag to indicate whether positions in which the maximizer is cut off from its opponents
+    # are settled by an EndgameSolver rather than searched
+    ENDGAME_SOLVER = True
+    # Initialize flag to indicate whether nodes at which the maximizer cannot beat alpha even if it collected
+    # the richest tiles within its reach are cut off without being expanded
+    BOUND_PRUNING = True
+    # Initialize flag to indicate whether moves other than the first one of a node are searched with a null
+    # window first (principal variation search)
+    PRINCIPAL_VARIATION_SEARCH = False
+    # Initialize half-width of the window around the previous iteration's score that iterative deepening
+    # starts each iteration with (None to search with a full window)
+    ASPIRATION_WINDOW = None
+    # Initialize flag to indicate whether leaves are scored by an Evaluator rather than by the maximizer's score
+    EVALUATION = False
+    # Initialize SearchStats to add the statistics of every call to get_best_action to (None to not aggregate
+    # them, i.e. set it to collect the statistics of a whole tournament)
+    AGGREGATE_STATS = None
+    # Initialize statistics of the latest call to get_best_action (on any thread)
+    stats = SearchStats()
+    # Initialize lock held while adding to AGGREGATE_STATS
+    __aggregate_lock = threading.Lock()
+    # Initialize pool of worker processes used in PARALLEL search mode (started upon first use)
+    __search_pool = None
+    # Initialize per-thread storage of the statistics, transposition table, Evaluator of the search running
+    # on a thread and the event that stops it once set
+    __local = threading.local()
 
     @staticmethod
     def place_penguin(player_color: Color, state: State) -> Position:
@@ -64,7 +136,9 @@ class Strategy(object):
         raise OutOfTilesException()
 
     @staticmethod
-    def get_best_action(state: State, depth: int) -> Action:
+    def get_best_action(state: State, depth: int = None, time_budget: float = None,
+                        stop_event: threading.Event = None,
+                        transposition_table: TranspositionTable = None, stats: SearchStats = None) -> Action:
         """
         This method determines the best action for the current player by looking ahead at most
         depth number of current-player turns and considering the most detrimental move an opponent
@@ -77,22 +151,73 @@ class Strategy(object):
         player gets stuck during the tree traversal and the provided depth has not been reached, the traversal is
         aborted and the best running move is returned.
 
+        If a time budget is provided, the search is deepened iteratively until the budget runs out (or the
+        provided depth is reached) and the best action of the deepest completed iteration is returned. The
+        first iteration (a depth of 1) is always completed so that there is an action to return.
+
+        If a stop event is provided, setting it (from another thread) stops the search as if it had run out of
+        time. A search that is stopped before its first iteration is complete throws SearchTimeoutException.
+        Searches in PARALLEL search mode only stop once the worker processes are done with the subtrees they
+        have been handed.
+
         :param state: state which to determine best move for current player for
-        :param depth: how many the current player in the provided states gets to go at most
+        :param depth: how many the current player in the provided states gets to go at most (optional if a
+                      time budget is provided)
+        :param time_budget: number of seconds to deepen the search for (None to search to depth right away)
+        :param stop_event: threading.Event to stop the search with (None for a search that runs to completion)
+        :param transposition_table: TranspositionTable to consult (None for TRANSPOSITION_TABLE or, if that is
+                                    None as well, a fresh one), i.e. one owned by the caller so that its
+                                    searches feed off one another
+        :param stats: SearchStats to record the search in (None for new ones), i.e. ones that belong to this
+                      call alone, unlike stats, which any later call on any thread replaces
         :return: best Action current player can make best on mini-max strategy
         """
         # Validate parameters
         if not isinstance(state, State):
             raise TypeError('Expected State object for state!')
 
-        if not isinstance(depth, int) or depth <= 0:
+        if (depth is not None or time_budget is None) and (not isinstance(depth, int) or depth <= 0):
             raise TypeError('Expected integer >= 0 for depth!')
 
-        # Make up a game tree for the state
-        tree = GameTree(state)
+        if time_budget is not None and (not isinstance(time_budget, (int, float)) or time_budget <= 0):
+            raise ValueError('Expected number > 0 for time_budget!')
 
-        # Determine min-max score for current child state
-        score, best_move = Strategy.__mini_max_search(tree, state.current_player, depth)
+        if stop_event is not None and not isinstance(stop_event, threading.Event):
+            raise TypeError('Expected threading.Event for stop_event!')
+
+        if transposition_table is not None and not isinstance(transposition_table, TranspositionTable):
+            raise TypeError('Expected TranspositionTable for transposition_table!')
+
+        if stats is not None and not isinstance(stats, SearchStats):
+            raise TypeError('Expected SearchStats for stats!')
+
+        # Make up statistics (unless given), a move orderer (and endgame solver) for the search
+        stats = SearchStats() if stats is None else stats
+        start = time.monotonic()
+        orderer = MoveOrderer(Strategy.MOVE_ORDERING)
+        solver = EndgameSolver() if Strategy.ENDGAME_SOLVER and not Strategy.EVALUATION else None
+
+        # Make statistics, stop event, transposition table (and evaluator) available to the search running on
+        # this thread
+        Strategy.__local.stats = stats
+        Strategy.__local.stop_event = stop_event
+        Strategy.__local.table = Strategy.__make_transposition_table(transposition_table)
+        Strategy.__local.evaluator = Evaluator(state.board) if Strategy.EVALUATION else None
+
+        try:
+            if time_budget is None:
+                with Strategy.__get_stats().iteration(depth):
+                    score, best_move = Strategy.__search(state, depth, orderer, solver=solver)
+            else:
+                score, best_move = Strategy.__iterative_deepening_search(state, depth, time_budget, orderer,
+                                                                         solver)
+        finally:
+            Strategy.__local.stop_event = None
+            del Strategy.__local.table
+            Strategy.__local.evaluator = None
+            Strategy.__record_search(stats, time.monotonic() - start)
+            del Strategy.__local.stats
+            Strategy.stats = stats
 
         if Strategy.DEBUG:
             print(f'  [depth={depth}] max score: {score} {best_move}')
@@ -100,9 +225,362 @@ class Strategy(object):
         # Return "best" action associated with the best score
         return best_move
 
+    @staticmethod
+    def __record_search(stats: SearchStats, seconds: float) -> None:
+        """
+        Completes the statistics of a call to get_best_action and adds them to AGGREGATE_STATS (if set).
+
+        :param stats: SearchStats of the call
+        :param seconds: number of seconds the call took
+        :return: None
+        """
+        stats.searches = 1
+        stats.seconds = seconds
+
+        if Strategy.AGGREGATE_STATS is not None:
+            # Calls on other threads may add to it at the same time
+            with Strategy.__aggregate_lock:
+                Strategy.AGGREGATE_STATS.merge(stats)
+
+        if Strategy.DEBUG:
+            print(f'  [stats] {stats.nodes} nodes, {stats.cutoffs} cutoffs, '
+                  f'branching factor {stats.branching_factor:.2f}, {seconds:.3f}s')
+
+    @staticmethod
+    def __search(state: State, depth: int, orderer: MoveOrderer, deadline: float = None,
+                 solver: EndgameSolver = None, alpha: int = -VERY_LARGE_NUMBER, beta: int = VERY_LARGE_NUMBER):
+        """
+        Runs the min-max search for the provided state's current player to the given depth using
+        the search mode set by SEARCH_MODE. Unless the window is left open, the score (and move) is
+        only exact if it falls within the window; PARALLEL search mode always searches with an open
+        window.
+
+        Throws SearchTimeoutException if the deadline passes before the search completes.
+
+        :param state: state which to determine best move for current player for
+        :param depth: how many the current player in the provided states gets to go at most
+        :param orderer: MoveOrderer to order moves with
+        :param deadline: time.monotonic() value by which to complete the search (None for no deadline)
+        :param solver: EndgameSolver to settle cut off positions with (None to search them)
+        :param alpha: lower end of the window to search with
+        :param beta: upper end of the window to search with
+        :return: tuple of integer best score and corresponding best Action object
+        """
+        if Strategy.OPPONENT_MODEL == OpponentModel.BEST_REPLY:
+            # Determine best-reply score on a copy of the state that moves are made and unmade on
+            Strategy.__get_stats().state_copies += 1
+            return Strategy.__best_reply_search(state.deepcopy(), state.current_player, depth, alpha, beta,
+                                                deadline=deadline, orderer=orderer, solver=solver)
+
+        if Strategy.SEARCH_MODE == SearchMode.PARALLEL:
+            # Determine min-max score with the help of worker processes
+            return Strategy.__parallel_search(state, depth, orderer, deadline, solver)
+
+        if Strategy.SEARCH_MODE == SearchMode.MAKE_UNMAKE:
+            # Determine min-max score on a copy of the state that moves are made and unmade on
+            Strategy.__get_stats().state_copies += 1
+            return Strategy.__mini_max_search_in_place(state.deepcopy(), state.current_player, depth, alpha, beta,
+                                                       deadline=deadline, orderer=orderer, solver=solver)
+
+        # Make up a game tree for the state
+        cache = ChildCache(Strategy.GAME_TREE_CACHE_NODES) \
+            if Strategy.GAME_TREE_RETENTION == RetentionPolicy.BOUNDED else None
+        tree = GameTree(state, Strategy.GAME_TREE_RETENTION, cache)
+        Strategy.__get_stats().state_copies += 1
+
+        # Determine min-max score for current child state
+        return Strategy.__mini_max_search(tree, state.current_player, depth, alpha, beta, deadline=deadline,
+                                          orderer=orderer, solver=solver)
+
+    @staticmethod
+    def __aspiration_search(state: State, depth: int, previous_score: int, orderer: MoveOrderer,
+                            deadline: float = None, solver: EndgameSolver = None):
+        """
+        Runs the min-max search (see __search) with a window of ASPIRATION_WINDOW around the score of the
+        previous iteration of iterative deepening. If the score falls outside of the window, the search is
+        run again with the window opened up on the side the score fell out on, which yields the same score
+        and move as searching with an open window right away.
+
+        Throws SearchTimeoutException if the deadline passes before the search completes.
+
+        :param state: state which to determine best move for current player for
+        :param depth: how many the current player in the provided states gets to go at most
+        :param previous_score: best score of the previous iteration
+        :param orderer: MoveOrderer to order moves with
+        :param deadline: time.monotonic() value by which to complete the search (None for no deadline)
+        :param solver: EndgameSolver to settle cut off positions with (None to search them)
+        :return: tuple of integer best score and corresponding best Action object
+        """
+        # The parallel search does not take a window
+        if Strategy.ASPIRATION_WINDOW is None or Strategy.SEARCH_MODE == SearchMode.PARALLEL:
+            return Strategy.__search(state, depth, orderer, deadline, solver)
+
+        alpha = previous_score - Strategy.ASPIRATION_WINDOW
+        beta = previous_score + Strategy.ASPIRATION_WINDOW
+
+        while True:
+            score, best_move = Strategy.__search(state, depth, orderer, deadline, solver, alpha, beta)
+
+            # Open window up on the side the score fell out on (if any), keeping the other side just beyond
+            # the score as it bounds the true score from said side
+            if score <= alpha:
+                alpha, beta = -VERY_LARGE_NUMBER, score + 1
+            elif score >= beta:
+                alpha, beta = score - 1, VERY_LARGE_NUMBER
+            else:
+                return score, best_move
+
+            Strategy.__get_stats().researches += 1
+
+            if Strategy.DEBUG:
+                print(f'  [depth={depth}] aspiration window failed: {score}, searching ({alpha}, {beta})')
+
+    @staticmethod
+    def shutdown_search_pool() -> None:
+        """
+        Shuts down the pool of worker processes used in PARALLEL search mode (if it has been
+        started). A new pool is started upon the next parallel search.
+
+        :return: None
+        """
+        if Strategy.__search_pool is not None:
+            Strategy.__search_pool.close()
+            Strategy.__search_pool = None
+
+    @staticmethod
+    def __get_search_pool() -> SearchPool:
+        """
+        Returns the pool of worker processes used in PARALLEL search mode, (re)starting it if it has not been
+        started yet or if it is made up of a number of processes other than PARALLEL_PROCESSES.
+
+        :return: SearchPool object
+        """
+        if Strategy.__search_pool is None or Strategy.__search_pool.processes != Strategy.PARALLEL_PROCESSES:
+            Strategy.shutdown_search_pool()
+            Strategy.__search_pool = SearchPool(Strategy.PARALLEL_PROCESSES, _init_search_worker)
+
+        return Strategy.__search_pool
+
+    @staticmethod
+    def __parallel_search(state: State, depth: int, orderer: MoveOrderer, deadline: float = None,
+                          solver: EndgameSolver = None):
+        """
+        Runs the min-max search for the provided state's current player to the given depth by expanding
+        the moves down to PARALLEL_SPLIT_DEPTH plies and having the pool of worker processes search the
+        subtrees found there. See the class description for details.
+
+        Throws SearchTimeoutException if the deadline passes before the search completes.
+
+        :param state: state which to determine best move for current player for
+        :param depth: how many the current player in the provided states gets to go at most
+        :param orderer: MoveOrderer to order the moves expanded up front with
+        :param deadline: time.monotonic() value by which to complete the search (None for no deadline)
+        :param solver: EndgameSolver to settle cut off positions expanded up front with (None to search them);
+                       workers make up solvers of their own
+        :return: tuple of integer best score and corresponding best Action object
+        """
+        # Expand moves down to the split depth, collecting the subtrees to search
+        tasks = []
+        Strategy.__get_stats().state_copies += 1
+        root = Strategy.__split(state.deepcopy(), state.current_player, depth, 0, orderer, deadline, tasks, solver)
+
+        # Return score if there is nothing to search
+        if root[0] == 'score':
+            return root[1], None
+
+        # Map each task onto the index of the root move it descends from
+        task_roots = {}
+
+        for root_index, (_, subtree) in enumerate(root[1]):
+            for index in Strategy.__get_task_indices(subtree):
+                task_roots[index] = root_index
+
+        # Count subtrees left to search per root move
+        remaining = [0] * len(root[1])
+
+        for root_index in task_roots.values():
+            remaining[root_index] += 1
+
+        scores = {}
+        timed_out = False
+        pool = Strategy.__get_search_pool()
+
+        with pool.lock:
+            pool.shared_bound = -VERY_LARGE_NUMBER
+
+            for index, score, stats in pool.imap_unordered(_search_subtree, tasks):
+                Strategy.__get_stats().merge(stats)
+
+                # Note timeout, yet wait for the remaining workers to wind down
+                if score is None:
+                    timed_out = True
+                    continue
+
+                scores[index] = score
+                root_index = task_roots[index]
+                remaining[root_index] -= 1
+
+                # Share alpha bound once the score of a root move is known (kept just below the
+                # score so that moves tying with it can be told apart)
+                if remaining[root_index] == 0 and not timed_out:
+                    root_score = Strategy.__combine(root[1][root_index][1], scores)
+                    pool.shared_bound = max(pool.shared_bound, root_score - 1)
+
+        if timed_out:
+            raise SearchTimeoutException()
+
+        # Initialize best value and move as in the serial search
+        best_val = -VERY_LARGE_NUMBER
+        best_move: Action = Action(Position(VERY_LARGE_NUMBER, VERY_LARGE_NUMBER),
+                                   Position(VERY_LARGE_NUMBER, VERY_LARGE_NUMBER))
+
+        for move, subtree in root[1]:
+            score = Strategy.__combine(subtree, scores)
+
+            # Break ties by picking the move with the lowest src x, src y, dst x, dst y (in that order)
+            if score == best_val:
+                best_move = min(best_move, move)
+            elif score > best_val:
+                best_val = score
+                best_move = move
+
+        return best_val, best_move
+
+    @staticmethod
+    def __split(state: State, player_color_to_max: Color, depth: int, ply: int, orderer: MoveOrderer,
+                deadline: float, tasks: list, solver: EndgameSolver = None) -> tuple:
+        """
+        Expands the moves of the provided state down to PARALLEL_SPLIT_DEPTH plies, making up a task for
+        each subtree found there. Nodes are checked for being terminal just as in the serial search.
+
+        :param state: state to expand (altered throughout, yet restored once done)
+        :param player_color_to_max: color of player whose score to maximize (maximizer)
+        :param depth: the number of times maximizing player is evaluated
+        :param ply: number of moves the state is away from the root of the search
+        :param orderer: MoveOrderer to order moves with
+        :param deadline: time.monotonic() value by which to complete the search (None for no deadline)
+        :param tasks: list to append tasks to
+        :param solver: EndgameSolver to settle cut off positions with (None to search them)
+        :return: tuple of ('score', score) for terminal nodes, ('task', task index) for subtrees handed to
+                 the workers, or ('max' or 'min', list of tuples of Action and child node) otherwise
+        """
+        # Check whether maximizer is stuck prior to refreshing the stuck player cache
+        is_maximizer_stuck = player_color_to_max in state.stuck_players
+
+        if depth == 0 or (not state.can_anyone_move()) or is_maximizer_stuck:
+            return 'score', state.get_player_score(player_color_to_max)
+
+        # Settle cut off positions below the root right away
+        solved_score = solver.solve(state, player_color_to_max, depth) if solver is not None and ply > 0 else None
+
+        if solved_score is not None:
+            Strategy.__get_stats().solved += 1
+            return 'score', solved_score
+
+        if ply == Strategy.PARALLEL_SPLIT_DEPTH:
+            Strategy.__get_stats().state_copies += 1
+            tasks.append((len(tasks), state.deepcopy(), player_color_to_max, depth, ply, deadline,
+                          orderer.heuristics, Strategy.__get_transposition_table() is not None, solver is not None,
+                          Strategy.__get_evaluator() is not None))
+            return 'task', len(tasks) - 1
+
+        is_maximizer = state.current_player == player_color_to_max
+
+        # Evaluate children in a single batch if they are all leaves
+        if depth == 1 and is_maximizer and Strategy.__get_evaluator() is not None:
+            return 'score', Strategy.__evaluate_children(state, player_color_to_max)[0]
+        children = []
+
+        for move in state.generate_actions(orderer.get_key(state, ply)):
+            state.apply_action(move)
+            children.append((move, Strategy.__split(state, player_color_to_max, depth - 1 if is_maximizer else depth,
+                                                    ply + 1, orderer, deadline, tasks, solver)))
+            state.undo_action()
+
+        return 'max' if is_maximizer else 'min', children
+
+    @staticmethod
+    def __get_task_indices(node: tuple) -> [int]:
+        """
+        Returns the indices of the tasks made up for the subtrees below the provided node (see __split).
+
+        :param node: node made up by __split
+        :return: list of task indices
+        """
+        if node[0] == 'task':
+            return [node[1]]
+
+        if node[0] == 'score':
+            return []
+
+        return [index for _, child in node[1] for index in Strategy.__get_task_indices(child)]
+
+    @staticmethod
+    def __combine(node: tuple, scores: dict) -> int:
+        """
+        Determines the min-max score of the provided node (see __split) from the scores of its tasks.
+
+        :param node: node made up by __split
+        :param scores: dict of task index to the score its worker came up with
+        :return: resulting score
+        """
+        if node[0] == 'score':
+            return node[1]
+
+        if node[0] == 'task':
+            return scores[node[1]]
+
+        child_scores = [Strategy.__combine(child, scores) for _, child in node[1]]
+        return max(child_scores) if node[0] == 'max' else min(child_scores)
+
+    @staticmethod
+    def __iterative_deepening_search(state: State, max_depth: int, time_budget: float, orderer: MoveOrderer,
+                                     solver: EndgameSolver = None):
+        """
+        Runs the min-max search for the provided state's current player to a depth of 1, 2, 3, ... until
+        the time budget runs out or max_depth is reached. The first iteration is run to completion
+        regardless of the time budget.
+
+        :param state: state which to determine best move for current player for
+        :param max_depth: maximum depth to deepen the search to (None for no maximum)
+        :param time_budget: number of seconds to deepen the search for
+        :param orderer: MoveOrderer to order moves with (throughout all iterations)
+        :param solver: EndgameSolver to settle cut off positions with (None to search them)
+        :return: tuple of integer best score and corresponding best Action object of the
+                 deepest completed iteration
+        """
+        deadline = time.monotonic() + time_budget
+
+        # Every turn of the current player removes a tile, so searching any deeper than there
+        # are tiles cannot tell us anything new
+        tile_no = sum(1 for tile in state.board.tiles.values() if tile.is_tile)
+        max_depth = tile_no if max_depth is None else min(max_depth, tile_no)
+
+        # Complete first iteration so that there is a move to fall back on
+        with Strategy.__get_stats().iteration(1):
+            score, best_move = Strategy.__search(state, 1, orderer, solver=solver)
+
+        for depth in range(2, max_depth + 1):
+            # Stop deepening if time is up
+            if Strategy.__is_time_up(deadline):
+                break
+
+            try:
+                with Strategy.__get_stats().iteration(depth):
+                    score, best_move = Strategy.__aspiration_search(state, depth, score, orderer, deadline,
+                                                                    solver)
+            except SearchTimeoutException:
+                break
+
+            if Strategy.DEBUG:
+                print(f'  [depth={depth}] completed iteration: {score} {best_move}')
+
+        return score, best_move
+
     @staticmethod
     def __mini_max_search(node: GameTree, player_color_to_max: Color, depth: int,
-                          alpha: int = -VERY_LARGE_NUMBER, beta: int = VERY_LARGE_NUMBER):
+                          alpha: int = -VERY_LARGE_NUMBER, beta: int = VERY_LARGE_NUMBER, deadline: float = None,
+                          ply: int = 0, orderer: MoveOrderer = None, solver: EndgameSolver = None):
         """
         Implements min-max algorithm with alpha-beta pruning. It computes the best worst
         score of the current player in the provided GameTree node by picking
@@ -114,14 +592,22 @@ class Strategy(object):
 
         If there are multiple best moves leading to the same score, then the one with the smallest
         source row, source column, destination row or destination column is picked (in that order).
+        Only the move picked at the root of the search (ply 0) is guaranteed to honor this rule.
         If the maximizing player becomes stuck at any point in the tree traversal, the search is aborted and
         its current score is returned.
 
+        Throws SearchTimeoutException if the deadline passes before the search completes.
+
         :param node: game tree node for which to run
         :param player_color_to_max: color of player whose score to maximize (maximizer)
         :param depth: the number of times maximizing player is evaluated
         :param alpha: the best score of the maximizer
         :param beta: the best worst score of the minimizer (one of the player's opponents)
+        :param deadline: time.monotonic() value by which to complete the search (None for no deadline)
+        :param ply: number of moves the node is away from the root of the search
+        :param orderer: MoveOrderer to order moves with (None to search moves in the order they are generated)
+        :param solver: EndgameSolver to settle positions in which the maximizer is cut off with (None to
+                       search them)
         :return: tuple of integer best score and corresponding best Action object.
         """
         # Validate params
@@ -140,62 +626,581 @@ class Strategy(object):
         if not isinstance(beta, int):
             raise TypeError('Expected integer for beta!')
 
+        if deadline is not None and not isinstance(deadline, float):
+            raise TypeError('Expected float for deadline!')
+
+        if not isinstance(ply, int) or ply < 0:
+            raise TypeError('Expected integer >= 0 for ply!')
+
+        if orderer is not None and not isinstance(orderer, MoveOrderer):
+            raise TypeError('Expected MoveOrderer for orderer!')
+
+        if solver is not None and not isinstance(solver, EndgameSolver):
+            raise TypeError('Expected EndgameSolver for solver!')
+
+        # Query the node's state through its view, which does not copy it
+        state = node.view
+        settled, window, key = Strategy.__enter_node(state, player_color_to_max, depth, alpha, beta, deadline, ply,
+                                                     orderer, solver)
+
+        if settled is not None:
+            return settled
+
+        is_maximizing = state.current_player == player_color_to_max
+
+        def search_child(child_node: GameTree, child_alpha: int, child_beta: int, is_first: bool) -> int:
+            # Each child node holds a copy of the state
+            Strategy.__get_stats().state_copies += 1
+            return Strategy.__search_child(Strategy.__mini_max_search, child_node, player_color_to_max,
+                                           depth - 1 if is_maximizing else depth, child_alpha, child_beta,
+                                           deadline, ply + 1, orderer, solver, is_maximizing, is_first)
+
+        return Strategy.__search_children(state, node.get_next(key), search_child, player_color_to_max, depth,
+                                          (alpha, beta), window, ply, orderer)
+
+    @staticmethod
+    def __mini_max_search_in_place(state: State, player_color_to_max: Color, depth: int,
+                                   alpha: int = -VERY_LARGE_NUMBER, beta: int = VERY_LARGE_NUMBER,
+                                   deadline: float = None, ply: int = 0, orderer: MoveOrderer = None,
+                                   solver: EndgameSolver = None):
+        """
+        Implements the same min-max algorithm with alpha-beta pruning as __mini_max_search, yet rather
+        than walking a GameTree it applies each move to the provided state, searches the resulting state
+        and undoes the move again. The state is therefore left as it was once the search returns.
+
+        :param state: state for which to run (altered throughout the search)
+        :param player_color_to_max: color of player whose score to maximize (maximizer)
+        :param depth: the number of times maximizing player is evaluated
+        :param alpha: the best score of the maximizer
+        :param beta: the best worst score of the minimizer (one of the player's opponents)
+        :param deadline: time.monotonic() value by which to complete the search (None for no deadline)
+        :param ply: number of moves the node is away from the root of the search
+        :param orderer: MoveOrderer to order moves with (None to search moves in the order they are generated)
+        :param solver: EndgameSolver to settle positions in which the maximizer is cut off with (None to
+                       search them)
+        :return: tuple of integer best score and corresponding best Action object.
+        """
+        settled, window, key = Strategy.__enter_node(state, player_color_to_max, depth, alpha, beta, deadline, ply,
+                                                     orderer, solver)
+
+        if settled is not None:
+            return settled
+
+        is_maximizing = state.current_player == player_color_to_max
+
+        def search_child(move: Action, child_alpha: int, child_beta: int, is_first: bool) -> int:
+            state.apply_action(move)
+            score = Strategy.__search_child(Strategy.__mini_max_search_in_place, state, player_color_to_max,
+                                            depth - 1 if is_maximizing else depth, child_alpha, child_beta,
+                                            deadline, ply + 1, orderer, solver, is_maximizing, is_first)
+            state.undo_action()
+            return score
+
+        return Strategy.__search_children(state, ((move, move) for move in state.generate_actions(key)),
+                                          search_child, player_color_to_max, depth, (alpha, beta), window, ply,
+                                          orderer)
+
+    @staticmethod
+    def __best_reply_search(state: State, player_color_to_max: Color, depth: int,
+                            alpha: int = -VERY_LARGE_NUMBER, beta: int = VERY_LARGE_NUMBER,
+                            deadline: float = None, ply: int = 0, orderer: MoveOrderer = None,
+                            solver: EndgameSolver = None):
+        """
+        Implements best-reply search with alpha-beta pruning on a state that moves are made and unmade on (see
+        __mini_max_search_in_place). It only differs from the paranoid min-max search in how the opponents'
+        turns are handled: rather than having each opponent take its turn in order, the moves of all opponents
+        that can move are searched as a single layer, each of them handing the turn straight back to the
+        maximizer (see State.apply_action), and the reply minimizing the maximizer's score is picked.
+
+        :param state: state for which to run (altered throughout the search)
+        :param player_color_to_max: color of player whose score to maximize (maximizer)
+        :param depth: the number of times maximizing player is evaluated
+        :param alpha: the best score of the maximizer
+        :param beta: the best worst score of the opponents
+        :param deadline: time.monotonic() value by which to complete the search (None for no deadline)
+        :param ply: number of moves the node is away from the root of the search
+        :param orderer: MoveOrderer to order moves with (None to search moves in the order they are generated)
+        :param solver: EndgameSolver to settle positions in which the maximizer is cut off with (None to
+                       search them)
+        :return: tuple of integer best score and corresponding best Action object.
+        """
+        settled, window, key = Strategy.__enter_node(state, player_color_to_max, depth, alpha, beta, deadline, ply,
+                                                     orderer, solver, OpponentModel.BEST_REPLY)
+
+        if settled is not None:
+            return settled
+
+        is_maximizing = state.current_player == player_color_to_max
+
+        if is_maximizing:
+            moves = state.generate_actions(key)
+        else:
+            # Gather the moves of every opponent that can move into a single layer
+            stuck_players = state.stuck_players
+            moves = [move for color in state.player_order
+                     if color != player_color_to_max and color not in stuck_players
+                     for move in state.generate_actions(color=color)]
+
+            if key is not None:
+                moves.sort(key=key)
+
+        def search_child(move: Action, child_alpha: int, child_beta: int, is_first: bool) -> int:
+            # Make reply and hand the turn back to the maximizer
+            state.apply_action(move, None if is_maximizing else player_color_to_max)
+            score = Strategy.__search_child(Strategy.__best_reply_search, state, player_color_to_max,
+                                            depth - 1 if is_maximizing else depth, child_alpha, child_beta,
+                                            deadline, ply + 1, orderer, solver, is_maximizing, is_first)
+            state.undo_action()
+            return score
+
+        return Strategy.__search_children(state, ((move, move) for move in moves), search_child,
+                                          player_color_to_max, depth, (alpha, beta), window, ply, orderer,
+                                          OpponentModel.BEST_REPLY)
+
+    @staticmethod
+    def __enter_node(state: State, player_color_to_max: Color, depth: int, alpha: int, beta: int,
+                     deadline: float, ply: int, orderer: MoveOrderer, solver: EndgameSolver,
+                     opponent_model: OpponentModel = OpponentModel.PARANOID) -> tuple:
+        """
+        Runs what every search does upon entering a node before searching its children: it settles the
+        node's score right away if the depth is reached, the maximizer is stuck or the game is over, if the
+        maximizer is cut off from its opponents (below the root), if the transposition table holds its score
+        or if even the richest tiles the maximizer could collect do not beat alpha. Otherwise, it narrows the
+        window by the transposition table, determines the order to search moves in and, if the node's
+        children are all leaves that are evaluated, settles the node by evaluating them in a single batch.
+
+        Throws SearchTimeoutException if the deadline has passed by the time the node is to be expanded.
+
+        :param state: state (or StateView) of the node
+        :param player_color_to_max: color of player whose score to maximize (maximizer)
+        :param depth: the number of times maximizing player is evaluated
+        :param alpha: the best score of the maximizer
+        :param beta: the best worst score of the minimizer
+        :param deadline: time.monotonic() value by which to complete the search (None for no deadline)
+        :param ply: number of moves the node is away from the root of the search
+        :param orderer: MoveOrderer to order moves with (None to search moves in the order they are generated)
+        :param solver: EndgameSolver to settle cut off positions with (None to search them)
+        :param opponent_model: OpponentModel the node is searched with
+        :return: tuple of the settled tuple of score and best Action (None if the node's children are to be
+                 searched), the window to search them with as a tuple of alpha and beta, and the key function
+                 to order moves by
+        """
+        # Check whether maximizer is stuck prior to refreshing the stuck player cache
+        is_maximizer_stuck = player_color_to_max in state.stuck_players
+        Strategy.__get_stats().nodes += 1
+
         # If we have reached our depth, maximizer is stuck or game is over, return player score
-        if depth == 0 or (not node.state.can_anyone_move()) \
-                or player_color_to_max in node.state.stuck_players:
-            return node.state.get_player_score(player_color_to_max), None
+        if depth == 0 or (not state.can_anyone_move()) or is_maximizer_stuck:
+            return (state.get_player_score(player_color_to_max), None), None, None
 
-        # If current player is maximizer, maximize
-        if node.state.current_player == player_color_to_max:
-            if Strategy.DEBUG:
-                print(f'==== PLAYER {node.state.current_player} ========')
-            # Initialize best value to something very negative
-            best_val = -VERY_LARGE_NUMBER
+        # Settle score right away if the maximizer is cut off from its opponents (below the root)
+        if solver is not None and ply > 0:
+            solved_score = solver.solve(state, player_color_to_max, depth)
+
+            if solved_score is not None:
+                Strategy.__get_stats().solved += 1
+                return (solved_score, None), None, None
+
+        # Consult transposition table before expanding node
+        table_score, table_move, window = Strategy.__probe_transposition_table(
+            state, player_color_to_max, depth, alpha, beta, opponent_model)
+
+        # Leave the root's window be so that ties are told apart properly
+        if ply > 0:
+            if table_score is not None:
+                Strategy.__get_stats().table_hits += 1
+                return (table_score, table_move), None, None
+
+            # Cut node off if even the richest tiles the maximizer could collect do not beat alpha
+            bound = Strategy.__get_bound_cutoff(state, player_color_to_max, depth, window[0])
+
+            if bound is not None:
+                return (bound, None), None, None
+        else:
+            window = (alpha, beta)
+
+        # Determine order to search moves in
+        key = orderer.get_key(state, ply, table_move) if orderer is not None else None
+
+        # Make sure there is time left to expand the node
+        if Strategy.__is_time_up(deadline):
+            raise SearchTimeoutException()
+
+        Strategy.__get_stats().expanded += 1
+
+        # Evaluate children in a single batch if they are all leaves
+        if depth == 1 and state.current_player == player_color_to_max and Strategy.__get_evaluator() is not None:
+            best_val, best_move = Strategy.__evaluate_children(state, player_color_to_max, key)
+            Strategy.__store_transposition_table(state, player_color_to_max, depth, (alpha, beta), best_val,
+                                                 best_move, opponent_model)
+            return (best_val, best_move), None, None
+
+        return None, window, key
+
+    @staticmethod
+    def __search_children(state: State, children, search_child, player_color_to_max: Color, depth: int,
+                          original_window: tuple, window: tuple, ply: int, orderer: MoveOrderer,
+                          opponent_model: OpponentModel = OpponentModel.PARANOID) -> tuple:
+        """
+        Searches the children of a node in the given order with alpha-beta pruning and stores the outcome in
+        the transposition table. At a node of the maximizer, the best score is picked, and ties are broken by
+        picking the move with the lowest src x, src y, dst x, dst y (in that order). At the root, alpha is kept
+        just below the best score so that moves tying with it are not cut off. At a node of an opponent, the
+        score minimizing the maximizer's score is picked.
+
+        :param state: state (or StateView) of the node
+        :param children: iterable of tuples of Action and what search_child reaches the child by (the child
+                         GameTree node or the Action to make)
+        :param search_child: function of what reaches a child, alpha, beta and whether it is the first child
+                             searched to the child's score
+        :param player_color_to_max: color of player whose score to maximize (maximizer)
+        :param depth: the number of times maximizing player is evaluated
+        :param original_window: tuple of alpha and beta the node was entered with
+        :param window: tuple of alpha and beta to search the children with
+        :param ply: number of moves the node is away from the root of the search
+        :param orderer: MoveOrderer to record cutoffs with (None to not record them)
+        :param opponent_model: OpponentModel the node is searched with
+        :return: tuple of integer best score and corresponding best Action object (None at a node of an
+                 opponent)
+        """
+        alpha, beta = window
+        is_maximizing = state.current_player == player_color_to_max
+
+        if Strategy.DEBUG:
+            print(f'==== PLAYER {state.current_player} ========')
+
+        if is_maximizing:
             # Initialize best_move to anything (won't be compared to assuming we can always achieve
             # a positive score)
+            best_val = -VERY_LARGE_NUMBER
             best_move: Action = Action(Position(VERY_LARGE_NUMBER, VERY_LARGE_NUMBER),
                                        Position(VERY_LARGE_NUMBER, VERY_LARGE_NUMBER))
-            # Cycle over all possibles moves and their associated states
-            for move, child_node in node.get_next():
-                # Get best score of subsequent node
-                score, _ = Strategy.__mini_max_search(child_node, player_color_to_max, depth - 1, alpha, beta)
+        else:
+            best_val = VERY_LARGE_NUMBER
+            best_move = None
 
+        for i, (move, child) in enumerate(children):
+            score = search_child(child, alpha, beta, i == 0)
+
+            if is_maximizing:
                 # If our best move leads to the same score, pick the move with
                 # the lowest src x, dst y, dst x, dst y (in that order)
                 if score == best_val:
                     best_move = min(best_move, move)
                 elif score > best_val:
-                    # If it leads to a better score, update best val and best move
                     best_val = score
                     best_move = move
 
-                # Determine if this beats our alpha, and if so set our alpha
-                alpha = max(alpha, best_val)
-
-                # If player's best beats opponents best worst move, cut off
-                if alpha >= beta:
-                    break
-
-            # Return our best move
-            return best_val, best_move
-        else:
-            if Strategy.DEBUG:
-                print(f'==== PLAYER {node.state.current_player} ========')
-            # Initialize opponent's best value to something very positive
-            best_val = VERY_LARGE_NUMBER
-            # Minimize, otherwise
-            for move, child_node in node.get_next():
-                # Get best score of subsequent node
-                score, _ = Strategy.__mini_max_search(child_node, player_color_to_max, depth, alpha, beta)
+                # Determine if this beats our alpha, and if so set our alpha (at the root, keep alpha
+                # just below our best score so that moves tying with it are not cut off)
+                alpha = max(alpha, best_val if ply > 0 else best_val - 1)
+            else:
                 # Minimize player_id_to_max's score
-                best_val = min(score, best_val)
+                if score < best_val:
+                    best_val = score
+                    best_move = move
 
                 # See if we have come up with a better "worst" move
                 beta = min(beta, best_val)
 
-                # If player's best beats opponents best worst move, cut off
-                if alpha >= beta:
-                    break
+            # If player's best beats opponents best worst move, cut off (at the root, said move
+            # may only beat it by reaching it as alpha is kept below our best score)
+            if alpha >= beta or (is_maximizing and best_val >= beta):
+                Strategy.__get_stats().cutoffs += 1
+                if orderer is not None:
+                    orderer.record_cutoff(move, ply, depth)
+                break
+
+        Strategy.__store_transposition_table(state, player_color_to_max, depth, original_window, best_val,
+                                             best_move, opponent_model)
+        return best_val, best_move if is_maximizing else None
+
+    @staticmethod
+    def __is_time_up(deadline: float) -> bool:
+        """
+        Tells whether the search running on the current thread is to stop, either as the given deadline
+        has passed or as its stop event has been set (see get_best_action).
+
+        :param deadline: time.monotonic() value by which to complete the search (None for no deadline)
+        :return: boolean indicating whether the search is to stop
+        """
+        if deadline is not None and time.monotonic() >= deadline:
+            return True
+
+        stop_event = getattr(Strategy.__local, 'stop_event', None)
+        return stop_event is not None and stop_event.is_set()
+
+    @staticmethod
+    def __get_stats() -> SearchStats:
+        """
+        Returns the statistics of the search running on the current thread.
+
+        :return: SearchStats object
+        """
+        return getattr(Strategy.__local, 'stats', Strategy.stats)
+
+    @staticmethod
+    def __get_transposition_table() -> TranspositionTable:
+        """
+        Returns the transposition table of the search running on the current thread.
+
+        :return: TranspositionTable object or None if the search does without one
+        """
+        return getattr(Strategy.__local, 'table', None)
+
+    @staticmethod
+    def __make_transposition_table(transposition_table: TranspositionTable) -> TranspositionTable:
+        """
+        Returns the transposition table a search is to consult given the one handed to get_best_action.
+
+        :param transposition_table: TranspositionTable handed to get_best_action (or None)
+        :return: TranspositionTable object or None if USE_TRANSPOSITION_TABLE is off
+        """
+        if not Strategy.USE_TRANSPOSITION_TABLE:
+            return None
+
+        if transposition_table is not None:
+            return transposition_table
+
+        return Strategy.TRANSPOSITION_TABLE if Strategy.TRANSPOSITION_TABLE is not None else TranspositionTable()
+
+    @staticmethod
+    def __get_evaluator() -> Evaluator:
+        """
+        Returns the Evaluator of the search running on the current thread.
+
+        :return: Evaluator object or None if leaves are scored by the maximizer's score
+        """
+        return getattr(Strategy.__local, 'evaluator', None)
+
+    @staticmethod
+    def __evaluate_children(state: State, player_color_to_max: Color, key=None) -> tuple:
+        """
+        Evaluates the children of a node of the maximizer whose children are all leaves of the search in a
+        single batch (see Evaluator.evaluate_children) and picks the best of them, breaking ties just like
+        the search does.
+
+        :param state: state of the node
+        :param player_color_to_max: color of player whose score to maximize (maximizer)
+        :param key: key function to order moves by (None to leave them in the order they are generated)
+        :return: tuple of integer best evaluation and corresponding best Action object
+        """
+        moves = list(state.generate_actions(key))
+        evaluations = Strategy.__get_evaluator().evaluate_children(state, player_color_to_max, moves)
+        Strategy.__get_stats().nodes += len(moves)
+        Strategy.__get_stats().children += len(moves)
+
+        best_val = -VERY_LARGE_NUMBER
+        best_move: Action = Action(Position(VERY_LARGE_NUMBER, VERY_LARGE_NUMBER),
+                                   Position(VERY_LARGE_NUMBER, VERY_LARGE_NUMBER))
+
+        for move, evaluation in zip(moves, evaluations):
+            # Break ties by picking the move with the lowest src x, src y, dst x, dst y (in that order)
+            if evaluation == best_val:
+                best_move = min(best_move, move)
+            elif evaluation > best_val:
+                best_val = evaluation
+                best_move = move
+
+        return best_val, best_move
+
+    @staticmethod
+    def __search_child(search, node, player_color_to_max: Color, depth: int, alpha: int, beta: int,
+                       deadline: float, ply: int, orderer: MoveOrderer, solver: EndgameSolver, is_maximizing: bool,
+                       is_first: bool) -> int:
+        """
+        Searches a child of a node with the given search function. If PRINCIPAL_VARIATION_SEARCH is set,
+        every child but the first is searched with a null window first, which merely tells whether the
+        child beats the best score found so far (alpha at a node of the maximizer, beta at a node of an
+        opponent). Only if it does is the child searched again with the full window to determine its score.
+
+        :param search: search function to run on the child (one of __mini_max_search,
+                       __mini_max_search_in_place and __best_reply_search)
+        :param node: child GameTree node or State (as expected by the search function)
+        :param player_color_to_max: color of player whose score to maximize (maximizer)
+        :param depth: the number of times maximizing player is evaluated (from the child on)
+        :param alpha: the best score of the maximizer
+        :param beta: the best worst score of the minimizer
+        :param deadline: time.monotonic() value by which to complete the search (None for no deadline)
+        :param ply: number of moves the child is away from the root of the search
+        :param orderer: MoveOrderer to order moves with (None to search moves in the order they are generated)
+        :param solver: EndgameSolver to settle cut off positions with (None to search them)
+        :param is_maximizing: whether the child's parent is a node of the maximizer
+        :param is_first: whether the child is the first child of its parent to be searched
+        :return: score of the child (a bound on it if it falls outside of the window)
+        """
+        Strategy.__get_stats().children += 1
+
+        if Strategy.PRINCIPAL_VARIATION_SEARCH and not is_first:
+            # Search child with a null window just above alpha (or just below beta)
+            null_window = (alpha, alpha + 1) if is_maximizing else (beta - 1, beta)
+            score, _ = search(node, player_color_to_max, depth, *null_window, deadline, ply, orderer, solver)
+
+            # A score outside of the window is settled as is; one within it calls for an exact score
+            if score <= alpha or score >= beta:
+                return score
+
+            Strategy.__get_stats().researches += 1
+
+        score, _ = search(node, player_color_to_max, depth, alpha, beta, deadline, ply, orderer, solver)
+        return score
+
+    @staticmethod
+    def __get_bound_cutoff(state: State, player_color_to_max: Color, depth: int, alpha: int) -> int:
+        """
+        Determines whether a node can be cut off without being expanded as the maximizer cannot
+        beat alpha from there on even if it collected the richest tiles within its reach with each
+        of its remaining depth number of moves (see State.get_score_upper_bound). The bound is an
+        upper bound on the node's score, hence it is a valid fail-soft result of the search.
+
+        :param state: state of the node
+        :param player_color_to_max: color of player whose score to maximize (maximizer)
+        :param depth: the number of times maximizing player is evaluated
+        :param alpha: the best score of the maximizer
+        :return: score to cut node off with or None if it is to be searched
+        """
+        # Nothing can fail to beat alpha if it is not set yet (and the bound does not hold for evaluations)
+        if not Strategy.BOUND_PRUNING or Strategy.__get_evaluator() is not None or alpha == -VERY_LARGE_NUMBER:
+            return None
+
+        bound = state.get_score_upper_bound(player_color_to_max, depth)
+
+        if bound > alpha:
+            return None
+
+        Strategy.__get_stats().bound_cutoffs += 1
+        return bound
+
+    @staticmethod
+    def __probe_transposition_table(state: State, player_color_to_max: Color, depth: int, alpha: int, beta: int,
+                                    opponent_model: OpponentModel = OpponentModel.PARANOID):
+        """
+        Looks up the provided state in the transposition table. If it holds an entry searched to the given
+        depth, its score either settles the state's score outright or narrows the search window. The scores
+        of entries searched to other depths are ignored so that the outcome of a search only depends on its
+        depth, yet their best move still serves to order moves by.
+
+        :param state: state to look up
+        :param player_color_to_max: color of player whose score to maximize (maximizer)
+        :param depth: the number of times maximizing player is to be evaluated
+        :param alpha: the best score of the maximizer
+        :param beta: the best worst score of the minimizer
+        :param opponent_model: OpponentModel the state is searched with (as entries of either model differ)
+        :return: tuple of the settled score (None if the state is to be searched), the best Action stored
+                 for the state (None if unknown) and the (narrowed) window as a tuple of alpha and beta
+        """
+        table = Strategy.__get_transposition_table()
+
+        if table is None:
+            return None, None, (alpha, beta)
+
+        entry = table.probe((state.position_hash, player_color_to_max, opponent_model,
+                             Strategy.__get_evaluator() is not None))
+
+        if entry is None:
+            return None, None, (alpha, beta)
+
+        entry_depth, bound, score, best_move = entry
+
+        # Entries searched to other depths only hint at the best move
+        if entry_depth != depth:
+            return None, best_move, (alpha, beta)
+
+        # Translate score gained into score at state
+        score += state.get_player_score(player_color_to_max)
+
+        if bound == BoundType.EXACT:
+            return score, best_move, (alpha, beta)
+        elif bound == BoundType.LOWER:
+            alpha = max(alpha, score)
+        else:
+            beta = min(beta, score)
+
+        # Cut off if the window closed
+        if alpha >= beta:
+            return score, best_move, (alpha, beta)
+
+        return None, best_move, (alpha, beta)
+
+    @staticmethod
+    def __store_transposition_table(state: State, player_color_to_max: Color, depth: int, window: tuple,
+                                    score: int, best_move: Action,
+                                    opponent_model: OpponentModel = OpponentModel.PARANOID) -> None:
+        """
+        Stores the outcome of searching the provided state in the transposition table.
+
+        :param state: state that was searched
+        :param player_color_to_max: color of player whose score to maximize (maximizer)
+        :param depth: the number of times maximizing player was evaluated
+        :param window: tuple of alpha and beta the state was searched with
+        :param score: resulting score
+        :param best_move: resulting best Action
+        :param opponent_model: OpponentModel the state was searched with
+        :return: None
+        """
+        table = Strategy.__get_transposition_table()
+
+        if table is None:
+            return
+
+        alpha, beta = window
+
+        # Determine how the score relates to the state's true score
+        if score <= alpha:
+            bound = BoundType.UPPER
+        elif score >= beta:
+            bound = BoundType.LOWER
+        else:
+            bound = BoundType.EXACT
+
+        # Store score gained rather than score at state
+        table.store((state.position_hash, player_color_to_max, opponent_model, Strategy.__get_evaluator() is not None),
+                    depth, bound, score - state.get_player_score(player_color_to_max), best_move)
+
+
+# Transposition table of a worker process (kept across searches) and the alpha bound it shares with
+# the process running the parallel search; both are only set in worker processes
+_worker_table = None
+_shared_bound = None
+
+
+def _init_search_worker(shared_bound) -> None:
+    """
+    Initializes a worker process of the pool used in PARALLEL search mode.
+
+    :param shared_bound: multiprocessing.Value holding the alpha bound shared by the parallel search
+    :return: None
+    """
+    global _worker_table, _shared_bound
+
+    # Keep the transposition table inherited from the parent process (or make up one)
+    _worker_table = Strategy.TRANSPOSITION_TABLE if Strategy.TRANSPOSITION_TABLE is not None \
+        else TranspositionTable()
+    _shared_bound = shared_bound
+
+
+def _search_subtree(task: tuple) -> tuple:
+    """
+    Searches a subtree of a parallel search in a worker process, starting out from the alpha bound
+    currently shared by the parallel search.
+
+    :param task: tuple of task index, State, maximizer Color, depth, ply, deadline, list of MoveOrdering,
+                 whether to use a transposition table, whether to use an endgame solver and whether to evaluate
+                 leaves (see Strategy.__split)
+    :return: tuple of task index, resulting score (None if the deadline passed) and SearchStats of the search
+    """
+    index, state, player_color_to_max, depth, ply, deadline, move_ordering, use_table, use_solver, evaluation = task
+
+    Strategy._Strategy__local.table = _worker_table if use_table else None
+    Strategy._Strategy__local.evaluator = Evaluator(state.board) if evaluation else None
+    Strategy._Strategy__local.stats = SearchStats()
+
+    try:
+        score, _ = Strategy._Strategy__mini_max_search_in_place(state, player_color_to_max, depth,
+                                                                _shared_bound.value, VERY_LARGE_NUMBER,
+                                                                deadline, ply, MoveOrderer(move_ordering),
+                                                                EndgameSolver() if use_solver else None)
+    except SearchTimeoutException:
+        score = None
 
-            # Return opponent's best move
-            return best_val, None
+    return index, score, Strategy._Strategy__local.stats
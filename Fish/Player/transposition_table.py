@@ -0,0 +1,168 @@
+import sys
+
+sys.path.append('../Common')
+
+from action import Action
+from bound_type import BoundType
+from replacement_policy import ReplacementPolicy
+
+
+class TranspositionTable(object):
+    """
+    PURPOSE:        The purpose of the transposition table is to remember the outcome of searching a position
+                    so that a min-max search reaching the same position again (through a different order of
+                    moves) can reuse said outcome rather than searching the position anew.
+
+    INTERPRETATION: The table is made up of max_entries slots. An entry is stored under a key (a hashable value
+                    identifying the searched position, such as a tuple of State.position_hash and the color of the
+                    maximizing player), which determines the one slot the entry may occupy. Each entry holds the
+                    depth the position was searched to, the score the search came up with, the BoundType telling
+                    how said score relates to the position's true score, and the best move found (if any).
+
+                    The number of slots caps the memory used by the table. Once a key maps onto a slot that is
+                    taken by an entry for another key, the ReplacementPolicy decides which of the two is kept.
+                    Slots are allocated as they are first used, so that a large table costs little memory until it
+                    fills up.
+
+                    The table counts hits (probes that found an entry for their key), misses (probes that did
+                    not), stores and replacements (stores that evicted an entry for another key) to allow for
+                    tuning its size and policy.
+    """
+    # Default number of slots to a table
+    DEFAULT_MAX_ENTRIES = 1 << 18
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES,
+                 replacement_policy: ReplacementPolicy = ReplacementPolicy.DEPTH_PREFERRED):
+        """
+        Initializes an empty transposition table.
+
+        :param max_entries: maximum number of entries the table holds at any one time
+        :param replacement_policy: ReplacementPolicy to follow when two keys compete for one slot
+        :return: new TranspositionTable designed to spec
+        """
+        # Validate params
+        if not isinstance(max_entries, int) or max_entries <= 0:
+            raise ValueError('Expected int > 0 for max_entries!')
+
+        if not isinstance(replacement_policy, ReplacementPolicy):
+            raise TypeError('Expected ReplacementPolicy for replacement_policy!')
+
+        # Set fields
+        self.__max_entries = max_entries
+        self.__replacement_policy = replacement_policy
+        # Initialize dict of slot index to entry tuple of (key, depth, BoundType, score, best move)
+        self.__slots = {}
+
+        # Initialize counters
+        self.reset_counters()
+
+    @property
+    def max_entries(self) -> int:
+        """
+        Returns the maximum number of entries the table holds.
+        """
+        return self.__max_entries
+
+    @property
+    def replacement_policy(self) -> ReplacementPolicy:
+        """
+        Returns the replacement policy of the table.
+        """
+        return self.__replacement_policy
+
+    @property
+    def entries(self) -> int:
+        """
+        Returns the number of entries currently held by the table.
+        """
+        return len(self.__slots)
+
+    @property
+    def hits(self) -> int:
+        """
+        Returns the number of probes that found an entry for their key.
+        """
+        return self.__hits
+
+    @property
+    def misses(self) -> int:
+        """
+        Returns the number of probes that found no entry for their key.
+        """
+        return self.__misses
+
+    @property
+    def stores(self) -> int:
+        """
+        Returns the number of entries stored.
+        """
+        return self.__stores
+
+    @property
+    def replacements(self) -> int:
+        """
+        Returns the number of stores that evicted the entry of another key.
+        """
+        return self.__replacements
+
+    def probe(self, key) -> tuple:
+        """
+        Looks up the entry stored for the given key.
+
+        :param key: hashable key identifying the position
+        :return: tuple of (depth, BoundType, score, best move) or None if there is no such entry
+        """
+        entry = self.__slots.get(hash(key) % self.__max_entries)
+
+        # Make sure slot is not taken by the entry of another key
+        if entry is None or entry[0] != key:
+            self.__misses += 1
+            return None
+
+        self.__hits += 1
+        return entry[1:]
+
+    def store(self, key, depth: int, bound: BoundType, score: int, best_move: Action = None) -> bool:
+        """
+        Stores the outcome of searching the position of the given key. If the key's slot is taken
+        by the entry of another key, the replacement policy decides whether it is overwritten.
+
+        :param key: hashable key identifying the position
+        :param depth: depth the position was searched to
+        :param bound: BoundType of score
+        :param score: score the search came up with
+        :param best_move: best Action found by the search (if any)
+        :return: boolean indicating whether the entry was stored
+        """
+        slot = hash(key) % self.__max_entries
+        entry = self.__slots.get(slot)
+
+        if entry is not None and entry[0] != key:
+            # Keep deeper entry of other key if the policy says so
+            if self.__replacement_policy == ReplacementPolicy.DEPTH_PREFERRED and entry[1] > depth:
+                return False
+
+            self.__replacements += 1
+
+        self.__slots[slot] = (key, depth, bound, score, best_move)
+        self.__stores += 1
+        return True
+
+    def clear(self) -> None:
+        """
+        Removes all entries from the table (leaving the counters as they are).
+
+        :return: None
+        """
+        self.__slots.clear()
+
+    def reset_counters(self) -> None:
+        """
+        Resets the hit, miss, store and replacement counters.
+
+        :return: None
+        """
+        self.__hits = 0
+        self.__misses = 0
+        self.__stores = 0
+        self.__replacements = 0
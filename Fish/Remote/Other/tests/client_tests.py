@@ -8,6 +8,7 @@ sys.path.append('Common/')
 sys.path.append('Remote/')
 
 from client import Client
+from search_engine import SearchEngine
 from json_serializer import JsonSerializer
 
 
@@ -57,6 +58,31 @@ class ClientTests(unittest.TestCase):
         with self.assertRaises(ValueError):
             Client("thisstringistoolong", 2)
 
+    def test_init_fail6(self):
+        # Tests failing init due to invalid time_budget
+        with self.assertRaises(TypeError):
+            Client("name", 1, "not a number")
+
+    def test_init_fail7(self):
+        # Tests failing init due to time_budget being negative
+        with self.assertRaises(ValueError):
+            Client("name", 1, -0.5)
+
+    def test_init_fail8(self):
+        # Tests failing init due to invalid search_engine
+        with self.assertRaises(TypeError):
+            Client("name", 1, None, "mcts")
+
+    def test_init_fail9(self):
+        # Tests failing init due to invalid ponder
+        with self.assertRaises(TypeError):
+            Client("name", 1, None, SearchEngine.MINIMAX, "yes")
+
+    def test_init_fail10(self):
+        # Tests failing init due to pondering with a search engine other than MINIMAX
+        with self.assertRaises(ValueError):
+            Client("name", 1, None, SearchEngine.MONTE_CARLO, True)
+
     def test_run_failed_connection(self):
         # tests running a client with a failed connection
         c1 = Client("a", 1)
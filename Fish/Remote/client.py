@@ -8,6 +8,10 @@ sys.path.append('../C')
 
 from Other.json_serializer import JsonSerializer
 from strategy import Strategy
+from monte_carlo_tree_search import MonteCarloTreeSearch
+from search_engine import SearchEngine
+from ponderer import Ponderer
+from transposition_table import TranspositionTable
 
 
 class Client(object):
@@ -50,13 +54,20 @@ class Client(object):
     NO_MESSAGE_TIMEOUT = 75
     CONNECTION_RETRIES = 10
 
-    def __init__(self, name: str, lookahead_depth: int = 1):
+    def __init__(self, name: str, lookahead_depth: int = 1, time_budget: float = None,
+                 search_engine: SearchEngine = SearchEngine.MINIMAX, ponder: bool = False):
         """
         Initializes a client with the given name, for the purpose of connecting to the Fish servers and playing
         in a tournament of fish.
 
         :param name: name is a string that will act as a unique identifier of this player on the Fish servers
         :param lookahead_depth: the number of turns to look ahead when employing our Maximin strategy for this player
+        :param time_budget: the number of seconds to deepen our Maximin strategy for on each turn (None to look
+                            ahead lookahead_depth turns instead)
+        :param search_engine: the SearchEngine to determine moves with (a Monte Carlo tree search runs for time_budget
+                              seconds if given, or MonteCarloTreeSearch.DEFAULT_ITERATIONS iterations otherwise)
+        :param ponder: whether to search ahead while waiting on opponents (MINIMAX search engine only), starting
+                       from the state our move leads to (see Ponderer)
         """
         # Validate params
         if not isinstance(name, str):
@@ -68,12 +79,37 @@ class Client(object):
         if lookahead_depth < 0:
             raise ValueError('lookahead_depth must be greater than zero')
 
+        if time_budget is not None and not isinstance(time_budget, (int, float)):
+            raise TypeError('Expected int or float for time_budget')
+
+        if time_budget is not None and time_budget <= 0:
+            raise ValueError('time_budget must be greater than zero')
+
+        if not isinstance(search_engine, SearchEngine):
+            raise TypeError('Expected SearchEngine for search_engine')
+
+        if not isinstance(ponder, bool):
+            raise TypeError('Expected bool for ponder')
+
+        if ponder and search_engine != SearchEngine.MINIMAX:
+            raise ValueError('ponder requires the MINIMAX search engine')
+
+        if ponder and lookahead_depth == 0:
+            raise ValueError('ponder requires lookahead_depth to be greater than zero')
+
         if len(name) == 0 or len(name) > 12:
             raise ValueError('name must be between 1 and 12 characters inclusive')
 
         self.__name = name
         self.__lookahead_depth = lookahead_depth
+        self.__time_budget = time_budget
+        self.__search_engine = search_engine
+        self.__ponder = ponder
         self.__json_serializer = JsonSerializer()
+        # Transposition table of our min-max searches (cleared as each game starts)
+        self.__transposition_table = TranspositionTable()
+        # Ponderer is made up once our color is known
+        self.__ponderer = None
 
         self.__client_socket = None
         self.__color = None
@@ -259,6 +295,21 @@ class Client(object):
         """
         self.__color = args[0]
 
+        # Start over on the transposition table as entries do not carry over from the previous game
+        if self.__ponderer is not None:
+            self.__ponderer.stop()
+
+        self.__transposition_table.clear()
+        self.__transposition_table.reset_counters()
+
+        # Ponder on behalf of our color in the game that is starting
+        if self.__ponder:
+            if self.__ponderer is None:
+                self.__ponderer = Ponderer(self.__color, self.__lookahead_depth, self.__time_budget,
+                                          self.__transposition_table)
+            else:
+                self.__ponderer.color = self.__color
+
         if Client.DEBUG:
             print(f'[{self.name}] is playing as {self.__color}')
 
@@ -309,7 +360,25 @@ class Client(object):
         if Client.DEBUG:
             print(f'[{self.name}] is calculating turn...')
 
-        action = Strategy.get_best_action(state, self.__lookahead_depth)
+        # Answer from what was pondered if it predicted the state (stopping pondering either way)
+        action = self.__ponderer.get_action(state) if self.__ponderer is not None else None
+
+        # Otherwise search within time budget (if any), or to lookahead depth
+        if action is None:
+            if self.__search_engine == SearchEngine.MONTE_CARLO:
+                action = MonteCarloTreeSearch.get_best_action(state, time_budget=self.__time_budget)
+            elif self.__time_budget is not None:
+                action = Strategy.get_best_action(state, time_budget=self.__time_budget,
+                                                  transposition_table=self.__transposition_table)
+            else:
+                action = Strategy.get_best_action(state, self.__lookahead_depth,
+                                                  transposition_table=self.__transposition_table)
+
+        # Ponder while our opponents respond to our move
+        if self.__ponderer is not None:
+            next_state = state.deepcopy()
+            next_state.move_avatar(*action)
+            self.__ponderer.start(next_state)
 
         if Client.DEBUG:
             print(f'[{self.name}] [{self.color}] [SEND -> RPP] take-turn ~ {action[0]} -> {action[1]}')
@@ -328,6 +397,9 @@ class Client(object):
 
         self.__is_tournament_over = True
         self.__won_tournament = args[0]
+
+        if self.__ponderer is not None:
+            self.__ponderer.reset()
         return json.dumps('void')
 
     def __receive_messages(self):
@@ -366,6 +438,8 @@ class Client(object):
         This method deals with closing the client TCP socket connection, and is called when we receive a
         message that the tournament is over (and break out of the main loop).
         """
+        if self.__ponderer is not None:
+            self.__ponderer.reset()
         if self.__client_socket:
             self.__client_socket.close()
         if Client.DEBUG: